@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Store de artefatos de build endereçado por conteúdo
+Guarda ZIP, build-info e checksums por digest das entradas, com índice e retenção
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class ArtifactStore:
+    """Classe responsável pelo armazenamento e retenção dos artefatos de build"""
+
+    INDEX_VERSION = 1
+
+    def __init__(self, root: Path):
+        """
+        Inicializa o ArtifactStore
+
+        Args:
+            root: Diretório raiz do store (ex: <projeto>/build)
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.json"
+        self._index: Optional[Dict[str, Any]] = None
+
+    # ------------------------------------------------------------------
+    # Índice
+    # ------------------------------------------------------------------
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        """Índice do store (carregado sob demanda)"""
+        if self._index is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+                if self._index.get('version') != self.INDEX_VERSION:
+                    raise ValueError("Versão de índice incompatível")
+            except (FileNotFoundError, ValueError):
+                self._index = {'version': self.INDEX_VERSION, 'artifacts': {}}
+        return self._index
+
+    def _save_index(self):
+        """Salva o índice de forma atômica"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def object_dir(self, digest: str) -> Path:
+        """
+        Diretório do artefato para um digest
+
+        Args:
+            digest: Digest das entradas do build
+
+        Returns:
+            Caminho do diretório do artefato
+        """
+        return self.objects_dir / digest[:2] / digest
+
+    # ------------------------------------------------------------------
+    # Leitura e escrita
+    # ------------------------------------------------------------------
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém artefato armazenado e atualiza seu último uso
+
+        Args:
+            digest: Digest das entradas do build
+
+        Returns:
+            Entrada do índice com 'path' ou None
+        """
+        entry = self.index['artifacts'].get(digest)
+        if entry is None:
+            return None
+
+        object_dir = self.object_dir(digest)
+        if not object_dir.is_dir():
+            # Objeto removido manualmente: índice se auto-corrige
+            del self.index['artifacts'][digest]
+            self._save_index()
+            return None
+
+        entry['last_used'] = time.time()
+        self._save_index()
+        return dict(entry, digest=digest, path=str(object_dir))
+
+    def find_by_version(self, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém o artefato mais recente de uma versão
+
+        Args:
+            version: Versão da extensão
+
+        Returns:
+            Entrada do índice com 'path' ou None
+        """
+        matches = [(digest, entry) for digest, entry in self.index['artifacts'].items()
+                   if entry.get('version') == version]
+        if not matches:
+            return None
+
+        digest, entry = max(matches, key=lambda item: item[1]['created'])
+        return dict(entry, digest=digest, path=str(self.object_dir(digest)))
+
+    def find_file(self, name: str) -> Optional[Path]:
+        """
+        Obtém um arquivo do artefato mais recente que o contém
+
+        Args:
+            name: Nome do arquivo (ex: help-otrs-v1.0.3.zip, checksums-v1.0.3.txt)
+
+        Returns:
+            Caminho do arquivo no store ou None
+        """
+        matches = [(digest, entry) for digest, entry in self.index['artifacts'].items()
+                   if name in entry.get('files', [])]
+        for digest, _ in sorted(matches, key=lambda item: item[1]['created'], reverse=True):
+            file_path = self.object_dir(digest) / name
+            if file_path.is_file():
+                return file_path
+        return None
+
+    def create_staging_dir(self) -> Path:
+        """
+        Cria diretório temporário para montar um artefato
+
+        Returns:
+            Caminho do diretório de staging
+        """
+        staging_dir = self.root / f".staging-{uuid.uuid4().hex}"
+        staging_dir.mkdir(parents=True)
+        return staging_dir
+
+    def put(self, digest: str, staging_dir: Path, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Publica um artefato montado em staging (rename atômico)
+
+        Args:
+            digest: Digest das entradas do build
+            staging_dir: Diretório com os arquivos do artefato
+            metadata: Informações adicionais (ex: version)
+
+        Returns:
+            Entrada do índice com 'path'
+        """
+        staging_dir = Path(staging_dir)
+        files = sorted(p.name for p in staging_dir.iterdir() if p.is_file())
+        total_bytes = sum((staging_dir / name).stat().st_size for name in files)
+
+        object_dir = self.object_dir(digest)
+        object_dir.parent.mkdir(parents=True, exist_ok=True)
+        if object_dir.exists():
+            shutil.rmtree(object_dir)
+        os.replace(staging_dir, object_dir)
+
+        now = time.time()
+        entry = dict(metadata)
+        entry.update({
+            'files': files,
+            'bytes': total_bytes,
+            'created': now,
+            'last_used': now
+        })
+        self.index['artifacts'][digest] = entry
+        self._save_index()
+
+        return dict(entry, digest=digest, path=str(object_dir))
+
+    def discard_staging(self, staging_dir: Path):
+        """Remove diretório de staging não publicado"""
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Retenção
+    # ------------------------------------------------------------------
+
+    def prune(self, keep_count: Optional[int] = None, max_age_days: Optional[float] = None,
+              max_bytes: Optional[int] = None, protect: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Aplica políticas de retenção usando apenas o índice
+
+        Artefatos são ordenados pelo último uso (mais recente primeiro).
+
+        Args:
+            keep_count: Número máximo de artefatos mantidos
+            max_age_days: Remove artefatos sem uso há mais de N dias
+            max_bytes: Tamanho total máximo do store
+            protect: Digests que nunca são removidos (ex: build atual)
+
+        Returns:
+            Lista de entradas removidas
+        """
+        protect = set(protect or [])
+        now = time.time()
+        entries = sorted(self.index['artifacts'].items(),
+                         key=lambda item: item[1]['last_used'], reverse=True)
+
+        kept_count = 0
+        kept_bytes = 0
+        removed = []
+
+        for digest, entry in entries:
+            expired = max_age_days is not None and (now - entry['last_used']) > max_age_days * 86400
+            over_count = keep_count is not None and kept_count >= keep_count
+            over_bytes = max_bytes is not None and kept_bytes + entry['bytes'] > max_bytes
+
+            if digest not in protect and (expired or over_count or over_bytes):
+                removed.append(dict(entry, digest=digest))
+                continue
+
+            kept_count += 1
+            kept_bytes += entry['bytes']
+
+        for entry in removed:
+            del self.index['artifacts'][entry['digest']]
+            object_dir = self.object_dir(entry['digest'])
+            shutil.rmtree(object_dir, ignore_errors=True)
+            try:
+                object_dir.parent.rmdir()
+            except OSError:
+                pass  # Prefixo ainda contém outros artefatos
+
+        if removed:
+            self._save_index()
+
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém estatísticas do store a partir do índice
+
+        Returns:
+            Dicionário com quantidade e tamanho total
+        """
+        artifacts = self.index['artifacts'].values()
+        return {
+            'artifacts': len(artifacts),
+            'bytes': sum(entry['bytes'] for entry in artifacts)
+        }
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark do fluxo de release contra a API GitHub simulada
+Mede tempo de create_full_release e número de requisições por endpoint
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import contextlib
+import io
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List
+
+from fake_github import FakeGitHubServer
+from release import GitHubReleaseManager
+
+
+# Itens que não fazem parte da entrada do build
+COPY_IGNORE = shutil.ignore_patterns(
+    '.git', '.cache', '.venv', 'venv', 'node_modules', '__pycache__',
+    'dist', 'build', '*.zip', 'build-info-v*.json', 'github-release-v*.json'
+)
+
+
+def prepare_workspace(project_root: Path) -> Path:
+    """
+    Copia o projeto para um diretório temporário
+
+    O release incrementa a versão e gera arquivos, então o benchmark
+    nunca roda sobre a árvore original.
+
+    Args:
+        project_root: Caminho raiz do projeto
+
+    Returns:
+        Caminho da cópia temporária
+    """
+    workspace = Path(tempfile.mkdtemp(prefix='help-otrs-bench-'))
+    shutil.copytree(project_root, workspace / 'project', ignore=COPY_IGNORE)
+    return workspace / 'project'
+
+
+def run_benchmark(iterations: int = 5, latency: float = 0.0, jitter: float = 0.0,
+                  failure_rate: float = 0.0, rate_limit: int = 0, seed: int = 42,
+                  project_root: Path = None) -> Dict[str, Any]:
+    """
+    Executa create_full_release repetidamente contra a API simulada
+
+    Args:
+        iterations: Número de releases a criar
+        latency: Latência fixa por requisição (segundos)
+        jitter: Variação aleatória de latência (segundos)
+        failure_rate: Probabilidade de falha injetada (0-1)
+        rate_limit: Requisições permitidas por janela (0 desativa)
+        seed: Semente para resultados reproduzíveis
+        project_root: Caminho raiz do projeto
+
+    Returns:
+        Dicionário com tempos, requisições e falhas
+    """
+    project_root = Path(project_root or Path(__file__).parent.parent)
+    workspace = prepare_workspace(project_root)
+
+    server = FakeGitHubServer(
+        latency=latency,
+        jitter=jitter,
+        failure_rate=failure_rate,
+        rate_limit=rate_limit,
+        seed=seed
+    )
+
+    runs: List[Dict[str, Any]] = []
+
+    try:
+        with server:
+            manager = GitHubReleaseManager(
+                project_root=workspace,
+                github_token='fake-token',
+                repo_owner='bench',
+                repo_name='help-otrs',
+                api_base=server.url
+            )
+
+            for iteration in range(1, iterations + 1):
+                server.reset_stats()
+                output = io.StringIO()
+
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(output):
+                    result = manager.create_full_release('patch')
+                elapsed = time.perf_counter() - start
+
+                stats = server.get_stats()
+                runs.append({
+                    'iteration': iteration,
+                    'success': result['success'],
+                    'error': result.get('error'),
+                    'seconds': round(elapsed, 4),
+                    'requests': stats['total_requests'],
+                    'by_endpoint': stats['by_endpoint'],
+                    'by_status': stats['by_status']
+                })
+    finally:
+        shutil.rmtree(workspace.parent, ignore_errors=True)
+
+    times = [run['seconds'] for run in runs]
+    requests_per_run = [run['requests'] for run in runs]
+
+    return {
+        'config': {
+            'iterations': iterations,
+            'latency': latency,
+            'jitter': jitter,
+            'failure_rate': failure_rate,
+            'rate_limit': rate_limit,
+            'seed': seed
+        },
+        'runs': runs,
+        'summary': {
+            'successful': sum(1 for run in runs if run['success']),
+            'failed': sum(1 for run in runs if not run['success']),
+            'mean_seconds': round(statistics.mean(times), 4) if times else 0,
+            'median_seconds': round(statistics.median(times), 4) if times else 0,
+            'min_seconds': min(times) if times else 0,
+            'max_seconds': max(times) if times else 0,
+            'mean_requests': round(statistics.mean(requests_per_run), 2) if requests_per_run else 0
+        }
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """
+    Exibe relatório do benchmark
+
+    Args:
+        report: Resultado de run_benchmark
+    """
+    config = report['config']
+    summary = report['summary']
+
+    print("📊 Benchmark de release (API GitHub simulada)")
+    print("━" * 60)
+    print(f"🔁 Iterações: {config['iterations']} | ⏱️ Latência: {config['latency']}s "
+          f"(+{config['jitter']}s) | 💥 Falhas: {config['failure_rate']:.0%} | "
+          f"🚦 Rate limit: {config['rate_limit'] or 'off'}")
+    print("━" * 60)
+
+    for run in report['runs']:
+        status = "✅" if run['success'] else f"❌ {run['error']}"
+        print(f"   #{run['iteration']:<3} {run['seconds']:>8.3f}s  {run['requests']:>4} req  {status}")
+
+    print("━" * 60)
+    print(f"⏱️ Média: {summary['mean_seconds']:.3f}s | Mediana: {summary['median_seconds']:.3f}s | "
+          f"Min: {summary['min_seconds']:.3f}s | Max: {summary['max_seconds']:.3f}s")
+    print(f"🌐 Requisições por release: {summary['mean_requests']}")
+    print(f"📦 Sucesso: {summary['successful']}/{summary['successful'] + summary['failed']}")
+
+    if report['runs']:
+        print("━" * 60)
+        print("🔎 Requisições por endpoint (última iteração):")
+        for endpoint, count in sorted(report['runs'][-1]['by_endpoint'].items()):
+            print(f"   {endpoint:<28} {count}")
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(description='Benchmark do release contra API simulada')
+
+    parser.add_argument('--iterations', '-n', type=int, default=5, help='Número de releases')
+    parser.add_argument('--latency', type=float, default=0.0, help='Latência por requisição (s)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Variação de latência (s)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Probabilidade de 502 (0-1)')
+    parser.add_argument('--rate-limit', type=int, default=0, help='Requisições por janela (0 desativa)')
+    parser.add_argument('--seed', type=int, default=42, help='Semente aleatória')
+    parser.add_argument('--json', dest='json_path', help='Salva relatório completo em JSON')
+
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        iterations=args.iterations,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed
+    )
+
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 Relatório salvo: {args.json_path}")
+
+    # Sem falhas injetadas, qualquer falha é regressão
+    if report['summary']['failed'] and not args.failure_rate and not args.rate_limit:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
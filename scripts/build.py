@@ -7,40 +7,136 @@ Autor: Charllys Fernandes
 Data: 2025-08-12
 """
 
+import hashlib
 import json
 import os
+import re
 import sys
 import shutil
+import time
+import uuid
 import zipfile
+import zlib
 import argparse
+import contextlib
+import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
 from version_bump import VersionBumper
+from build_cache import BuildCache
+from integrity import IntegrityChecker
+from artifact_store import ArtifactStore
+from zip_writer import PrecompressedZipWriter
+from compression import CompressionTuner
+from tenants import TenantConfig
+from codegen import CodeGenerator
+from perf_lint import PerfLinter
+from style_extract import StyleExtractor
+from icons import IconGenerator
+from minify import PageMinifier
+from sourcemap import SourceMap
+from task_graph import TaskGraph
+from build_events import BuildEventLog, RENDERERS
+from file_lock import FileLock
 
 
 class ExtensionBuilder:
     """Classe responsável pelo build e empacotamento da extensão"""
     
-    def __init__(self, project_root: str = None):
+    # Compressão usada no pacote ZIP (nível padrão; os membros são ajustados por arquivo)
+    ZIP_COMPRESSION = zipfile.ZIP_DEFLATED
+    ZIP_COMPRESS_LEVEL = 6
+    
+    # Versão do "formato" do build; alterar invalida os artefatos armazenados
+    BUILD_RECIPE_VERSION = 7
+    
+    # Navegadores suportados (package.json → browserslist); o padrão mantém os nomes sem sufixo
+    BROWSER_TARGETS = ('chrome', 'edge', 'opera', 'firefox')
+    DEFAULT_TARGET = 'chrome'
+    
+    # Firefox: identificador do add-on e primeira versão com suporte a MV3
+    FIREFOX_GECKO_ID = 'help-otrs@helpotrs'  # Pacote genérico; órgãos: TenantConfig.gecko_id
+    FIREFOX_MIN_VERSION = '109.0'
+    
+    # Log de eventos (NDJSON) do último build, na raiz de saída
+    EVENT_LOG_NAME = 'build-events.ndjson'
+    
+    # Build em memória: pacotes acima deste tamanho passam do buffer para arquivo temporário
+    SPOOL_MAX_SIZE = 16 * 1024 * 1024
+    
+    # Política de retenção padrão do store de artefatos
+    DEFAULT_RETENTION = {'keep_count': 5, 'max_age_days': None, 'max_bytes': None}
+    
+    def __init__(self, project_root: str = None, jobs: Optional[int] = None, out_dir: str = None,
+                 compression_budget: Optional[float] = None, progress: str = 'summary'):
         """
         Inicializa o ExtensionBuilder
         
         Args:
             project_root: Caminho raiz do projeto
+            jobs: Tarefas simultâneas do build (padrão: número de CPUs)
+            out_dir: Raiz das saídas (dist/ e build/); padrão: raiz do projeto
+            compression_budget: Segundos de busca do método de compressão por build
+                                (padrão: CompressionTuner.DEFAULT_BUDGET; 0 usa só o nível padrão)
+            progress: Progresso no console: 'quiet', 'summary' ou 'verbose' (uma linha por arquivo)
         """
         if project_root is None:
             self.project_root = Path(__file__).parent.parent
         else:
             self.project_root = Path(project_root)
             
-        self.dist_dir = self.project_root / "dist"
+        # Saídas: dist/ e store de artefatos; o cache (.cache/) é compartilhado entre raízes
+        self.out_dir = Path(out_dir) if out_dir else self.project_root
+        self.dist_dir = self.out_dir / "dist"
+        self._published_dist_dir = self.dist_dir
         self.manifest_path = self.project_root / "manifest.json"
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
         
         # Inicializar VersionBumper
         self.version_bumper = VersionBumper(self.project_root)
         
+        # Cache de digests e tamanhos comprimidos (usado pelo planejamento)
+        self.build_cache = BuildCache(self.project_root / ".cache", repo_root=self.project_root)
+        self._file_digests: Dict[str, str] = {}
+        
+        # Eventos do build (NDJSON) e progresso no console
+        self.events = BuildEventLog(RENDERERS[progress]())
+        
+        # Método de compressão por arquivo (decisões em cache por digest)
+        self.compression_tuner = CompressionTuner(self.ZIP_COMPRESS_LEVEL, compression_budget)
+        self._compression_summary: Optional[Dict[str, any]] = None
+        
+        # Digests SHA-256 em paralelo e verificação de pacotes
+        self.integrity = IntegrityChecker(self.jobs)
+        
+        # Store de artefatos endereçado pelo digest das entradas
+        self.artifact_store = ArtifactStore(self.out_dir / "build")
+        
+        # Pacotes por órgão (tenants.json)
+        self.tenant_config = TenantConfig(self.project_root / "tenants.json")
+        
+        # Módulos JS gerados em tempo de build (src/generated/)
+        self.codegen = CodeGenerator(self.project_root, self.tenant_config)
+        
+        # Lint de desempenho dos scripts empacotados
+        self.perf_linter = PerfLinter(self.project_root)
+        
+        # CSS injetado pelos scripts → content_scripts.css do dist/
+        self.style_extractor = StyleExtractor()
+        
+        # Ícones redimensionados por tamanho declarado (cache por digest da origem)
+        self.icon_generator = IconGenerator(self.build_cache)
+        
+        # HTML/CSS das páginas da extensão (opções)
+        self.page_minifier = PageMinifier()
+        
+        # Arquivos JS/CSS transformados no dist/ → origem no projeto (para os source maps)
+        self._map_sources: Dict[str, str] = {}
+        
     def get_current_version(self) -> str:
         """
         Obtém versão atual do manifest.json
@@ -149,11 +245,19 @@ class ExtensionBuilder:
         if self.dist_dir.exists():
             shutil.rmtree(self.dist_dir)
         self.dist_dir.mkdir(parents=True, exist_ok=True)
+        self._map_sources = {}
+        self.events.emit('dist.created', path=str(self.dist_dir))
+        
+        sources = {file_path.relative_to(self.project_root).as_posix(): file_path for file_path in files}
+        
+        # Digests SHA-256 em paralelo (reaproveitando arquivos inalterados)
+        if not sources.keys() <= self._file_digests.keys():
+            self._file_digests = self.integrity.compute_digests(sources, self.build_cache)
         
         file_info = []
         total_size = 0
         
-        for file_path in files:
+        for posix_path, file_path in sources.items():
             # Calcular caminho relativo
             relative_path = file_path.relative_to(self.project_root)
             dest_path = self.dist_dir / relative_path
@@ -166,19 +270,22 @@ class ExtensionBuilder:
             
             # Coletar informações
             file_stats = file_path.stat()
-            size_kb = file_stats.st_size / 1024
             total_size += file_stats.st_size
             
-            file_info.append({
+            entry = {
                 'name': str(relative_path),
                 'size': file_stats.st_size,
-                'size_kb': round(size_kb, 2),
-                'modified': datetime.fromtimestamp(file_stats.st_mtime).isoformat()
-            })
+                'size_kb': round(file_stats.st_size / 1024, 2),
+                'modified': datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
+                'sha256': self._file_digests[posix_path]
+            }
+            file_info.append(entry)
             
-            print(f"   📄 {relative_path} ({size_kb:.2f} KB)")
+            # Uma linha por arquivo só no nível verbose
+            self.events.emit('file.copied', path=posix_path, **entry)
         
         print(f"📊 Total: {len(files)} arquivos ({total_size/1024:.2f} KB)")
+        print(f"🔐 SHA-256 calculado para {len(self._file_digests)} arquivos")
         
         return {
             'files': file_info,
@@ -188,36 +295,485 @@ class ExtensionBuilder:
             'total_size_mb': round(total_size / (1024 * 1024), 2)
         }
     
-    def create_zip_package(self, version: str, file_info: Dict[str, any]) -> Tuple[Path, Dict[str, any]]:
+    def extract_styles(self, result: Optional[Dict[str, any]] = None) -> Dict[str, any]:
         """
-        Cria pacote ZIP da extensão
+        Move o CSS injetado em tempo de execução para folhas estáticas do dist/
+        
+        Os scripts do dist/ deixam de montar e injetar <style> a cada página; as
+        folhas minificadas entram em content_scripts.css do manifest.json.
+        
+        Args:
+            result: Resultado de StyleExtractor.apply já executado (tarefa do grafo)
+            
+        Returns:
+            Resumo da extração (os arquivos alterados vão para o fluxo de eventos)
+        """
+        if result is None:
+            result = self.style_extractor.apply(self.dist_dir)
+        
+        for name, data in result['changed'].items():
+            self._record_change(name, data, 'styles')
+            self._track_transformed(name)
+        
+        for style in result['styles']:
+            self._map_sources[style['output']] = style['script']
+            print(f"🎨 Estilos de {style['script']} → {style['output']} "
+                  f"({style['original_css_bytes']} → {style['css_bytes']} bytes)")
+        for skipped in result['skipped']:
+            print(f"⚠️ Estilos mantidos em {skipped['script']}: {skipped['reason']}")
+        
+        summary = {
+            'files': [style['output'] for style in result['styles']],
+            'css_bytes': sum(style['css_bytes'] for style in result['styles']),
+            'js_bytes_saved': result['js_bytes_saved'],
+            'skipped': result['skipped']
+        }
+        return summary
+    
+    def generate_icons(self, result: Optional[Dict[str, any]] = None) -> Dict[str, any]:
+        """
+        Gera um PNG otimizado para cada tamanho de ícone do manifest.json do dist/
+        
+        Args:
+            result: Resultado de IconGenerator.apply já executado (tarefa do grafo)
+            
+        Returns:
+            Resumo com os bytes acrescentados ao pacote (os arquivos alterados vão para o fluxo de eventos)
+        """
+        if result is None:
+            result = self.icon_generator.apply(self.dist_dir)
+        
+        for name, data in result['changed'].items():
+            self._record_change(name, data, 'icons')
+        
+        for output, icon in result['icons'].items():
+            width, height = icon['actual_size']
+            print(f"🖼️ Ícone {output}: {width}x{height}px, {icon['bytes']} bytes")
+        for kept in result['kept']:
+            print(f"↩️ Slot {kept['size']}px mantido em {kept['path']} (origem de {max(kept['actual_size'])}px)")
+        for skipped in result['skipped']:
+            print(f"⚠️ Ícone mantido {skipped['path']} ({skipped['size']}px): {skipped['reason']}")
+        if result['icons']:
+            print(f"📦 Ícones: {result['package_delta']:+} bytes no pacote (as origens continuam nele)")
+        
+        summary = {
+            'files': result['icons'],
+            'kept': result['kept'],
+            'icon_bytes': result['icon_bytes'],
+            'package_delta': result['package_delta'],
+            'skipped': result['skipped']
+        }
+        return summary
+    
+    def minify_pages(self, result: Optional[Dict[str, any]] = None) -> Dict[str, any]:
+        """
+        Minifica o HTML das páginas da extensão e poda/minifica as folhas que elas carregam
+        
+        Args:
+            result: Resultado de PageMinifier.apply já executado (tarefa do grafo)
+            
+        Returns:
+            Tamanhos antes/depois e seletores removidos (os arquivos alterados vão para o fluxo de eventos)
+        """
+        if result is None:
+            result = self.page_minifier.apply(self.dist_dir)
+        
+        for name, data in result['changed'].items():
+            self._record_change(name, data, 'minify')
+            self._track_transformed(name)
+        
+        for name, sizes in result['files'].items():
+            removed = len(result['removed_selectors'].get(name, []))
+            note = f", {removed} seletores sem uso removidos" if removed else ''
+            print(f"🗜️ Minificado {name}: {sizes['before']} → {sizes['after']} bytes{note}")
+        
+        summary = {k: v for k, v in result.items() if k != 'changed'}
+        return summary
+    
+    def _record_change(self, name: str, data: bytes, stage: str):
+        """Registra um arquivo gravado no dist/ por uma transformação (digest e evento 'file.changed')"""
+        digest = hashlib.sha256(data).hexdigest()
+        self._file_digests[name] = digest
+        self.events.emit('file.changed', path=name, name=str(Path(name)), size=len(data), sha256=digest,
+                         modified=datetime.now().isoformat(), stage=stage)
+    
+    def _track_transformed(self, name: str):
+        """Registra um JS/CSS alterado no dist/ cuja origem é o arquivo de mesmo caminho"""
+        if Path(name).suffix in ('.js', '.css') and (self.project_root / name).is_file():
+            self._map_sources.setdefault(name, name)
+    
+    def write_source_maps(self, version: str, output_dir: Optional[Path] = None) -> Optional[Dict[str, any]]:
+        """
+        Gera source maps v3 dos arquivos transformados em um ZIP separado do pacote
+        
+        Os mapas não entram no ZIP da extensão (nem há sourceMappingURL nos
+        arquivos); ficam em sourcemaps-v<versão>.zip, publicado no release e usado
+        por scripts/symbolicate.py.
+        
+        Args:
+            version: Versão da extensão
+            output_dir: Diretório de saída (padrão: raiz de saída, --out)
+            
+        Returns:
+            Resumo com o caminho e os mapas gerados, ou None sem arquivos transformados
+        """
+        if not self._map_sources:
+            return None
+        
+        maps_name = f"sourcemaps-v{version}.zip"
+        maps_path = Path(output_dir or self.out_dir) / maps_name
+        files = self._write_source_map_archive(maps_path)
+        
+        print(f"🗺️ Source maps: {maps_name} ({len(files)} arquivos)")
+        return {'name': maps_name, 'path': str(maps_path), 'files': files}
+    
+    def _write_source_map_archive(self, target) -> Dict[str, Dict[str, any]]:
+        """
+        Grava o ZIP de source maps (caminho ou arquivo binário aberto)
+        
+        Returns:
+            Mapa arquivo do pacote → {'source', 'map_bytes'}
+        """
+        files = {}
+        with zipfile.ZipFile(target, 'w', self.ZIP_COMPRESSION, compresslevel=self.ZIP_COMPRESS_LEVEL) as archive:
+            for name, source in sorted(self._map_sources.items()):
+                generated = (self.dist_dir / name).read_text(encoding='utf-8')
+                original = (self.project_root / source).read_text(encoding='utf-8')
+                # Origem relativa ao próprio mapa, como prevê o formato
+                relative_source = os.path.relpath(source, os.path.dirname(name) or '.').replace(os.sep, '/')
+                source_map = self._source_map(Path(name).name, generated, original, relative_source)
+                data = json.dumps(source_map.to_dict(), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+                archive.writestr(zipfile.ZipInfo(f"{name}.map", date_time=(1980, 1, 1, 0, 0, 0)), data)
+                files[name] = {'source': source, 'map_bytes': len(data)}
+        return files
+    
+    def _source_map(self, file: str, generated: str, original: str, source_name: str) -> SourceMap:
+        """
+        Source map de um arquivo, reaproveitando os mapeamentos do cache
+        
+        Os mapeamentos dependem só do par (conteúdo original, conteúdo gerado):
+        ficam no cache por esses dois digests, e nome e origem são preenchidos
+        a cada build.
+        
+        Returns:
+            SourceMap do arquivo
+        """
+        key = (f"{hashlib.sha256(generated.encode('utf-8')).hexdigest()}-"
+               f"{hashlib.sha256(original.encode('utf-8')).hexdigest()}-v{SourceMap.ALIGNMENT_VERSION}")
+        cached = self.build_cache.get_blob('sourcemaps', key)
+        if cached is not None:
+            return SourceMap.from_dict({'version': 3, 'file': file, 'sources': [source_name],
+                                        'sourcesContent': [original], 'mappings': cached.decode('utf-8')})
+        
+        source_map = SourceMap.from_alignment(file, generated, original, source_name)
+        self.build_cache.put_blob('sourcemaps', key, source_map.to_dict()['mappings'].encode('utf-8'))
+        return source_map
+    
+    def create_zip_package(self, version: str, file_info: Dict[str, any],
+                           output_dir: Optional[Path] = None) -> Tuple[Path, Dict[str, any]]:
+        """
+        Cria pacote ZIP da extensão (alvo padrão)
         
         Args:
             version: Versão da extensão
             file_info: Informações dos arquivos
+            output_dir: Diretório de saída (padrão: raiz de saída, --out)
             
         Returns:
             Tupla (caminho_zip, informações_zip)
         """
         print("🗜️ Criando arquivo ZIP...")
         
-        zip_name = f"help-otrs-v{version}.zip"
-        zip_path = self.project_root / zip_name
+        members = self._collect_zip_members()
+        compressed = self._compress_members(members)
+        zip_path, zip_info = self._write_package(version, members, compressed, file_info['total_size'],
+                                                 output_dir)
+        
+        print(f"✅ Pacote criado: {zip_info['name']}")
+        print(f"📊 Tamanho: {zip_info['size_kb']} KB ({zip_info['size_mb']} MB)")
+        print(f"📐 Compressão: {zip_info['compression_ratio']}%")
+        
+        return zip_path, zip_info
+    
+    def create_target_packages(self, version: str, file_info: Dict[str, any], targets: List[str],
+                               output_dir: Optional[Path] = None,
+                               tenants: Optional[List[str]] = None) -> Dict[str, Dict[str, any]]:
+        """
+        Cria os pacotes de vários navegadores (e órgãos) em paralelo
+        
+        Descoberta, digests e compressão dos membros são feitos uma única vez;
+        cada variante só transforma e comprime o próprio manifest.json (e, nos
+        pacotes por órgão, a configuração padrão pré-compilada).
+        
+        Args:
+            version: Versão da extensão
+            file_info: Informações dos arquivos (do dist/)
+            targets: Alvos (ex: ['chrome', 'firefox'])
+            output_dir: Diretório de saída (padrão: raiz de saída, --out)
+            tenants: Órgãos de tenants.json (além do pacote genérico)
+            
+        Returns:
+            Mapa variante → {zip_path, zip_info, checksums_path, file_info, timings, target, tenant}
+        """
+        variants = [(None, target) for target in targets]
+        variants += [(tenant, target) for tenant in tenants or [] for target in targets]
+        
+        print(f"🗜️ Criando pacotes: {', '.join(self._variant_id(*variant) for variant in variants)}...")
+        
+        start = time.perf_counter()
+        members = self._collect_zip_members()
+        compressed = self._compress_members(members)
+        manifest = self.version_bumper.load_json_file(self.dist_dir / 'manifest.json')
+        shared_seconds = round(time.perf_counter() - start, 4)
+        
+        def package(variant: Tuple[Optional[str], str]) -> Tuple[str, Dict[str, any]]:
+            variant_start = time.perf_counter()
+            tenant, target = variant
+            variant_id = self._variant_id(tenant, target)
+            overrides, variant_file_info = self._variant_overrides(manifest, file_info, tenant, target)
+            
+            zip_path, zip_info = self._write_package(version, members, compressed,
+                                                     variant_file_info['total_size'], output_dir,
+                                                     self._target_suffix(variant_id), overrides)
+            checksums_path = self.write_checksums(version, variant_file_info, output_dir, variant_id,
+                                                  verbose=False)
+            
+            return variant_id, {
+                'target': target,
+                'tenant': tenant,
+                'zip_path': zip_path,
+                'zip_info': zip_info,
+                'checksums_path': checksums_path,
+                'file_info': variant_file_info,
+                'timings': {
+                    'shared_seconds': shared_seconds,
+                    'package_seconds': round(time.perf_counter() - variant_start, 4)
+                }
+            }
+        
+        with ThreadPoolExecutor(max_workers=min(len(variants), self.jobs)) as executor:
+            packages = dict(executor.map(package, variants))
+        
+        for variant_id, package_info in packages.items():
+            zip_info = package_info['zip_info']
+            self.events.emit('package.written', variant=variant_id, name=zip_info['name'], size=zip_info['size'],
+                             sha256=zip_info['sha256'])
+            print(f"   ✅ {variant_id:<14} {zip_info['name']} ({zip_info['size_kb']} KB, "
+                  f"compressão {zip_info['compression_ratio']}%) "
+                  f"em {package_info['timings']['package_seconds']:.3f}s")
+        
+        return packages
+    
+    def _variant_overrides(self, manifest: Dict[str, any], file_info: Dict[str, any], tenant: Optional[str],
+                           target: str) -> Tuple[Dict[str, bytes], Dict[str, any]]:
+        """
+        Arquivos que uma variante troca no pacote (manifest.json e configuração do órgão)
+        
+        Returns:
+            Tupla (caminho → conteúdo substituto, file_info da variante)
+        """
+        overrides = {}
+        variant_manifest = manifest
+        if tenant:
+            variant_manifest = self.tenant_config.transform_manifest(variant_manifest, tenant)
+            overrides[TenantConfig.DEFAULT_CONFIG_PATH] = self.tenant_config.render_default_config(
+                tenant, manifest.get('version'))
+        variant_manifest = self.transform_manifest(variant_manifest, target, tenant) or variant_manifest
+        if variant_manifest is not manifest:
+            overrides['manifest.json'] = json.dumps(variant_manifest, indent=4,
+                                                    ensure_ascii=False).encode('utf-8')
+        
+        variant_file_info = file_info
+        for name, data in overrides.items():
+            variant_file_info = self._replace_file_entry(variant_file_info, name, data)
+        return overrides, variant_file_info
+    
+    def transform_manifest(self, manifest: Dict[str, any], target: str,
+                           tenant: Optional[str] = None) -> Optional[Dict[str, any]]:
+        """
+        Adapta o manifest.json para um navegador
+        
+        Chrome, Edge e Opera usam o manifest original. O Firefox (MV3) não
+        suporta service worker em background nem version_name, e exige
+        browser_specific_settings.gecko (com ID próprio por órgão).
+        
+        Args:
+            manifest: Manifest original
+            target: Alvo (chrome, edge, opera, firefox)
+            tenant: Órgão do pacote (None: pacote genérico)
+            
+        Returns:
+            Manifest transformado ou None se o original serve
+        """
+        if target not in self.BROWSER_TARGETS:
+            raise ValueError(f"Alvo desconhecido: {target}")
         
-        # Remover ZIP existente
-        if zip_path.exists():
-            zip_path.unlink()
+        if target != 'firefox':
+            return None
         
-        # Criar ZIP
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
-            # Adicionar todos os arquivos do dist
-            for file_path in self.dist_dir.rglob('*'):
-                if file_path.is_file():
-                    # Caminho relativo dentro do ZIP
-                    arc_path = file_path.relative_to(self.dist_dir)
-                    zf.write(file_path, arc_path)
+        firefox_manifest = dict(manifest)
+        firefox_manifest.pop('version_name', None)
+        
+        # Sem service worker não há importScripts: a configuração pré-compilada
+        # é carregada como script de background antes do background.js
+        background = firefox_manifest.get('background', {})
+        if 'service_worker' in background:
+            firefox_manifest['background'] = {
+                'scripts': [TenantConfig.DEFAULT_CONFIG_PATH, background['service_worker']]
+            }
+        
+        firefox_manifest['browser_specific_settings'] = {
+            'gecko': {
+                'id': self.tenant_config.gecko_id(tenant) if tenant else self.FIREFOX_GECKO_ID,
+                'strict_min_version': self.FIREFOX_MIN_VERSION
+            }
+        }
+        
+        return firefox_manifest
+    
+    def _variant_id(self, tenant: Optional[str], target: str) -> str:
+        """Identificador da variante (ex: chrome, firefox, mapa, mapa-firefox)"""
+        parts = [tenant.lower()] if tenant else []
+        if target != self.DEFAULT_TARGET or not parts:
+            parts.append(target)
+        return '-'.join(parts)
+    
+    def _target_suffix(self, target: Optional[str]) -> str:
+        """Sufixo dos artefatos de uma variante (vazio para o alvo padrão)"""
+        return '' if target in (None, self.DEFAULT_TARGET) else f"-{target}"
+    
+    @staticmethod
+    def _replace_file_entry(file_info: Dict[str, any], name: str, data: bytes) -> Dict[str, any]:
+        """
+        Copia file_info substituindo tamanho e digest de um arquivo (ou adicionando-o)
+        
+        Args:
+            file_info: Informações dos arquivos
+            name: Caminho relativo do arquivo substituído
+            data: Novo conteúdo
+            
+        Returns:
+            Novo dicionário de informações dos arquivos
+        """
+        files = []
+        total_size = 0
+        replaced = False
+        for entry in file_info['files']:
+            if Path(entry['name']).as_posix() == name:
+                entry = dict(entry, size=len(data), size_kb=round(len(data) / 1024, 2),
+                             sha256=hashlib.sha256(data).hexdigest())
+                replaced = True
+            files.append(entry)
+            total_size += entry['size']
+        if not replaced:
+            files.append({
+                'name': str(Path(name)),
+                'size': len(data),
+                'size_kb': round(len(data) / 1024, 2),
+                'modified': datetime.now().isoformat(),
+                'sha256': hashlib.sha256(data).hexdigest()
+            })
+            total_size += len(data)
+        
+        return dict(file_info, files=files, total_files=len(files), total_size=total_size,
+                    total_size_kb=round(total_size / 1024, 2),
+                    total_size_mb=round(total_size / (1024 * 1024), 2))
+    
+    def _collect_zip_members(self) -> List[Tuple[str, Path, str]]:
+        """
+        Lista os arquivos do dist/ com seus digests
+        
+        Returns:
+            Lista de (caminho_no_zip, caminho_absoluto, sha256)
+        """
+        members = []
+        for file_path in self.dist_dir.rglob('*'):
+            if file_path.is_file():
+                arc_path = file_path.relative_to(self.dist_dir).as_posix()
+                digest = self._file_digests.get(arc_path) or self.integrity.sha256_file(file_path)
+                members.append((arc_path, file_path, digest))
+        return members
+    
+    def _compress_members(self, members: List[Tuple[str, Path, str]]) -> Dict[str, Tuple[bytes, int, str]]:
+        """
+        Obtém os membros comprimidos, reaproveitando o cache por conteúdo
+        
+        Cada conteúdo novo passa pela escolha do método (stored ou deflate 1–9,
+        o menor vence) dentro do orçamento do build; a decisão fica no cache
+        pelo digest, então builds seguintes não repetem a busca. Conteúdos cuja
+        busca não terminou no orçamento usam o melhor método testado e voltam
+        a ser avaliados no próximo build.
+        
+        Args:
+            members: Resultado de _collect_zip_members
+            
+        Returns:
+            Mapa sha256 → (dados_comprimidos, crc32, método)
+        """
+        compressed = {}
+        pending = {}
+        for arc_path, file_path, digest in members:
+            if digest in compressed or digest in pending:
+                continue
+            method = self.build_cache.get_strategy(digest)
+            cached = self.build_cache.get_member(digest, method) if method else None
+            if cached:
+                compressed[digest] = cached + (method,)
+            else:
+                pending[digest] = (file_path, digest, method)
+        
+        if pending:
+            self.compression_tuner.start()
+            # zlib libera o GIL: membros novos são comprimidos em paralelo
+            with ThreadPoolExecutor(max_workers=self.integrity.max_workers) as executor:
+                for digest, method, data, crc, sizes, complete in executor.map(
+                        lambda item: self._tune_file(*item), pending.values()):
+                    self.build_cache.put_member(digest, method, data, crc)
+                    for tried, size in sizes.items():
+                        self.build_cache.set_compressed_size(digest, tried, size)
+                    if complete:
+                        self.build_cache.set_strategy(digest, method)
+                    compressed[digest] = (data, crc, method)
+        
+        for arc_path, file_path, digest in members:
+            data, _, method = compressed[digest]
+            self.events.emit('file.compressed', path=arc_path, method=method, size=file_path.stat().st_size,
+                             compressed_size=len(data), cached=digest not in pending)
+        
+        self.build_cache.save()
+        self._compression_summary = self._summarize_compression(compressed)
+        reused = sum(1 for _, _, digest in members if digest not in pending)
+        print(f"♻️ Membros reaproveitados do cache: {reused}/{len(members)}")
+        methods = ', '.join(f"{method} {count}" for method, count in self._compression_summary['methods'].items())
+        print(f"🎛️ Compressão por arquivo: {methods} ({self._compression_summary['saved_bytes']:,} bytes "
+              f"a menos que {self._compression_method_key()})")
+        
+        return compressed
+    
+    def _write_package(self, version: str, members: List[Tuple[str, Path, str]],
+                       compressed: Dict[str, Tuple[bytes, int]], total_size: int,
+                       output_dir: Optional[Path] = None, suffix: str = '',
+                       overrides: Optional[Dict[str, bytes]] = None) -> Tuple[Path, Dict[str, any]]:
+        """
+        Monta um ZIP a partir dos membros já comprimidos
+        
+        Args:
+            version: Versão da extensão
+            members: Resultado de _collect_zip_members
+            compressed: Resultado de _compress_members
+            total_size: Tamanho descomprimido do pacote
+            output_dir: Diretório de saída (padrão: raiz de saída, --out)
+            suffix: Sufixo do nome do pacote (ex: '-firefox')
+            overrides: Conteúdo substituto por caminho (ex: manifest.json)
+            
+        Returns:
+            Tupla (caminho_zip, informações_zip)
+        """
+        zip_name = f"help-otrs-v{version}{suffix}.zip"
+        zip_path = Path(output_dir or self.out_dir) / zip_name
+        
+        self._write_members(zip_path, members, compressed, overrides)
         
-        # Obter informações do ZIP
         zip_stats = zip_path.stat()
         zip_info = {
             'name': zip_name,
@@ -225,18 +781,272 @@ class ExtensionBuilder:
             'size': zip_stats.st_size,
             'size_kb': round(zip_stats.st_size / 1024, 2),
             'size_mb': round(zip_stats.st_size / (1024 * 1024), 2),
-            'compression_ratio': round((1 - zip_stats.st_size / file_info['total_size']) * 100, 1),
-            'created': datetime.fromtimestamp(zip_stats.st_ctime).isoformat()
+            'compression_ratio': round((1 - zip_stats.st_size / total_size) * 100, 1),
+            'created': datetime.fromtimestamp(zip_stats.st_ctime).isoformat(),
+            'sha256': self.integrity.sha256_file(zip_path)
         }
         
-        print(f"✅ Pacote criado: {zip_name}")
-        print(f"📊 Tamanho: {zip_info['size_kb']} KB ({zip_info['size_mb']} MB)")
-        print(f"📐 Compressão: {zip_info['compression_ratio']}%")
-        
         return zip_path, zip_info
     
+    def _write_members(self, target, members: List[Tuple[str, Path, str]],
+                       compressed: Dict[str, Tuple[bytes, int]], overrides: Optional[Dict[str, bytes]] = None):
+        """
+        Grava os membros já comprimidos em um ZIP
+        
+        Args:
+            target: Caminho do ZIP ou arquivo binário aberto
+            members: Resultado de _collect_zip_members
+            compressed: Resultado de _compress_members
+            overrides: Conteúdo substituto por caminho (ex: manifest.json)
+        """
+        with PrecompressedZipWriter(target) as writer:
+            for arc_path, file_path, digest in members:
+                file_stats = file_path.stat()
+                if overrides and arc_path in overrides:
+                    # Arquivos pequenos da variante (manifest, configuração): busca completa, sem cache
+                    content = overrides[arc_path]
+                    method, data, _, _ = self.compression_tuner.tune(content, exhaustive=True)
+                    crc, size = zlib.crc32(content), len(content)
+                else:
+                    (data, crc, method), size = compressed[digest], file_stats.st_size
+                writer.add_compressed(
+                    arc_path, data, crc, size,
+                    date_time=time.localtime(file_stats.st_mtime)[:6],
+                    mode=file_stats.st_mode,
+                    compress_type=CompressionTuner.compress_type(method)
+                )
+    
+    def _tune_file(self, file_path: Path, digest: str,
+                   method: Optional[str] = None) -> Tuple[str, str, bytes, int, Dict[str, int], bool]:
+        """
+        Comprime um arquivo com o menor método encontrado (ou com o já escolhido)
+        
+        Args:
+            file_path: Caminho do arquivo
+            digest: SHA-256 do conteúdo
+            method: Método escolhido em um build anterior (pula a busca)
+            
+        Returns:
+            Tupla (digest, método, dados_comprimidos, crc32, tamanhos por método testado, busca_completa)
+        """
+        content = file_path.read_bytes()
+        if method:
+            data = CompressionTuner.compress(content, method)
+            return digest, method, data, zlib.crc32(content), {method: len(data)}, True
+        method, data, sizes, complete = self.compression_tuner.tune(content)
+        return digest, method, data, zlib.crc32(content), sizes, complete
+    
+    def _summarize_compression(self, compressed: Dict[str, Tuple[bytes, int, str]]) -> Dict[str, any]:
+        """
+        Resumo dos métodos escolhidos (build-info: 'compression')
+        
+        Returns:
+            {'default', 'budget_seconds', 'methods': {método: arquivos}, 'saved_bytes'}
+            (economia frente ao nível padrão, onde o tamanho padrão é conhecido)
+        """
+        default_method = self._compression_method_key()
+        methods: Dict[str, int] = {}
+        saved = 0
+        for digest, (data, _, method) in compressed.items():
+            methods[method] = methods.get(method, 0) + 1
+            default_size = self.build_cache.get_compressed_size(digest, default_method)
+            if default_size is not None and method != default_method:
+                saved += default_size - len(data)
+        return {
+            'default': default_method,
+            'budget_seconds': self.compression_tuner.budget,
+            'methods': dict(sorted(methods.items())),
+            'saved_bytes': saved
+        }
+    
+    def write_checksums(self, version: str, file_info: Dict[str, any],
+                        output_dir: Optional[Path] = None, target: Optional[str] = None,
+                        verbose: bool = True) -> Path:
+        """
+        Grava manifesto SHA-256 dos arquivos empacotados ao lado do ZIP
+        
+        Args:
+            version: Versão da extensão
+            file_info: Informações dos arquivos (com digests)
+            output_dir: Diretório de saída (padrão: raiz de saída, --out)
+            target: Navegador alvo (padrão: chrome)
+            verbose: Se deve exibir o arquivo gerado
+            
+        Returns:
+            Caminho do arquivo de checksums
+        """
+        checksums_name = f"checksums-v{version}{self._target_suffix(target)}.txt"
+        checksums_path = Path(output_dir or self.out_dir) / checksums_name
+        digests = {
+            Path(entry['name']).as_posix(): entry['sha256']
+            for entry in file_info['files']
+        }
+        self.integrity.write_checksums(checksums_path, digests)
+        
+        if verbose:
+            print(f"🔐 Checksums salvos: {checksums_path.name}")
+        
+        return checksums_path
+    
+    def verify_package(self, target: Path, manifest_path: Optional[Path] = None) -> Dict[str, any]:
+        """
+        Verifica um ZIP ou diretório descompactado contra o manifesto SHA-256
+        
+        Nomes que não existem no disco são procurados no store de artefatos:
+        'help-otrs-v1.0.3.zip', a versão ('1.0.3' ou 'v1.0.3', pacote principal)
+        ou 'checksums-v1.0.3.txt' no manifesto.
+        
+        Args:
+            target: ZIP (help-otrs-vX.zip), versão ou diretório (ex: dist/)
+            manifest_path: checksums-vX.txt ou build-info-vX.json
+                           (padrão: checksums da versão do alvo)
+            
+        Returns:
+            Resultado da verificação
+        """
+        target = Path(target)
+        if not target.exists():
+            name = target.name
+            if re.fullmatch(r'v?\d+\.\d+\.\d+', name):
+                name = f"help-otrs-v{name.lstrip('v')}.zip"
+            target = self.artifact_store.find_file(name) or target
+        if not target.exists():
+            raise FileNotFoundError(f"Alvo não encontrado: {target} (nem no store de artefatos)")
+        if manifest_path is not None and not Path(manifest_path).exists():
+            manifest_path = self.artifact_store.find_file(Path(manifest_path).name) or manifest_path
+        
+        is_zip = target.is_file() and zipfile.is_zipfile(target)
+        
+        if manifest_path is None:
+            # Versão a partir do manifest.json contido no alvo
+            suffix = ''
+            if is_zip:
+                with zipfile.ZipFile(target) as zf:
+                    version = json.loads(zf.read('manifest.json').decode('utf-8'))['version']
+                search_dir = target.parent
+                # Pacotes de outros navegadores: help-otrs-vX-<alvo>.zip
+                prefix = f"help-otrs-v{version}"
+                if target.stem.startswith(prefix):
+                    suffix = target.stem[len(prefix):]
+            else:
+                version = self.version_bumper.load_json_file(target / 'manifest.json')['version']
+                artifact = self.artifact_store.find_by_version(version)
+                search_dir = Path(artifact['path']) if artifact else self.project_root
+            manifest_path = search_dir / f"checksums-v{version}{suffix}.txt"
+        
+        if not Path(manifest_path).exists():
+            raise FileNotFoundError(f"Manifesto não encontrado: {manifest_path}")
+        
+        print(f"🔍 Verificando {target.name} contra {Path(manifest_path).name}...")
+        if self.artifact_store.objects_dir in target.parents:
+            print(f"🗄️ Store: {target.parent}")
+        
+        expected = self.integrity.load_manifest(manifest_path)
+        if is_zip:
+            result = self.integrity.verify_zip(target, expected)
+        else:
+            result = self.integrity.verify_directory(target, expected)
+        
+        for path in result['mismatched']:
+            print(f"   ❌ Digest divergente: {path}")
+        for path in result['missing']:
+            print(f"   ❌ Ausente: {path}")
+        for path in result['unexpected']:
+            print(f"   ⚠️ Não listado no manifesto: {path}")
+        
+        if result['valid']:
+            print(f"✅ Integridade OK ({result['ok']}/{result['checked']} arquivos)")
+        else:
+            print(f"❌ Integridade comprometida ({result['ok']}/{result['checked']} arquivos OK)")
+        
+        return result
+    
+    def _compression_method_key(self) -> str:
+        """Identificador do método de compressão padrão usado no cache"""
+        return self.compression_tuner.default_method
+    
+    def plan_build(self, version_type: str = 'patch') -> Dict[str, any]:
+        """
+        Planeja o build inteiramente em memória, sem escrever nenhum arquivo
+        
+        Calcula a próxima versão e monta o pacote com o mesmo pipeline do build
+        (módulos gerados, extração de estilos, ícones, minificação e método de
+        compressão por arquivo, com as decisões em cache) via build_in_memory.
+        Só o manifest.json difere: o planejado (com a nova versão) substitui o
+        atual na tabela de arquivos e no tamanho do ZIP.
+        
+        Args:
+            version_type: Tipo de incremento de versão
+            
+        Returns:
+            Dicionário no mesmo formato de build_extension (com 'dry_run': True)
+        """
+        start = time.perf_counter()
+        
+        # Versão planejada (como bump_version a calcularia)
+        manifest = self.version_bumper.load_json_file(self.manifest_path)
+        version_info = self.version_bumper.preview_version(version_type, manifest)
+        new_version = version_info['version']
+        
+        built = self.build_in_memory(source_maps=False)  # O plano não publica mapas
+        if not built['success']:
+            raise ValueError(built['error'])
+        
+        # Troca o membro manifest.json (já com estilos e ícones) pelo da nova versão;
+        # os cabeçalhos do ZIP não mudam
+        with zipfile.ZipFile(io.BytesIO(built['zip_data'])) as archive:
+            current_size = archive.getinfo('manifest.json').compress_size
+            planned_manifest = json.loads(archive.read('manifest.json'))
+        planned_manifest['version'] = new_version
+        planned_manifest['version_name'] = f"{new_version} - {version_info['description']}"
+        manifest_bytes = json.dumps(planned_manifest, indent=4, ensure_ascii=False).encode('utf-8')
+        _, planned_data, _, _ = self.compression_tuner.tune(manifest_bytes, exhaustive=True)
+        zip_size = built['zip_info']['size'] - current_size + len(planned_data)
+        
+        file_info = self._replace_file_entry(built['file_info'], 'manifest.json', manifest_bytes)
+        total_size = file_info['total_size']
+        compression = self.events.summary()['compression']
+        cache_hits = sum(method['cached'] for method in compression.values())
+        members = sum(method['files'] for method in compression.values())
+        
+        zip_name = f"help-otrs-v{new_version}.zip"
+        zip_info = {
+            'name': zip_name,
+            'path': str(self.out_dir / zip_name),
+            'size': zip_size,
+            'size_kb': round(zip_size / 1024, 2),
+            'size_mb': round(zip_size / (1024 * 1024), 2),
+            'compression_ratio': round((1 - zip_size / total_size) * 100, 1) if total_size else 0,
+            'estimated': True
+        }
+        
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        
+        print(f"🧪 Plano de build: v{version_info['previous_version']} → v{new_version}")
+        print(f"📊 Arquivos: {file_info['total_files']} ({file_info['total_size_kb']:.2f} KB)")
+        print(f"🗜️ ZIP estimado: {zip_info['size_kb']} KB (compressão: {zip_info['compression_ratio']}%)")
+        print(f"⚡ Cache: {cache_hits}/{members} membros | {elapsed_ms} ms | nenhum arquivo escrito")
+        
+        return {
+            'success': True,
+            'dry_run': True,
+            'version': new_version,
+            'version_info': version_info,
+            'zip_file': zip_info['path'],
+            'zip_info': zip_info,
+            'file_info': file_info,
+            'compression': built['targets'][self.DEFAULT_TARGET]['build_info']['compression'],
+            'plan': {
+                'cache_hits': cache_hits,
+                'cache_misses': members - cache_hits,
+                'elapsed_ms': elapsed_ms
+            }
+        }
+    
     def generate_build_info(self, version: str, version_type: str, file_info: Dict[str, any], 
-                          zip_info: Dict[str, any]) -> Dict[str, any]:
+                          zip_info: Dict[str, any], output_dir: Optional[Path] = None,
+                          extra_info: Optional[Dict[str, any]] = None,
+                          target: Optional[str] = None, save: bool = True) -> Dict[str, any]:
         """
         Gera arquivo com informações do build
         
@@ -245,12 +1055,34 @@ class ExtensionBuilder:
             version_type: Tipo de incremento
             file_info: Informações dos arquivos
             zip_info: Informações do ZIP
+            output_dir: Diretório de saída (padrão: raiz de saída, --out)
+            extra_info: Campos adicionais (ex: digest das entradas)
+            target: Navegador alvo (padrão: chrome)
+            save: Se False, apenas monta o dicionário (build em memória)
             
         Returns:
             Dicionário com informações do build
         """
+        if not save:
+            return self._build_info_dict(version, version_type, file_info, zip_info, extra_info)
+        
         print("📋 Gerando informações de build...")
         
+        build_info = self._build_info_dict(version, version_type, file_info, zip_info, extra_info)
+        
+        # Salvar arquivo de build
+        build_info_name = f"build-info-v{version}{self._target_suffix(target)}.json"
+        build_info_path = Path(output_dir or self.out_dir) / build_info_name
+        with open(build_info_path, 'w', encoding='utf-8') as f:
+            json.dump(build_info, f, indent=2, ensure_ascii=False, default=str)
+        
+        print(f"📋 Informações salvas: {build_info_name}")
+        
+        return build_info
+    
+    def _build_info_dict(self, version: str, version_type: str, file_info: Dict[str, any],
+                         zip_info: Dict[str, any], extra_info: Optional[Dict[str, any]]) -> Dict[str, any]:
+        """Conteúdo do build-info"""
         build_info = {
             'version': version,
             'version_type': version_type,
@@ -261,17 +1093,63 @@ class ExtensionBuilder:
             'project_root': str(self.project_root),
             'files': file_info,
             'zip': zip_info,
-            'manifest_info': self._get_manifest_info()
+            'manifest_info': self._get_manifest_info(),
+            'cache': self._get_cache_info(),
+            'events': self.events.summary()
         }
+        build_info.update(extra_info or {})
+        return build_info
+    
+    def _get_cache_info(self) -> Dict[str, any]:
+        """
+        Obtém taxas de acerto do cache de build neste processo
         
-        # Salvar arquivo de build
-        build_info_path = self.project_root / f"build-info-v{version}.json"
-        with open(build_info_path, 'w', encoding='utf-8') as f:
-            json.dump(build_info, f, indent=2, ensure_ascii=False, default=str)
+        Returns:
+            Dicionário com taxas por categoria e origem do cache importado
+        """
+        return {
+            'hit_rates': self.build_cache.get_hit_rates(),
+            'imported': self.build_cache.get_state('imported')
+        }
+    
+    def export_cache(self, archive_path: Path) -> Dict[str, any]:
+        """
+        Exporta o cache de build para um arquivo (ex: artefato de CI)
         
-        print(f"📋 Informações salvas: build-info-v{version}.json")
+        Args:
+            archive_path: Caminho do arquivo .tar.gz
+            
+        Returns:
+            Resultado da exportação
+        """
+        print(f"📤 Exportando cache de build para {archive_path}...")
+        result = self.build_cache.export_archive(archive_path)
+        print(f"✅ Cache exportado: {result['entries']} entradas "
+              f"({result['files']} digests, {result['members']} membros, {result['minified']} minificados, "
+              f"{result['sourcemaps']} source maps, {result['tasks']} tarefas) - {result['size'] / 1024:.2f} KB")
+        return result
+    
+    def import_cache(self, archive_path: Path) -> Dict[str, any]:
+        """
+        Importa o cache de build de um arquivo, verificando a integridade
         
-        return build_info
+        Args:
+            archive_path: Caminho do arquivo .tar.gz
+            
+        Returns:
+            Resultado da importação
+        """
+        print(f"📥 Importando cache de build de {archive_path}...")
+        result = self.build_cache.import_archive(archive_path)
+        imported = result['imported']
+        print(f"✅ Importado: {imported['files']} digests, {imported['members']} membros, "
+              f"{imported['minified']} minificados, {imported['sourcemaps']} source maps, "
+              f"{imported['tasks']} tarefas")
+        if result['rejected']:
+            print(f"⚠️ {len(result['rejected'])} entradas rejeitadas (integridade):")
+            for name in result['rejected']:
+                print(f"   ❌ {name}")
+        return result
     
     def _get_manifest_info(self) -> Dict[str, any]:
         """
@@ -294,38 +1172,149 @@ class ExtensionBuilder:
         except Exception as e:
             return {'error': str(e)}
     
-    def cleanup_old_builds(self, keep_recent: int = 5):
+    def compute_input_digest(self, files: List[Path], targets: Optional[List[str]] = None,
+                             tenants: Optional[List[str]] = None) -> str:
         """
-        Remove builds antigos, mantendo apenas os mais recentes
+        Calcula o digest das entradas do build (chave do store de artefatos)
+        
+        Combina caminho e SHA-256 de cada arquivo com a receita do build
+        (formato e compressão), de modo que árvores idênticas geram o mesmo digest.
+        
+        Args:
+            files: Arquivos incluídos no build
+            targets: Navegadores alvo (padrão: apenas chrome)
+            tenants: Órgãos com pacotes próprios
+            
+        Returns:
+            Digest SHA-256 hexadecimal
+        """
+        sources = {path.relative_to(self.project_root).as_posix(): path for path in files}
+        self._file_digests = self.integrity.compute_digests(sources, self.build_cache)
+        
+        recipe = {
+            'recipe': self.BUILD_RECIPE_VERSION,
+            'compression': f"tuned:{self._compression_method_key()}",
+            'targets': targets or [self.DEFAULT_TARGET]
+        }
+        if 'firefox' in recipe['targets']:
+            recipe['gecko'] = [self.FIREFOX_GECKO_ID, self.FIREFOX_MIN_VERSION]
+        if tenants:
+            recipe['tenants'] = {code: self.tenant_config.tenants[code] for code in tenants}
+            if 'firefox' in recipe['targets']:
+                recipe['tenant_gecko'] = {code: self.tenant_config.gecko_id(code) for code in tenants}
+        digest = hashlib.sha256(json.dumps(recipe, sort_keys=True).encode('utf-8'))
+        for relative_path in sorted(self._file_digests):
+            digest.update(f"{relative_path}\0{self._file_digests[relative_path]}\n".encode('utf-8'))
+        
+        return digest.hexdigest()
+    
+    def _restore_dist(self, zip_path: Path, input_digest: str):
+        """
+        Restaura dist/ a partir de um artefato armazenado, se estiver desatualizado
+        
+        Args:
+            zip_path: ZIP do artefato
+            input_digest: Digest das entradas do artefato
+        """
+        if self.dist_dir.exists() and self.build_cache.get_state(self._dist_state_key()) == input_digest:
+            return
+        
+        work_dir = self._create_work_dist()
+        try:
+            with zipfile.ZipFile(zip_path) as zf:
+                zf.extractall(work_dir)
+            self._publish_dist(work_dir)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        
+        self.build_cache.set_state(self._dist_state_key(), input_digest)
+        self.build_cache.save()
+        print("📂 dist/ restaurado a partir do artefato armazenado")
+    
+    def _dist_state_key(self) -> str:
+        """Chave do digest do dist/ publicado no cache (uma por raiz de saída)"""
+        if self.out_dir == self.project_root:
+            return 'dist_digest'
+        return f"dist_digest:{self.out_dir.resolve().as_posix()}"
+    
+    def _create_work_dist(self) -> Path:
+        """Diretório temporário (na raiz de saída) onde o dist/ é montado"""
+        work_dir = self.out_dir / f".dist-{uuid.uuid4().hex}"
+        work_dir.mkdir(parents=True)
+        return work_dir
+    
+    def _publish_dist(self, work_dir: Path):
+        """
+        Publica um dist/ montado em diretório temporário
+        
+        O diretório anterior sai do caminho e o novo entra por rename, sob uma
+        trava da raiz de saída; quem lê dist/ nunca vê uma cópia pela metade.
+        
+        Args:
+            work_dir: Diretório montado (mesmo sistema de arquivos de dist/)
+        """
+        dist_dir = self._published_dist_dir
+        previous = None
+        with FileLock(self.out_dir / ".dist.lock"):
+            if dist_dir.exists():
+                previous = self.out_dir / f".dist-old-{uuid.uuid4().hex}"
+                os.replace(dist_dir, previous)
+            os.replace(work_dir, dist_dir)
+        if previous is not None:
+            shutil.rmtree(previous, ignore_errors=True)
+    
+    def cleanup_old_builds(self, keep_recent: Optional[int] = 5, max_age_days: Optional[float] = None,
+                           max_bytes: Optional[int] = None, protect: Optional[List[str]] = None):
+        """
+        Aplica a política de retenção ao store de artefatos
+        
+        A decisão é feita apenas pelo índice do store (sem varrer o disco).
         
         Args:
             keep_recent: Número de builds recentes para manter
+            max_age_days: Remove builds sem uso há mais de N dias
+            max_bytes: Tamanho total máximo do store
+            protect: Digests que nunca são removidos (ex: build atual)
         """
-        print(f"🧹 Limpando builds antigos (mantendo {keep_recent} recentes)...")
+        policies = []
+        if keep_recent is not None:
+            policies.append(f"{keep_recent} recentes")
+        if max_age_days is not None:
+            policies.append(f"até {max_age_days} dias")
+        if max_bytes is not None:
+            policies.append(f"até {max_bytes / (1024 * 1024):.1f} MB")
+        
+        print(f"🧹 Limpando builds antigos (mantendo {', '.join(policies) or 'todos'})...")
         
-        # Encontrar arquivos de build
-        zip_files = list(self.project_root.glob("help-otrs-v*.zip"))
-        info_files = list(self.project_root.glob("build-info-v*.json"))
+        removed = self.artifact_store.prune(
+            keep_count=keep_recent,
+            max_age_days=max_age_days,
+            max_bytes=max_bytes,
+            protect=protect
+        )
         
-        # Ordenar por data de modificação (mais recente primeiro)
-        zip_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        info_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        for entry in removed:
+            print(f"   🗑️ Removido: v{entry.get('version', '?')} ({entry['digest'][:12]})")
         
-        # Remover arquivos antigos
-        for files_list, file_type in [(zip_files, "ZIP"), (info_files, "info")]:
-            if len(files_list) > keep_recent:
-                old_files = files_list[keep_recent:]
-                for old_file in old_files:
-                    old_file.unlink()
-                    print(f"   🗑️ Removido: {old_file.name}")
+        stats = self.artifact_store.get_stats()
+        print(f"📦 Store: {stats['artifacts']} artefatos ({stats['bytes'] / 1024:.2f} KB)")
     
-    def build_extension(self, version_type: str = 'patch', auto_cleanup: bool = True) -> Dict[str, any]:
+    def build_extension(self, version_type: str = 'patch', auto_cleanup: bool = True,
+                        bump: bool = True, retention: Optional[Dict[str, any]] = None,
+                        targets: Optional[List[str]] = None,
+                        tenants: Optional[List[str]] = None,
+                        perf_lint: str = 'report') -> Dict[str, any]:
         """
         Executa build completo da extensão
         
         Args:
             version_type: Tipo de incremento de versão
             auto_cleanup: Se deve limpar builds antigos automaticamente
+            bump: Se False, reconstrói a versão atual sem incrementá-la
+            retention: Política de retenção (keep_count, max_age_days, max_bytes)
+            targets: Navegadores alvo (padrão: apenas chrome); o primeiro é o pacote principal
+            tenants: Órgãos de tenants.json com pacotes próprios (além do genérico)
+            perf_lint: Lint de desempenho: 'off', 'report' (apenas exibe) ou 'fail' (falha com achados)
             
         Returns:
             Dicionário com resultados do build
@@ -333,46 +1322,142 @@ class ExtensionBuilder:
         print("🚀 Iniciando build da extensão Help OTRS")
         print("━" * 60)
         
+        retention = dict(self.DEFAULT_RETENTION, **(retention or {}))
+        targets = list(dict.fromkeys(targets or [self.DEFAULT_TARGET]))
+        staging_dir = None
+        work_dir = None
+        
+        self.events.open(self.out_dir / self.EVENT_LOG_NAME)
+        self.events.emit('build.start', version_type=version_type, bump=bump, targets=targets, tenants=tenants,
+                         jobs=self.jobs)
+        
         try:
-            # Etapa 1: Incrementar versão
-            print("📈 Etapa 1: Incrementando versão...")
-            version_result = self.version_bumper.bump_version(version_type)
+            self._validate_variants(targets, tenants)
+            
+            graph = TaskGraph(self.jobs, self.build_cache, self.project_root, self.events)
+            
+            # Lint antes do incremento: com 'fail' o build para sem alterar a versão.
+            # O próprio linter é entrada: mudar as regras invalida o resultado guardado.
+            graph.add(
+                'lint', lambda _: self.run_perf_lint(self.get_files_to_include(), perf_lint),
+                inputs=lambda: (self._lint_scripts(self.get_files_to_include()) if perf_lint != 'off' else [])
+                + [Path(__file__).parent / 'perf_lint.py', Path(__file__).parent / 'js_source.py'],
+                key=perf_lint
+            )
+            graph.add('codegen', lambda _: self._run_codegen())
+            graph.add('bump', lambda _: self._run_bump(version_type, bump), deps=['lint'])
+            graph.add('discover', lambda _: self._run_discover(), deps=['codegen', 'bump'])
+            graph.add('digest', lambda deps: self.compute_input_digest(deps['discover'], targets, tenants),
+                      deps=['discover'])
+            
+            # Etapas 1-2: lint e geração de código em paralelo; versão; digest das entradas
+            early = graph.run(['bump', 'discover', 'digest'])
+            version_result = early['bump']
+            version_type = version_result['type']
             new_version = version_result['version']
+            files_to_include = early['discover']
+            input_digest = early['digest']
+            print(f"🔑 Digest das entradas: {input_digest[:12]}")
             
             print("━" * 60)
             
-            # Etapa 2: Preparar arquivos
-            print("📋 Etapa 2: Preparando arquivos para distribuição...")
-            files_to_include = self.get_files_to_include()
+            # Árvore inalterada: reutilizar artefato armazenado
+            artifact = self.artifact_store.get(input_digest)
+            if artifact:
+                self.events.emit('build.done', version=new_version, cached=True)
+                return self._reuse_artifact(artifact, version_result, auto_cleanup, retention)
             
-            if not files_to_include:
-                raise ValueError("Nenhum arquivo encontrado para incluir no build")
+            staging_dir = self.artifact_store.create_staging_dir()
+            object_dir = self.artifact_store.object_dir(input_digest)
             
-            print("━" * 60)
+            # dist/ é montado à parte e só substitui o publicado no fim
+            work_dir = self._create_work_dist()
+            self.dist_dir = work_dir
             
-            # Etapa 3: Criar estrutura dist
-            print("📂 Etapa 3: Criando estrutura de distribuição...")
-            file_info = self.create_dist_structure(files_to_include)
+            # Etapa 3: dist/ e transformações. Estilos e ícones reescrevem o manifest.json
+            # (em sequência); a minificação das páginas roda ao lado deles.
+            graph.add('dist', lambda _: self._run_dist(files_to_include), deps=['digest'])
+            graph.add('styles', lambda _: self.style_extractor.apply(self.dist_dir), deps=['dist'])
+            graph.add('icons', lambda _: self.icon_generator.apply(self.dist_dir), deps=['styles'])
+            graph.add('minify', lambda _: self.page_minifier.apply(self.dist_dir), deps=['dist'])
+            graph.add('stage', self._run_stage, deps=['dist', 'styles', 'icons', 'minify'])
             
-            print("━" * 60)
+            # Etapa 4: pacotes ZIP (montados em staging e publicados no store) e source maps
+            graph.add('packages', lambda deps: self._run_packages(new_version, deps['stage']['file_info'],
+                                                                  targets, staging_dir, tenants),
+                      deps=['stage'])
+            graph.add('sourcemaps', lambda _: self.write_source_maps(new_version, staging_dir), deps=['stage'])
+            
+            late = graph.run(['stage', 'packages', 'sourcemaps'])
+            file_info = late['stage']['file_info']
+            styles_summary = late['stage']['styles']
+            icons_summary = late['stage']['icons']
+            minify_summary = late['stage']['minify']
+            packages = late['packages']
+            lint_summary = graph.result('lint')
+            sourcemaps_summary = late['sourcemaps']
+            sourcemaps_file = None
+            if sourcemaps_summary:
+                sourcemaps_file = str(object_dir / sourcemaps_summary['name'])
+                sourcemaps_summary = dict(sourcemaps_summary, path=sourcemaps_file)
             
-            # Etapa 4: Criar pacote ZIP
-            print("📦 Etapa 4: Criando pacote ZIP...")
-            zip_path, zip_info = self.create_zip_package(new_version, file_info)
+            graph.print_report()
+            task_report = graph.report()
             
             print("━" * 60)
             
-            # Etapa 5: Gerar informações de build
+            # Etapa 5: Gerar informações de build (uma por alvo)
             print("📋 Etapa 5: Gerando informações de build...")
-            build_info = self.generate_build_info(new_version, version_type, file_info, zip_info)
+            variants = {}
+            for variant_id, package in packages.items():
+                zip_info = dict(package['zip_info'], path=str(object_dir / package['zip_info']['name']))
+                build_info = self.generate_build_info(
+                    new_version, version_type, package['file_info'], zip_info, staging_dir,
+                    extra_info={
+                        'input_digest': input_digest,
+                        'artifact_path': str(object_dir),
+                        'target': package['target'],
+                        'tenant': package['tenant'],
+                        'timings': dict(package['timings'], tasks=task_report),
+                        'perf_lint': lint_summary,
+                        'styles': styles_summary,
+                        'icons': icons_summary,
+                        'minify': minify_summary,
+                        'compression': self._compression_summary,
+                        'sourcemaps': sourcemaps_summary
+                    },
+                    target=variant_id
+                )
+                variants[variant_id] = {
+                    'zip_file': zip_info['path'],
+                    'zip_info': zip_info,
+                    'checksums_file': str(object_dir / package['checksums_path'].name),
+                    'file_info': package['file_info'],
+                    'build_info': build_info
+                }
+            
+            self.artifact_store.put(input_digest, staging_dir, {'version': new_version, 'targets': list(variants)})
+            staging_dir = None
             
+            self._publish_dist(work_dir)
+            work_dir = None
+            self.dist_dir = self._published_dist_dir
+            
+            self.build_cache.set_state(self._dist_state_key(), input_digest)
+            self.build_cache.save()
+            
+            print(f"🗄️ Artefato armazenado: {object_dir.relative_to(self.out_dir)}")
             print("━" * 60)
             
             # Etapa 6: Limpeza (opcional)
             if auto_cleanup:
-                self.cleanup_old_builds()
+                self.cleanup_old_builds(retention['keep_count'], retention['max_age_days'],
+                                        retention['max_bytes'], protect=[input_digest])
                 print("━" * 60)
             
+            primary = variants[targets[0]]
+            zip_info = primary['zip_info']
+            
             # Resumo final
             print("🎉 BUILD CONCLUÍDO COM SUCESSO!")
             print("━" * 60)
@@ -383,6 +1468,8 @@ class ExtensionBuilder:
             print(f"📝 Descrição: {version_result['description']}")
             print(f"📊 Arquivos: {file_info['total_files']} ({file_info['total_size_kb']:.2f} KB)")
             print(f"🗜️ ZIP: {zip_info['size_kb']} KB (compressão: {zip_info['compression_ratio']}%)")
+            if len(variants) > 1:
+                print(f"🌐 Pacotes: {', '.join(variants)}")
             
             print('\n📋 Próximos passos:')
             print('1. Teste a extensão carregando a pasta dist/ no Chrome')
@@ -391,22 +1478,357 @@ class ExtensionBuilder:
             print(f'4. Crie uma tag: git tag v{new_version}')
             print('5. Publique na Chrome Web Store se necessário')
             
-            return {
-                'success': True,
-                'version': new_version,
-                'version_info': version_result,
-                'zip_file': str(zip_path),
-                'zip_info': zip_info,
-                'file_info': file_info,
-                'build_info': build_info
-            }
+            self.events.emit('build.done', version=new_version, cached=False)
+            return dict(
+                primary,
+                success=True,
+                version=new_version,
+                version_info=version_result,
+                input_digest=input_digest,
+                targets=variants,
+                sourcemaps_file=sourcemaps_file,
+                cached=False
+            )
             
         except Exception as error:
             print(f"❌ Erro durante o build: {error}")
+            self.events.emit('build.failed', error=str(error))
             return {
                 'success': False,
                 'error': str(error)
             }
+        finally:
+            self.events.close()
+            if staging_dir is not None:
+                self.artifact_store.discard_staging(staging_dir)
+            if work_dir is not None:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            self.dist_dir = self._published_dist_dir
+    
+    def build_in_memory(self, targets: Optional[List[str]] = None, tenants: Optional[List[str]] = None,
+                        spool_max_size: Optional[int] = None, render_generated: bool = True,
+                        source_maps: bool = True) -> Dict[str, any]:
+        """
+        Empacota a versão atual sem gravar nada no projeto nem na raiz de saída
+        
+        Para testes e para o release manager: não incrementa a versão, não
+        publica dist/, não usa o store de artefatos e não imprime nada. As
+        etapas de transformação rodam em um diretório temporário do sistema; os
+        módulos de src/generated/ são renderizados em memória. Cada ZIP é
+        montado em um SpooledTemporaryFile (em memória até spool_max_size) e
+        devolvido como bytes. O cache de build é consultado, mas nada é gravado
+        nele (nem o índice nem os blobs).
+        
+        Args:
+            targets: Navegadores alvo (padrão: apenas chrome); o primeiro é o pacote principal
+            tenants: Órgãos de tenants.json com pacotes próprios (além do genérico)
+            spool_max_size: Bytes mantidos em memória por pacote (padrão: SPOOL_MAX_SIZE)
+            render_generated: Renderiza src/generated/ (False: empacota os módulos como estão na árvore)
+            source_maps: Gera os source maps (False: quem só olha o pacote pula a etapa; 'sourcemaps' fica None)
+            
+        Returns:
+            Resultado no formato de build_extension, em que cada variante traz
+            'zip_data' e 'checksums_data' (bytes) no lugar dos caminhos; 'files'
+            (tabela de arquivos) e 'metrics' (tamanhos, tempos e cache). Em caso de
+            erro, {'success': False, 'error'}.
+        """
+        targets = list(dict.fromkeys(targets or [self.DEFAULT_TARGET]))
+        spool_max_size = spool_max_size or self.SPOOL_MAX_SIZE
+        
+        try:
+            with contextlib.redirect_stdout(io.StringIO()), self.build_cache.in_memory(), \
+                    tempfile.TemporaryDirectory(prefix='help-otrs-build-') as temp_dir:
+                self._validate_variants(targets, tenants)
+                self._file_digests = {}  # A árvore pode ter mudado desde o build anterior deste objeto
+                self.events.open()  # Só em memória: o fluxo monta a tabela de arquivos
+                self.dist_dir = Path(temp_dir) / 'dist'
+                version_result = self.version_bumper.current_version_info()
+                version = version_result['version']
+                files_to_include = self.get_files_to_include()
+                
+                graph = TaskGraph(self.jobs, events=self.events)
+                graph.add('dist', lambda _: (self._dist_with_rendered_modules(files_to_include) if render_generated
+                                             else self.create_dist_structure(files_to_include)))
+                graph.add('styles', lambda _: self.style_extractor.apply(self.dist_dir), deps=['dist'])
+                graph.add('icons', lambda _: self.icon_generator.apply(self.dist_dir), deps=['styles'])
+                graph.add('minify', lambda _: self.page_minifier.apply(self.dist_dir), deps=['dist'])
+                graph.add('stage', self._run_stage, deps=['dist', 'styles', 'icons', 'minify'])
+                graph.add('packages', lambda deps: self._memory_packages(
+                    version, deps['stage']['file_info'], targets, tenants, spool_max_size), deps=['stage'])
+                goals = ['stage', 'packages']
+                if source_maps:
+                    graph.add('sourcemaps', lambda _: self._memory_source_maps(version), deps=['stage'])
+                    goals.append('sourcemaps')
+                results = graph.run(goals)
+                task_report = graph.report()
+        except Exception as error:
+            return {'success': False, 'error': str(error)}
+        finally:
+            self.dist_dir = self._published_dist_dir
+        
+        stage = results['stage']
+        variants = {}
+        for variant_id, package in results['packages'].items():
+            build_info = self.generate_build_info(
+                version, version_result['type'], package['file_info'], package['zip_info'],
+                extra_info={
+                    'target': package['target'],
+                    'tenant': package['tenant'],
+                    'timings': {'tasks': task_report},
+                    'styles': stage['styles'],
+                    'icons': stage['icons'],
+                    'minify': stage['minify'],
+                    'compression': self._compression_summary
+                },
+                target=variant_id, save=False
+            )
+            variants[variant_id] = dict(package, zip_file=None, checksums_file=None, build_info=build_info)
+        
+        primary = variants[targets[0]]
+        return dict(
+            primary,
+            success=True,
+            version=version,
+            version_info=version_result,
+            targets=variants,
+            sourcemaps_file=None,
+            sourcemaps=results.get('sourcemaps'),
+            files=stage['file_info']['files'],
+            metrics={
+                'total_files': stage['file_info']['total_files'],
+                'total_size': stage['file_info']['total_size'],
+                'packages': {variant_id: {k: variant['zip_info'][k] for k in ('size', 'compression_ratio')}
+                             for variant_id, variant in variants.items()},
+                'tasks': task_report,
+                'cache': self._get_cache_info()
+            },
+            cached=False,
+            in_memory=True
+        )
+    
+    def _validate_variants(self, targets: List[str], tenants: Optional[List[str]]):
+        """
+        Valida alvos e órgãos pedidos
+        
+        Raises:
+            ValueError: Alvo ou órgão desconhecido
+        """
+        for target in targets:
+            if target not in self.BROWSER_TARGETS:
+                raise ValueError(f"Alvo desconhecido: {target}")
+        for tenant in tenants or []:
+            if tenant not in self.tenant_config.tenants:
+                raise ValueError(f"Órgão desconhecido: {tenant}")
+    
+    def _dist_with_rendered_modules(self, files: List[Path]) -> Dict[str, any]:
+        """dist/ com os módulos de src/generated/ renderizados em memória (sem gravar no projeto)"""
+        self.create_dist_structure(files)
+        for name, content in self.codegen.render_all().items():
+            relative_path = f"{CodeGenerator.GENERATED_DIR}/{name}"
+            if self._file_digests.get(relative_path) == hashlib.sha256(content).hexdigest():
+                continue
+            dest_path = self.dist_dir / relative_path
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            dest_path.write_bytes(content)
+            self._record_change(relative_path, content, 'codegen')
+        return self.events.file_info()
+    
+    def _memory_packages(self, version: str, file_info: Dict[str, any], targets: List[str],
+                         tenants: Optional[List[str]], spool_max_size: int) -> Dict[str, Dict[str, any]]:
+        """
+        Monta os pacotes de cada variante em buffers temporários
+        
+        Returns:
+            Mapa variante → {zip_info, zip_data, checksums_data, file_info, target, tenant}
+        """
+        members = self._collect_zip_members()
+        compressed = self._compress_members(members)
+        manifest = self.version_bumper.load_json_file(self.dist_dir / 'manifest.json')
+        
+        packages = {}
+        for tenant, target in [(None, t) for t in targets] + [(o, t) for o in tenants or [] for t in targets]:
+            variant_id = self._variant_id(tenant, target)
+            overrides, variant_file_info = self._variant_overrides(manifest, file_info, tenant, target)
+            
+            with tempfile.SpooledTemporaryFile(max_size=spool_max_size) as buffer:
+                self._write_members(buffer, members, compressed, overrides)
+                size = buffer.tell()
+                buffer.seek(0)
+                data = buffer.read()
+            
+            suffix = self._target_suffix(variant_id)
+            checksums = self.integrity.format_checksums({
+                Path(entry['name']).as_posix(): entry['sha256'] for entry in variant_file_info['files']
+            })
+            packages[variant_id] = {
+                'target': target,
+                'tenant': tenant,
+                'zip_info': {
+                    'name': f"help-otrs-v{version}{suffix}.zip",
+                    'path': None,
+                    'size': size,
+                    'size_kb': round(size / 1024, 2),
+                    'size_mb': round(size / (1024 * 1024), 2),
+                    'compression_ratio': round((1 - size / variant_file_info['total_size']) * 100, 1),
+                    'created': datetime.now().isoformat(),
+                    'sha256': hashlib.sha256(data).hexdigest(),
+                    'spilled': size > spool_max_size
+                },
+                'zip_data': data,
+                'checksums_name': f"checksums-v{version}{suffix}.txt",
+                'checksums_data': checksums.encode('utf-8'),
+                'file_info': variant_file_info
+            }
+            self.events.emit('package.written', variant=variant_id, name=packages[variant_id]['zip_info']['name'],
+                             size=size, sha256=packages[variant_id]['zip_info']['sha256'])
+        return packages
+    
+    def _memory_source_maps(self, version: str) -> Optional[Dict[str, any]]:
+        """ZIP de source maps em memória (None sem arquivos transformados)"""
+        if not self._map_sources:
+            return None
+        buffer = io.BytesIO()
+        files = self._write_source_map_archive(buffer)
+        return {'name': f"sourcemaps-v{version}.zip", 'data': buffer.getvalue(), 'files': files}
+    
+    def _run_codegen(self) -> List[str]:
+        """Tarefa 'codegen': gera os módulos de src/generated/"""
+        generated = []
+        for generated_path in self.codegen.generate_all():
+            generated.append(generated_path.relative_to(self.project_root).as_posix())
+            print(f"🧬 Gerado: {generated[-1]}")
+        return generated
+    
+    def _run_bump(self, version_type: str, bump: bool) -> Dict[str, any]:
+        """Tarefa 'bump' (Etapa 1): incrementa ou mantém a versão"""
+        if bump:
+            print("📈 Etapa 1: Incrementando versão...")
+            return self.version_bumper.bump_version(version_type)
+        print("📌 Etapa 1: Mantendo versão atual (sem incremento)...")
+        return self.version_bumper.current_version_info()
+    
+    def _run_discover(self) -> List[Path]:
+        """Tarefa 'discover' (Etapa 2): arquivos incluídos no pacote"""
+        print("📋 Etapa 2: Preparando arquivos para distribuição...")
+        files_to_include = self.get_files_to_include()
+        if not files_to_include:
+            raise ValueError("Nenhum arquivo encontrado para incluir no build")
+        for file_path in files_to_include:
+            self.events.emit('file.discovered', path=file_path.relative_to(self.project_root).as_posix(),
+                             size=file_path.stat().st_size)
+        return files_to_include
+    
+    def _run_dist(self, files: List[Path]) -> Dict[str, any]:
+        """Tarefa 'dist' (Etapa 3): cópia para dist/ com digests"""
+        print("📂 Etapa 3: Criando estrutura de distribuição...")
+        return self.create_dist_structure(files)
+    
+    def _run_stage(self, deps: Dict[str, any]) -> Dict[str, any]:
+        """Tarefa 'stage': registra, em ordem fixa, o que as transformações gravaram"""
+        styles_summary = self.extract_styles(deps['styles'])
+        icons_summary = self.generate_icons(deps['icons'])
+        minify_summary = self.minify_pages(deps['minify'])
+        # Tabela de arquivos montada a partir do fluxo: cópias do dist/ + alterações das transformações
+        return {'file_info': self.events.file_info(), 'styles': styles_summary, 'icons': icons_summary,
+                'minify': minify_summary}
+    
+    def _run_packages(self, version: str, file_info: Dict[str, any], targets: List[str],
+                      output_dir: Path, tenants: Optional[List[str]]) -> Dict[str, Dict[str, any]]:
+        """Tarefa 'packages' (Etapa 4): um ZIP por variante"""
+        print("📦 Etapa 4: Criando pacote ZIP...")
+        return self.create_target_packages(version, file_info, targets, output_dir, tenants)
+    
+    def run_perf_lint(self, files: List[Path], mode: str = 'report') -> Optional[Dict[str, any]]:
+        """
+        Executa o lint de desempenho nos scripts de src/ incluídos no pacote
+        
+        Args:
+            files: Arquivos do build
+            mode: 'off', 'report' ou 'fail'
+            
+        Returns:
+            Resumo (achados por regra) ou None se desativado
+            
+        Raises:
+            ValueError: Se mode for 'fail' e houver achados
+        """
+        if mode == 'off':
+            return None
+        
+        result = self.perf_linter.lint_files(self._lint_scripts(files))
+        self.perf_linter.print_report(result)
+        
+        if mode == 'fail' and result['findings']:
+            raise ValueError(f"Lint de desempenho encontrou {len(result['findings'])} problema(s)")
+        
+        return {
+            'findings': len(result['findings']),
+            'by_rule': result['by_rule'],
+            'suppressed': result['suppressed']
+        }
+    
+    def _lint_scripts(self, files: List[Path]) -> List[Path]:
+        """Scripts de src/ analisados pelo lint (sem os módulos gerados)"""
+        src_dir = self.project_root / 'src'
+        generated_dir = src_dir / 'generated'
+        return [f for f in files if f.suffix == '.js' and src_dir in f.parents
+                and generated_dir not in f.parents]
+    
+    def _reuse_artifact(self, artifact: Dict[str, any], version_result: Dict[str, any],
+                        auto_cleanup: bool, retention: Dict[str, any]) -> Dict[str, any]:
+        """
+        Monta o resultado do build a partir de um artefato já armazenado
+        
+        Args:
+            artifact: Entrada do store (ArtifactStore.get)
+            version_result: Informações da versão
+            auto_cleanup: Se deve aplicar a política de retenção
+            retention: Política de retenção
+            
+        Returns:
+            Dicionário com resultados do build (mesmo formato de build_extension)
+        """
+        object_dir = Path(artifact['path'])
+        version = artifact['version']
+        targets = artifact.get('targets', [self.DEFAULT_TARGET])
+        
+        variants = {}
+        for target in targets:
+            suffix = self._target_suffix(target)
+            build_info = self.version_bumper.load_json_file(object_dir / f"build-info-v{version}{suffix}.json")
+            zip_path = object_dir / f"help-otrs-v{version}{suffix}.zip"
+            variants[target] = {
+                'zip_file': str(zip_path),
+                'zip_info': dict(build_info['zip'], path=str(zip_path)),
+                'checksums_file': str(object_dir / f"checksums-v{version}{suffix}.txt"),
+                'file_info': build_info['files'],
+                'build_info': build_info
+            }
+        
+        primary = variants[targets[0]]
+        sourcemaps_path = object_dir / f"sourcemaps-v{version}.zip"
+        
+        print(f"♻️ Entradas inalteradas: reutilizando artefato {artifact['digest'][:12]} (v{version})")
+        self._restore_dist(Path(variants.get(self.DEFAULT_TARGET, primary)['zip_file']), artifact['digest'])
+        
+        if auto_cleanup:
+            self.cleanup_old_builds(retention['keep_count'], retention['max_age_days'],
+                                    retention['max_bytes'], protect=[artifact['digest']])
+        
+        print("━" * 60)
+        print("🎉 BUILD CONCLUÍDO (artefato reutilizado)")
+        print(f"📦 Pacote: {primary['zip_file']}")
+        
+        return dict(
+            primary,
+            success=True,
+            version=version,
+            version_info=version_result,
+            input_digest=artifact['digest'],
+            targets=variants,
+            sourcemaps_file=str(sourcemaps_path) if sourcemaps_path.exists() else None,
+            cached=True
+        )
     
     def create_github_release_info(self, build_result: Dict[str, any]) -> Dict[str, any]:
         """
@@ -426,6 +1848,16 @@ class ExtensionBuilder:
         zip_info = build_result['zip_info']
         file_info = build_result['file_info']
         
+        # Pacotes adicionais (navegadores / órgãos) listados no corpo do release
+        other_packages = ''
+        for variant in build_result.get('targets', {}).values():
+            if variant['zip_info']['name'] == zip_info['name']:
+                continue
+            label = variant['build_info'].get('target', '').capitalize()
+            if variant['build_info'].get('tenant'):
+                label = f"{variant['build_info']['tenant']} ({label})"
+            other_packages += f"\n- **{variant['zip_info']['name']}** ({variant['zip_info']['size_kb']} KB) - {label}"
+        
         # Preparar conteúdo do release
         release_body = f"""
 ## 🚀 Help OTRS v{version}
@@ -434,10 +1866,10 @@ class ExtensionBuilder:
 
 ### 📦 Arquivos do Release
 
-- **help-otrs-v{version}.zip** ({zip_info['size_kb']} KB)
+- **{zip_info['name']}** ({zip_info['size_kb']} KB)
   - Extensão completa pronta para instalação
   - {file_info['total_files']} arquivos incluídos
-  - Compressão: {zip_info['compression_ratio']}%
+  - Compressão: {zip_info['compression_ratio']}%{other_packages}
 
 ### 📥 Como Instalar
 
@@ -463,19 +1895,46 @@ class ExtensionBuilder:
 *Build automático gerado em {version_info['datetime']}*
 """
 
+        # Build em memória (build_in_memory): assets levam os bytes em 'data' no lugar de 'path'
+        def asset(name: str, path: Optional[str], data: Optional[bytes], content_type: str) -> Dict[str, any]:
+            entry = {'name': name, 'content_type': content_type}
+            if data is not None:
+                entry['data'] = data
+            else:
+                entry['path'] = path
+            return entry
+        
+        assets = [asset(zip_info['name'], zip_info['path'], build_result.get('zip_data'), 'application/zip')]
+        
+        if build_result.get('checksums_file') or build_result.get('checksums_data'):
+            assets.append(asset(build_result.get('checksums_name') or Path(build_result['checksums_file']).name,
+                                build_result.get('checksums_file'), build_result.get('checksums_data'),
+                                'text/plain'))
+        
+        # Source maps dos arquivos transformados (fora do pacote da extensão)
+        if build_result.get('sourcemaps_file'):
+            assets.append(asset(Path(build_result['sourcemaps_file']).name, build_result['sourcemaps_file'],
+                                None, 'application/zip'))
+        elif build_result.get('sourcemaps'):
+            assets.append(asset(build_result['sourcemaps']['name'], None, build_result['sourcemaps']['data'],
+                                'application/zip'))
+        
+        # Pacotes adicionais (navegadores / órgãos)
+        for variant in build_result.get('targets', {}).values():
+            if variant['zip_info']['name'] == zip_info['name']:
+                continue
+            assets.append(asset(variant['zip_info']['name'], variant['zip_file'], variant.get('zip_data'),
+                                'application/zip'))
+            assets.append(asset(variant.get('checksums_name') or Path(variant['checksums_file']).name,
+                                variant['checksums_file'], variant.get('checksums_data'), 'text/plain'))
+        
         return {
             'tag_name': f"v{version}",
             'name': f"Help OTRS v{version}",
             'body': release_body.strip(),
             'draft': False,
             'prerelease': version_info['type'] == 'major',
-            'assets': [
-                {
-                    'name': zip_info['name'],
-                    'path': zip_info['path'],
-                    'content_type': 'application/zip'
-                }
-            ]
+            'assets': assets
         }
 
 
@@ -486,30 +1945,51 @@ def show_help():
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 Uso: python build.py [tipo]
+     python build.py verify ALVO [--checksums ARQUIVO]
 
 Tipos de build:
   patch   Incrementa versão patch e faz build (2.1.0 → 2.1.1) [padrão]
   minor   Incrementa versão minor e faz build (2.1.0 → 2.2.0)  
   major   Incrementa versão major e faz build (2.1.0 → 3.0.0)
+  verify  Verifica ZIP (caminho, nome ou versão no store) ou diretório contra o manifesto SHA-256
+  cache-export  Exporta o cache de build (padrão: build-cache.tar.gz)
+  cache-import  Importa o cache de build com verificação de integridade
 
 Exemplos:
   python build.py         # Build com incremento patch
   python build.py patch   # Build com incremento patch
   python build.py minor   # Build com incremento minor
   python build.py major   # Build com incremento major
+  python build.py verify 2.1.1                  # Pacote da versão no store (build/objects/)
+  python build.py verify help-otrs-v2.1.1-firefox.zip
+  python build.py verify dist --checksums checksums-v2.1.1.txt
+  python build.py cache-export ci-cache.tar.gz
+  python build.py cache-import ci-cache.tar.gz
 
 Opções:
   --no-cleanup           Não remove builds antigos
   --keep-builds N        Mantém N builds recentes (padrão: 5)
+  --max-age-days D       Remove builds sem uso há mais de D dias
+  --max-store-mb M       Limita o tamanho total do store de artefatos
+  --no-bump              Reconstrói a versão atual (reutiliza artefato se inalterado)
+  --targets LISTA        Navegadores: chrome,edge,opera,firefox ou all (padrão: chrome)
+  --tenants LISTA        Pacotes por órgão (tenants.json): MAPA,MT ou all
+  --perf-lint MODO       Lint de desempenho: off, report [padrão] ou fail
+  --jobs N, -j N         Tarefas simultâneas do build (padrão: número de CPUs)
+  --out DIR              Raiz das saídas (dist/ e build/), fora do projeto
+  --compression-budget S Segundos de busca do método de compressão (padrão: 5)
+  --progress NÍVEL       Console: quiet, summary [padrão] ou verbose (log em build-events.ndjson)
   --release-info         Gera informações para GitHub release
+  --dry-run              Planeja o build em memória (não escreve nada)
+  --checksums ARQUIVO    Manifesto para verify (checksums-vX.txt ou build-info)
   --help, -h            Mostra esta ajuda
 
 O build executa:
   1. Incrementa a versão nos arquivos
   2. Cria estrutura de distribuição (dist/)
   3. Cria pacote ZIP para distribuição
-  4. Gera informações de build
-  5. Remove builds antigos (opcional)
+  4. Gera informações de build e checksums SHA-256
+  5. Armazena o artefato em build/objects/ e aplica a retenção (opcional)
 
 Arquivos incluídos no pacote:
   • Toda estrutura src/ (JS, HTML, CSS, imagens)
@@ -530,8 +2010,19 @@ def main():
         'type',
         nargs='?',
         default='patch',
-        choices=['patch', 'minor', 'major'],
-        help='Tipo de incremento de versão'
+        choices=['patch', 'minor', 'major', 'verify', 'cache-export', 'cache-import'],
+        help='Tipo de incremento de versão (ou verify, cache-export, cache-import)'
+    )
+    
+    parser.add_argument(
+        'target',
+        nargs='?',
+        help='ZIP ou diretório a verificar (verify) ou arquivo de cache (cache-export/cache-import)'
+    )
+    
+    parser.add_argument(
+        '--checksums',
+        help='Manifesto SHA-256 para o comando verify'
     )
     
     parser.add_argument(
@@ -547,12 +2038,78 @@ def main():
         help='Número de builds recentes para manter'
     )
     
+    parser.add_argument(
+        '--max-age-days',
+        type=float,
+        help='Remove builds sem uso há mais de N dias'
+    )
+    
+    parser.add_argument(
+        '--max-store-mb',
+        type=float,
+        help='Tamanho total máximo do store de artefatos (MB)'
+    )
+    
+    parser.add_argument(
+        '--targets',
+        default='chrome',
+        help='Navegadores alvo separados por vírgula (chrome,edge,opera,firefox) ou "all"'
+    )
+    
+    parser.add_argument(
+        '--tenants',
+        help='Pacotes por órgão de tenants.json (ex: MAPA,MT ou "all")'
+    )
+    
+    parser.add_argument(
+        '--perf-lint',
+        choices=['off', 'report', 'fail'],
+        default='report',
+        help='Lint de desempenho dos scripts (fail interrompe o build com achados)'
+    )
+    
+    parser.add_argument(
+        '--out',
+        help='Raiz das saídas (dist/ e build/) fora do projeto; builds com --out diferentes rodam em paralelo'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        help='Tarefas simultâneas do build (padrão: número de CPUs)'
+    )
+    
+    parser.add_argument(
+        '--compression-budget',
+        type=float,
+        help='Segundos de busca do método de compressão por arquivo (0: só o nível padrão)'
+    )
+    
+    parser.add_argument(
+        '--progress',
+        choices=sorted(RENDERERS),
+        default='summary',
+        help='Progresso no console: quiet (só o resultado), summary ou verbose (uma linha por arquivo)'
+    )
+    
+    parser.add_argument(
+        '--no-bump',
+        action='store_true',
+        help='Reconstrói a versão atual sem incrementar'
+    )
+    
     parser.add_argument(
         '--release-info',
         action='store_true',
         help='Gera arquivo com informações para GitHub release'
     )
     
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Planeja o build em memória sem escrever arquivos'
+    )
+    
     parser.add_argument(
         '--help', '-h',
         action='store_true',
@@ -567,14 +2124,54 @@ def main():
     
     try:
         # Inicializar builder
-        builder = ExtensionBuilder()
+        builder = ExtensionBuilder(jobs=args.jobs, out_dir=args.out, compression_budget=args.compression_budget,
+                                   progress=args.progress)
         
-        # Executar build
-        result = builder.build_extension(
-            version_type=args.type,
-            auto_cleanup=not args.no_cleanup
-        )
+        if args.type in ('cache-export', 'cache-import'):
+            archive_path = Path(args.target or 'build-cache.tar.gz')
+            if args.type == 'cache-export':
+                builder.export_cache(archive_path)
+                return 0
+            result = builder.import_cache(archive_path)
+            return 1 if result['rejected'] else 0
+        
+        if args.type == 'verify':
+            if not args.target:
+                print("❌ Informe o ZIP ou diretório a verificar")
+                return 1
+            result = builder.verify_package(
+                Path(args.target),
+                Path(args.checksums) if args.checksums else None
+            )
+            return 0 if result['valid'] else 1
+        
+        if args.dry_run:
+            plan = builder.plan_build(args.type)
+            if args.release_info:
+                release_info = builder.create_github_release_info(plan)
+                print(json.dumps(release_info, indent=2, ensure_ascii=False))
+            return 0
         
+        # Executar build
+        with contextlib.ExitStack() as stack:
+            if args.progress == 'quiet':
+                # Saída das etapas só no log de eventos (build-events.ndjson)
+                stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, 'w'))))
+            result = builder.build_extension(
+                version_type=args.type,
+                auto_cleanup=not args.no_cleanup,
+                bump=not args.no_bump,
+                targets=(list(ExtensionBuilder.BROWSER_TARGETS) if args.targets == 'all'
+                         else [t.strip() for t in args.targets.split(',') if t.strip()]),
+                tenants=builder.tenant_config.resolve(args.tenants) if args.tenants else None,
+                perf_lint=args.perf_lint,
+                retention={
+                    'keep_count': args.keep_builds,
+                    'max_age_days': args.max_age_days,
+                    'max_bytes': int(args.max_store_mb * 1024 * 1024) if args.max_store_mb else None
+                }
+            )
+
         if not result['success']:
             print(f"❌ Build falhou: {result['error']}")
             return 1
@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""
+Cache persistente do build da extensão Help OTRS
+Guarda digests dos arquivos de entrada, membros comprimidos, saídas minificadas
+e mapeamentos de source maps por conteúdo, com exportação/importação para runners de CI
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import contextlib
+import functools
+import hashlib
+import io
+import json
+import os
+import re
+import subprocess
+import tarfile
+import threading
+import time
+import uuid
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from file_lock import FileLock
+
+
+def _synchronized(method):
+    """Executa o método sob a trava do cache (as tarefas do build rodam em threads)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class BuildCache:
+    """Classe responsável pelo cache de digests e métricas de compressão"""
+
+    CACHE_VERSION = 1
+
+    # Categorias de blobs guardados em .cache/blobs/<categoria>/
+    BLOB_KINDS = ('members', 'minified', 'sourcemaps')
+
+    # Nome do manifesto dentro do arquivo exportado
+    ARCHIVE_MANIFEST = 'MANIFEST.json'
+
+    # Estados dos carimbos de tarefa (TaskGraph.STATE_PREFIX): dependem só do conteúdo
+    # das entradas, então valem em outro checkout e seguem na importação
+    TASK_STATE_PREFIX = 'task:'
+
+    # Caminho aceito para blobs importados: blobs/<categoria>/<dd>/<sha256>[-<variante>]
+    BLOB_NAME_PATTERN = re.compile(
+        r'blobs/(?P<kind>members|minified|sourcemaps)/(?P<prefix>[0-9a-f]{2})/'
+        r'(?P<key>(?P=prefix)[0-9a-f]{62}(?:-[a-z0-9.-]+)?)'
+    )
+
+    def __init__(self, cache_dir: Path, repo_root: Optional[Path] = None):
+        """
+        Inicializa o BuildCache
+
+        Args:
+            cache_dir: Diretório de cache (ex: <projeto>/.cache)
+            repo_root: Raiz dos caminhos relativos dentro do repositório git; com ela
+                os digests também são reconhecidos pelo blob do git (ex: checkout novo no CI)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.repo_root = Path(repo_root) if repo_root else None
+        self.cache_path = self.cache_dir / "build-cache.json"
+        self.lock_path = self.cache_dir / "build-cache.lock"
+        self.blobs_dir = self.cache_dir / "blobs"
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.persist = True
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    @_synchronized
+    def data(self) -> Dict[str, Any]:
+        """Conteúdo do cache (carregado sob demanda)"""
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    def _load(self) -> Dict[str, Any]:
+        """
+        Carrega o cache do disco, descartando formatos incompatíveis
+
+        Returns:
+            Dicionário com o conteúdo do cache
+        """
+        empty = {'version': self.CACHE_VERSION, 'files': {}, 'compressed': {}, 'crc32': {}, 'strategies': {},
+                 'state': {}}
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return empty
+
+        if data.get('version') != self.CACHE_VERSION:
+            return empty
+
+        data.setdefault('files', {})
+        data.setdefault('compressed', {})
+        data.setdefault('crc32', {})
+        data.setdefault('strategies', {})
+        data.setdefault('state', {})
+        return data
+
+    @contextlib.contextmanager
+    def in_memory(self):
+        """
+        Usa o cache sem gravar no disco (build em memória)
+
+        Consultas continuam valendo; registros ficam só em memória: save() e
+        put_blob() não escrevem nada enquanto o contexto estiver ativo.
+        """
+        previous, self.persist = self.persist, False
+        try:
+            yield self
+        finally:
+            self.persist = previous
+
+    @_synchronized
+    def save(self):
+        """
+        Salva o cache no disco se houve alterações
+
+        Builds simultâneos (ex: vários --out) compartilham o cache: a gravação é
+        feita sob trava e incorpora o que outro processo salvou desde a leitura,
+        sem sobrescrever as entradas deste.
+        """
+        if not self._dirty or not self.persist:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.lock_path):
+            on_disk = self._load()
+            self._merge(on_disk)
+            for key, value in on_disk['state'].items():
+                self.data['state'].setdefault(key, value)
+
+            tmp_path = self.cache_path.with_name(f"build-cache.{uuid.uuid4().hex}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> list:
+        """Assinatura barata do arquivo (tamanho + mtime em ns)"""
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @_synchronized
+    def is_current(self, relative_path: str, stat: os.stat_result) -> bool:
+        """Se o digest em cache vale para o arquivo pela assinatura (sem contabilizar)"""
+        entry = self.data['files'].get(relative_path)
+        return bool(entry) and entry['stat'] == self._signature(stat)
+
+    @_synchronized
+    def get_digest(self, relative_path: str, stat: os.stat_result,
+                   blob_id: Optional[str] = None) -> Optional[str]:
+        """
+        Obtém digest SHA-256 em cache se o arquivo não mudou
+
+        A assinatura (tamanho + mtime) só vale na mesma cópia de trabalho. Em
+        um checkout novo (cache importado no CI) os mtimes mudam; aí a entrada
+        vale se o blob do git e o tamanho do arquivo forem os registrados, e a
+        assinatura é atualizada.
+
+        Args:
+            relative_path: Caminho relativo (formato POSIX)
+            stat: Resultado de os.stat do arquivo
+            blob_id: Blob do git do arquivo, se versionado e sem alterações locais
+
+        Returns:
+            Digest hexadecimal ou None
+        """
+        entry = self.data['files'].get(relative_path)
+        signature = self._signature(stat)
+        hit = bool(entry) and (entry['stat'] == signature or (
+            blob_id is not None and entry.get('blob') == blob_id and entry['stat'][0] == stat.st_size))
+        self._record('digests', hit)
+        if not hit:
+            return None
+        if entry['stat'] != signature:
+            self.set_digest(relative_path, stat, entry['sha256'], blob_id)
+        return entry['sha256']
+
+    @_synchronized
+    def set_digest(self, relative_path: str, stat: os.stat_result, sha256: str,
+                   blob_id: Optional[str] = None):
+        """
+        Registra digest SHA-256 de um arquivo
+
+        Args:
+            relative_path: Caminho relativo (formato POSIX)
+            stat: Resultado de os.stat do arquivo
+            sha256: Digest hexadecimal
+            blob_id: Blob do git do arquivo (torna a entrada reutilizável em outro checkout)
+        """
+        entry = {'stat': self._signature(stat), 'sha256': sha256}
+        if blob_id:
+            entry['blob'] = blob_id
+        if self.data['files'].get(relative_path) != entry:
+            self.data['files'][relative_path] = entry
+            self._dirty = True
+
+    def git_blob_ids(self) -> Dict[str, str]:
+        """
+        Blobs do git dos arquivos versionados sem alterações locais
+
+        Lê o índice (git ls-files) e descarta o que difere da cópia de trabalho
+        (git diff), sem ler o conteúdo dos arquivos inalterados.
+
+        Returns:
+            Mapa caminho relativo a repo_root → blob (vazio sem repo_root ou fora de um repositório)
+        """
+        if self.repo_root is None:
+            return {}
+        try:
+            staged = subprocess.run(['git', 'ls-files', '--stage', '-z'], cwd=self.repo_root,
+                                    capture_output=True, check=True).stdout.decode('utf-8')
+            changed = subprocess.run(['git', 'diff', '--name-only', '--relative', '-z'], cwd=self.repo_root,
+                                     capture_output=True, check=True).stdout.decode('utf-8')
+        except (OSError, subprocess.CalledProcessError, UnicodeDecodeError):
+            return {}
+
+        modified = set(changed.split('\0'))
+        blob_ids = {}
+        for record in staged.split('\0'):
+            info, _, path = record.partition('\t')
+            fields = info.split()
+            # Só entradas normais (estágio 0); conflitos de merge ficam de fora
+            if len(fields) == 3 and fields[2] == '0' and path not in modified:
+                blob_ids[path] = fields[1]
+        return blob_ids
+
+    @_synchronized
+    def get_compressed_size(self, sha256: str, method: str) -> Optional[int]:
+        """
+        Obtém tamanho comprimido conhecido para um conteúdo
+
+        Args:
+            sha256: Digest do conteúdo
+            method: Identificador do método (ex: 'deflate-6')
+
+        Returns:
+            Tamanho comprimido em bytes ou None
+        """
+        return self.data['compressed'].get(sha256, {}).get(method)
+
+    @_synchronized
+    def set_compressed_size(self, sha256: str, method: str, size: int):
+        """
+        Registra tamanho comprimido de um conteúdo
+
+        Args:
+            sha256: Digest do conteúdo
+            method: Identificador do método (ex: 'deflate-6')
+            size: Tamanho comprimido em bytes
+        """
+        sizes = self.data['compressed'].setdefault(sha256, {})
+        if sizes.get(method) != size:
+            sizes[method] = size
+            self._dirty = True
+
+    @_synchronized
+    def get_strategy(self, sha256: str) -> Optional[str]:
+        """
+        Obtém o método de compressão escolhido para um conteúdo
+
+        Args:
+            sha256: Digest do conteúdo
+
+        Returns:
+            Método (ex: 'stored', 'deflate-9') ou None se ainda não escolhido
+        """
+        method = self.data['strategies'].get(sha256)
+        self._record('strategies', method is not None)
+        return method
+
+    @_synchronized
+    def set_strategy(self, sha256: str, method: str):
+        """
+        Registra o método de compressão escolhido para um conteúdo
+
+        Args:
+            sha256: Digest do conteúdo
+            method: Método (ex: 'stored', 'deflate-9')
+        """
+        if self.data['strategies'].get(sha256) != method:
+            self.data['strategies'][sha256] = method
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Blobs (membros comprimidos e saídas minificadas)
+    # ------------------------------------------------------------------
+
+    def _blob_path(self, kind: str, key: str) -> Path:
+        """Caminho do blob de uma categoria"""
+        if kind not in self.BLOB_KINDS:
+            raise ValueError(f"Categoria de blob desconhecida: {kind}")
+        return self.blobs_dir / kind / key[:2] / key
+
+    def get_blob(self, kind: str, key: str) -> Optional[bytes]:
+        """
+        Obtém blob em cache
+
+        Args:
+            kind: Categoria ('members', 'minified' ou 'sourcemaps')
+            key: Chave do blob (ex: '<sha256>-deflate-6', '<sha256>-stored')
+
+        Returns:
+            Conteúdo do blob ou None
+        """
+        try:
+            data = self._blob_path(kind, key).read_bytes()
+        except FileNotFoundError:
+            data = None
+        self._record(kind, data is not None)
+        return data
+
+    def put_blob(self, kind: str, key: str, data: bytes):
+        """
+        Grava blob no cache (escrita atômica)
+
+        Args:
+            kind: Categoria ('members', 'minified' ou 'sourcemaps')
+            key: Chave do blob
+            data: Conteúdo
+        """
+        blob_path = self._blob_path(kind, key)
+        if not self.persist:
+            return
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob_path.with_name(f"{blob_path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, blob_path)
+
+    @_synchronized
+    def get_member(self, sha256: str, method: str) -> Optional[Tuple[bytes, int]]:
+        """
+        Obtém membro de ZIP já comprimido para um conteúdo
+
+        Args:
+            sha256: Digest do conteúdo original
+            method: Identificador do método (ex: 'deflate-6')
+
+        Returns:
+            Tupla (dados_comprimidos, crc32) ou None
+        """
+        crc = self.data['crc32'].get(sha256)
+        size = self.get_compressed_size(sha256, method)
+        data = self.get_blob('members', f"{sha256}-{method}") if crc is not None else None
+
+        if data is None or len(data) != size:
+            return None
+        return data, crc
+
+    @_synchronized
+    def put_member(self, sha256: str, method: str, data: bytes, crc: int):
+        """
+        Registra membro de ZIP comprimido para um conteúdo
+
+        Args:
+            sha256: Digest do conteúdo original
+            method: Identificador do método (ex: 'deflate-6')
+            data: Dados comprimidos
+            crc: CRC-32 do conteúdo original
+        """
+        self.put_blob('members', f"{sha256}-{method}", data)
+        self.set_compressed_size(sha256, method, len(data))
+        if self.data['crc32'].get(sha256) != crc:
+            self.data['crc32'][sha256] = crc
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Estatísticas
+    # ------------------------------------------------------------------
+
+    @_synchronized
+    def _record(self, category: str, hit: bool):
+        """Contabiliza acerto ou falha de uma categoria"""
+        counters = self.stats.setdefault(category, {'hits': 0, 'misses': 0})
+        counters['hits' if hit else 'misses'] += 1
+
+    @_synchronized
+    def get_hit_rates(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtém taxa de acerto por categoria desde a criação do objeto
+
+        Returns:
+            Mapa categoria → {hits, misses, hit_rate}
+        """
+        rates = {}
+        for category, counters in sorted(self.stats.items()):
+            total = counters['hits'] + counters['misses']
+            rates[category] = dict(counters, hit_rate=round(counters['hits'] / total * 100, 1) if total else 0.0)
+        return rates
+
+    @_synchronized
+    def get_state(self, key: str) -> Optional[Any]:
+        """
+        Obtém valor de estado do build (ex: digest do dist/ atual)
+
+        Args:
+            key: Nome do estado
+
+        Returns:
+            Valor armazenado ou None
+        """
+        return self.data['state'].get(key)
+
+    @_synchronized
+    def set_state(self, key: str, value: Any):
+        """
+        Registra valor de estado do build
+
+        Args:
+            key: Nome do estado
+            value: Valor serializável em JSON
+        """
+        if self.data['state'].get(key) != value:
+            self.data['state'][key] = value
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Exportação / importação (CI)
+    # ------------------------------------------------------------------
+
+    @_synchronized
+    def export_archive(self, archive_path: Path) -> Dict[str, Any]:
+        """
+        Exporta todo o cache em um único arquivo .tar.gz
+
+        O arquivo contém MANIFEST.json com o SHA-256 de cada membro.
+
+        Args:
+            archive_path: Caminho do arquivo de saída
+
+        Returns:
+            Dicionário com quantidade de entradas e tamanho do arquivo
+        """
+        self._add_blob_ids()
+        self.save()
+        archive_path = Path(archive_path)
+
+        members = {}
+        if self.cache_path.exists():
+            members['build-cache.json'] = self.cache_path
+        for kind in self.BLOB_KINDS:
+            kind_dir = self.blobs_dir / kind
+            if kind_dir.is_dir():
+                for blob_path in sorted(kind_dir.glob('*/*')):
+                    if blob_path.is_file() and not blob_path.name.endswith('.tmp'):
+                        members[f"blobs/{kind}/{blob_path.parent.name}/{blob_path.name}"] = blob_path
+
+        manifest = {
+            'version': self.CACHE_VERSION,
+            'created': time.time(),
+            'files': {}
+        }
+
+        tmp_path = archive_path.with_name(f"{archive_path.name}.{uuid.uuid4().hex}.tmp")
+        with tarfile.open(tmp_path, 'w:gz') as tar:
+            for name, path in members.items():
+                data = path.read_bytes()
+                manifest['files'][name] = hashlib.sha256(data).hexdigest()
+                self._add_tar_member(tar, name, data)
+            self._add_tar_member(tar, self.ARCHIVE_MANIFEST,
+                                 json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+        os.replace(tmp_path, archive_path)
+
+        return {
+            'path': str(archive_path),
+            'entries': len(members),
+            'size': archive_path.stat().st_size,
+            'files': len(self.data['files']),
+            'members': sum(1 for name in members if name.startswith('blobs/members/')),
+            'minified': sum(1 for name in members if name.startswith('blobs/minified/')),
+            'sourcemaps': sum(1 for name in members if name.startswith('blobs/sourcemaps/')),
+            'tasks': sum(1 for key in self.data['state'] if key.startswith(self.TASK_STATE_PREFIX))
+        }
+
+    @_synchronized
+    def _add_blob_ids(self):
+        """Completa com o blob do git as entradas de digest ainda atuais (reuso em outro checkout)"""
+        if self.repo_root is None:
+            return
+        blob_ids = None
+        for relative_path, entry in self.data['files'].items():
+            if 'blob' in entry:
+                continue
+            if blob_ids is None:
+                blob_ids = self.git_blob_ids()
+            if relative_path not in blob_ids:
+                continue
+            try:
+                stat = (self.repo_root / relative_path).stat()
+            except OSError:
+                continue
+            if entry['stat'] == self._signature(stat):
+                self.set_digest(relative_path, stat, entry['sha256'], blob_ids[relative_path])
+
+    @staticmethod
+    def _add_tar_member(tar: tarfile.TarFile, name: str, data: bytes):
+        """Adiciona bytes ao tar com metadados determinísticos"""
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mode = 0o644
+        tar.addfile(info, io.BytesIO(data))
+
+    @_synchronized
+    def import_archive(self, archive_path: Path) -> Dict[str, Any]:
+        """
+        Importa cache exportado, verificando a integridade de cada membro
+
+        Membros cujo SHA-256 não confere com o manifesto, caminhos fora do cache
+        e membros comprimidos cujo conteúdo não corresponde ao digest da chave
+        são rejeitados. Entradas importadas são mescladas ao cache local.
+
+        Args:
+            archive_path: Caminho do arquivo exportado
+
+        Returns:
+            Dicionário com entradas importadas e rejeitadas
+
+        Raises:
+            ValueError: Se o arquivo não for um cache válido
+        """
+        with tarfile.open(archive_path, 'r:gz') as tar:
+            try:
+                manifest = json.load(tar.extractfile(self.ARCHIVE_MANIFEST))
+            except (KeyError, json.JSONDecodeError):
+                raise ValueError("Arquivo de cache inválido: MANIFEST.json ausente ou corrompido")
+
+            if manifest.get('version') != self.CACHE_VERSION:
+                raise ValueError(
+                    f"Versão de cache incompatível: {manifest.get('version')} (esperado {self.CACHE_VERSION})"
+                )
+
+            expected = manifest.get('files', {})
+            imported = {'files': 0, 'members': 0, 'minified': 0, 'sourcemaps': 0, 'tasks': 0}
+            rejected = []
+            cache_data = None
+            verified_members = {}
+
+            for info in tar.getmembers():
+                name = info.name
+                if name == self.ARCHIVE_MANIFEST:
+                    continue
+                if not info.isfile() or name not in expected:
+                    rejected.append(name)
+                    continue
+
+                data = tar.extractfile(info).read()
+                if hashlib.sha256(data).hexdigest() != expected[name]:
+                    rejected.append(name)
+                    continue
+
+                if name == 'build-cache.json':
+                    cache_data = json.loads(data)
+                    continue
+
+                match = self.BLOB_NAME_PATTERN.fullmatch(name)
+                if not match:
+                    rejected.append(name)
+                    continue
+
+                kind, key = match.group('kind'), match.group('key')
+                if kind == 'members':
+                    crc = self._verify_member(key, data)
+                    if crc is None:
+                        rejected.append(name)
+                        continue
+                    verified_members[key] = (len(data), crc)
+
+                self.put_blob(kind, key, data)
+                imported[kind] += 1
+
+        if cache_data and cache_data.get('version') == self.CACHE_VERSION:
+            imported['files'] = self._merge(cache_data)
+            imported['tasks'] = self._merge_task_states(cache_data)
+
+        # Metadados dos membros vêm do próprio conteúdo verificado
+        for key, (size, crc) in verified_members.items():
+            sha256, _, method = key.partition('-')
+            self.set_compressed_size(sha256, method, size)
+            self.data['crc32'][sha256] = crc
+            self._dirty = True
+
+        if cache_data or verified_members:
+            self.set_state('imported', {
+                'archive': Path(archive_path).name,
+                'created': manifest.get('created'),
+                'imported_at': time.time()
+            })
+            self.save()
+
+        return {'imported': imported, 'rejected': rejected}
+
+    @staticmethod
+    def _verify_member(key: str, data: bytes) -> Optional[int]:
+        """
+        Confere se o membro (deflate ou stored) corresponde ao conteúdo da chave
+
+        Returns:
+            CRC-32 do conteúdo ou None se inválido
+        """
+        sha256, _, method = key.partition('-')
+        if method == 'stored':
+            content = data
+        elif method.startswith('deflate'):
+            try:
+                content = zlib.decompress(data, -15)
+            except zlib.error:
+                return None
+        else:
+            return None
+        if hashlib.sha256(content).hexdigest() != sha256:
+            return None
+        return zlib.crc32(content)
+
+    @_synchronized
+    def _merge(self, other: Dict[str, Any]) -> int:
+        """
+        Mescla conteúdo de outro cache sem sobrescrever entradas locais
+
+        Args:
+            other: Conteúdo de build-cache.json importado
+
+        Returns:
+            Número de digests de arquivos importados
+        """
+        added = 0
+        for relative_path, entry in other.get('files', {}).items():
+            if relative_path not in self.data['files']:
+                self.data['files'][relative_path] = entry
+                added += 1
+
+        for sha256, sizes in other.get('compressed', {}).items():
+            local = self.data['compressed'].setdefault(sha256, {})
+            for method, size in sizes.items():
+                local.setdefault(method, size)
+
+        for sha256, crc in other.get('crc32', {}).items():
+            self.data['crc32'].setdefault(sha256, crc)
+
+        for sha256, method in other.get('strategies', {}).items():
+            self.data['strategies'].setdefault(sha256, method)
+
+        self._dirty = True
+        return added
+
+    @_synchronized
+    def _merge_task_states(self, other: Dict[str, Any]) -> int:
+        """
+        Mescla os carimbos de tarefa de outro cache sem sobrescrever os locais
+
+        Os demais estados (ex: digest do dist/) descrevem o checkout de origem
+        e não são importados.
+
+        Args:
+            other: Conteúdo de build-cache.json importado
+
+        Returns:
+            Número de carimbos importados
+        """
+        added = 0
+        for key, value in other.get('state', {}).items():
+            if key.startswith(self.TASK_STATE_PREFIX) and key not in self.data['state']:
+                self.data['state'][key] = value
+                added += 1
+        if added:
+            self._dirty = True
+        return added
@@ -9,7 +9,6 @@ Data: 2025-08-12
 
 import json
 import sys
-from pathlib import Path
 from build import ExtensionBuilder
 
 
@@ -20,56 +19,20 @@ def create_current_version_build():
     print("━" * 60)
     
     try:
-        # Inicializar builder
+        # Mesmo caminho do build.py --no-bump: diretório de trabalho, etapas de
+        # transformação e publicação atômica do dist/ sob a trava
         builder = ExtensionBuilder()
+        result = builder.build_extension(bump=False, auto_cleanup=False)
         
-        # Obter versão atual
-        current_version = builder.get_current_version()
-        print(f"📦 Versão atual: {current_version}")
+        if not result['success']:
+            raise ValueError(result['error'])
         
-        # Preparar arquivos
-        print("📋 Preparando arquivos para distribuição...")
-        files_to_include = builder.get_files_to_include()
-        
-        if not files_to_include:
-            raise ValueError("Nenhum arquivo encontrado para incluir no build")
-        
-        print("━" * 60)
-        
-        # Criar estrutura dist
-        print("📂 Criando estrutura de distribuição...")
-        file_info = builder.create_dist_structure(files_to_include)
-        
-        print("━" * 60)
-        
-        # Criar pacote ZIP
-        print("📦 Criando pacote ZIP...")
-        zip_path, zip_info = builder.create_zip_package(current_version, file_info)
+        current_version = result['version']
+        zip_info = result['zip_info']
+        file_info = result['file_info']
         
         print("━" * 60)
         
-        # Gerar informações de build (sem version_type pois não houve incremento)
-        print("📋 Gerando informações de build...")
-        build_info = {
-            'version': current_version,
-            'version_type': 'current',
-            'build_date': builder.version_bumper.get_current_datetime(),
-            'build_timestamp': int(builder.version_bumper.get_current_datetime().timestamp()) if hasattr(builder.version_bumper.get_current_datetime(), 'timestamp') else 0,
-            'platform': sys.platform,
-            'python_version': sys.version,
-            'project_root': str(builder.project_root),
-            'files': file_info,
-            'zip': zip_info,
-            'manifest_info': builder._get_manifest_info()
-        }
-        
-        # Salvar arquivo de build
-        build_info_path = builder.project_root / f"build-info-v{current_version}.json"
-        with open(build_info_path, 'w', encoding='utf-8') as f:
-            json.dump(build_info, f, indent=2, ensure_ascii=False, default=str)
-        
-        print(f"📋 Informações salvas: build-info-v{current_version}.json")
-        
         # Criar informações de release
         print("📋 Gerando informações para GitHub release...")
         
@@ -102,16 +65,8 @@ Esta é a primeira versão estável da extensão Help OTRS - MAPA, marcando o in
 """
         }
         
-        # Simular build_result para create_github_release_info
-        build_result = {
-            'success': True,
-            'version': current_version,
-            'version_info': version_result,
-            'zip_file': str(zip_path),
-            'zip_info': zip_info,
-            'file_info': file_info,
-            'build_info': build_info
-        }
+        # Notas do primeiro release no lugar das do rebuild
+        build_result = dict(result, version_info=version_result)
         
         release_info = builder.create_github_release_info(build_result)
         release_file = f"github-release-v{current_version}.json"
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Log de eventos do build
+Grava os eventos do build em NDJSON à medida que acontecem, exibe o progresso no
+console conforme o nível escolhido e monta o resumo do build-info a partir do fluxo
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+
+class ConsoleRenderer:
+    """Progresso no console (nível summary): uma linha por etapa concluída"""
+
+    def render(self, record: Dict[str, Any]):
+        """Exibe um evento (chamado sob a trava do log, na thread que o emitiu)"""
+        if record['event'] == 'stage.end':
+            icon = {'done': '✔️', 'skipped': '⏭️', 'failed': '❌'}.get(record['status'], '•')
+            print(f"   {icon} {record['name']} em {record['seconds']:.3f}s")
+
+
+class QuietRenderer(ConsoleRenderer):
+    """Nível quiet: nada no console (o resumo fica no log e no build-info)"""
+
+    def render(self, record: Dict[str, Any]):
+        pass
+
+
+class VerboseRenderer(ConsoleRenderer):
+    """Nível verbose: etapas e uma linha por arquivo"""
+
+    def render(self, record: Dict[str, Any]):
+        event = record['event']
+        if event == 'file.discovered':
+            print(f"   🔎 {record['path']} ({record['size']} bytes)")
+        elif event == 'file.copied':
+            print(f"   📄 {record['path']} ({record['size'] / 1024:.2f} KB)")
+        elif event == 'file.changed':
+            print(f"   ✏️ {record['path']} ({record['stage']}, {record['size']} bytes)")
+        elif event == 'file.compressed':
+            origin = ' (cache)' if record['cached'] else ''
+            print(f"   🗜️ {record['path']}: {record['method']} "
+                  f"{record['size']} → {record['compressed_size']} bytes{origin}")
+        else:
+            super().render(record)
+
+
+RENDERERS = {'quiet': QuietRenderer, 'summary': ConsoleRenderer, 'verbose': VerboseRenderer}
+
+
+class BuildEventLog:
+    """Classe responsável pelo fluxo de eventos do build (NDJSON) e pelo resumo montado a partir dele"""
+
+    # Campos de 'file.copied' que formam a entrada da tabela de arquivos
+    FILE_FIELDS = ('name', 'size', 'size_kb', 'modified', 'sha256')
+
+    def __init__(self, renderer: Optional[ConsoleRenderer] = None):
+        """
+        Inicializa o BuildEventLog
+
+        Args:
+            renderer: Exibição no console (padrão: ConsoleRenderer, nível summary)
+        """
+        self.renderer = renderer or ConsoleRenderer()
+        self.path: Optional[Path] = None
+        self._file = None
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        """Zera o estado montado a partir dos eventos"""
+        self._start = time.monotonic()
+        self.count = 0
+        self.counts: Dict[str, int] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.compression: Dict[str, Dict[str, int]] = {}
+
+    def open(self, path: Optional[Path] = None):
+        """
+        Inicia o fluxo de um build (zera o estado anterior)
+
+        Args:
+            path: Arquivo NDJSON (sobrescrito); None mantém os eventos só em memória
+        """
+        self.close()
+        self._reset()
+        self.path = Path(path) if path else None
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'w', encoding='utf-8')
+
+    def close(self):
+        """Encerra o arquivo do fluxo (o estado continua disponível)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def emit(self, event: str, **fields):
+        """
+        Registra um evento: grava uma linha no NDJSON, atualiza o resumo e exibe
+
+        Pode ser chamado de qualquer thread do build.
+
+        Args:
+            event: Tipo (ex: 'file.copied', 'stage.end')
+            **fields: Dados do evento (serializáveis em JSON)
+        """
+        record = {'t': round(time.monotonic() - self._start, 4), 'event': event}
+        record.update(fields)
+        with self._lock:
+            if self._file is not None:
+                self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str))
+                self._file.write('\n')
+                if event == 'stage.end':
+                    self._file.flush()  # Acompanhável com tail -f
+            self._reduce(record)
+            self.renderer.render(record)
+
+    def _reduce(self, record: Dict[str, Any]):
+        """Atualiza o resumo com um evento"""
+        event = record['event']
+        self.count += 1
+        self.counts[event] = self.counts.get(event, 0) + 1
+
+        if event == 'dist.created':
+            self.files = {}
+        elif event == 'file.copied':
+            self.files[record['path']] = {key: record[key] for key in self.FILE_FIELDS}
+        elif event == 'file.changed':
+            # Arquivo novo (ex: folha extraída) entra no fim, como em create_dist_structure
+            entry = self.files.setdefault(record['path'], {'name': record['name'], 'size': 0, 'size_kb': 0,
+                                                           'modified': record['modified'], 'sha256': None})
+            entry.update(size=record['size'], size_kb=round(record['size'] / 1024, 2), sha256=record['sha256'])
+        elif event == 'file.compressed':
+            method = self.compression.setdefault(record['method'], {'files': 0, 'bytes': 0, 'cached': 0})
+            method['files'] += 1
+            method['bytes'] += record['compressed_size']
+            method['cached'] += bool(record['cached'])
+        elif event == 'stage.end':
+            self.stages[record['name']] = {'status': record['status'], 'seconds': record['seconds']}
+
+    def file_info(self) -> Dict[str, Any]:
+        """Arquivos do dist/ (cópias e transformações), no formato de create_dist_structure"""
+        files = [dict(entry) for entry in self.files.values()]
+        total_size = sum(entry['size'] for entry in files)
+        return {
+            'files': files,
+            'total_files': len(files),
+            'total_size': total_size,
+            'total_size_kb': round(total_size / 1024, 2),
+            'total_size_mb': round(total_size / (1024 * 1024), 2)
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumo do fluxo para o build-info (seção 'events')"""
+        return {
+            'log': str(self.path) if self.path else None,
+            'events': self.count,
+            'counts': dict(sorted(self.counts.items())),
+            'stages': self.stages,
+            'compression': dict(sorted(self.compression.items()))
+        }
+
+    @staticmethod
+    def read(path: Path) -> Iterator[Dict[str, Any]]:
+        """Eventos de um NDJSON gravado (linhas inválidas, ex: build interrompido, são ignoradas)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    @classmethod
+    def replay(cls, path: Path, renderer: Optional[ConsoleRenderer] = None) -> 'BuildEventLog':
+        """
+        Reconstrói o resumo de um log gravado, exibindo os eventos no nível escolhido
+
+        Returns:
+            BuildEventLog com o estado ao fim do log (sem arquivo aberto)
+        """
+        log = cls(renderer or QuietRenderer())
+        for record in cls.read(path):
+            log._reduce(record)
+            log.renderer.render(record)
+        log.path = Path(path)
+        return log
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(description='Exibe e resume um log de eventos do build (NDJSON)')
+    parser.add_argument('log', nargs='?', default='build-events.ndjson', help='Arquivo NDJSON do build')
+    parser.add_argument('--progress', choices=sorted(RENDERERS), default='summary',
+                        help='Eventos exibidos durante a leitura')
+    parser.add_argument('--json', action='store_true', help='Exibe o resumo em JSON')
+    args = parser.parse_args()
+
+    try:
+        log = BuildEventLog.replay(Path(args.log), RENDERERS[args.progress]())
+    except OSError as error:
+        print(f"❌ Erro ao ler {args.log}: {error}", file=sys.stderr)
+        return 1
+
+    summary = log.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        return 0
+
+    file_info = log.file_info()
+    print(f"📜 {args.log}: {summary['events']} eventos")
+    print(f"📊 Arquivos: {file_info['total_files']} ({file_info['total_size_kb']:.2f} KB)")
+    for method, info in summary['compression'].items():
+        print(f"🗜️ {method}: {info['files']} arquivos ({info['cached']} do cache), {info['bytes']} bytes")
+    for name, stage in sorted(summary['stages'].items(), key=lambda item: -item[1]['seconds']):
+        print(f"⏱️ {name}: {stage['status']} em {stage['seconds']:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
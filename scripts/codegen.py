@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Geração de módulos JS em tempo de build (src/generated/)
+Pré-compila tabelas usadas em todo carregamento de página pelos content scripts
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import json
+import os
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from tenants import TenantConfig
+
+
+class CodeGenerator:
+    """Classe responsável por gerar os módulos de src/generated/"""
+
+    GENERATED_DIR = 'src/generated'
+
+    # Indicadores de página OTRS (ConfigManager.detectCurrentOtrsSystem)
+    OTRS_PATH_INDICATORS = ['/otrs/', 'index.pl', 'Action=Agent']
+
+    # Caminhos que começam com este prefixo também são OTRS
+    OTRS_PATH_PREFIX = '/otrs'
+
+    # Especificação declarativa dos sinônimos de nível de usuário
+    LEVEL_SPEC_FILE = 'level-synonyms.json'
+    LEVEL_SPEC_VERSION = 1
+
+    def __init__(self, project_root: Path, tenant_config: Optional[TenantConfig] = None):
+        """
+        Inicializa o CodeGenerator
+
+        Args:
+            project_root: Caminho raiz do projeto
+            tenant_config: Configuração dos órgãos (padrão: <projeto>/tenants.json)
+        """
+        self.project_root = Path(project_root)
+        self.generated_dir = self.project_root / self.GENERATED_DIR
+        self.tenant_config = tenant_config or TenantConfig(self.project_root / "tenants.json")
+
+    def render_all(self) -> Dict[str, bytes]:
+        """
+        Conteúdo de todos os módulos, sem gravar
+
+        Returns:
+            Mapa nome do arquivo (em src/generated/) → conteúdo
+        """
+        return {
+            'otrsMatcher.js': self.render_otrs_matcher(),
+            'levelTable.js': self.render_level_table()
+        }
+
+    def generate_all(self) -> List[Path]:
+        """
+        Gera todos os módulos, gravando apenas os que mudaram
+
+        Returns:
+            Lista de arquivos reescritos
+        """
+        changed = []
+        for name, content in self.render_all().items():
+            path = self.generated_dir / name
+            if path.exists() and path.read_bytes() == content:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Troca atômica: outro build simultâneo pode estar lendo o módulo
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            temp_path.write_bytes(content)
+            os.replace(temp_path, path)
+            changed.append(path)
+        return changed
+
+    @staticmethod
+    def _header(title: str, description: str) -> str:
+        """Cabeçalho padrão dos módulos gerados"""
+        return (
+            "/**\n"
+            f" * {title}\n"
+            " * \n"
+            " * Arquivo gerado por scripts/codegen.py - não editar manualmente.\n"
+            f"{description}"
+            " */\n"
+        )
+
+    @staticmethod
+    def _js_value(value: Any, indent: int = 4) -> str:
+        """Serializa valor como literal JS indentado dentro do módulo"""
+        return json.dumps(value, indent=4, ensure_ascii=False).replace('\n', '\n' + ' ' * indent)
+
+    # ------------------------------------------------------------------
+    # Detecção de sistema OTRS
+    # ------------------------------------------------------------------
+
+    def build_otrs_path_pattern(self) -> str:
+        """
+        Combina os indicadores de caminho OTRS em uma única regex
+
+        Equivale a: url.includes('/otrs/') || url.includes('index.pl') ||
+        url.includes('Action=Agent') || pathname.startsWith('/otrs')
+
+        Returns:
+            Fonte da regex (sem delimitadores)
+        """
+        prefix = r'^[^:]+://[^/?#]*' + re.escape(self.OTRS_PATH_PREFIX)
+        return self._js_regex([prefix] + [re.escape(indicator) for indicator in self.OTRS_PATH_INDICATORS])
+
+    def build_otrs_indicator_pattern(self) -> str:
+        """
+        Regex apenas dos indicadores (fallback para URLs base inválidas)
+
+        Returns:
+            Fonte da regex (sem delimitadores)
+        """
+        return self._js_regex([re.escape(indicator) for indicator in self.OTRS_PATH_INDICATORS])
+
+    @staticmethod
+    def _js_regex(alternatives: List[str]) -> str:
+        """Une alternativas em uma regex para literal /.../ do JS (barras escapadas)"""
+        return '|'.join(alternatives).replace('/', r'\/')
+
+    def build_known_systems(self) -> Dict[str, List[str]]:
+        """
+        Pré-processa as URLs base conhecidas (tenants.json)
+
+        Returns:
+            Mapa URL base → [hostname, pathname]
+        """
+        known = {}
+        try:
+            tenants = self.tenant_config.tenants
+        except FileNotFoundError:
+            return known
+
+        for tenant in tenants.values():
+            for system in tenant['systems']:
+                base_url = system['baseUrl'] if system['baseUrl'].endswith('/') else system['baseUrl'] + '/'
+                parsed = urlparse(base_url)
+                known[base_url] = [parsed.hostname, parsed.path or '/']
+        return dict(sorted(known.items()))
+
+    def render_otrs_matcher(self) -> bytes:
+        """
+        Gera src/generated/otrsMatcher.js
+
+        Returns:
+            Conteúdo do módulo JS
+        """
+        header = self._header(
+            'Detecção pré-compilada de sistema OTRS por URL',
+            " * \n"
+            " * match() indexa os sistemas configurados por hostname uma única vez\n"
+            " * (URLs base conhecidas já vêm pré-processadas de tenants.json) e\n"
+            " * testa os indicadores de caminho OTRS com uma única regex.\n"
+        )
+
+        body = f"""
+(function(global) {{
+    'use strict';
+
+    // Indicadores de caminho OTRS combinados (/otrs/, index.pl, Action=Agent)
+    const OTRS_PATH_PATTERN = /{self.build_otrs_path_pattern()}/;
+    const OTRS_INDICATOR_PATTERN = /{self.build_otrs_indicator_pattern()}/;
+
+    // URL base → [hostname, pathname] dos sistemas conhecidos
+    const KNOWN_SYSTEMS = {self._js_value(self.build_known_systems())};
+
+    const indexCache = new WeakMap();
+
+    /**
+     * Extrair hostname e caminho de uma URL base (tabela pré-compilada primeiro)
+     * @param {{string}} baseUrl - URL base do sistema
+     * @returns {{Array|null}} [hostname, pathname] ou null se inválida
+     */
+    function parseBaseUrl(baseUrl) {{
+        const known = KNOWN_SYSTEMS[baseUrl];
+        if (known) {{
+            return known;
+        }}
+        try {{
+            const url = new URL(baseUrl);
+            return [url.hostname, url.pathname];
+        }} catch (error) {{
+            return null;
+        }}
+    }}
+
+    /**
+     * Indexar sistemas habilitados por hostname (uma vez por array de sistemas)
+     * @param {{Array}} systems - Sistemas configurados
+     * @returns {{Object}} Índice {{ byHost: Map, invalid: Array }}
+     */
+    function buildIndex(systems) {{
+        let index = indexCache.get(systems);
+        if (index) {{
+            return index;
+        }}
+
+        index = {{ byHost: new Map(), invalid: [] }};
+        systems.forEach((system, order) => {{
+            if (!system || !system.enabled || !system.baseUrl) {{
+                return;
+            }}
+            const parsed = parseBaseUrl(system.baseUrl);
+            if (!parsed) {{
+                // Mesmo fallback de antes: host contido na URL atual
+                const host = system.baseUrl.replace(/https?:\\/\\//, '').replace(/\\/.*$/, '');
+                index.invalid.push({{ system, order, host }});
+                return;
+            }}
+            const [hostname, pathname] = parsed;
+            if (!index.byHost.has(hostname)) {{
+                index.byHost.set(hostname, []);
+            }}
+            index.byHost.get(hostname).push({{ system, order, pathname }});
+        }});
+
+        indexCache.set(systems, index);
+        return index;
+    }}
+
+    /**
+     * Encontrar o sistema OTRS correspondente a uma URL
+     * @param {{Array}} systems - Sistemas configurados (ordem define prioridade)
+     * @param {{string}} href - URL completa
+     * @param {{string}} hostname - Hostname da URL
+     * @param {{string}} pathname - Caminho da URL
+     * @returns {{Object|null}} Sistema correspondente
+     */
+    function match(systems, href, hostname, pathname) {{
+        if (!Array.isArray(systems) || systems.length === 0) {{
+            return null;
+        }}
+
+        const index = buildIndex(systems);
+        const hasOtrsPath = OTRS_PATH_PATTERN.test(href);
+        let best = null;
+
+        for (const entry of index.byHost.get(hostname) || []) {{
+            if (hasOtrsPath || (entry.pathname !== '/' && pathname.startsWith(entry.pathname))) {{
+                best = entry;
+                break;
+            }}
+        }}
+
+        if (index.invalid.length > 0 && OTRS_INDICATOR_PATTERN.test(href)) {{
+            for (const entry of index.invalid) {{
+                if (best && entry.order > best.order) {{
+                    break;
+                }}
+                if (href.includes(entry.host)) {{
+                    best = entry;
+                    break;
+                }}
+            }}
+        }}
+
+        return best ? best.system : null;
+    }}
+
+    global.HelpOTRS = global.HelpOTRS || {{}};
+    global.HelpOTRS.OtrsMatcher = {{ match, OTRS_PATH_PATTERN, KNOWN_SYSTEMS }};
+
+}})(globalThis);
+"""
+        return (header + body).encode('utf-8')
+
+    # ------------------------------------------------------------------
+    # Normalização de níveis de usuário
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def fold_level(text: str) -> str:
+        """
+        Dobra um texto para a chave da tabela de níveis
+
+        Remove acentos, converte para minúsculas e descarta espaços e pontuação.
+        Deve ser idêntico a fold() em levelTable.js.
+
+        Args:
+            text: Texto original (ex: 'Nível 1 - Serviços aos Usuários de TIC')
+
+        Returns:
+            Chave dobrada (ex: 'nivel1servicosaosusuariosdetic')
+        """
+        text = unicodedata.normalize('NFD', text)
+        text = re.sub('[\u0300-\u036f]', '', text).lower()
+        return re.sub('[^a-z0-9]+', '', text)
+
+    def build_level_table(self) -> Dict[str, str]:
+        """
+        Expande a especificação de sinônimos em uma tabela chave dobrada → nível
+
+        Cada nível gera <prefixo><número><sufixo> para todos os prefixos e
+        sufixos da especificação, além dos seus apelidos.
+
+        Returns:
+            Tabela ordenada por chave
+
+        Raises:
+            ValueError: Se duas variantes de níveis diferentes colidirem
+        """
+        spec_path = self.project_root / self.LEVEL_SPEC_FILE
+        with open(spec_path, 'r', encoding='utf-8') as f:
+            spec = json.load(f)
+
+        if spec.get('version') != self.LEVEL_SPEC_VERSION:
+            raise ValueError(f"Versão de {self.LEVEL_SPEC_FILE} incompatível: {spec.get('version')}")
+
+        table = {}
+        for level in spec['levels']:
+            variants = [
+                f"{prefix} {level['number']}{suffix}"
+                for prefix in spec.get('prefixes', [])
+                for suffix in spec.get('suffixes', [''])
+            ]
+            variants += level.get('aliases', [])
+            variants.append(level['canonical'])
+
+            for variant in variants:
+                key = self.fold_level(variant)
+                if table.get(key, level['canonical']) != level['canonical']:
+                    raise ValueError(f"Sinônimo ambíguo '{variant}': {table[key]} e {level['canonical']}")
+                table[key] = level['canonical']
+
+        return dict(sorted(table.items()))
+
+    def render_level_table(self) -> bytes:
+        """
+        Gera src/generated/levelTable.js
+
+        Returns:
+            Conteúdo do módulo JS
+        """
+        table = self.build_level_table()
+        header = self._header(
+            'Tabela pré-compilada de normalização de níveis de usuário',
+            " * \n"
+            f" * Gerada a partir de {self.LEVEL_SPEC_FILE} ({len(table)} variantes).\n"
+            " * Normalizar um nível é uma dobra (acentos, caixa, espaços e\n"
+            " * pontuação) seguida de uma busca na tabela.\n"
+        )
+
+        body = f"""
+(function(global) {{
+    'use strict';
+
+    // Chave dobrada → nível canônico
+    const LEVELS = Object.freeze({self._js_value(table)});
+
+    /**
+     * Dobrar texto para a chave da tabela (idêntico a CodeGenerator.fold_level)
+     * @param {{string}} text - Texto original
+     * @returns {{string}} Chave dobrada
+     */
+    function fold(text) {{
+        return text.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase().replace(/[^a-z0-9]+/g, '');
+    }}
+
+    /**
+     * Obter nível canônico de um texto
+     * @param {{string}} text - Nível em qualquer grafia
+     * @returns {{string|null}} Nível canônico ou null se desconhecido
+     */
+    function lookup(text) {{
+        return LEVELS[fold(text)] || null;
+    }}
+
+    global.HelpOTRS = global.HelpOTRS || {{}};
+    global.HelpOTRS.LevelTable = {{ fold, lookup, LEVELS }};
+
+}})(globalThis);
+"""
+        return (header + body).encode('utf-8')
+
+
+def main():
+    """Função principal do script"""
+    generator = CodeGenerator(Path(__file__).parent.parent)
+    changed = generator.generate_all()
+
+    for path in changed:
+        print(f"🧬 Gerado: {path.relative_to(generator.project_root)}")
+    if not changed:
+        print("✅ Módulos gerados já estão atualizados")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
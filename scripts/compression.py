@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Escolha do método de compressão por arquivo
+Testa stored e deflate 1–9 dentro de um orçamento de tempo e fica com o menor membro
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import time
+import zipfile
+import zlib
+from typing import Dict, Optional, Tuple
+
+
+class CompressionTuner:
+    """Classe responsável por escolher, arquivo a arquivo, o método que gera o menor membro do ZIP"""
+
+    STORED = 'stored'
+
+    # Níveis testados depois do padrão; os mais altos costumam vencer e vêm primeiro
+    LEVELS = (9, 8, 7, 6, 5, 4, 3, 2, 1)
+
+    # Segundos de busca por build (compartilhados entre os arquivos ainda sem decisão)
+    DEFAULT_BUDGET = 5.0
+
+    def __init__(self, default_level: int = 6, budget: Optional[float] = None):
+        """
+        Inicializa o CompressionTuner
+
+        Args:
+            default_level: Nível deflate sempre testado (usado sem busca e quando o orçamento acaba)
+            budget: Segundos de busca por build (padrão: DEFAULT_BUDGET; 0 desativa a busca)
+        """
+        self.default_level = default_level
+        self.budget = self.DEFAULT_BUDGET if budget is None else max(0.0, budget)
+        self._deadline = None
+
+    @property
+    def default_method(self) -> str:
+        """Método usado sem busca (ex: 'deflate-6')"""
+        return self.method_name(self.default_level)
+
+    @staticmethod
+    def method_name(level: int) -> str:
+        """Identificador de um nível deflate (mesmo formato das chaves do cache)"""
+        return f"deflate-{level}"
+
+    @classmethod
+    def compress_type(cls, method: str) -> int:
+        """Método do ZIP (ZIP_STORED ou ZIP_DEFLATED) de um identificador"""
+        return zipfile.ZIP_STORED if method == cls.STORED else zipfile.ZIP_DEFLATED
+
+    @classmethod
+    def compress(cls, content: bytes, method: str) -> bytes:
+        """
+        Comprime com um método conhecido (deflate puro, como no zipfile)
+
+        Raises:
+            ValueError: Método desconhecido
+        """
+        if method == cls.STORED:
+            return content
+        if not method.startswith('deflate-'):
+            raise ValueError(f"Método de compressão desconhecido: {method}")
+        compressor = zlib.compressobj(int(method.partition('-')[2]), zlib.DEFLATED, -15)
+        return compressor.compress(content) + compressor.flush()
+
+    def start(self):
+        """Inicia o orçamento de busca de um build"""
+        self._deadline = time.monotonic() + self.budget
+
+    def tune(self, content: bytes, exhaustive: bool = False) -> Tuple[str, bytes, Dict[str, int], bool]:
+        """
+        Escolhe o menor membro entre stored e os níveis deflate
+
+        O nível padrão é sempre testado; os demais, enquanto houver orçamento
+        (iniciado por start()). Em empate vale o que foi testado antes, com
+        stored à frente: arquivos incompressíveis (PNG, JSON minúsculos) ficam
+        sem compressão.
+
+        Args:
+            content: Conteúdo original
+            exhaustive: Testa todos os níveis, ignorando o orçamento (arquivos pequenos)
+
+        Returns:
+            Tupla (método, dados, tamanhos por método testado, busca_completa);
+            só decisões completas devem ir para o cache
+        """
+        best_method, best_data = self.STORED, content
+        sizes = {self.STORED: len(content)}
+        methods = [self.default_method] + [self.method_name(level) for level in self.LEVELS
+                                           if level != self.default_level]
+
+        for index, method in enumerate(methods):
+            if index and not exhaustive and (self._deadline is None or time.monotonic() >= self._deadline):
+                return best_method, best_data, sizes, False
+            data = self.compress(content, method)
+            sizes[method] = len(data)
+            if len(data) < len(best_data):
+                best_method, best_data = method, data
+        return best_method, best_data, sizes, True
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Servidor local que simula os endpoints de release da API do GitHub
+Permite testar e medir o release.py sem acesso à rede
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+import argparse
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeGitHubState:
+    """Estado em memória dos repositórios simulados"""
+
+    def __init__(self, repos: Optional[List[str]] = None):
+        """
+        Inicializa o estado
+
+        Args:
+            repos: Repositórios existentes (OWNER/REPO); None aceita qualquer um
+        """
+        self.allowed_repos = set(repos) if repos is not None else None
+        self.releases: Dict[str, List[Dict]] = {}
+        self.tags: Dict[str, Dict[str, str]] = {}
+        self.lock = threading.Lock()
+        self._next_id = 1
+
+    def repo_exists(self, repo: str) -> bool:
+        """Verifica se o repositório existe na simulação"""
+        return self.allowed_repos is None or repo in self.allowed_repos
+
+    def next_id(self) -> int:
+        """Gera IDs sequenciais para releases e assets"""
+        with self.lock:
+            value = self._next_id
+            self._next_id += 1
+            return value
+
+    def add_release(self, repo: str, tag_name: str, **fields) -> Dict:
+        """
+        Adiciona um release (usado pelo servidor e para popular cenários)
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            tag_name: Tag do release
+            **fields: Campos adicionais (name, body, draft, prerelease, created_at)
+
+        Returns:
+            Dados do release no formato da API
+        """
+        release_id = self.next_id()
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        release = {
+            'id': release_id,
+            'tag_name': tag_name,
+            'name': fields.get('name', tag_name),
+            'body': fields.get('body', ''),
+            'draft': bool(fields.get('draft', False)),
+            'prerelease': bool(fields.get('prerelease', False)),
+            'created_at': fields.get('created_at', now),
+            'published_at': None if fields.get('draft') else fields.get('created_at', now),
+            'html_url': f"https://github.com/{repo}/releases/tag/{tag_name}",
+            'upload_url': f"/repos/{repo}/releases/{release_id}/assets{{?name,label}}",
+            'assets': []
+        }
+
+        with self.lock:
+            self.releases.setdefault(repo, []).append(release)
+            self.tags.setdefault(repo, {})[tag_name] = hashlib.sha1(tag_name.encode()).hexdigest()
+
+        return release
+
+    def sorted_releases(self, repo: str) -> List[Dict]:
+        """Releases do repositório, mais recentes primeiro"""
+        with self.lock:
+            releases = list(self.releases.get(repo, []))
+        return sorted(releases, key=lambda r: (r['created_at'], r['id']), reverse=True)
+
+
+class FakeGitHubServer:
+    """Classe responsável pelo servidor HTTP que simula a API do GitHub"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, failure_rate: float = 0.0, rate_limit: int = 0,
+                 rate_limit_window: float = 3600.0, require_auth: bool = True,
+                 repos: Optional[List[str]] = None, seed: Optional[int] = None):
+        """
+        Inicializa o FakeGitHubServer
+
+        Args:
+            host: Endereço de escuta
+            port: Porta (0 escolhe uma porta livre)
+            latency: Latência fixa por requisição (segundos)
+            jitter: Variação aleatória adicional de latência (segundos)
+            failure_rate: Probabilidade (0-1) de responder 502 Bad Gateway
+            rate_limit: Requisições permitidas por janela (0 desativa)
+            rate_limit_window: Duração da janela de rate limit (segundos)
+            require_auth: Exige header Authorization em requisições de escrita
+            repos: Repositórios existentes (OWNER/REPO); None aceita qualquer um
+            seed: Semente para latência/falhas reproduzíveis
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.require_auth = require_auth
+        self.state = FakeGitHubState(repos)
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+
+        # Estatísticas
+        self.request_counts: Counter = Counter()
+        self.status_counts: Counter = Counter()
+        self.stats_lock = threading.Lock()
+
+        # Rate limit
+        self._window_start = time.time()
+        self._window_used = 0
+
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base do servidor (equivalente a https://api.github.com)"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> 'FakeGitHubServer':
+        """
+        Inicia o servidor em uma thread de fundo
+
+        Returns:
+            A própria instância (para encadeamento)
+        """
+        server = self
+
+        class Handler(FakeGitHubHandler):
+            fake = server
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_port
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Para o servidor"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> 'FakeGitHubServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reset_stats(self):
+        """Zera contadores de requisições"""
+        with self.stats_lock:
+            self.request_counts.clear()
+            self.status_counts.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém estatísticas de requisições recebidas
+
+        Returns:
+            Dicionário com total, contagem por endpoint e por status
+        """
+        with self.stats_lock:
+            return {
+                'total_requests': sum(self.request_counts.values()),
+                'by_endpoint': dict(self.request_counts),
+                'by_status': {str(k): v for k, v in self.status_counts.items()}
+            }
+
+    def record(self, endpoint: str, status: int):
+        """Registra uma requisição atendida"""
+        with self.stats_lock:
+            self.request_counts[endpoint] += 1
+            self.status_counts[status] += 1
+
+    def simulate_latency(self):
+        """Aplica latência configurada"""
+        if self.latency or self.jitter:
+            with self.random_lock:
+                extra = self.random.uniform(0, self.jitter) if self.jitter else 0.0
+            time.sleep(self.latency + extra)
+
+    def should_fail(self) -> bool:
+        """Sorteia falha injetada"""
+        if self.failure_rate <= 0:
+            return False
+        with self.random_lock:
+            return self.random.random() < self.failure_rate
+
+    def consume_rate_limit(self, conditional_hit: bool) -> Tuple[bool, Dict[str, str]]:
+        """
+        Consome uma unidade do rate limit
+
+        Respostas 304 (requisição condicional) não consomem limite, como no GitHub.
+
+        Args:
+            conditional_hit: Se a requisição será respondida com 304
+
+        Returns:
+            Tupla (permitido, headers_de_rate_limit)
+        """
+        if not self.rate_limit:
+            return True, {}
+
+        with self.stats_lock:
+            now = time.time()
+            if now - self._window_start >= self.rate_limit_window:
+                self._window_start = now
+                self._window_used = 0
+
+            allowed = self._window_used < self.rate_limit
+            if allowed and not conditional_hit:
+                self._window_used += 1
+
+            reset_at = int(self._window_start + self.rate_limit_window)
+            headers = {
+                'X-RateLimit-Limit': str(self.rate_limit),
+                'X-RateLimit-Remaining': str(max(0, self.rate_limit - self._window_used)),
+                'X-RateLimit-Reset': str(reset_at),
+                'X-RateLimit-Used': str(self._window_used)
+            }
+
+        return allowed, headers
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    """Handler HTTP com as rotas de release da API do GitHub"""
+
+    fake: FakeGitHubServer = None
+    protocol_version = 'HTTP/1.1'
+
+    ROUTES = [
+        ('GET', re.compile(r'^/repos/(?P<repo>[^/]+/[^/]+)$'), 'repo'),
+        ('GET', re.compile(r'^/repos/(?P<repo>[^/]+/[^/]+)/releases$'), 'list_releases'),
+        ('GET', re.compile(r'^/repos/(?P<repo>[^/]+/[^/]+)/releases/latest$'), 'latest_release'),
+        ('POST', re.compile(r'^/repos/(?P<repo>[^/]+/[^/]+)/releases$'), 'create_release'),
+        ('POST', re.compile(r'^/repos/(?P<repo>[^/]+/[^/]+)/releases/(?P<release_id>\d+)/assets$'), 'upload_asset'),
+        ('GET', re.compile(r'^/repos/(?P<repo>[^/]+/[^/]+)/git/refs/tags/(?P<tag>.+)$'), 'get_tag_ref'),
+        ('GET', re.compile(r'^/repos/(?P<repo>[^/]+/[^/]+)/git/matching-refs/tags$'), 'list_tag_refs'),
+    ]
+
+    def log_message(self, format, *args):
+        """Silencia o log padrão do http.server"""
+        pass
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _dispatch(self, method: str):
+        """Resolve rota, aplica latência/falhas/rate limit e responde"""
+        parsed = urlparse(self.path)
+        self.query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        body = self._read_body()
+
+        for route_method, pattern, handler_name in self.ROUTES:
+            match = pattern.match(parsed.path)
+            if route_method == method and match:
+                endpoint = f"{method} {handler_name}"
+                break
+        else:
+            self._send_json(404, {'message': 'Not Found'}, endpoint=f"{method} unknown")
+            return
+
+        self.fake.simulate_latency()
+
+        if self.fake.should_fail():
+            self._send_json(502, {'message': 'Server Error (injected)'}, endpoint=endpoint)
+            return
+
+        repo = match.group('repo')
+        if not self.fake.state.repo_exists(repo):
+            self._send_json(404, {'message': 'Not Found'}, endpoint=endpoint)
+            return
+
+        if method == 'POST' and self.fake.require_auth and not self.headers.get('Authorization'):
+            self._send_json(401, {'message': 'Requires authentication'}, endpoint=endpoint)
+            return
+
+        # Escritas consomem rate limit antes de qualquer efeito colateral
+        if method == 'POST':
+            allowed, rate_headers = self.fake.consume_rate_limit(conditional_hit=False)
+            if not allowed:
+                self._send_json(403, {'message': 'API rate limit exceeded (simulated)'},
+                                endpoint=endpoint, headers=rate_headers)
+                return
+
+        status, payload, extra_headers = getattr(self, f"_handle_{handler_name}")(
+            body=body, **match.groupdict())
+
+        conditional_hit = False
+        if method == 'GET':
+            conditional_hit = status == 200 and self._etag(payload) == self.headers.get('If-None-Match')
+            allowed, rate_headers = self.fake.consume_rate_limit(conditional_hit)
+            if not allowed:
+                self._send_json(403, {'message': 'API rate limit exceeded (simulated)'},
+                                endpoint=endpoint, headers=rate_headers)
+                return
+
+        extra_headers.update(rate_headers)
+
+        if conditional_hit:
+            extra_headers['ETag'] = self._etag(payload)
+            self._send_raw(304, b'', endpoint=endpoint, headers=extra_headers)
+            return
+
+        if method == 'GET' and status == 200:
+            extra_headers['ETag'] = self._etag(payload)
+
+        self._send_json(status, payload, endpoint=endpoint, headers=extra_headers)
+
+    # ------------------------------------------------------------------
+    # Rotas
+    # ------------------------------------------------------------------
+
+    def _handle_repo(self, repo: str, body: bytes):
+        owner, name = repo.split('/')
+        return 200, {'full_name': repo, 'name': name, 'owner': {'login': owner}}, {}
+
+    def _handle_list_releases(self, repo: str, body: bytes):
+        return self._paginate(self.fake.state.sorted_releases(repo))
+
+    def _handle_latest_release(self, repo: str, body: bytes):
+        for release in self.fake.state.sorted_releases(repo):
+            if not release['draft'] and not release['prerelease']:
+                return 200, release, {}
+        return 404, {'message': 'Not Found'}, {}
+
+    def _handle_create_release(self, repo: str, body: bytes):
+        try:
+            data = json.loads(body or b'{}')
+        except json.JSONDecodeError:
+            return 400, {'message': 'Problems parsing JSON'}, {}
+
+        tag_name = data.get('tag_name')
+        if not tag_name:
+            return 422, {'message': 'Validation Failed', 'errors': [{'field': 'tag_name', 'code': 'missing'}]}, {}
+
+        if any(r['tag_name'] == tag_name for r in self.fake.state.sorted_releases(repo)):
+            return 422, {'message': 'Validation Failed', 'errors': [{'field': 'tag_name', 'code': 'already_exists'}]}, {}
+
+        release = self.fake.state.add_release(
+            repo, tag_name,
+            name=data.get('name', tag_name),
+            body=data.get('body', ''),
+            draft=data.get('draft', False),
+            prerelease=data.get('prerelease', False)
+        )
+        return 201, release, {}
+
+    def _handle_upload_asset(self, repo: str, release_id: str, body: bytes):
+        name = self.query.get('name')
+        if not name:
+            return 422, {'message': 'Validation Failed', 'errors': [{'field': 'name', 'code': 'missing'}]}, {}
+
+        for release in self.fake.state.sorted_releases(repo):
+            if release['id'] == int(release_id):
+                break
+        else:
+            return 404, {'message': 'Not Found'}, {}
+
+        if any(a['name'] == name for a in release['assets']):
+            return 422, {'message': 'Validation Failed', 'errors': [{'field': 'name', 'code': 'already_exists'}]}, {}
+
+        asset = {
+            'id': self.fake.state.next_id(),
+            'name': name,
+            'size': len(body),
+            'content_type': self.headers.get('Content-Type', 'application/octet-stream'),
+            'download_count': 0,
+            'sha256': hashlib.sha256(body).hexdigest(),
+            'browser_download_url': f"https://github.com/{repo}/releases/download/{release['tag_name']}/{name}"
+        }
+        with self.fake.state.lock:
+            release['assets'].append(asset)
+        return 201, asset, {}
+
+    def _handle_get_tag_ref(self, repo: str, tag: str, body: bytes):
+        sha = self.fake.state.tags.get(repo, {}).get(tag)
+        if sha is None:
+            return 404, {'message': 'Not Found'}, {}
+        return 200, self._tag_ref(repo, tag, sha), {}
+
+    def _handle_list_tag_refs(self, repo: str, body: bytes):
+        with self.fake.state.lock:
+            tags = sorted(self.fake.state.tags.get(repo, {}).items())
+        return self._paginate([self._tag_ref(repo, tag, sha) for tag, sha in tags])
+
+    # ------------------------------------------------------------------
+    # Utilitários
+    # ------------------------------------------------------------------
+
+    def _tag_ref(self, repo: str, tag: str, sha: str) -> Dict:
+        return {
+            'ref': f"refs/tags/{tag}",
+            'url': f"{self.fake.url}/repos/{repo}/git/refs/tags/{tag}",
+            'object': {'sha': sha, 'type': 'commit'}
+        }
+
+    def _paginate(self, items: List[Dict]):
+        """Aplica per_page/page e monta header Link como o GitHub"""
+        per_page = min(int(self.query.get('per_page', 30)), 100)
+        page = max(int(self.query.get('page', 1)), 1)
+        chunk = items[(page - 1) * per_page:page * per_page]
+
+        headers = {}
+        if page * per_page < len(items):
+            base = urlparse(self.path).path
+            next_url = f"{self.fake.url}{base}?per_page={per_page}&page={page + 1}"
+            headers['Link'] = f'<{next_url}>; rel="next"'
+
+        return 200, chunk, headers
+
+    def _etag(self, payload) -> str:
+        digest = hashlib.md5(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        return f'W/"{digest}"'
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send_json(self, status: int, payload, endpoint: str, headers: Dict[str, str] = None):
+        self._send_raw(status, json.dumps(payload).encode('utf-8'), endpoint, headers,
+                       content_type='application/json; charset=utf-8')
+
+    def _send_raw(self, status: int, data: bytes, endpoint: str, headers: Dict[str, str] = None,
+                  content_type: str = None):
+        self.send_response(status)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+        self.fake.record(endpoint, status)
+
+
+def show_help():
+    """Exibe ajuda do script"""
+    help_text = """
+🧪 Help OTRS - API GitHub Simulada
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Uso: python fake_github.py [opções]
+
+Opções:
+  --port N              Porta de escuta (padrão: 8765)
+  --latency S           Latência fixa por requisição em segundos
+  --jitter S            Variação aleatória de latência em segundos
+  --failure-rate P      Probabilidade (0-1) de responder 502
+  --rate-limit N        Requisições por janela (0 desativa)
+  --rate-window S       Duração da janela de rate limit (padrão: 3600)
+  --seed N              Semente para latência e falhas reproduzíveis
+  --help, -h            Mostra esta ajuda
+
+Endpoints simulados:
+  GET  /repos/OWNER/REPO
+  GET  /repos/OWNER/REPO/releases (paginado, ETag)
+  GET  /repos/OWNER/REPO/releases/latest
+  POST /repos/OWNER/REPO/releases
+  POST /repos/OWNER/REPO/releases/ID/assets?name=NOME
+  GET  /repos/OWNER/REPO/git/refs/tags/TAG
+  GET  /repos/OWNER/REPO/git/matching-refs/tags (paginado, ETag)
+
+Para usar com release.py:
+  GITHUB_API_URL=http://127.0.0.1:8765 GITHUB_TOKEN=fake python release.py create
+"""
+    print(help_text)
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(
+        description='API GitHub simulada para releases',
+        add_help=False
+    )
+
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=int, default=0)
+    parser.add_argument('--rate-window', type=float, default=3600.0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--help', '-h', action='store_true')
+
+    args = parser.parse_args()
+
+    if args.help:
+        show_help()
+        return 0
+
+    server = FakeGitHubServer(
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        rate_limit=args.rate_limit,
+        rate_limit_window=args.rate_window,
+        seed=args.seed
+    ).start()
+
+    print(f"🧪 API GitHub simulada em {server.url}")
+    print(f"💡 Use: GITHUB_API_URL={server.url} GITHUB_TOKEN=fake python scripts/release.py create")
+    print("⏹️ Ctrl+C para encerrar")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print()
+        print(f"📊 Requisições: {json.dumps(server.get_stats(), indent=2)}")
+        server.stop()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+Páginas OTRS sintéticas de grande porte e servidor local para testes de estresse
+Gera formulários com milhares de campos dinâmicos, filas longas e editores extensos
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import argparse
+import html
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+class OtrsFormGenerator:
+    """Classe responsável por gerar páginas com a estrutura das telas do OTRS"""
+
+    # Telas geradas (parâmetro Action do index.pl)
+    ACTIONS = {
+        'AgentTicketPhone': 'Novo Chamado por Telefone',
+        'AgentTicketNote': 'Adicionar Nota',
+        'AgentTicketZoom': 'Detalhes do Chamado'
+    }
+
+    # Tamanhos padrão (sobrescritos por parâmetros da URL)
+    DEFAULT_SIZES = {'fields': 2000, 'queues': 500, 'editor_kb': 512}
+
+    # Limites para evitar páginas que esgotem a memória do servidor
+    MAX_SIZES = {'fields': 50000, 'queues': 20000, 'editor_kb': 65536}
+
+    # Campos reais usados pelos validadores e pelo FormDataReuser
+    KNOWN_FIELDS = [
+        ('PRITipoAtendimento', 'Tipo Atendimento', 'dropdown', ['-', 'Presencial', 'Remoto']),
+        ('localidade', 'Localidade', 'dropdown', None),
+        ('PRIRamal', 'Ramal/Contato', 'text', None),
+        ('PRITelefone', 'Telefone', 'text', None),
+        ('PRISala', 'Sala', 'text', None),
+        ('PRIAndar', 'Andar', 'text', None),
+        ('PRIPatrimonio', 'Patrimônio', 'text', None),
+        ('PRIEquipamento', 'Equipamento', 'dropdown', None)
+    ]
+
+    # Distribuição dos tipos de campo sintéticos
+    FIELD_TYPES = ['text'] * 5 + ['dropdown'] * 3 + ['textarea', 'checkbox']
+
+    UNITS = ['SFA', 'VIGIAGRO', 'LFDA', 'SLAV', 'UTRAS', 'Sede', 'SDA', 'SPA']
+    STATES = ['AC', 'AL', 'AM', 'BA', 'CE', 'DF', 'ES', 'GO', 'MA', 'MG', 'MS', 'MT', 'PA', 'PB', 'PE',
+              'PI', 'PR', 'RJ', 'RN', 'RO', 'RR', 'RS', 'SC', 'SE', 'SP', 'TO']
+    QUEUE_GROUPS = ['Técnico Remoto', 'Técnico Presencial', 'Nível 1 - Serviços aos Usuários de TIC',
+                    'Nível 2 - Serviços aos Usuários de TIC', 'Nível 3 - Infraestrutura', 'Sistemas']
+    WORDS = ['chamado', 'usuário', 'estação', 'impressora', 'rede', 'acesso', 'sistema', 'senha', 'equipamento',
+             'atendimento', 'solicitação', 'configuração', 'unidade', 'instalação', 'certificado', 'correio']
+
+    def __init__(self, seed: int = 0):
+        """
+        Inicializa o OtrsFormGenerator
+
+        Args:
+            seed: Semente para páginas reproduzíveis
+        """
+        self.seed = seed
+
+    @classmethod
+    def sizes_from_params(cls, params: Dict[str, str]) -> Dict[str, int]:
+        """
+        Tamanhos a partir dos parâmetros da URL (Fields, Queues, EditorKB)
+
+        Args:
+            params: Parâmetros da query string
+
+        Returns:
+            Dicionário fields/queues/editor_kb limitado a MAX_SIZES
+        """
+        names = {'fields': 'Fields', 'queues': 'Queues', 'editor_kb': 'EditorKB'}
+        sizes = dict(cls.DEFAULT_SIZES)
+        for key, param in names.items():
+            if params.get(param, '').isdigit():
+                sizes[key] = min(int(params[param]), cls.MAX_SIZES[key])
+        return sizes
+
+    # ------------------------------------------------------------------
+    # Páginas
+    # ------------------------------------------------------------------
+
+    def render(self, action: str, fields: int, queues: int, editor_kb: int) -> str:
+        """
+        Gera uma página
+
+        Args:
+            action: Tela (chave de ACTIONS)
+            fields: Quantidade de campos dinâmicos sintéticos
+            queues: Quantidade de filas no campo Dest
+            editor_kb: Tamanho aproximado do conteúdo do editor (KB)
+
+        Returns:
+            HTML da página
+
+        Raises:
+            KeyError: Se a tela não existir
+        """
+        title = self.ACTIONS[action]
+        rng = random.Random(f"{self.seed}:{action}:{fields}:{queues}:{editor_kb}")
+
+        if action == 'AgentTicketZoom':
+            body = self._render_zoom(rng, fields, editor_kb)
+        else:
+            body = self._render_form(rng, action, fields, queues, editor_kb)
+
+        return (
+            '<!DOCTYPE html>\n<html>\n<head>\n'
+            '<meta http-equiv="Content-type" content="text/html;charset=utf-8">\n'
+            f'<title>{html.escape(title)} - Suporte (simulado)</title>\n'
+            '</head>\n'
+            '<body class="Popup RealPopup Visible-ScreenXL">\n'
+            '<div id="AppWrapper">\n'
+            '<div class="LayoutPopup ARIARoleMain">\n'
+            f'<div class="Header"><h1>{html.escape(title)}: Chamado#2026101800001 — Estresse</h1></div>\n'
+            f'{body}'
+            '</div>\n</div>\n</body>\n</html>\n'
+        )
+
+    def render_index(self, base_path: str) -> str:
+        """Página inicial com links para as telas geradas"""
+        links = ''.join(
+            f'<li><a href="{base_path}?Action={action}">{html.escape(title)}</a> '
+            f'(<a href="{base_path}?Action={action};Fields=10000;Queues=5000;EditorKB=4096">grande</a>)</li>\n'
+            for action, title in self.ACTIONS.items()
+        )
+        return ('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>OTRS simulado</title></head>\n'
+                f'<body><h1>OTRS simulado (Help OTRS)</h1>\n<ul>\n{links}</ul>\n'
+                '<p>Parâmetros: Fields, Queues, EditorKB.</p></body></html>\n')
+
+    def _render_form(self, rng: random.Random, action: str, fields: int, queues: int, editor_kb: int) -> str:
+        """Formulário compose (AgentTicketPhone/AgentTicketNote)"""
+        parts = [
+            '<div class="Content">\n'
+            '<form action="/otrs/index.pl" method="post" enctype="multipart/form-data" name="compose" '
+            'id="Compose" class="Validate PreventMultipleSubmits" novalidate="novalidate">\n'
+            f'<input type="hidden" name="Action" value="{action}">\n'
+            '<input type="hidden" name="Subaction" value="Store">\n'
+            '<input type="hidden" name="TicketID" value="1">\n'
+            '<div class="WidgetSimple Expanded">\n'
+            '<div class="Header"><h2>Configurações de Chamado</h2></div>\n'
+            '<div class="Content">\n<fieldset class="TableLike FixedLabel">\n'
+        ]
+
+        if action == 'AgentTicketPhone':
+            parts.append(self._render_queue_field(rng, queues))
+
+        parts.append(self._render_modernized_select(
+            'TypeID', 'Tipo', ['Incidente', 'Requisição', 'Problema'], mandatory=True))
+        parts.append(self._render_modernized_select(
+            'ServiceID', 'Serviço', [self._service_name(rng, i) for i in range(max(10, queues // 5))],
+            mandatory=True))
+
+        for field_id, label, kind, options in self.KNOWN_FIELDS:
+            parts.append(self._render_dynamic_field(rng, field_id, label, kind, options))
+
+        for index in range(1, fields + 1):
+            kind = rng.choice(self.FIELD_TYPES)
+            parts.append(self._render_dynamic_field(
+                rng, f"PRICampo{index:05d}", f"Campo {index} ({rng.choice(self.WORDS)})", kind, None))
+
+        parts.append('</fieldset>\n</div>\n</div>\n')
+        parts.append(self._render_editor(rng, editor_kb))
+        parts.append(
+            '<div class="Field SpacingTop">\n'
+            '<button class="Primary CallForAction" id="submitRichText" accesskey="g" type="submit" '
+            'value="Enviar"><span>Enviar</span></button>\n'
+            '</div>\n</form>\n</div>\n'
+        )
+        return ''.join(parts)
+
+    def _render_zoom(self, rng: random.Random, fields: int, editor_kb: int) -> str:
+        """Tela do chamado com informações (labels) e artigos extensos"""
+        labels = [('Estado:', 'Em Atendimento'), ('Fila:', 'Técnico Remoto::Nível 1'),
+                  ('Tipo:', 'Requisição'), ('Serviço:', self._service_name(rng, 0))]
+        labels.extend((f"Campo {i}:", self._sentence(rng, 3)) for i in range(1, fields + 1))
+
+        rows = ''.join(
+            f'<label>{html.escape(label)}</label>\n'
+            f'<p class="Value" title="{html.escape(value)}">{html.escape(value)}</p>\n'
+            '<div class="Clear"></div>\n'
+            for label, value in labels
+        )
+
+        articles = []
+        remaining = editor_kb * 1024
+        number = 1
+        while remaining > 0:
+            text = self._paragraphs(rng, min(remaining, 64 * 1024))
+            remaining -= len(text)
+            articles.append(
+                f'<div class="WidgetSimple"><div class="Header"><h2>Artigo #{number}</h2></div>\n'
+                f'<div class="Content ArticleBody">{text}</div></div>\n'
+            )
+            number += 1
+
+        return (
+            '<div class="WidgetSimple Expanded" id="WidgetTicketInfo">\n'
+            '<div class="Header"><h2>Informações do Chamado</h2></div>\n'
+            f'<div class="Content" id="Core_UI_AutogeneratedID_1">\n<fieldset class="TableLike FixedLabelSmall">\n'
+            f'{rows}</fieldset>\n</div>\n</div>\n'
+            f'{"".join(articles)}'
+        )
+
+    # ------------------------------------------------------------------
+    # Campos
+    # ------------------------------------------------------------------
+
+    def _render_queue_field(self, rng: random.Random, queues: int) -> str:
+        """Campo Dest (fila) com a lista longa de filas"""
+        names = [self._queue_name(rng, i) for i in range(queues)]
+        options = ['<option value="">-</option>'] + [
+            f'<option value="{i + 1}||{html.escape(name)}">{html.escape(name)}</option>'
+            for i, name in enumerate(names)
+        ]
+        return (
+            '<label class="Mandatory" for="Dest"><span class="Marker">*</span>Para:</label>\n'
+            '<div class="Field">\n'
+            '<div class="InputField_Container" tabindex="-1">'
+            '<div class="InputField_InputContainer">'
+            '<input id="Dest_Search" class="InputField_Search" type="text" role="search" autocomplete="off">'
+            '<div class="InputField_Selection" style="display: block;"><div class="Text">-</div></div>'
+            '</div></div>'
+            '<select name="Dest" id="Dest" class="Validate_Required Modernize" style="display: none;">\n'
+            f'{chr(10).join(options)}\n</select>\n'
+            '<div id="DestError" class="TooltipErrorMessage"><p>Este campo é obrigatório.</p></div>\n'
+            '<div id="DestServerError" class="TooltipErrorMessage"><p>Este campo é obrigatório.</p></div>\n'
+            '</div>\n<div class="Clear"></div>\n'
+        )
+
+    def _render_modernized_select(self, field_id: str, label: str, values: List[str],
+                                  mandatory: bool = False) -> str:
+        """Select com campo de pesquisa (InputField) como o OTRS moderniza"""
+        options = '\n'.join(f'<option value="{i}">{html.escape(value)}</option>' for i, value in enumerate(values))
+        mandatory_class = ' class="Mandatory"' if mandatory else ''
+        marker = '<span class="Marker">*</span>' if mandatory else ''
+        return (
+            f'<label{mandatory_class} for="{field_id}">{marker}{html.escape(label)}:</label>\n'
+            '<div class="Field">\n'
+            '<div class="InputField_Container" tabindex="-1"><div class="InputField_InputContainer">'
+            f'<input id="{field_id}_Search" class="InputField_Search" type="text" role="search" autocomplete="off">'
+            '<div class="InputField_Selection" style="display: block;"><div class="Text">-</div></div>'
+            '</div></div>'
+            f'<select class="Modernize Validate_Required" id="{field_id}" name="{field_id}" style="display: none;">\n'
+            f'<option value="" selected="">-</option>\n{options}\n</select>\n'
+            '</div>\n<div class="Clear"></div>\n'
+        )
+
+    def _render_dynamic_field(self, rng: random.Random, name: str, label: str, kind: str,
+                              options: Optional[List[str]]) -> str:
+        """Campo dinâmico (DynamicField_*) no formato de linha do OTRS"""
+        field_id = f"DynamicField_{name}"
+        title = html.escape(label)
+
+        if kind == 'dropdown':
+            values = options or [self._location_name(rng) for _ in range(rng.randint(5, 40))]
+            option_tags = '\n'.join(f'<option value="{html.escape(v)}">{html.escape(v)}</option>' for v in values)
+            control = (
+                '<div class="InputField_Container" tabindex="-1"><div class="InputField_InputContainer">'
+                f'<input id="{field_id}_Search" class="InputField_Search" type="text" role="search" '
+                f'autocomplete="off" aria-label="{title}">'
+                '<div class="InputField_Selection" style="display: block;"><div class="Text">-</div></div>'
+                '</div></div>'
+                f'<select class="DynamicFieldText Modernize" id="{field_id}" name="{field_id}" title="{title}" '
+                f'size="1" style="display: none;">\n{option_tags}\n</select>'
+            )
+        elif kind == 'textarea':
+            control = (f'<textarea class="DynamicFieldTextArea Validate_MaxLength" id="{field_id}" '
+                       f'name="{field_id}" title="{title}" rows="7" cols="60">'
+                       f'{html.escape(self._sentence(rng, 20))}</textarea>')
+        elif kind == 'checkbox':
+            checked = ' checked="checked"' if rng.random() < 0.3 else ''
+            control = (f'<input type="hidden" id="{field_id}Used" name="{field_id}Used" value="1">'
+                       f'<input type="checkbox" class="DynamicFieldCheckbox" id="{field_id}" name="{field_id}" '
+                       f'title="{title}" value="1"{checked}>')
+        else:
+            value = html.escape(self._sentence(rng, rng.randint(0, 3)))
+            control = (f'<input type="text" class="DynamicFieldText W50pc" id="{field_id}" name="{field_id}" '
+                       f'title="{title}" value="{value}">')
+
+        return (
+            f'<div class="Row Row_{field_id}">\n'
+            f'<label id="Label{field_id}" for="{field_id}">{title}:</label>\n'
+            f'<div class="Field">\n{control}\n'
+            f'<div id="{field_id}Error" class="TooltipErrorMessage"><p>Este campo é obrigatório.</p></div>\n'
+            '</div>\n<div class="Clear"></div>\n</div>\n'
+        )
+
+    def _render_editor(self, rng: random.Random, editor_kb: int) -> str:
+        """Editor rich text: textarea original e iframe do CKEditor com o mesmo conteúdo"""
+        content = self._paragraphs(rng, editor_kb * 1024)
+        document = f'<html><body class="cke_editable" contenteditable="true">{content}</body></html>'
+        return (
+            '<div class="WidgetSimple Expanded"><div class="Header"><h2>Adicionar Artigo</h2></div>\n'
+            '<div class="Content" id="Core_UI_AutogeneratedID_2">\n<fieldset class="TableLike FixedLabel">\n'
+            '<label class="Mandatory" for="Subject"><span class="Marker">*</span>Assunto:</label>\n'
+            '<div class="Field"><input type="text" id="Subject" name="Subject" value="Nota:" '
+            'class="W75pc Validate Validate_Required"></div>\n<div class="Clear"></div>\n'
+            '<label class="Mandatory" for="RichText"><span class="Marker">*</span>Texto:</label>\n'
+            '<div class="Field RichTextField">\n'
+            '<div id="cke_RichText" class="cke_1 cke cke_reset cke_chrome cke_editor_RichText">'
+            '<div class="cke_inner"><div id="cke_1_contents" class="cke_contents">'
+            f'<iframe class="cke_wysiwyg_frame cke_reset" title="Editor de Rich Text, RichText" '
+            f'srcdoc="{html.escape(document)}"></iframe>'
+            '</div></div></div>\n'
+            '<textarea id="RichText" class="RichText Validate Validate_Required HasCKEInstance" name="Body" '
+            f'rows="15" cols="78" style="visibility: hidden; display: none;">{html.escape(content)}</textarea>\n'
+            '</div>\n<div class="Clear"></div>\n</fieldset>\n</div>\n</div>\n'
+        )
+
+    # ------------------------------------------------------------------
+    # Textos
+    # ------------------------------------------------------------------
+
+    def _queue_name(self, rng: random.Random, index: int) -> str:
+        return (f"{rng.choice(self.QUEUE_GROUPS)}::{rng.choice(self.STATES)} - "
+                f"{rng.choice(self.UNITS)}::Fila {index + 1:05d}")
+
+    def _service_name(self, rng: random.Random, index: int) -> str:
+        return f"{rng.choice(self.WORDS).capitalize()}::{rng.choice(self.WORDS)} {index + 1}"
+
+    def _location_name(self, rng: random.Random) -> str:
+        return f"{rng.choice(self.STATES)} - {rng.choice(self.UNITS)} - {rng.choice(self.WORDS).capitalize()}"
+
+    def _sentence(self, rng: random.Random, words: int) -> str:
+        return ' '.join(rng.choice(self.WORDS) for _ in range(words))
+
+    def _paragraphs(self, rng: random.Random, size: int) -> str:
+        """Parágrafos HTML até aproximadamente size bytes"""
+        parts = []
+        total = 0
+        while total < size:
+            paragraph = f"<p>{self._sentence(rng, rng.randint(20, 80)).capitalize()}.</p>"
+            parts.append(paragraph)
+            total += len(paragraph)
+        return ''.join(parts)
+
+
+class FakeOtrsServer:
+    """Classe responsável pelo servidor HTTP que serve as páginas OTRS sintéticas"""
+
+    # Caminho coberto pelos match patterns do manifest (*/otrs/*)
+    BASE_PATH = '/otrs/index.pl'
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, seed: int = 0):
+        """
+        Inicializa o FakeOtrsServer
+
+        Args:
+            host: Endereço de escuta
+            port: Porta (0 escolhe uma porta livre)
+            latency: Atraso por requisição (segundos), para simular servidor lento
+            seed: Semente das páginas geradas
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.generator = OtrsFormGenerator(seed)
+
+        # Páginas já geradas (a geração é determinística)
+        self.page_cache: Dict[tuple, bytes] = {}
+        self.cache_lock = threading.Lock()
+
+        # Estatísticas
+        self.request_counts: Counter = Counter()
+        self.bytes_sent = 0
+        self.stats_lock = threading.Lock()
+
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base do sistema OTRS simulado (para cadastrar nas opções da extensão)"""
+        return f"http://{self.host}:{self.port}/otrs/"
+
+    def start(self) -> 'FakeOtrsServer':
+        """
+        Inicia o servidor em uma thread de fundo
+
+        Returns:
+            A própria instância (para encadeamento)
+        """
+        server = self
+
+        class Handler(FakeOtrsHandler):
+            fake = server
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_port
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Para o servidor"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> 'FakeOtrsServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def get_page(self, action: str, sizes: Dict[str, int]) -> bytes:
+        """
+        Obtém página gerada (com cache em memória)
+
+        Raises:
+            KeyError: Se a tela não existir
+        """
+        key = (action, sizes['fields'], sizes['queues'], sizes['editor_kb'])
+        with self.cache_lock:
+            page = self.page_cache.get(key)
+        if page is None:
+            page = self.generator.render(action, **sizes).encode('utf-8')
+            with self.cache_lock:
+                self.page_cache[key] = page
+        return page
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtém estatísticas de requisições recebidas
+
+        Returns:
+            Dicionário com total, contagem por tela e bytes enviados
+        """
+        with self.stats_lock:
+            return {
+                'total_requests': sum(self.request_counts.values()),
+                'by_action': dict(self.request_counts),
+                'bytes_sent': self.bytes_sent
+            }
+
+    def record(self, action: str, size: int):
+        """Registra uma requisição atendida"""
+        with self.stats_lock:
+            self.request_counts[action] += 1
+            self.bytes_sent += size
+
+
+class FakeOtrsHandler(BaseHTTPRequestHandler):
+    """Handler HTTP com as rotas /otrs/index.pl?Action=..."""
+
+    fake: FakeOtrsServer = None
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        """Silencia o log padrão do http.server"""
+        pass
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        """Envio do formulário: como no OTRS, redireciona para a tela do chamado"""
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        self._send(302, b'', 'store', headers={'Location': f"{self.fake.BASE_PATH}?Action=AgentTicketZoom"})
+
+    def _dispatch(self):
+        """Resolve a tela pela query string (separadores ; ou &, como no OTRS)"""
+        parsed = urlparse(self.path)
+
+        if parsed.path in ('/', '/otrs', '/otrs/'):
+            self._send(302, b'', 'redirect', headers={'Location': self.fake.BASE_PATH})
+            return
+        if parsed.path != self.fake.BASE_PATH:
+            self._send(404, b'Not Found', 'unknown', content_type='text/plain; charset=utf-8')
+            return
+
+        params = {k: v[0] for k, v in parse_qs(parsed.query.replace(';', '&')).items()}
+        action = params.get('Action')
+
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+
+        if not action:
+            page = self.fake.generator.render_index(self.fake.BASE_PATH).encode('utf-8')
+            self._send(200, page, 'index')
+            return
+
+        try:
+            page = self.fake.get_page(action, OtrsFormGenerator.sizes_from_params(params))
+        except KeyError:
+            self._send(404, f"Action desconhecida: {action}".encode('utf-8'), action,
+                       content_type='text/plain; charset=utf-8')
+            return
+
+        self._send(200, page, action)
+
+    def _send(self, status: int, data: bytes, action: str, headers: Dict[str, str] = None,
+              content_type: str = 'text/html; charset=utf-8'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Cache-Control', 'no-store')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+        self.fake.record(action, len(data))
+
+
+def show_help():
+    """Exibe ajuda do script"""
+    help_text = """
+🧪 Help OTRS - OTRS Simulado (páginas de estresse)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Uso: python fake_otrs.py [serve] [opções]
+     python fake_otrs.py generate --out DIR [opções]
+
+Opções:
+  --port N              Porta de escuta (padrão: 8780)
+  --host HOST           Endereço de escuta (padrão: 127.0.0.1)
+  --latency S           Atraso por requisição em segundos
+  --seed N              Semente das páginas (padrão: 0)
+  --fields N            Campos dinâmicos (generate; padrão: 2000)
+  --queues N            Filas no campo Dest (generate; padrão: 500)
+  --editor-kb N         Conteúdo do editor em KB (generate; padrão: 512)
+  --out DIR             Diretório de saída (generate)
+  --help, -h            Mostra esta ajuda
+
+Telas (GET /otrs/index.pl?Action=...):
+  AgentTicketPhone      Novo chamado: fila (Dest), serviço, campos dinâmicos, editor
+  AgentTicketNote       Nota/classificação: tipo, serviço, campos dinâmicos, editor
+  AgentTicketZoom       Chamado: informações (Estado: Em Atendimento) e artigos extensos
+
+Parâmetros da URL (separados por ; ou &):
+  Fields=N  Queues=N  EditorKB=N
+  ex: /otrs/index.pl?Action=AgentTicketNote;Fields=10000;EditorKB=4096
+
+Para a extensão atuar, o host precisa casar com os match patterns do
+manifest (ex: *.com.br/otrs/*). Mapeie um nome para 127.0.0.1:
+  chrome --host-resolver-rules="MAP otrs-estresse.com.br 127.0.0.1"
+  (ou adicione "127.0.0.1 otrs-estresse.com.br" ao /etc/hosts)
+e cadastre http://otrs-estresse.com.br:PORTA/otrs/ nas opções da extensão.
+"""
+    print(help_text)
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(
+        description='OTRS simulado com páginas de grande porte',
+        add_help=False
+    )
+
+    parser.add_argument('command', nargs='?', default='serve', choices=['serve', 'generate'])
+    parser.add_argument('--port', type=int, default=8780)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--fields', type=int, default=OtrsFormGenerator.DEFAULT_SIZES['fields'])
+    parser.add_argument('--queues', type=int, default=OtrsFormGenerator.DEFAULT_SIZES['queues'])
+    parser.add_argument('--editor-kb', type=int, default=OtrsFormGenerator.DEFAULT_SIZES['editor_kb'])
+    parser.add_argument('--out')
+    parser.add_argument('--help', '-h', action='store_true')
+
+    args = parser.parse_args()
+
+    if args.help:
+        show_help()
+        return 0
+
+    if args.command == 'generate':
+        if not args.out:
+            print("❌ Informe o diretório de saída com --out")
+            return 1
+
+        out_dir = Path(args.out)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        generator = OtrsFormGenerator(args.seed)
+        for action in OtrsFormGenerator.ACTIONS:
+            start = time.perf_counter()
+            page = generator.render(action, args.fields, args.queues, args.editor_kb)
+            path = out_dir / f"{action}.html"
+            path.write_text(page, encoding='utf-8')
+            print(f"📄 {path} ({len(page.encode('utf-8')) / 1024:.0f} KB, "
+                  f"{(time.perf_counter() - start) * 1000:.0f} ms)")
+        return 0
+
+    server = FakeOtrsServer(host=args.host, port=args.port, latency=args.latency, seed=args.seed).start()
+
+    print(f"🧪 OTRS simulado em {server.url}index.pl")
+    for action in OtrsFormGenerator.ACTIONS:
+        print(f"   📄 {server.url}index.pl?Action={action}")
+    print("💡 Veja --help para mapear um host *.com.br e ativar a extensão")
+    print("⏹️ Ctrl+C para encerrar")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print()
+        print(f"📊 Requisições: {json.dumps(server.get_stats(), indent=2)}")
+        server.stop()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Trava de arquivo entre processos
+Serializa escritas em recursos compartilhados por builds simultâneos (cache, dist/)
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLockTimeout(TimeoutError):
+    """Trava não obtida dentro do tempo limite"""
+
+
+class FileLock:
+    """Classe responsável por uma trava exclusiva baseada em arquivo (fcntl/msvcrt)"""
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, path: Path, timeout: Optional[float] = 60.0):
+        """
+        Inicializa o FileLock
+
+        Args:
+            path: Arquivo da trava (criado se não existir; nunca é removido)
+            timeout: Segundos de espera antes de desistir (None: espera indefinida)
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self._fd = None
+
+    def acquire(self):
+        """
+        Obtém a trava, aguardando outro processo liberá-la
+
+        Raises:
+            FileLockTimeout: Se o tempo limite se esgotar
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                self._fd = fd
+                return
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise FileLockTimeout(f"Trava ocupada: {self.path}")
+                time.sleep(self.POLL_INTERVAL)
+
+    def release(self):
+        """Libera a trava"""
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
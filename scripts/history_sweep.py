@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Varredura histórica de builds
+Empacota várias revisões do git em paralelo e compara tamanho do pacote,
+bytes de cada content script e tempo de build entre elas
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from build import ExtensionBuilder
+
+
+class HistorySweep:
+    """Classe responsável por empacotar revisões antigas e montar a tabela de tendências"""
+
+    def __init__(self, project_root: Optional[Path] = None, jobs: Optional[int] = None,
+                 targets: Optional[List[str]] = None):
+        """
+        Inicializa o HistorySweep
+
+        Args:
+            project_root: Repositório git do projeto (padrão: pai de scripts/)
+            jobs: Revisões empacotadas ao mesmo tempo (padrão: número de CPUs)
+            targets: Navegadores empacotados em cada revisão (padrão: chrome); o primeiro é o medido
+        """
+        self.project_root = Path(project_root) if project_root else Path(__file__).parent.parent
+        self.jobs = jobs
+        self.targets = targets or [ExtensionBuilder.DEFAULT_TARGET]
+
+    def revisions(self, rev_range: str, max_count: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Commits de um intervalo, do mais antigo para o mais novo (só a linha principal)
+
+        Args:
+            rev_range: Intervalo ou revisão do git (ex: v1.0.0..HEAD, HEAD~20..)
+            max_count: Limita às N revisões mais recentes do intervalo
+
+        Returns:
+            Lista de {'sha', 'short', 'date', 'subject'}
+
+        Raises:
+            ValueError: Intervalo inválido
+        """
+        command = ['git', 'log', '--first-parent', '--reverse', '--format=%H%x1f%h%x1f%cs%x1f%s']
+        if max_count:
+            command.append(f'--max-count={max_count}')
+        result = subprocess.run(command + [rev_range, '--'], cwd=self.project_root,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"Intervalo inválido: {rev_range} ({result.stderr.strip()})")
+
+        revisions = []
+        for line in result.stdout.splitlines():
+            sha, short, date, subject = line.split('\x1f', 3)
+            revisions.append({'sha': sha, 'short': short, 'date': date, 'subject': subject})
+        return revisions
+
+    def run(self, rev_range: str, max_count: Optional[int] = None, log=None) -> Dict[str, Any]:
+        """
+        Empacota as revisões do intervalo em um pool de processos
+
+        Cada revisão é exportada com git archive para um diretório temporário e
+        empacotada pelo ExtensionBuilder atual em memória, sem incremento de
+        versão; as mesmas regras de empacotamento valem para todas, de modo que
+        as diferenças vêm do código da extensão. Os módulos de src/generated/
+        entram como foram versionados em cada revisão.
+
+        Args:
+            rev_range: Intervalo ou revisão do git
+            max_count: Limita às N revisões mais recentes
+            log: Onde exibir o progresso (padrão: saída padrão)
+
+        Returns:
+            {'range', 'targets', 'jobs', 'scripts', 'revisions', 'largest_increase'}
+        """
+        log = log or sys.stdout
+        revisions = self.revisions(rev_range, max_count)
+        if not revisions:
+            raise ValueError(f"Nenhuma revisão em {rev_range}")
+
+        cpus = os.cpu_count() or 1
+        jobs = max(1, min(self.jobs or cpus, len(revisions)))
+        print(f"🕰️ Empacotando {len(revisions)} revisões ({jobs} processos)...", file=log)
+        if jobs > cpus:
+            print(f"⚠️ {jobs} processos para {cpus} CPUs: os tempos de build ficam inflados "
+                  f"(compare 'build_cpu_seconds' ou use --jobs {cpus})", file=log)
+
+        rows = {}
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(_build_revision, str(self.project_root), revision, self.targets):
+                       revision['sha'] for revision in revisions}
+            for future in as_completed(futures):
+                row = future.result()
+                rows[row['sha']] = row
+                if row['success']:
+                    print(f"   ✅ {row['short']} {row['package_size']:,} bytes em {row['build_seconds']:.2f}s",
+                          file=log)
+                else:
+                    print(f"   ❌ {row['short']}: {row['error']}", file=log)
+
+        ordered = [rows[revision['sha']] for revision in revisions]
+        self._add_deltas(ordered)
+
+        scripts = []
+        for row in ordered:
+            scripts.extend(path for path in row.get('scripts', {}) if path not in scripts)
+
+        increases = [row for row in ordered if (row.get('package_delta') or 0) > 0]
+        return {
+            'range': rev_range,
+            'targets': self.targets,
+            'jobs': jobs,
+            'scripts': scripts,
+            'revisions': ordered,
+            'largest_increase': max(increases, key=lambda row: row['package_delta'], default=None)
+        }
+
+    @staticmethod
+    def _add_deltas(rows: List[Dict[str, Any]]):
+        """Variação de cada revisão em relação à anterior empacotada com sucesso"""
+        previous = None
+        for row in rows:
+            if not row['success']:
+                continue
+            row['package_delta'] = row['package_size'] - previous['package_size'] if previous else None
+            row['script_deltas'] = {
+                path: size - previous['scripts'].get(path, 0)
+                for path, size in row['scripts'].items()
+                if previous and size != previous['scripts'].get(path)
+            }
+            if previous:
+                row['script_deltas'].update({path: -size for path, size in previous['scripts'].items()
+                                             if path not in row['scripts']})
+            previous = row
+
+    # ------------------------------------------------------------------
+    # Saídas
+    # ------------------------------------------------------------------
+
+    def print_report(self, report: Dict[str, Any]):
+        """Exibe a tabela por revisão e os content scripts que mudaram em cada uma"""
+        print("━" * 60)
+        print(f"📊 {report['range']} ({', '.join(report['targets'])}; medido: {report['targets'][0]})")
+        print(f"   {'revisão':<9} {'data':<10} {'pacote':>10} {'Δ':>8} {'scripts':>10} {'tempo':>7}  assunto")
+        for row in report['revisions']:
+            if not row['success']:
+                print(f"   {row['short']:<9} {row['date']:<10} {'erro':>10} {'':>8} {'':>10} {'':>7}  "
+                      f"{row['subject'][:40]}")
+                continue
+            delta = '' if row['package_delta'] is None else f"{row['package_delta']:+,}"
+            print(f"   {row['short']:<9} {row['date']:<10} {row['package_size']:>10,} {delta:>8} "
+                  f"{sum(row['scripts'].values()):>10,} {row['build_seconds']:>6.2f}s  {row['subject'][:40]}")
+            for path, change in sorted(row['script_deltas'].items(), key=lambda item: -abs(item[1])):
+                print(f"   {'':<9} ↳ {path} {row['scripts'].get(path, 0):,} bytes ({change:+,})")
+
+        increase = report['largest_increase']
+        if increase:
+            print(f"📈 Maior aumento do pacote: {increase['short']} ({increase['package_delta']:+,} bytes) "
+                  f"— {increase['subject']}")
+
+    @staticmethod
+    def render_csv(report: Dict[str, Any]) -> str:
+        """Tabela combinada: uma linha por revisão e uma coluna por content script"""
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow(['sha', 'date', 'subject', 'package_bytes', 'package_delta', 'files',
+                         'uncompressed_bytes', 'build_seconds', 'build_cpu_seconds', 'error'] + report['scripts'])
+        for row in report['revisions']:
+            scripts = row.get('scripts', {})
+            writer.writerow([row['sha'], row['date'], row['subject'], row.get('package_size', ''),
+                             row.get('package_delta') if row.get('package_delta') is not None else '',
+                             row.get('files', ''), row.get('total_size', ''), row.get('build_seconds', ''),
+                             row.get('build_cpu_seconds', ''), row.get('error', '')]
+                            + [scripts.get(path, '') for path in report['scripts']])
+        return output.getvalue()
+
+
+def _build_revision(project_root: str, revision: Dict[str, str], targets: List[str]) -> Dict[str, Any]:
+    """
+    Exporta e empacota uma revisão (executado em um processo do pool)
+
+    Returns:
+        Linha da tabela: dados da revisão, tamanhos, bytes por content script e
+        tempos; ou 'error' se a revisão não pôde ser empacotada
+    """
+    row = dict(revision, success=False)
+    try:
+        with tempfile.TemporaryDirectory(prefix='help-otrs-sweep-') as temp_dir, \
+                contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            archive = subprocess.run(['git', 'archive', '--format=tar', revision['sha']], cwd=project_root,
+                                     capture_output=True, check=True).stdout
+            with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+                if hasattr(tarfile, 'data_filter'):
+                    tar.extractall(temp_dir, filter='data')
+                else:
+                    tar.extractall(temp_dir)
+            row['export_seconds'] = round(time.perf_counter() - start, 4)
+
+            start, cpu_start = time.perf_counter(), time.process_time()
+            builder = ExtensionBuilder(temp_dir, jobs=1)
+            result = builder.build_in_memory(targets, render_generated=False, source_maps=False)
+            row['build_seconds'] = round(time.perf_counter() - start, 4)
+            # Tempo de CPU do processo: não depende de quantas revisões disputam a máquina
+            row['build_cpu_seconds'] = round(time.process_time() - cpu_start, 4)
+    except Exception as error:  # Uma revisão com problema não interrompe a varredura
+        row['error'] = str(error)
+        return row
+
+    if not result['success']:
+        row['error'] = result['error']
+        return row
+
+    with zipfile.ZipFile(io.BytesIO(result['zip_data'])) as archive:
+        sizes = {info.filename: info.file_size for info in archive.infolist()}
+        manifest = json.loads(archive.read('manifest.json'))
+    scripts = {}
+    for content_script in manifest.get('content_scripts', []):
+        for path in content_script.get('js', []) + content_script.get('css', []):
+            if path in sizes:
+                scripts[path] = sizes[path]
+
+    row.update(
+        success=True,
+        version=result['version'],
+        package_size=result['zip_info']['size'],
+        packages={variant: info['size'] for variant, info in result['metrics']['packages'].items()},
+        files=result['metrics']['total_files'],
+        total_size=result['metrics']['total_size'],
+        scripts=scripts
+    )
+    return row
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(description='Empacota revisões antigas e compara tamanhos e tempos')
+    parser.add_argument('range', help='Intervalo ou revisão do git (ex: v1.0.0..HEAD, HEAD~20..)')
+    parser.add_argument('--max-count', '-n', type=int, help='Apenas as N revisões mais recentes do intervalo')
+    parser.add_argument('--jobs', '-j', type=int, help='Revisões empacotadas ao mesmo tempo (padrão: CPUs)')
+    parser.add_argument('--targets', default='chrome',
+                        help='Navegadores empacotados (o primeiro é o medido na tabela)')
+    parser.add_argument('--format', choices=['text', 'csv', 'json'], default='text', help='Formato da saída')
+    args = parser.parse_args()
+
+    sweep = HistorySweep(jobs=args.jobs, targets=[t.strip() for t in args.targets.split(',') if t.strip()])
+    log = sys.stdout if args.format == 'text' else sys.stderr
+    try:
+        report = sweep.run(args.range, args.max_count, log=log)
+    except ValueError as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return 1
+
+    if args.format == 'json':
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    elif args.format == 'csv':
+        sys.stdout.write(sweep.render_csv(report))
+    else:
+        sweep.print_report(report)
+    return 0 if all(row['success'] for row in report['revisions']) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Geração dos ícones da extensão em cada tamanho declarado no manifest.json
+Redimensiona e otimiza PNGs sem perdas em Python puro, com cache por digest
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import hashlib
+import json
+import math
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from build_cache import BuildCache
+
+
+class PngImage:
+    """Classe responsável por ler, redimensionar e gravar PNGs RGBA de 8 bits"""
+
+    SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+    # Canais por tipo de cor (0: cinza, 2: RGB, 3: paleta, 4: cinza+alfa, 6: RGBA)
+    CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+    # Estratégias do zlib testadas na compressão
+    ZLIB_STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED)
+
+    def __init__(self, width: int, height: int, pixels: bytearray, srgb: Optional[bytes] = None):
+        """
+        Inicializa o PngImage
+
+        Args:
+            width: Largura em pixels
+            height: Altura em pixels
+            pixels: RGBA com 4 bytes por pixel, linha a linha
+            srgb: Conteúdo do chunk sRGB original (intenção de renderização)
+        """
+        self.width = width
+        self.height = height
+        self.pixels = pixels
+        self.srgb = srgb
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def decode(cls, data: bytes) -> 'PngImage':
+        """
+        Decodifica um PNG não entrelaçado de 8 bits por canal
+
+        Raises:
+            ValueError: Formato não suportado ou arquivo inválido
+        """
+        if not data.startswith(cls.SIGNATURE):
+            raise ValueError("Assinatura PNG inválida")
+
+        header = None
+        palette = b''
+        transparency = b''
+        srgb = None
+        idat = []
+        position = len(cls.SIGNATURE)
+        while position + 8 <= len(data):
+            length, kind = struct.unpack('>I4s', data[position:position + 8])
+            body = data[position + 8:position + 8 + length]
+            position += 12 + length
+            if kind == b'IHDR':
+                header = struct.unpack('>IIBBBBB', body)
+            elif kind == b'PLTE':
+                palette = body
+            elif kind == b'tRNS':
+                transparency = body
+            elif kind == b'sRGB':
+                srgb = body
+            elif kind == b'IDAT':
+                idat.append(body)
+            elif kind == b'IEND':
+                break
+
+        if header is None:
+            raise ValueError("Chunk IHDR ausente")
+        width, height, bit_depth, color_type, _, _, interlace = header
+        if bit_depth != 8 or color_type not in cls.CHANNELS:
+            raise ValueError(f"PNG não suportado (profundidade {bit_depth}, tipo de cor {color_type})")
+        if interlace:
+            raise ValueError("PNG entrelaçado não suportado")
+
+        channels = cls.CHANNELS[color_type]
+        raw = cls._unfilter(zlib.decompress(b''.join(idat)), width * channels, height, channels)
+
+        pixels = bytearray(width * height * 4)
+        if color_type == 6:
+            pixels[:] = raw
+        elif color_type == 2:
+            for i in range(width * height):
+                pixels[4 * i:4 * i + 3] = raw[3 * i:3 * i + 3]
+                pixels[4 * i + 3] = 255
+        elif color_type == 4:
+            for i in range(width * height):
+                pixels[4 * i:4 * i + 3] = bytes([raw[2 * i]]) * 3
+                pixels[4 * i + 3] = raw[2 * i + 1]
+        elif color_type == 0:
+            for i in range(width * height):
+                pixels[4 * i:4 * i + 4] = bytes([raw[i]] * 3 + [255])
+        else:
+            alphas = transparency + b'\xff' * (256 - len(transparency))
+            for i, index in enumerate(raw):
+                pixels[4 * i:4 * i + 3] = palette[3 * index:3 * index + 3]
+                pixels[4 * i + 3] = alphas[index]
+        return cls(width, height, pixels, srgb)
+
+    @staticmethod
+    def _paeth(a: int, b: int, c: int) -> int:
+        """Preditor Paeth da especificação PNG"""
+        p = a + b - c
+        pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+        if pa <= pb and pa <= pc:
+            return a
+        return b if pb <= pc else c
+
+    @classmethod
+    def _unfilter(cls, data: bytes, stride: int, height: int, bpp: int) -> bytearray:
+        """Desfaz os filtros de cada linha"""
+        out = bytearray(stride * height)
+        previous = bytearray(stride)
+        position = 0
+        for y in range(height):
+            kind = data[position]
+            row = bytearray(data[position + 1:position + 1 + stride])
+            position += stride + 1
+            for x in range(stride):
+                left = row[x - bpp] if x >= bpp else 0
+                if kind == 1:
+                    row[x] = (row[x] + left) & 0xFF
+                elif kind == 2:
+                    row[x] = (row[x] + previous[x]) & 0xFF
+                elif kind == 3:
+                    row[x] = (row[x] + ((left + previous[x]) >> 1)) & 0xFF
+                elif kind == 4:
+                    upper_left = previous[x - bpp] if x >= bpp else 0
+                    row[x] = (row[x] + cls._paeth(left, previous[x], upper_left)) & 0xFF
+            out[y * stride:(y + 1) * stride] = row
+            previous = row
+        return out
+
+    # ------------------------------------------------------------------
+    # Redimensionamento
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _weights(source: int, target: int) -> List[Tuple[int, List[float]]]:
+        """
+        Pesos do filtro triangular (bilinear com antialias) de cada pixel de saída
+
+        Returns:
+            Lista de (primeiro pixel de origem, pesos normalizados)
+        """
+        scale = source / target
+        support = max(scale, 1.0)
+        weights = []
+        for i in range(target):
+            center = (i + 0.5) * scale
+            first = max(0, int(center - support))
+            last = min(source, int(math.ceil(center + support)))
+            taps = [max(0.0, 1.0 - abs((j + 0.5 - center) / support)) for j in range(first, last)]
+            total = sum(taps) or 1.0
+            weights.append((first, [tap / total for tap in taps]))
+        return weights
+
+    def resize(self, width: int, height: int) -> 'PngImage':
+        """
+        Redimensiona com alfa pré-multiplicado (bordas transparentes sem halo escuro)
+
+        Args:
+            width: Nova largura
+            height: Nova altura
+
+        Returns:
+            Nova imagem
+        """
+        src = self.pixels
+        premultiplied = []
+        for i in range(0, len(src), 4):
+            alpha = src[i + 3]
+            premultiplied.extend((src[i] * alpha / 255, src[i + 1] * alpha / 255, src[i + 2] * alpha / 255, alpha))
+
+        # Passada horizontal: height_origem × width
+        horizontal = []
+        columns = self._weights(self.width, width)
+        for y in range(self.height):
+            base = y * self.width * 4
+            row = []
+            for first, taps in columns:
+                r = g = b = a = 0.0
+                offset = base + first * 4
+                for tap in taps:
+                    r += premultiplied[offset] * tap
+                    g += premultiplied[offset + 1] * tap
+                    b += premultiplied[offset + 2] * tap
+                    a += premultiplied[offset + 3] * tap
+                    offset += 4
+                row.extend((r, g, b, a))
+            horizontal.append(row)
+
+        # Passada vertical e volta ao alfa direto
+        pixels = bytearray(width * height * 4)
+        position = 0
+        for first, taps in self._weights(self.height, height):
+            rows = horizontal[first:first + len(taps)]
+            for x in range(width):
+                channel = x * 4
+                r = g = b = a = 0.0
+                for tap, row in zip(taps, rows):
+                    r += row[channel] * tap
+                    g += row[channel + 1] * tap
+                    b += row[channel + 2] * tap
+                    a += row[channel + 3] * tap
+                alpha = min(255, max(0, round(a)))
+                if alpha:
+                    factor = 255 / a
+                    pixels[position:position + 4] = bytes((min(255, max(0, round(r * factor))),
+                                                           min(255, max(0, round(g * factor))),
+                                                           min(255, max(0, round(b * factor))), alpha))
+                position += 4
+        return PngImage(width, height, pixels, self.srgb)
+
+    # ------------------------------------------------------------------
+    # Gravação otimizada
+    # ------------------------------------------------------------------
+
+    def _color_modes(self) -> List[Tuple[int, bytes, bytes, bytes, int]]:
+        """
+        Representações sem perdas candidatas
+
+        Returns:
+            Lista de (tipo_de_cor, linhas_concatenadas, PLTE, tRNS, bytes_por_pixel)
+        """
+        src = self.pixels
+        count = self.width * self.height
+        opaque = all(src[4 * i + 3] == 255 for i in range(count))
+        gray = all(src[4 * i] == src[4 * i + 1] == src[4 * i + 2] for i in range(count))
+
+        modes = []
+        if gray:
+            if opaque:
+                modes.append((0, bytes(src[0::4]), b'', b'', 1))
+            else:
+                data = bytearray(count * 2)
+                data[0::2], data[1::2] = src[0::4], src[3::4]
+                modes.append((4, bytes(data), b'', b'', 2))
+        elif opaque:
+            data = bytearray(count * 3)
+            data[0::3], data[1::3], data[2::3] = src[0::4], src[1::4], src[2::4]
+            modes.append((2, bytes(data), b'', b'', 3))
+        else:
+            modes.append((6, bytes(src), b'', b'', 4))
+
+        # Paleta quando há no máximo 256 cores (sempre o caso até 16x16)
+        colors: Dict[bytes, int] = {}
+        for i in range(count):
+            colors[bytes(src[4 * i:4 * i + 4])] = colors.get(bytes(src[4 * i:4 * i + 4]), 0) + 1
+            if len(colors) > 256:
+                break
+        if len(colors) <= 256:
+            # Cores translúcidas primeiro encurtam o tRNS; depois, as mais frequentes
+            ordered = sorted(colors, key=lambda color: (color[3] == 255, -colors[color]))
+            index = {color: i for i, color in enumerate(ordered)}
+            palette = b''.join(color[:3] for color in ordered)
+            alphas = bytes(color[3] for color in ordered)
+            transparency = alphas.rstrip(b'\xff')
+            data = bytes(index[bytes(src[4 * i:4 * i + 4])] for i in range(count))
+            modes.append((3, data, palette, transparency, 1))
+        return modes
+
+    @classmethod
+    def _filter_variants(cls, data: bytes, stride: int, height: int, bpp: int) -> List[bytes]:
+        """Fluxos filtrados: cada filtro fixo (0-4) e o adaptativo por linha"""
+        rows = [data[y * stride:(y + 1) * stride] for y in range(height)]
+        filtered = {kind: [] for kind in range(5)}
+        previous = bytes(stride)
+        for row in rows:
+            for kind in range(5):
+                out = bytearray(stride + 1)
+                out[0] = kind
+                for x in range(stride):
+                    left = row[x - bpp] if x >= bpp else 0
+                    if kind == 0:
+                        predicted = 0
+                    elif kind == 1:
+                        predicted = left
+                    elif kind == 2:
+                        predicted = previous[x]
+                    elif kind == 3:
+                        predicted = (left + previous[x]) >> 1
+                    else:
+                        upper_left = previous[x - bpp] if x >= bpp else 0
+                        predicted = cls._paeth(left, previous[x], upper_left)
+                    out[x + 1] = (row[x] - predicted) & 0xFF
+                filtered[kind].append(bytes(out))
+            previous = row
+
+        # Adaptativo: menor soma dos valores com sinal (heurística da libpng)
+        adaptive = [
+            min((filtered[kind][y] for kind in range(5)),
+                key=lambda line: sum(v if v < 128 else 256 - v for v in line[1:]))
+            for y in range(height)
+        ]
+        return [b''.join(filtered[kind]) for kind in range(5)] + [b''.join(adaptive)]
+
+    @staticmethod
+    def _chunk(kind: bytes, body: bytes) -> bytes:
+        """Chunk PNG com comprimento e CRC"""
+        return struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body))
+
+    def encode(self) -> bytes:
+        """
+        Grava o PNG menor entre tipos de cor, filtros e estratégias do zlib
+
+        Só o sRGB é mantido entre os chunks auxiliares (afeta a cor exibida).
+        """
+        best = None
+        for color_type, data, palette, transparency, bpp in self._color_modes():
+            stride = self.width * bpp
+            for stream in self._filter_variants(data, stride, self.height, bpp):
+                for strategy in self.ZLIB_STRATEGIES:
+                    compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+                    compressed = compressor.compress(stream) + compressor.flush()
+                    if best is None or len(compressed) < len(best[0]):
+                        best = (compressed, color_type, palette, transparency)
+
+        compressed, color_type, palette, transparency = best
+        chunks = [self._chunk(b'IHDR', struct.pack('>IIBBBBB', self.width, self.height, 8, color_type, 0, 0, 0))]
+        if self.srgb is not None:
+            chunks.append(self._chunk(b'sRGB', self.srgb))
+        if palette:
+            chunks.append(self._chunk(b'PLTE', palette))
+        if transparency:
+            chunks.append(self._chunk(b'tRNS', transparency))
+        chunks.append(self._chunk(b'IDAT', compressed))
+        chunks.append(self._chunk(b'IEND', b''))
+        return self.SIGNATURE + b''.join(chunks)
+
+    @classmethod
+    def read_size(cls, data: bytes) -> Optional[Tuple[int, int]]:
+        """Dimensões declaradas no IHDR (None se não for PNG)"""
+        if not data.startswith(cls.SIGNATURE) or data[12:16] != b'IHDR':
+            return None
+        return struct.unpack('>II', data[16:24])
+
+
+class IconGenerator:
+    """Classe responsável por gerar os ícones de cada tamanho e reescrever o manifest.json"""
+
+    # Diretório dos ícones gerados no dist/
+    OUTPUT_DIR = 'src/ui/icons'
+
+    # Versão do algoritmo; faz parte da chave do cache
+    ICON_VERSION = 2
+
+    # Chaves do manifest com mapas tamanho → caminho
+    MANIFEST_ICON_KEYS = (('icons',), ('action', 'default_icon'))
+
+    def __init__(self, build_cache: Optional[BuildCache] = None):
+        """
+        Inicializa o IconGenerator
+
+        Args:
+            build_cache: Cache de build (blobs 'minified'); sem cache, sempre gera
+        """
+        self.build_cache = build_cache
+
+    def render(self, source: bytes, size: int) -> bytes:
+        """
+        PNG reduzido para um tamanho a partir do conteúdo original, usando o cache por digest
+
+        O lado maior passa a medir size e a proporção é mantida (origens não
+        quadradas não são distorcidas). Só reduz: apply() mantém a origem nos
+        slots que ela não excede.
+
+        Args:
+            source: PNG original
+            size: Lado do ícone em pixels
+
+        Returns:
+            PNG otimizado
+        """
+        width, height = PngImage.read_size(source) or (0, 0)
+        scale = size / max(width, height, 1)
+        expected = (max(1, round(width * scale)), max(1, round(height * scale)))
+
+        key = f"{hashlib.sha256(source).hexdigest()}-icon{size}-v{self.ICON_VERSION}"
+        if self.build_cache is not None:
+            cached = self.build_cache.get_blob('minified', key)
+            if cached is not None and PngImage.read_size(cached) == expected:
+                return cached
+
+        image = PngImage.decode(source)
+        data = image.resize(*expected).encode()
+
+        if self.build_cache is not None:
+            self.build_cache.put_blob('minified', key, data)
+        return data
+
+    def _icon_maps(self, manifest: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Mapas tamanho → caminho declarados no manifest"""
+        maps = []
+        for keys in self.MANIFEST_ICON_KEYS:
+            value = manifest
+            for key in keys:
+                value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, dict):
+                maps.append(value)
+        return maps
+
+    def apply(self, dist_dir: Path) -> Dict[str, Any]:
+        """
+        Gera os ícones declarados no manifest.json do dist/ e aponta cada tamanho para o seu
+
+        Args:
+            dist_dir: Diretório de distribuição
+
+        Slots que a origem não excede (ex: origem de 101px no slot de 128px)
+        continuam apontando para a própria origem, sem cópia com outro nome.
+
+        Returns:
+            Dicionário com 'changed' (caminho → conteúdo gravado), 'icons',
+            'kept' (slots mantidos na origem), 'skipped' e 'package_delta'
+            (bytes acrescentados ao pacote: a origem continua nele)
+        """
+        dist_dir = Path(dist_dir)
+        manifest_path = dist_dir / 'manifest.json'
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        changed: Dict[str, bytes] = {}
+        icons: Dict[str, Dict[str, Any]] = {}
+        kept = []
+        skipped = []
+        sources: Dict[str, bytes] = {}
+
+        for icon_map in self._icon_maps(manifest):
+            for size_key, path in icon_map.items():
+                if not size_key.isdigit() or not path.lower().endswith('.png'):
+                    continue
+                size = int(size_key)
+                output = f"{self.OUTPUT_DIR}/{Path(path).stem}-{size}.png"
+
+                if output not in icons:
+                    if path not in sources:
+                        try:
+                            sources[path] = (dist_dir / path).read_bytes()
+                        except OSError as error:
+                            skipped.append({'path': path, 'size': size, 'reason': str(error)})
+                            continue
+                    source_size = PngImage.read_size(sources[path])
+                    if source_size is None:
+                        skipped.append({'path': path, 'size': size, 'reason': 'não é um PNG'})
+                        continue
+                    if max(source_size) <= size:
+                        # Ampliar não acrescenta detalhe: o slot usa a própria origem
+                        entry = {'path': path, 'size': size, 'actual_size': list(source_size)}
+                        if entry not in kept:
+                            kept.append(entry)
+                        continue
+                    try:
+                        data = self.render(sources[path], size)
+                    except (ValueError, zlib.error) as error:
+                        skipped.append({'path': path, 'size': size, 'reason': str(error)})
+                        continue
+                    changed[output] = data
+                    icons[output] = {'source': path, 'size': size, 'actual_size': list(PngImage.read_size(data)),
+                                     'bytes': len(data), 'slots': 0}
+
+                icon_map[size_key] = output
+                icons[output]['slots'] += 1
+
+        if changed:
+            changed['manifest.json'] = json.dumps(manifest, indent=4, ensure_ascii=False).encode('utf-8')
+        for name, data in changed.items():
+            path = dist_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Troca atômica: etapas paralelas do build podem estar lendo o manifest.json
+            temp_path = path.with_name(f"{path.name}.tmp")
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+
+        # As origens continuam no pacote (ex: logo.png da página de opções): os ícones só somam
+        icon_bytes = sum(icon['bytes'] for icon in icons.values())
+        return {
+            'changed': changed,
+            'icons': icons,
+            'kept': kept,
+            'skipped': skipped,
+            'icon_bytes': icon_bytes,
+            'package_delta': icon_bytes
+        }
+
+
+def main():
+    """Função principal do script"""
+    if len(sys.argv) != 2:
+        print("Uso: python scripts/icons.py <diretório dist>")
+        return 1
+
+    project_root = Path(__file__).parent.parent
+    generator = IconGenerator(BuildCache(project_root / ".cache"))
+    result = generator.apply(Path(sys.argv[1]))
+    for output, icon in result['icons'].items():
+        width, height = icon['actual_size']
+        print(f"🖼️ {icon['source']} → {output} ({width}x{height}px, {icon['bytes']} bytes)")
+    for kept in result['kept']:
+        print(f"↩️ Slot {kept['size']}px mantido em {kept['path']} (origem de {max(kept['actual_size'])}px)")
+    for skipped in result['skipped']:
+        print(f"⚠️ {skipped['path']} ({skipped['size']}px): {skipped['reason']}")
+    print(f"📦 Pacote: {result['package_delta']:+} bytes (ícones gerados; as origens continuam no pacote)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Manifesto de integridade (SHA-256) dos arquivos empacotados
+Calcula digests em paralelo e verifica ZIPs ou diretórios contra o manifesto
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class IntegrityChecker:
+    """Classe responsável pelos digests SHA-256 e pela verificação de pacotes"""
+
+    # Arquivos a partir deste tamanho são lidos via mmap
+    MMAP_THRESHOLD = 1024 * 1024
+
+    # Tamanho dos blocos lidos de membros do ZIP
+    CHUNK_SIZE = 256 * 1024
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Inicializa o IntegrityChecker
+
+        Args:
+            max_workers: Número de threads (padrão: CPUs + 4, máximo 32)
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+
+    def sha256_file(self, file_path: Path) -> str:
+        """
+        Calcula SHA-256 de um arquivo
+
+        Arquivos grandes são mapeados em memória, evitando cópias para buffers Python.
+
+        Args:
+            file_path: Caminho do arquivo
+
+        Returns:
+            Digest hexadecimal
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return hashlib.sha256(mapped).hexdigest()
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def compute_digests(self, files: Dict[str, Path], build_cache=None) -> Dict[str, str]:
+        """
+        Calcula SHA-256 de vários arquivos em paralelo
+
+        Args:
+            files: Mapa caminho_relativo (POSIX) → caminho absoluto
+            build_cache: BuildCache opcional para reaproveitar digests inalterados
+
+        Returns:
+            Mapa caminho_relativo → digest
+        """
+        digests = {}
+        pending = {}
+        blob_ids = None
+
+        for relative_path, file_path in files.items():
+            if build_cache is not None:
+                stat = file_path.stat()
+                if blob_ids is None and not build_cache.is_current(relative_path, stat):
+                    # Consultado uma vez, só quando a assinatura não basta (ex: checkout novo)
+                    blob_ids = build_cache.git_blob_ids()
+                blob_id = (blob_ids or {}).get(relative_path)
+                cached = build_cache.get_digest(relative_path, stat, blob_id)
+                if cached:
+                    digests[relative_path] = cached
+                    continue
+                pending[relative_path] = (file_path, stat, blob_id)
+            else:
+                pending[relative_path] = (file_path, None, None)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(lambda item: (item[0], self.sha256_file(item[1][0])),
+                                       pending.items())
+                for relative_path, digest in results:
+                    digests[relative_path] = digest
+                    _, stat, blob_id = pending[relative_path]
+                    if build_cache is not None:
+                        build_cache.set_digest(relative_path, stat, digest, blob_id)
+
+        return digests
+
+    # ------------------------------------------------------------------
+    # Manifesto
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def write_checksums(checksums_path: Path, digests: Dict[str, str]):
+        """
+        Escreve manifesto no formato do sha256sum (<digest>  <caminho>)
+
+        Args:
+            checksums_path: Caminho do arquivo de saída
+            digests: Mapa caminho_relativo → digest
+        """
+        with open(checksums_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(IntegrityChecker.format_checksums(digests))
+
+    @staticmethod
+    def format_checksums(digests: Dict[str, str]) -> str:
+        """Conteúdo do manifesto no formato do sha256sum, ordenado pelo caminho"""
+        return ''.join(f"{digest}  {path}\n" for path, digest in sorted(digests.items()))
+
+    @staticmethod
+    def load_manifest(manifest_path: Path) -> Dict[str, str]:
+        """
+        Carrega manifesto de checksums ou build-info JSON
+
+        Args:
+            manifest_path: checksums-vX.txt ou build-info-vX.json
+
+        Returns:
+            Mapa caminho_relativo → digest
+        """
+        manifest_path = Path(manifest_path)
+
+        if manifest_path.suffix == '.json':
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                build_info = json.load(f)
+            entries = build_info.get('files', {}).get('files', [])
+            return {
+                entry['name'].replace('\\', '/'): entry['sha256']
+                for entry in entries if entry.get('sha256')
+            }
+
+        digests = {}
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if not line.strip():
+                    continue
+                digest, _, path = line.partition('  ')
+                digests[path.lstrip('*')] = digest.lower()
+        return digests
+
+    # ------------------------------------------------------------------
+    # Verificação
+    # ------------------------------------------------------------------
+
+    def verify_directory(self, directory: Path, expected: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Verifica um diretório descompactado contra o manifesto
+
+        Args:
+            directory: Diretório (ex: dist/)
+            expected: Mapa caminho_relativo → digest esperado
+
+        Returns:
+            Resultado da verificação
+        """
+        directory = Path(directory)
+        present = {
+            path.relative_to(directory).as_posix(): path
+            for path in directory.rglob('*') if path.is_file()
+        }
+        to_check = {path: present[path] for path in expected if path in present}
+        actual = self.compute_digests(to_check)
+        return self._compare(expected, actual, set(present))
+
+    def verify_zip(self, zip_path: Path, expected: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Verifica um pacote ZIP contra o manifesto
+
+        Cada thread abre seu próprio handle do ZIP para ler membros em paralelo.
+
+        Args:
+            zip_path: Caminho do ZIP
+            expected: Mapa caminho_relativo → digest esperado
+
+        Returns:
+            Resultado da verificação
+        """
+        with zipfile.ZipFile(zip_path) as zf:
+            present = {info.filename for info in zf.infolist() if not info.is_dir()}
+
+        local = threading.local()
+        handles = []
+        handles_lock = threading.Lock()
+
+        def member_digest(name: str):
+            if not hasattr(local, 'zf'):
+                local.zf = zipfile.ZipFile(zip_path)
+                with handles_lock:
+                    handles.append(local.zf)
+            digest = hashlib.sha256()
+            with local.zf.open(name) as member:
+                for chunk in iter(lambda: member.read(self.CHUNK_SIZE), b''):
+                    digest.update(chunk)
+            return name, digest.hexdigest()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                actual = dict(executor.map(member_digest, [p for p in expected if p in present]))
+        finally:
+            for handle in handles:
+                handle.close()
+
+        return self._compare(expected, actual, present)
+
+    @staticmethod
+    def _compare(expected: Dict[str, str], actual: Dict[str, str], present: set) -> Dict[str, Any]:
+        """Compara digests esperados e calculados"""
+        missing = sorted(path for path in expected if path not in present)
+        mismatched = sorted(path for path, digest in actual.items() if expected[path] != digest)
+        unexpected = sorted(path for path in present if path not in expected)
+
+        return {
+            'valid': not missing and not mismatched and not unexpected,
+            'checked': len(actual),
+            'ok': len(actual) - len(mismatched),
+            'missing': missing,
+            'mismatched': mismatched,
+            'unexpected': unexpected
+        }
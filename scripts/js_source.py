@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Leitura leve de código JavaScript para as ferramentas de análise
+Mascara comentários, strings e regex mantendo posições, e casa parênteses/chaves
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import ast
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+
+class JsSource:
+    """Classe responsável por expor a estrutura de um arquivo JS sem um parser completo"""
+
+    # Palavras após as quais "/" inicia uma regex
+    REGEX_PRECEDING_WORDS = ('return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+                             'void', 'throw', 'yield', 'await')
+
+    def __init__(self, source: str):
+        """
+        Inicializa o JsSource
+
+        Args:
+            source: Código JavaScript
+        """
+        self.source = source
+        self.code = self.mask(source)
+        self.pairs = self.match_brackets(self.code)
+        self._line_starts = [0] + [i + 1 for i, char in enumerate(source) if char == '\n']
+
+    def line_of(self, offset: int) -> int:
+        """Linha (1-based) de uma posição"""
+        return bisect.bisect_right(self._line_starts, offset)
+
+    def skip_whitespace(self, position: int) -> int:
+        """Primeira posição não vazia a partir de position"""
+        while position < len(self.code) and self.code[position].isspace():
+            position += 1
+        return position
+
+    def split_args(self, open_pos: int) -> List[Tuple[int, int]]:
+        """
+        Intervalos dos argumentos de primeiro nível de uma chamada
+
+        Args:
+            open_pos: Posição do "(" (ou "[" para elementos de array)
+
+        Returns:
+            Lista de intervalos (início, fim)
+        """
+        close = self.pairs.get(open_pos)
+        if close is None:
+            return []
+
+        args = []
+        start = open_pos + 1
+        position = start
+        while position < close:
+            char = self.code[position]
+            if char in '([{' and position in self.pairs:
+                position = self.pairs[position] + 1
+                continue
+            if char == ',':
+                args.append((start, position))
+                start = position + 1
+            position += 1
+        if self.code[start:close].strip():
+            args.append((start, close))
+        return args
+
+    def string_value(self, start: int, end: int) -> Optional[str]:
+        """
+        Valor de um literal de string isolado no intervalo
+
+        Returns:
+            Conteúdo da string, ou None se o intervalo não for um único literal
+            (expressões, concatenações ou template strings com ${...})
+        """
+        text = self.source[start:end].strip()
+        masked = self.code[start:end].strip()
+        if len(text) < 2 or text[0] not in '\'"`' or text[-1] != text[0]:
+            return None
+        if masked[1:-1].strip():
+            return None  # Há código visível entre as aspas (${...} ou concatenação)
+
+        if text[0] == '`':
+            return text[1:-1]
+        try:
+            return ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            return None
+
+    @staticmethod
+    def match_brackets(code: str) -> Dict[int, int]:
+        """Mapa posição de abertura → posição de fechamento para (), [] e {}"""
+        pairs = {}
+        stack = []
+        closing = {')': '(', ']': '[', '}': '{'}
+        for position, char in enumerate(code):
+            if char in '([{':
+                stack.append((char, position))
+            elif char in closing:
+                # Código malformado: descarta aberturas sem par até achar a correspondente
+                while stack and stack[-1][0] != closing[char]:
+                    stack.pop()
+                if stack:
+                    pairs[stack.pop()[1]] = position
+        return pairs
+
+    @classmethod
+    def mask(cls, source: str) -> str:
+        """
+        Substitui comentários e conteúdo de strings/regex por espaços
+
+        Mantém o tamanho e as quebras de linha, de modo que posições no código
+        mascarado correspondem às do original. Expressões ${...} de template
+        strings continuam visíveis.
+        """
+        out = list(source)
+        length = len(source)
+        position = 0
+        last_significant = ''
+        last_word = ''
+        template_depth = []  # profundidade de chaves de cada ${ aberto
+
+        def blank(start: int, end: int):
+            for i in range(start, min(end, length)):
+                if out[i] != '\n':
+                    out[i] = ' '
+
+        def scan_template(start: int) -> int:
+            """Percorre template string a partir do conteúdo; retorna posição após ` ou ${"""
+            i = start
+            while i < length:
+                if source[i] == '\\':
+                    i += 2
+                elif source[i] == '`':
+                    blank(start, i)
+                    return i + 1
+                elif source.startswith('${', i):
+                    blank(start, i)
+                    template_depth.append(0)
+                    return i + 2
+                else:
+                    i += 1
+            blank(start, length)
+            return length
+
+        while position < length:
+            char = source[position]
+
+            if source.startswith('//', position):
+                end = source.find('\n', position)
+                end = length if end < 0 else end
+                blank(position, end)
+                position = end
+                continue
+
+            if source.startswith('/*', position):
+                end = source.find('*/', position + 2)
+                end = length if end < 0 else end + 2
+                blank(position, end)
+                position = end
+                continue
+
+            if char in '\'"':
+                i = position + 1
+                while i < length and source[i] != char and source[i] != '\n':
+                    i += 2 if source[i] == '\\' else 1
+                blank(position + 1, i)
+                position = i + 1
+                last_significant, last_word = char, ''
+                continue
+
+            if char == '`':
+                position = scan_template(position + 1)
+                last_significant, last_word = '`', ''
+                continue
+
+            if char == '}' and template_depth:
+                if template_depth[-1] == 0:
+                    template_depth.pop()
+                    position = scan_template(position + 1)
+                    last_significant, last_word = '`', ''
+                    continue
+                template_depth[-1] -= 1
+            elif char == '{' and template_depth:
+                template_depth[-1] += 1
+
+            if char == '/':
+                regex_allowed = (last_significant == '' or last_significant in '(,=:[!&|?{};+-*%<>~^'
+                                 or last_word in cls.REGEX_PRECEDING_WORDS)
+                if regex_allowed:
+                    i = position + 1
+                    in_class = False
+                    while i < length and source[i] != '\n':
+                        if source[i] == '\\':
+                            i += 2
+                            continue
+                        if source[i] == '[':
+                            in_class = True
+                        elif source[i] == ']':
+                            in_class = False
+                        elif source[i] == '/' and not in_class:
+                            break
+                        i += 1
+                    blank(position + 1, i)
+                    position = i + 1
+                    last_significant, last_word = '/', ''
+                    continue
+
+            if char.isalnum() or char in '_$':
+                end = position
+                while end < length and (source[end].isalnum() or source[end] in '_$'):
+                    end += 1
+                last_word = source[position:end]
+                last_significant = source[end - 1]
+                position = end
+                continue
+
+            if not char.isspace():
+                last_significant, last_word = char, ''
+            position += 1
+
+        return ''.join(out)
@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+Agregador das métricas de desempenho exportadas pela extensão
+Lê dumps de getPerformanceMetrics()/getStats() de vários agentes e compara versões
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class BuildInfoIndex:
+    """Classe responsável por relacionar versões da extensão aos build-info gerados"""
+
+    def __init__(self, project_root: Path):
+        """
+        Inicializa o BuildInfoIndex
+
+        Args:
+            project_root: Diretório raiz do projeto
+        """
+        self.project_root = Path(project_root)
+        self.builds: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        """Carrega build-info da raiz e dos artefatos do store (build/objects)"""
+        paths = list(self.project_root.glob('build-info-v*.json'))
+        paths += list((self.project_root / 'build' / 'objects').glob('*/*/build-info-v*.json'))
+
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    info = json.load(f)
+            except (OSError, ValueError):
+                continue
+            version = info.get('version')
+            if not version:
+                continue
+
+            build = {
+                'version': version,
+                'build_date': info.get('build_date'),
+                'input_digest': info.get('input_digest'),
+                'source': str(path.relative_to(self.project_root))
+            }
+            # Mesma versão em vários alvos/órgãos: vale o build mais antigo (primeira publicação)
+            current = self.builds.get(version)
+            if current is None or (build['build_date'] or '') < (current['build_date'] or ''):
+                self.builds[version] = build
+
+    def get(self, version: str) -> Optional[Dict[str, Any]]:
+        """Build-info resumido de uma versão"""
+        return self.builds.get(version)
+
+    def version_at(self, timestamp: Optional[str]) -> Optional[str]:
+        """
+        Versão em uso num instante (último build publicado até o timestamp)
+
+        Args:
+            timestamp: Data ISO da amostra
+
+        Returns:
+            Versão ou None se não houver build anterior
+        """
+        moment = _parse_date(timestamp)
+        if moment is None:
+            return None
+
+        candidates = [(date, version) for version, build in self.builds.items()
+                      if (date := _parse_date(build['build_date'])) is not None and date <= moment]
+        return max(candidates)[1] if candidates else None
+
+    def order(self, versions: Iterable[str]) -> List[str]:
+        """Ordena versões pela data de build (versões sem build-info por número)"""
+        def key(version: str) -> Tuple:
+            build = self.builds.get(version)
+            date = _parse_date(build['build_date']) if build else None
+            return (date is None, date or datetime.min, _version_key(version))
+        return sorted(versions, key=key)
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    """Converte data ISO (com ou sem Z/fuso) para datetime ingênuo"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return moment
+
+
+def _version_key(version: str) -> Tuple:
+    """Chave de ordenação numérica para X.Y.Z"""
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split('.'))
+
+
+class MetricsAggregator:
+    """Classe responsável por agregar amostras de benchmark() e calcular percentis"""
+
+    PERCENTILES = (50, 95, 99)
+
+    # Chaves que identificam o agente/máquina que exportou o dump
+    AGENT_KEYS = ('agent', 'hostname', 'user')
+
+    # Componente registrado quando o dump não informa de onde vieram as métricas
+    DEFAULT_COMPONENT = 'extension'
+
+    UNKNOWN_VERSION = 'desconhecida'
+
+    def __init__(self, project_root: Path):
+        """
+        Inicializa o MetricsAggregator
+
+        Args:
+            project_root: Diretório raiz do projeto
+        """
+        self.project_root = Path(project_root)
+        self.build_index = BuildInfoIndex(self.project_root)
+        self.samples: List[Dict[str, Any]] = []
+        self._seen = set()
+        self.stats = {'files': 0, 'records': 0, 'samples': 0, 'duplicates': 0, 'failed': 0, 'errors': []}
+
+    # ------------------------------------------------------------------
+    # Leitura dos dumps
+    # ------------------------------------------------------------------
+
+    def load_file(self, path: Path, default_version: Optional[str] = None, default_agent: Optional[str] = None):
+        """
+        Carrega um dump JSON (objeto ou lista) ou NDJSON (um objeto por linha)
+
+        Args:
+            path: Arquivo exportado
+            default_version: Versão para dumps que não a informam
+            default_agent: Agente para dumps que não o informam (padrão: nome do arquivo)
+        """
+        path = Path(path)
+        text = path.read_text(encoding='utf-8')
+        self.stats['files'] += 1
+        context = {'version': default_version, 'agent': default_agent or path.stem,
+                   'component': None, 'timestamp': None}
+
+        try:
+            records = [json.loads(text)]
+        except ValueError:
+            records = []
+            for number, line in enumerate(text.splitlines(), 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError as error:
+                    self.stats['errors'].append(f"{path.name}:{number}: {error}")
+
+        for record in records:
+            for item in (record if isinstance(record, list) else [record]):
+                self.stats['records'] += 1
+                self.add_record(item, context)
+
+    def add_record(self, record: Any, context: Dict[str, Any], key: Optional[str] = None):
+        """
+        Percorre um registro procurando mapas de métricas ({operação: {duration, ...}})
+
+        Campos de contexto (versão, agente, componente, timestamp) encontrados em
+        níveis superiores valem para os mapas aninhados, o que cobre tanto o
+        retorno de getPerformanceMetrics() quanto os de getStats()/getDebugInfo().
+
+        Args:
+            record: Objeto JSON
+            context: Contexto herdado
+            key: Chave sob a qual o objeto estava (usada como componente)
+        """
+        if not isinstance(record, dict):
+            return
+
+        if self._is_metrics_map(record):
+            for operation, data in record.items():
+                self._add_sample(operation, data, context)
+            return
+
+        context = dict(context)
+        version = record.get('version')
+        if isinstance(version, dict):
+            version = version.get('version')
+        if isinstance(version, str) and version:
+            context['version'] = version
+        for agent_key in self.AGENT_KEYS:
+            if isinstance(record.get(agent_key), str):
+                context['agent'] = record[agent_key]
+                break
+        if isinstance(record.get('component'), str):
+            context['component'] = record['component']
+        elif key and key not in ('performance', 'metrics', 'lastMetrics'):
+            context['component'] = key
+        if isinstance(record.get('timestamp'), str):
+            context['timestamp'] = record['timestamp']
+
+        for child_key, value in record.items():
+            if isinstance(value, dict):
+                self.add_record(value, context, child_key)
+            elif isinstance(value, list):
+                for item in value:
+                    self.add_record(item, context, child_key)
+
+    @staticmethod
+    def _is_metrics_map(record: Dict[str, Any]) -> bool:
+        """Verifica se o objeto é um mapa operação → amostra de benchmark()"""
+        return bool(record) and all(
+            isinstance(data, dict) and isinstance(data.get('duration'), (int, float))
+            and not isinstance(data.get('duration'), bool)
+            for data in record.values()
+        )
+
+    def _add_sample(self, operation: str, data: Dict[str, Any], context: Dict[str, Any]):
+        """Registra uma amostra resolvendo a versão pelo build-info quando ausente"""
+        timestamp = data.get('timestamp') or context['timestamp']
+        version = context['version'] or self.build_index.version_at(timestamp) or self.UNKNOWN_VERSION
+        component = context['component'] or self.DEFAULT_COMPONENT
+
+        # performanceMetrics guarda só a última execução: dumps repetidos do mesmo
+        # agente trazem a mesma amostra, que não deve pesar duas vezes
+        identity = (context['agent'], component, operation, timestamp, data['duration'])
+        if timestamp and identity in self._seen:
+            self.stats['duplicates'] += 1
+            return
+        self._seen.add(identity)
+
+        if data.get('success') is False:
+            self.stats['failed'] += 1
+
+        self.samples.append({
+            'version': version,
+            'agent': context['agent'],
+            'component': component,
+            'operation': operation,
+            'duration': float(data['duration']),
+            'memory_delta': data.get('memoryDelta'),
+            'success': data.get('success', True) is not False,
+            'timestamp': timestamp
+        })
+        self.stats['samples'] += 1
+
+    # ------------------------------------------------------------------
+    # Agregação
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def percentile(values: List[float], percent: float) -> float:
+        """
+        Percentil pelo método nearest-rank
+
+        Args:
+            values: Valores ordenados
+            percent: Percentil (0-100)
+        """
+        if not values:
+            return 0.0
+        rank = max(1, -(-len(values) * percent // 100))
+        return values[int(rank) - 1]
+
+    def aggregate(self, include_failed: bool = False) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Estatísticas por versão e operação
+
+        Args:
+            include_failed: Inclui execuções que lançaram erro nos percentis
+
+        Returns:
+            {versão: {"componente.operação": {count, agents, failed, min, mean, max, p50, p95, p99}}}
+        """
+        groups = defaultdict(list)
+        for sample in self.samples:
+            groups[(sample['version'], f"{sample['component']}.{sample['operation']}")].append(sample)
+
+        result = defaultdict(dict)
+        for (version, operation), samples in groups.items():
+            used = [s for s in samples if include_failed or s['success']]
+            durations = sorted(s['duration'] for s in used)
+            stats = {
+                'count': len(durations),
+                'agents': len({s['agent'] for s in samples}),
+                'failed': sum(1 for s in samples if not s['success'])
+            }
+            if durations:
+                stats.update({
+                    'min': durations[0],
+                    'mean': sum(durations) / len(durations),
+                    'max': durations[-1]
+                })
+                for percent in self.PERCENTILES:
+                    stats[f'p{percent}'] = self.percentile(durations, percent)
+            result[version][operation] = stats
+        return dict(result)
+
+    def versions(self) -> List[str]:
+        """Versões com amostras, em ordem de build"""
+        return self.build_index.order({sample['version'] for sample in self.samples})
+
+    def diff(self, aggregated: Dict[str, Dict[str, Dict[str, Any]]], baseline: str, candidate: str,
+             threshold: float = 10.0, min_samples: int = 5) -> List[Dict[str, Any]]:
+        """
+        Compara percentis de duas versões por operação
+
+        Args:
+            aggregated: Resultado de aggregate()
+            baseline: Versão de referência
+            candidate: Versão comparada
+            threshold: Variação percentual do p95 considerada regressão/melhora
+            min_samples: Amostras mínimas em cada versão para classificar a variação
+
+        Returns:
+            Lista de operações com percentis, variação e status
+        """
+        base_ops = aggregated.get(baseline, {})
+        cand_ops = aggregated.get(candidate, {})
+        rows = []
+        for operation in sorted(set(base_ops) | set(cand_ops)):
+            base, cand = base_ops.get(operation), cand_ops.get(operation)
+            row = {'operation': operation, 'baseline': base, 'candidate': cand}
+
+            if not base or 'p95' not in base:
+                row['status'] = 'new'
+            elif not cand or 'p95' not in cand:
+                row['status'] = 'missing'
+            else:
+                row['change'] = {
+                    f'p{p}': _percent_change(base[f'p{p}'], cand[f'p{p}']) for p in self.PERCENTILES
+                }
+                change = row['change']['p95']
+                if base['count'] < min_samples or cand['count'] < min_samples:
+                    row['status'] = 'insufficient'
+                elif change is not None and change > threshold:
+                    row['status'] = 'regression'
+                elif change is not None and change < -threshold:
+                    row['status'] = 'improvement'
+                else:
+                    row['status'] = 'stable'
+            rows.append(row)
+        return rows
+
+    def report(self, baseline: Optional[str] = None, candidate: Optional[str] = None,
+               threshold: float = 10.0, min_samples: int = 5, include_failed: bool = False) -> Dict[str, Any]:
+        """
+        Monta o relatório completo
+
+        Args:
+            baseline: Versão de referência (padrão: penúltima com amostras)
+            candidate: Versão comparada (padrão: última com amostras)
+            threshold: Variação percentual do p95 para regressão
+            min_samples: Amostras mínimas para classificar a variação
+            include_failed: Inclui execuções com erro nos percentis
+
+        Returns:
+            Relatório com versões, estatísticas e comparação
+        """
+        aggregated = self.aggregate(include_failed)
+        versions = self.versions()
+        known = [v for v in versions if v != self.UNKNOWN_VERSION]
+        if candidate is None and known:
+            candidate = known[-1]
+        if baseline is None and candidate in known and known.index(candidate) > 0:
+            baseline = known[known.index(candidate) - 1]
+
+        report = {
+            'generated': datetime.now().isoformat(),
+            'input': {k: v for k, v in self.stats.items() if k != 'errors'},
+            'errors': self.stats['errors'],
+            'versions': [
+                {
+                    'version': version,
+                    'samples': sum(s['count'] for s in aggregated.get(version, {}).values()),
+                    'agents': len({s['agent'] for s in self.samples if s['version'] == version}),
+                    'build': self.build_index.get(version)
+                }
+                for version in versions
+            ],
+            'operations': aggregated,
+            'comparison': None
+        }
+
+        if baseline and candidate and baseline != candidate:
+            rows = self.diff(aggregated, baseline, candidate, threshold, min_samples)
+            report['comparison'] = {
+                'baseline': baseline,
+                'candidate': candidate,
+                'threshold': threshold,
+                'min_samples': min_samples,
+                'operations': rows,
+                'regressions': sum(1 for row in rows if row['status'] == 'regression')
+            }
+        return report
+
+    # ------------------------------------------------------------------
+    # Saída
+    # ------------------------------------------------------------------
+
+    STATUS_ICONS = {
+        'regression': '🔴', 'improvement': '🟢', 'stable': '⚪',
+        'insufficient': '❔', 'new': '🆕', 'missing': '➖'
+    }
+
+    def print_report(self, report: Dict[str, Any]):
+        """Exibe o relatório no terminal"""
+        stats = report['input']
+        print(f"📈 Métricas de desempenho: {stats['samples']} amostras de {stats['files']} arquivos "
+              f"({stats['duplicates']} duplicadas ignoradas, {stats['failed']} com erro)")
+        for error in report['errors']:
+            print(f"   ⚠️ {error}")
+
+        for entry in report['versions']:
+            build = entry['build']
+            origin = f"build {build['build_date'][:19]}" if build and build['build_date'] else 'sem build-info'
+            print("━" * 60)
+            label = entry['version'] if entry['version'] == self.UNKNOWN_VERSION else f"v{entry['version']}"
+            print(f"📦 {label} ({origin}) — {entry['samples']} amostras, {entry['agents']} agentes")
+            print(f"   {'operação':<48} {'n':>5} {'p50':>9} {'p95':>9} {'p99':>9}")
+            operations = report['operations'].get(entry['version'], {})
+            for operation, op in sorted(operations.items(), key=lambda item: -item[1].get('p95', 0)):
+                if not op['count']:
+                    continue
+                print(f"   {operation:<48} {op['count']:>5} {op['p50']:>7.1f}ms {op['p95']:>7.1f}ms "
+                      f"{op['p99']:>7.1f}ms")
+
+        comparison = report['comparison']
+        print("━" * 60)
+        if not comparison:
+            print("ℹ️ Comparação indisponível (é preciso amostras de duas versões)")
+            return
+
+        print(f"🆚 v{comparison['baseline']} → v{comparison['candidate']} "
+              f"(limite p95: ±{comparison['threshold']:g}%, mínimo {comparison['min_samples']} amostras)")
+        for row in comparison['operations']:
+            icon = self.STATUS_ICONS[row['status']]
+            if 'change' in row:
+                changes = '  '.join(
+                    f"p{p} {row['baseline'][f'p{p}']:.1f}→{row['candidate'][f'p{p}']:.1f}ms "
+                    f"({_format_change(row['change'][f'p{p}'])})"
+                    for p in self.PERCENTILES
+                )
+                print(f"   {icon} {row['operation']}: {changes}")
+            else:
+                print(f"   {icon} {row['operation']}: {row['status']}")
+        print(f"📊 Regressões: {comparison['regressions']}")
+
+    def render_markdown(self, report: Dict[str, Any]) -> str:
+        """Relatório em Markdown (ex: anexar a releases ou issues)"""
+        lines = ['# Métricas de desempenho da extensão', '']
+        lines.append(f"{report['input']['samples']} amostras de {report['input']['files']} arquivos.")
+        lines.append('')
+
+        comparison = report['comparison']
+        if comparison:
+            lines += [f"## v{comparison['baseline']} → v{comparison['candidate']}", '',
+                      '| Operação | n | p50 | p95 | p99 | Status |', '|---|---|---|---|---|---|']
+            for row in comparison['operations']:
+                if 'change' in row:
+                    cells = [f"{row['candidate'][f'p{p}']:.1f} ms ({_format_change(row['change'][f'p{p}'])})"
+                             for p in self.PERCENTILES]
+                    count = f"{row['baseline']['count']}/{row['candidate']['count']}"
+                else:
+                    cells = ['—'] * len(self.PERCENTILES)
+                    count = '—'
+                lines.append(f"| `{row['operation']}` | {count} | {' | '.join(cells)} | "
+                             f"{self.STATUS_ICONS[row['status']]} {row['status']} |")
+            lines.append('')
+
+        for entry in report['versions']:
+            lines += [f"## v{entry['version']}", '', '| Operação | n | p50 | p95 | p99 |', '|---|---|---|---|---|']
+            for operation, op in sorted(report['operations'].get(entry['version'], {}).items()):
+                if op['count']:
+                    lines.append(f"| `{operation}` | {op['count']} | {op['p50']:.1f} | {op['p95']:.1f} | "
+                                 f"{op['p99']:.1f} |")
+            lines.append('')
+        return '\n'.join(lines)
+
+
+def _percent_change(before: float, after: float) -> Optional[float]:
+    """Variação percentual (None quando a referência é zero)"""
+    if before == 0:
+        return None
+    return (after - before) / before * 100
+
+
+def _format_change(change: Optional[float]) -> str:
+    """Formata variação percentual com sinal"""
+    return 'n/d' if change is None else f"{change:+.1f}%"
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(description='Agrega métricas de desempenho exportadas pela extensão')
+    parser.add_argument('files', nargs='+', help='Dumps JSON ou NDJSON (helpOtrsDebug.stats(), getStats(), ...)')
+    parser.add_argument('--baseline', help='Versão de referência (padrão: penúltima com amostras)')
+    parser.add_argument('--candidate', help='Versão comparada (padrão: última com amostras)')
+    parser.add_argument('--default-version', help='Versão de dumps sem versão nem timestamp de build conhecido')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Variação do p95 (%%) considerada regressão')
+    parser.add_argument('--min-samples', type=int, default=5, help='Amostras mínimas por versão para comparar')
+    parser.add_argument('--include-failed', action='store_true', help='Inclui execuções com erro nos percentis')
+    parser.add_argument('--format', choices=['text', 'json', 'markdown'], default='text', help='Formato da saída')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Código de saída 1 se houver regressão')
+    args = parser.parse_args()
+
+    aggregator = MetricsAggregator(Path(__file__).parent.parent)
+    for file_path in args.files:
+        try:
+            aggregator.load_file(Path(file_path), args.default_version)
+        except OSError as error:
+            print(f"❌ Erro ao ler {file_path}: {error}", file=sys.stderr)
+            return 1
+
+    report = aggregator.report(args.baseline, args.candidate, args.threshold, args.min_samples,
+                               args.include_failed)
+
+    if args.format == 'json':
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    elif args.format == 'markdown':
+        print(aggregator.render_markdown(report))
+    else:
+        aggregator.print_report(report)
+
+    if args.fail_on_regression and report['comparison'] and report['comparison']['regressions']:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
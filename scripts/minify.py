@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Minificação de HTML e CSS das páginas da extensão (opções e popup)
+Remove comentários, espaços e regras CSS sem uso na página e nos seus scripts
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import json
+import posixpath
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from js_source import JsSource
+
+
+class PageInventory(HTMLParser):
+    """Classe responsável por listar tags, ids, classes e recursos de uma página HTML"""
+
+    def __init__(self):
+        """Inicializa o PageInventory"""
+        super().__init__(convert_charrefs=True)
+        self.tags: Set[str] = set()
+        self.ids: Set[str] = set()
+        self.classes: Set[str] = set()
+        self.stylesheets: List[str] = []
+        self.scripts: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        """Registra a tag e seus atributos relevantes"""
+        attributes = dict(attrs)
+        self.tags.add(tag)
+        if attributes.get('id'):
+            self.ids.add(attributes['id'])
+        self.classes.update((attributes.get('class') or '').split())
+        if tag == 'link' and 'stylesheet' in (attributes.get('rel') or '').lower().split() and attributes.get('href'):
+            self.stylesheets.append(attributes['href'])
+        if tag == 'script' and attributes.get('src'):
+            self.scripts.append(attributes['src'])
+
+
+class PageMinifier:
+    """Classe responsável por minificar as páginas da extensão e as folhas que elas carregam"""
+
+    # Elementos cujo conteúdo é preservado sem alteração
+    RAW_TAGS = ('pre', 'textarea', 'script', 'style')
+
+    # Elementos de bloco: espaços entre eles e tags vizinhas não aparecem na renderização
+    BLOCK_TAGS = {
+        'html', 'head', 'body', 'title', 'meta', 'link', 'script', 'style', 'base',
+        'div', 'section', 'header', 'footer', 'main', 'nav', 'aside', 'article',
+        'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'li', 'dl', 'dt', 'dd',
+        'form', 'fieldset', 'legend', 'table', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th',
+        'hr', 'br', 'option', 'optgroup', 'select', 'template', 'dialog'
+    }
+
+    # At-rules cujo conteúdo são outras regras (podadas recursivamente)
+    NESTED_AT_RULES = ('@media', '@supports', '@document', '@layer')
+
+    # Tags sempre presentes no documento, mesmo que omitidas no HTML
+    IMPLICIT_TAGS = {'html', 'head', 'body'}
+
+    TOKEN_PATTERN = re.compile(r'-?[_a-zA-Z][\w-]*')
+
+    # ------------------------------------------------------------------
+    # CSS
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def minify_css(css: str) -> str:
+        """
+        Minifica CSS removendo comentários e espaços redundantes
+
+        Strings entre aspas são preservadas. Espaços antes de ":" são mantidos
+        para não alterar seletores como "a :hover".
+        """
+        parts = re.split(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')', css)
+        out = []
+        for index, part in enumerate(parts):
+            if index % 2:
+                out.append(part)
+                continue
+            part = re.sub(r'/\*.*?\*/', '', part, flags=re.DOTALL)
+            part = re.sub(r'\s+', ' ', part)
+            part = re.sub(r'\s*([{};,>])\s*', r'\1', part)
+            part = re.sub(r':\s+', ':', part)
+            out.append(part)
+        return ''.join(out).replace(';}', '}').strip()
+
+    @classmethod
+    def _strip_comments(cls, css: str) -> str:
+        """Remove comentários CSS fora de strings"""
+        parts = re.split(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')', css)
+        return ''.join(part if index % 2 else re.sub(r'/\*.*?\*/', '', part, flags=re.DOTALL)
+                       for index, part in enumerate(parts))
+
+    @classmethod
+    def _parse_blocks(cls, css: str) -> List[Tuple[str, Optional[str]]]:
+        """
+        Divide CSS (sem comentários) em blocos de primeiro nível
+
+        Returns:
+            Lista de (prelúdio, conteúdo entre chaves) — conteúdo None para
+            declarações soltas como @import ...;
+        """
+        blocks = []
+        position = 0
+        length = len(css)
+        while position < length:
+            start = position
+            quote = None
+            while position < length:
+                char = css[position]
+                if quote:
+                    if char == '\\':
+                        position += 1
+                    elif char == quote:
+                        quote = None
+                elif char in '"\'':
+                    quote = char
+                elif char in '{;':
+                    break
+                position += 1
+            prelude = css[start:position].strip()
+            if position >= length:
+                if prelude:
+                    blocks.append((prelude, None))
+                break
+            if css[position] == ';':
+                blocks.append((prelude, None))
+                position += 1
+                continue
+
+            depth = 0
+            body_start = position + 1
+            while position < length:
+                char = css[position]
+                if quote:
+                    if char == '\\':
+                        position += 1
+                    elif char == quote:
+                        quote = None
+                elif char in '"\'':
+                    quote = char
+                elif char == '{':
+                    depth += 1
+                elif char == '}':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                position += 1
+            blocks.append((prelude, css[body_start:position]))
+            position += 1
+        return blocks
+
+    @classmethod
+    def selector_used(cls, selector: str, used: Dict[str, Set[str]]) -> bool:
+        """
+        Verifica se um seletor pode casar com a página
+
+        Atributos e pseudo-classes são ignorados (conservador): basta que todas as
+        classes, ids e tags do seletor apareçam na página ou nos seus scripts.
+
+        Args:
+            selector: Seletor simples (sem vírgulas)
+            used: {'classes', 'ids', 'tags'} conhecidos
+        """
+        text = re.sub(r'\[[^\]]*\]', ' ', selector)
+        text = re.sub(r'::?[\w-]+(?:\([^)]*\))?', ' ', text)
+
+        classes = re.findall(r'\.(-?[_a-zA-Z][\w-]*)', text)
+        ids = re.findall(r'#(-?[_a-zA-Z][\w-]*)', text)
+        text = re.sub(r'[.#]-?[_a-zA-Z][\w-]*', ' ', text)
+        tags = [tag.lower() for tag in cls.TOKEN_PATTERN.findall(text)]
+
+        return (all(name in used['classes'] for name in classes)
+                and all(name in used['ids'] for name in ids)
+                and all(tag in used['tags'] for tag in tags))
+
+    @classmethod
+    def prune_css(cls, css: str, used: Dict[str, Set[str]]) -> Tuple[str, List[str]]:
+        """
+        Remove seletores (e regras) que não casam com a página
+
+        @keyframes sem nenhuma referência nas regras restantes também são removidos.
+
+        Args:
+            css: Folha de estilos
+            used: {'classes', 'ids', 'tags'} conhecidos
+
+        Returns:
+            Tupla (css podado, seletores removidos)
+        """
+        removed: List[str] = []
+
+        def prune(text: str) -> List[str]:
+            out = []
+            for prelude, body in cls._parse_blocks(text):
+                if body is None:
+                    out.append(f"{prelude};")
+                    continue
+                lowered = prelude.lower()
+                if lowered.startswith(cls.NESTED_AT_RULES):
+                    inner = prune(body)
+                    if inner:
+                        out.append(f"{prelude}{{{''.join(inner)}}}")
+                    continue
+                if prelude.startswith('@'):
+                    out.append(f"{prelude}{{{body}}}")
+                    continue
+
+                selectors = [s.strip() for s in prelude.split(',') if s.strip()]
+                kept = [s for s in selectors if cls.selector_used(s, used)]
+                removed.extend(s for s in selectors if s not in kept)
+                if kept:
+                    out.append(f"{','.join(kept)}{{{body}}}")
+            return out
+
+        blocks = prune(cls._strip_comments(css))
+
+        # Animações sem referência
+        rules_text = ''.join(block for block in blocks if not re.match(r'@(?:-\w+-)?keyframes\b', block))
+        result = []
+        for block in blocks:
+            match = re.match(r'@(?:-\w+-)?keyframes\s+([\w-]+)', block)
+            if match and not re.search(rf'(?<![\w-]){re.escape(match.group(1))}(?![\w-])', rules_text):
+                removed.append(f"@keyframes {match.group(1)}")
+                continue
+            result.append(block)
+        return ''.join(result), removed
+
+    # ------------------------------------------------------------------
+    # HTML
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def minify_html(cls, html_text: str) -> str:
+        """
+        Minifica HTML de forma segura para páginas de extensão
+
+        Remove comentários, normaliza espaços dentro das tags e colapsa espaços
+        em texto. Espaços só entre tags são removidos quando uma das vizinhas é
+        de bloco (entre elementos inline o espaço é significativo). Conteúdo de
+        pre, textarea, script e style é mantido.
+        """
+        token = re.compile(
+            r'<!--.*?-->'
+            rf'|<({"|".join(cls.RAW_TAGS)})\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>.*?</\1\s*>'
+            r'|<(?:[^>"\']|"[^"]*"|\'[^\']*\')*>',
+            re.DOTALL | re.IGNORECASE
+        )
+
+        pieces: List[Tuple[str, str]] = []  # (tipo, texto)
+        position = 0
+        for match in token.finditer(html_text):
+            if match.start() > position:
+                pieces.append(('text', html_text[position:match.start()]))
+            text = match.group(0)
+            if text.startswith('<!--'):
+                if text.startswith('<!--[if'):
+                    pieces.append(('raw', text))
+            elif match.group(1):
+                end_open = cls._tag_end(text)
+                pieces.append(('raw', cls._minify_tag(text[:end_open]) + text[end_open:]))
+            else:
+                pieces.append(('tag', cls._minify_tag(text)))
+            position = match.end()
+        if position < len(html_text):
+            pieces.append(('text', html_text[position:]))
+
+        out = []
+        for index, (kind, text) in enumerate(pieces):
+            if kind != 'text':
+                out.append(text)
+                continue
+            collapsed = re.sub(r'\s+', ' ', text)
+            if collapsed.strip():
+                out.append(collapsed)
+                continue
+            before = pieces[index - 1] if index > 0 else None
+            after = pieces[index + 1] if index + 1 < len(pieces) else None
+            if any(piece is None or cls._is_block(piece) for piece in (before, after)):
+                continue
+            out.append(' ')
+        return ''.join(out).strip() + '\n'
+
+    @staticmethod
+    def _tag_end(text: str) -> int:
+        """Posição após o ">" da tag de abertura (respeitando aspas)"""
+        quote = None
+        for position, char in enumerate(text):
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in '"\'':
+                quote = char
+            elif char == '>':
+                return position + 1
+        return len(text)
+
+    @staticmethod
+    def _minify_tag(tag: str) -> str:
+        """Normaliza espaços dentro de uma tag, sem tocar valores entre aspas"""
+        parts = re.split(r'("[^"]*"|\'[^\']*\')', tag)
+        for index in range(0, len(parts), 2):
+            parts[index] = re.sub(r'\s+', ' ', parts[index])
+            parts[index] = re.sub(r'\s*=\s*', '=', parts[index])
+        return re.sub(r'\s+(/?>)$', r'\1', ''.join(parts))
+
+    @classmethod
+    def _is_block(cls, piece: Tuple[str, str]) -> bool:
+        """Verifica se um pedaço é tag de elemento de bloco (ou comentário/doctype)"""
+        kind, text = piece
+        if kind == 'text':
+            return False
+        match = re.match(r'</?([a-zA-Z][\w-]*)', text)
+        return match is None or match.group(1).lower() in cls.BLOCK_TAGS
+
+    # ------------------------------------------------------------------
+    # Páginas da extensão
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def script_tokens(cls, source: str) -> Set[str]:
+        """
+        Identificadores citados em strings (e comentários) de um script
+
+        Conservador: qualquer palavra dentro de string pode ser classe, id ou
+        tag (ex: classList.add('show'), `status ${type}` com type = 'success').
+        """
+        js = JsSource(source)
+        hidden = ''.join(original if masked != original else ' '
+                         for original, masked in zip(js.source, js.code))
+        return set(cls.TOKEN_PATTERN.findall(hidden))
+
+    @staticmethod
+    def extension_pages(manifest: Dict[str, Any]) -> List[str]:
+        """Páginas HTML declaradas no manifest (opções e popup)"""
+        pages = [manifest.get('options_page'),
+                 (manifest.get('options_ui') or {}).get('page'),
+                 (manifest.get('action') or {}).get('default_popup')]
+        return list(dict.fromkeys(page for page in pages if page))
+
+    def apply(self, dist_dir: Path) -> Dict[str, Any]:
+        """
+        Minifica as páginas do manifest.json do dist/ e as folhas que elas carregam
+
+        Args:
+            dist_dir: Diretório de distribuição
+
+        Returns:
+            Dicionário com 'changed' (caminho → conteúdo gravado), tamanhos por
+            arquivo e seletores removidos por folha
+        """
+        dist_dir = Path(dist_dir)
+        with open(dist_dir / 'manifest.json', 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        pages: Dict[str, str] = {}
+        stylesheets: Dict[str, Dict[str, Set[str]]] = {}
+        for page in self.extension_pages(manifest):
+            page_path = dist_dir / page
+            if not page_path.exists():
+                continue
+            html_text = page_path.read_text(encoding='utf-8')
+            pages[page] = html_text
+
+            inventory = PageInventory()
+            inventory.feed(html_text)
+            tokens: Set[str] = set()
+            for script in inventory.scripts:
+                script_path = dist_dir / posixpath.normpath(posixpath.join(posixpath.dirname(page), script))
+                if script_path.exists():
+                    tokens |= self.script_tokens(script_path.read_text(encoding='utf-8'))
+
+            for href in inventory.stylesheets:
+                if re.match(r'^[a-z-]+:', href):
+                    continue  # Folhas externas não são alteradas
+                css_path = posixpath.normpath(posixpath.join(posixpath.dirname(page), href))
+                used = stylesheets.setdefault(css_path, {'classes': set(), 'ids': set(), 'tags': set()})
+                used['classes'] |= inventory.classes | tokens
+                used['ids'] |= inventory.ids | tokens
+                used['tags'] |= inventory.tags | self.IMPLICIT_TAGS | {token.lower() for token in tokens}
+
+        changed: Dict[str, bytes] = {}
+        files: Dict[str, Dict[str, int]] = {}
+        removed: Dict[str, List[str]] = {}
+
+        for page, html_text in pages.items():
+            data = self.minify_html(html_text).encode('utf-8')
+            files[page] = {'before': len(html_text.encode('utf-8')), 'after': len(data)}
+            changed[page] = data
+
+        for css_path, used in stylesheets.items():
+            path = dist_dir / css_path
+            if not path.exists():
+                continue
+            css = path.read_text(encoding='utf-8')
+            pruned, removed_selectors = self.prune_css(css, used)
+            data = self.minify_css(pruned).encode('utf-8')
+            files[css_path] = {'before': len(css.encode('utf-8')), 'after': len(data)}
+            removed[css_path] = removed_selectors
+            changed[css_path] = data
+
+        for name, data in changed.items():
+            (dist_dir / name).write_bytes(data)
+
+        return {
+            'changed': changed,
+            'files': files,
+            'removed_selectors': removed,
+            'bytes_before': sum(entry['before'] for entry in files.values()),
+            'bytes_after': sum(entry['after'] for entry in files.values())
+        }
+
+
+def main():
+    """Função principal do script"""
+    if len(sys.argv) != 2:
+        print("Uso: python scripts/minify.py <diretório dist>")
+        return 1
+
+    result = PageMinifier().apply(Path(sys.argv[1]))
+    for name, sizes in result['files'].items():
+        print(f"🗜️ {name}: {sizes['before']} → {sizes['after']} bytes")
+    for name, selectors in result['removed_selectors'].items():
+        print(f"✂️ {name}: {len(selectors)} seletores sem uso removidos")
+        for selector in selectors:
+            print(f"   {selector}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Lint estático de desempenho dos scripts da extensão
+Procura padrões caros nos caminhos quentes dos content scripts (observers, consultas ao DOM, polling)
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from js_source import JsSource
+
+
+class PerfLinter:
+    """Classe responsável pela análise estática de desempenho dos arquivos JS"""
+
+    # Regras: código → descrição
+    RULES = {
+        'PERF001': 'observer em document.body/documentElement com subtree: true',
+        'PERF002': 'consulta ao DOM dentro de callback de observer sem debounce',
+        'PERF003': 'consulta ao document inteiro dentro de laço',
+        'PERF004': 'polling com setInterval',
+        'PERF005': 'handler de evento frequente sem debounce/throttle'
+    }
+
+    # Alvos de observer que cobrem a página inteira
+    BROAD_TARGETS = ('document', 'document.body', 'document.documentElement')
+
+    # Eventos disparados em rajada (digitação, rolagem, arrasto)
+    HIGH_FREQUENCY_EVENTS = ('input', 'keyup', 'scroll', 'resize', 'wheel', 'mousemove',
+                             'pointermove', 'touchmove', 'drag', 'dragover')
+
+    # Consultas que percorrem a árvore
+    QUERY_PATTERN = re.compile(
+        r'\.(querySelectorAll|querySelector|getElementsByClassName|'
+        r'getElementsByTagName|getElementsByName)\s*(?:\?\.\s*)?\(')
+    DOCUMENT_QUERY_PATTERN = re.compile(
+        r'\bdocument\s*\.\s*(querySelectorAll|querySelector|getElementsByClassName|'
+        r'getElementsByTagName|getElementsByName)\s*(?:\?\.\s*)?\(')
+
+    OBSERVER_PATTERN = re.compile(r'\bnew\s+(MutationObserver|ResizeObserver|IntersectionObserver)\s*\(')
+    OBSERVE_CALL_PATTERN = re.compile(r'\.observe\s*\(')
+    LOOP_PATTERN = re.compile(r'\b(for|while)\s*\(')
+    ITERATION_PATTERN = re.compile(r'\.(forEach|map|filter|some|every|reduce|flatMap|each)\s*\(')
+    INTERVAL_PATTERN = re.compile(r'(?<![\w.$])(?:window\s*\.\s*|globalThis\s*\.\s*)?setInterval\s*\(')
+    LISTENER_PATTERN = re.compile(r'\.addEventListener\s*\(')
+    HANDLER_PROPERTY_PATTERN = re.compile(r'\.on(\w+)\s*=(?!=)')
+
+    # Indícios de que o handler é adiado ou agrupado
+    DEFERRAL_PATTERN = re.compile(r'debounce|throttle|requestAnimationFrame|requestIdleCallback|setTimeout',
+                                  re.IGNORECASE)
+
+    # Comentário que suprime achados na própria linha (ou na seguinte, se estiver sozinho)
+    SUPPRESS_PATTERN = re.compile(r'perf-lint-ignore(?:\s+((?:PERF\d{3}[\s,]*)+))?')
+
+
+    def __init__(self, project_root: Path):
+        """
+        Inicializa o PerfLinter
+
+        Args:
+            project_root: Caminho raiz do projeto
+        """
+        self.project_root = Path(project_root)
+
+    # ------------------------------------------------------------------
+    # Arquivos
+    # ------------------------------------------------------------------
+
+    def default_files(self) -> List[Path]:
+        """
+        Arquivos analisados por padrão (src/**/*.js, exceto módulos gerados)
+
+        Returns:
+            Lista ordenada de caminhos
+        """
+        generated_dir = self.project_root / 'src' / 'generated'
+        return sorted(path for path in (self.project_root / 'src').glob('**/*.js')
+                      if generated_dir not in path.parents)
+
+    def lint_files(self, files: List[Path]) -> Dict[str, Any]:
+        """
+        Analisa vários arquivos
+
+        Args:
+            files: Arquivos JS
+
+        Returns:
+            Dicionário com achados, contagem por regra e suprimidos
+        """
+        findings = []
+        suppressed = 0
+
+        for file_path in files:
+            file_path = Path(file_path)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                source = f.read()
+            try:
+                display = file_path.relative_to(self.project_root).as_posix()
+            except ValueError:
+                display = str(file_path)
+
+            file_findings, file_suppressed = self.lint_source(source, display)
+            findings.extend(file_findings)
+            suppressed += file_suppressed
+
+        by_rule = {}
+        for finding in findings:
+            by_rule[finding['rule']] = by_rule.get(finding['rule'], 0) + 1
+
+        return {
+            'files': len(files),
+            'findings': findings,
+            'by_rule': dict(sorted(by_rule.items())),
+            'suppressed': suppressed
+        }
+
+    # ------------------------------------------------------------------
+    # Análise de um arquivo
+    # ------------------------------------------------------------------
+
+    def lint_source(self, source: str, filename: str = '<js>') -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Analisa o código de um arquivo
+
+        Args:
+            source: Código JavaScript
+            filename: Nome exibido nos achados
+
+        Returns:
+            Tupla (achados ordenados por linha, quantidade suprimida)
+        """
+        js = JsSource(source)
+
+        raw = []
+        raw.extend(self._check_broad_observers(js))
+        observer_ranges, observer_findings = self._check_observer_callbacks(js)
+        raw.extend(observer_findings)
+        raw.extend(self._check_loop_queries(js, observer_ranges))
+        raw.extend(self._check_intervals(js))
+        raw.extend(self._check_handlers(js))
+
+        suppressions = self._collect_suppressions(source)
+        findings = []
+        suppressed = 0
+        seen = set()
+
+        for offset, rule, detail in sorted(raw):
+            line = js.line_of(offset)
+            if (line, rule) in seen:
+                continue
+            seen.add((line, rule))
+
+            rules = suppressions.get(line)
+            if rules is not None and (not rules or rule in rules):
+                suppressed += 1
+                continue
+
+            findings.append({
+                'file': filename,
+                'line': line,
+                'rule': rule,
+                'message': f"{self.RULES[rule]}: {detail}"
+            })
+
+        return findings, suppressed
+
+    def _collect_suppressions(self, source: str) -> Dict[int, set]:
+        """
+        Linhas suprimidas por perf-lint-ignore (conjunto vazio suprime todas as regras)
+
+        O comentário vale para a própria linha ou, se estiver sozinho na linha, para a seguinte.
+        """
+        suppressions = {}
+        for number, line in enumerate(source.split('\n'), 1):
+            match = self.SUPPRESS_PATTERN.search(line)
+            if match:
+                rules = set(re.findall(r'PERF\d{3}', match.group(1) or ''))
+                suppressions[number] = rules
+                if line.lstrip().startswith('//'):
+                    suppressions[number + 1] = rules
+        return suppressions
+
+    # ------------------------------------------------------------------
+    # Regras
+    # ------------------------------------------------------------------
+
+    def _check_broad_observers(self, js: JsSource) -> List[Tuple[int, str, str]]:
+        """PERF001: observe(document.body, {subtree: true})"""
+        code = js.code
+        results = []
+        for match in self.OBSERVE_CALL_PATTERN.finditer(code):
+            args = js.split_args(match.end() - 1)
+            if len(args) < 2:
+                continue
+
+            target = re.sub(r'\s+', '', code[args[0][0]:args[0][1]])
+            options = code[args[1][0]:args[1][1]]
+            if target in self.BROAD_TARGETS and re.search(r'\bsubtree\s*:\s*true\b', options):
+                results.append((match.start(), 'PERF001', f"observe({target}, {{subtree: true}})"))
+        return results
+
+    def _check_observer_callbacks(self, js: JsSource
+                                  ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, str, str]]]:
+        """PERF002: querySelector* dentro do callback do observer (exceto callbacks com debounce)"""
+        code = js.code
+        ranges = []
+        results = []
+        for match in self.OBSERVER_PATTERN.finditer(code):
+            args = js.split_args(match.end() - 1)
+            if not args:
+                continue
+
+            start, end = args[0]
+            callback = code[start:end].strip()
+            if re.match(r'^(?:this\.)?\w*(?:debounce|throttle)\w*\s*\(', callback, re.IGNORECASE):
+                continue
+
+            resolved = self._resolve_function(js, callback)
+            if resolved:
+                start, end = resolved
+
+            ranges.append((start, end))
+            for query in self.QUERY_PATTERN.finditer(code, start, end):
+                results.append((query.start(), 'PERF002', f"{query.group(1)}() em {match.group(1)}"))
+        return ranges, results
+
+    def _check_loop_queries(self, js: JsSource, excluded: List[Tuple[int, int]]) -> List[Tuple[int, str, str]]:
+        """PERF003: document.querySelector* repetido a cada iteração"""
+        code, pairs = js.code, js.pairs
+        loop_ranges = []
+
+        for match in self.LOOP_PATTERN.finditer(code):
+            close = pairs.get(match.end() - 1)
+            if close is None:
+                continue
+            body_start = js.skip_whitespace(close + 1)
+            if body_start < len(code) and code[body_start] == '{' and body_start in pairs:
+                loop_ranges.append((match.start(), body_start, pairs[body_start]))
+            else:
+                body_end = code.find(';', body_start)
+                loop_ranges.append((match.start(), body_start, body_end if body_end >= 0 else len(code)))
+
+        for match in self.ITERATION_PATTERN.finditer(code):
+            close = pairs.get(match.end() - 1)
+            if close is not None:
+                loop_ranges.append((match.start(), match.end(), close))
+
+        results = []
+        for query in self.DOCUMENT_QUERY_PATTERN.finditer(code):
+            position = query.start()
+            if any(start <= position < end for start, end in excluded):
+                continue
+            for loop_start, body_start, body_end in loop_ranges:
+                if body_start <= position < body_end:
+                    loop = code[loop_start:body_start].split('(')[0].strip(' .')
+                    results.append((position, 'PERF003', f"document.{query.group(1)}() em {loop}"))
+                    break
+        return results
+
+    def _check_intervals(self, js: JsSource) -> List[Tuple[int, str, str]]:
+        """PERF004: setInterval"""
+        return [(match.start(), 'PERF004', 'prefira eventos, observers ou setTimeout encadeado')
+                for match in self.INTERVAL_PATTERN.finditer(js.code)]
+
+    def _check_handlers(self, js: JsSource) -> List[Tuple[int, str, str]]:
+        """PERF005: addEventListener/on<evento> de eventos frequentes sem adiamento"""
+        code = js.code
+        results = []
+
+        for match in self.LISTENER_PATTERN.finditer(code):
+            args = js.split_args(match.end() - 1)
+            if len(args) < 2:
+                continue
+
+            event = js.string_value(*args[0])
+            if event not in self.HIGH_FREQUENCY_EVENTS:
+                continue
+            if not self._is_deferred(js, code[args[1][0]:args[1][1]].strip()):
+                results.append((match.start(), 'PERF005', f"'{event}'"))
+
+        for match in self.HANDLER_PROPERTY_PATTERN.finditer(code):
+            event = match.group(1)
+            if event not in self.HIGH_FREQUENCY_EVENTS:
+                continue
+            end = code.find(';', match.end())
+            handler = code[match.end():end if end >= 0 else len(code)].strip()
+            if handler != 'null' and not self._is_deferred(js, handler):
+                results.append((match.start(), 'PERF005', f"on{event}"))
+
+        return results
+
+    def _is_deferred(self, js: JsSource, handler: str) -> bool:
+        """Verifica se o handler usa debounce/throttle/rAF (diretamente ou pela definição)"""
+        if self.DEFERRAL_PATTERN.search(handler):
+            return True
+
+        name = re.sub(r'^this\.', '', handler)
+        if not re.fullmatch(r'[\w$]+', name):
+            return False
+
+        # Handler nomeado: const h = this.debounce(...) ou função cujo corpo adia o trabalho
+        if re.search(rf'\b(?:const|let|var)\s+{re.escape(name)}\s*=\s*(?:this\.)?\w*(?:debounce|throttle)',
+                     js.code, re.IGNORECASE):
+            return True
+
+        resolved = self._resolve_function(js, handler)
+        return bool(resolved and self.DEFERRAL_PATTERN.search(js.code[resolved[0]:resolved[1]]))
+
+    # ------------------------------------------------------------------
+    # Estrutura do código
+    # ------------------------------------------------------------------
+
+    def _resolve_function(self, js: JsSource, reference: str) -> Optional[Tuple[int, int]]:
+        """
+        Localiza o corpo de uma função referenciada por nome (x ou this.x)
+
+        Returns:
+            Intervalo (início, fim) do corpo ou None se não for uma referência resolvível
+        """
+        name = re.sub(r'^this\.', '', reference)
+        if not re.fullmatch(r'[\w$]+', name):
+            return None
+
+        code, pairs = js.code, js.pairs
+        escaped = re.escape(name)
+        patterns = [
+            rf'\bfunction\s+{escaped}\s*\(',
+            rf'\b(?:const|let|var)\s+{escaped}\s*=\s*(?:async\s+)?(?:function\b[^(]*)?\(',
+            rf'^\s*(?:async\s+)?{escaped}\s*\(',
+        ]
+        for pattern in patterns:
+            for match in re.finditer(pattern, code, re.MULTILINE):
+                params_close = pairs.get(match.end() - 1)
+                if params_close is None:
+                    continue
+                body_start = js.skip_whitespace(params_close + 1)
+                if code.startswith('=>', body_start):
+                    body_start = js.skip_whitespace(body_start + 2)
+                if body_start < len(code) and code[body_start] == '{' and body_start in pairs:
+                    return body_start, pairs[body_start]
+        return None
+
+    # ------------------------------------------------------------------
+    # Relatório
+    # ------------------------------------------------------------------
+
+    def print_report(self, result: Dict[str, Any]):
+        """Exibe achados no formato arquivo:linha"""
+        for finding in result['findings']:
+            print(f"{finding['file']}:{finding['line']}: {finding['rule']} {finding['message']}")
+
+        if result['findings']:
+            summary = ', '.join(f"{rule}×{count}" for rule, count in result['by_rule'].items())
+            print(f"⚠️ Lint de desempenho: {len(result['findings'])} achado(s) em "
+                  f"{result['files']} arquivo(s) ({summary})")
+        else:
+            print(f"✅ Lint de desempenho: nenhum achado em {result['files']} arquivo(s)")
+        if result['suppressed']:
+            print(f"🔕 Suprimidos (perf-lint-ignore): {result['suppressed']}")
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(description='Lint estático de desempenho (src/**/*.js)')
+    parser.add_argument('files', nargs='*', help='Arquivos JS (padrão: src/**/*.js)')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+    parser.add_argument('--no-fail', action='store_true', help='Retorna 0 mesmo com achados')
+    args = parser.parse_args()
+
+    linter = PerfLinter(Path(__file__).parent.parent)
+    files = [Path(f).resolve() for f in args.files] if args.files else linter.default_files()
+    result = linter.lint_files(files)
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        linter.print_report(result)
+
+    return 0 if args.no_fail or not result['findings'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
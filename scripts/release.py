@@ -12,18 +12,28 @@ import os
 import sys
 import requests
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from build import ExtensionBuilder
+from release_index import ReleaseIndex
 
 
 class GitHubReleaseManager:
     """Classe responsável por gerenciar releases no GitHub"""
     
+    # Tamanho de página máximo aceito pela API de releases
+    PER_PAGE = 100
+    
     def __init__(self, project_root: str = None, github_token: str = None, 
-                 repo_owner: str = None, repo_name: str = None):
+                 repo_owner: str = None, repo_name: str = None,
+                 offline: bool = False, cache_ttl: int = 300, api_base: str = None,
+                 session: requests.Session = None):
         """
         Inicializa o GitHubReleaseManager
         
@@ -32,6 +42,10 @@ class GitHubReleaseManager:
             github_token: Token de acesso do GitHub
             repo_owner: Proprietário do repositório
             repo_name: Nome do repositório
+            offline: Se True, responde apenas com o índice local (sem rede)
+            cache_ttl: Segundos em que o índice local é considerado atualizado
+            api_base: URL base da API (padrão: GITHUB_API_URL ou api.github.com)
+            session: Sessão HTTP compartilhada (pool de conexões)
         """
         if project_root is None:
             self.project_root = Path(__file__).parent.parent
@@ -44,7 +58,7 @@ class GitHubReleaseManager:
         self.repo_name = repo_name or os.environ.get('GITHUB_REPO_NAME', 'HELP-OTRS-MAPA')
         
         # URLs da API
-        self.api_base = 'https://api.github.com'
+        self.api_base = (api_base or os.environ.get('GITHUB_API_URL', 'https://api.github.com')).rstrip('/')
         self.repo_api = f"{self.api_base}/repos/{self.repo_owner}/{self.repo_name}"
         
         # Headers para requisições
@@ -55,6 +69,16 @@ class GitHubReleaseManager:
         
         if self.github_token:
             self.headers['Authorization'] = f'Bearer {self.github_token}'
+        
+        # Sessão HTTP (reaproveita conexões entre requisições)
+        self.session = session or requests.Session()
+        
+        # Índice local de releases (SQLite)
+        self.offline = offline
+        self.cache_ttl = cache_ttl
+        # Chave inclui o host da API para não misturar GitHub real e simulado
+        self.repo_key = f"{urlparse(self.api_base).netloc}/{self.repo_owner}/{self.repo_name}"
+        self.release_index = ReleaseIndex(self.project_root / ".cache" / "releases.sqlite3")
             
         # Inicializar builder
         self.builder = ExtensionBuilder(self.project_root)
@@ -87,11 +111,98 @@ class GitHubReleaseManager:
             True se conexão for bem-sucedida
         """
         try:
-            response = requests.get(f"{self.repo_api}", headers=self.headers, timeout=10)
+            response = self.session.get(f"{self.repo_api}", headers=self.headers, timeout=10)
             return response.status_code == 200
         except Exception:
             return False
     
+    def _fetch_paginated(self, resource: str, url: str) -> Tuple[List[Dict], bool]:
+        """
+        Percorre todas as páginas de um recurso usando requisições condicionais
+        
+        Páginas inalteradas (304 Not Modified) são lidas do índice local e
+        não consomem o limite de requisições da API.
+        
+        Args:
+            resource: Nome do recurso ('releases' ou 'tags')
+            url: URL da primeira página
+            
+        Returns:
+            Tupla (lista_completa_de_itens, houve_alteração)
+        """
+        items = []
+        visited = []
+        changed = False
+        
+        while url and url not in visited:
+            visited.append(url)
+            cached_page = self.release_index.get_page(self.repo_key, url)
+            
+            headers = self.headers.copy()
+            if cached_page and cached_page['etag']:
+                headers['If-None-Match'] = cached_page['etag']
+            
+            response = self.session.get(url, headers=headers, timeout=10)
+            
+            if response.status_code == 304 and cached_page:
+                items.extend(cached_page['items'])
+                url = cached_page['next_url']
+                continue
+            
+            if response.status_code == 404:
+                # Repositório sem tags retorna 404 em git/matching-refs
+                page_items = []
+            elif response.status_code == 200:
+                page_items = response.json()
+            else:
+                raise ValueError(f"Erro HTTP {response.status_code} ao sincronizar {resource}")
+            
+            next_url = response.links.get('next', {}).get('url')
+            self.release_index.save_page(self.repo_key, resource, url,
+                                         response.headers.get('ETag'), next_url, page_items)
+            items.extend(page_items)
+            changed = True
+            url = next_url
+        
+        if changed:
+            self.release_index.prune_pages(self.repo_key, resource, visited)
+        
+        return items, changed
+    
+    def sync_releases(self, force: bool = False) -> bool:
+        """
+        Sincroniza o índice local com releases e tags do GitHub
+        
+        Args:
+            force: Ignora o TTL do índice e sincroniza mesmo assim
+            
+        Returns:
+            True se o índice está sincronizado (ou dentro do TTL)
+        """
+        if self.offline:
+            return False
+        
+        last_synced = self.release_index.last_synced(self.repo_key, 'releases')
+        if not force and last_synced and (time.time() - last_synced) < self.cache_ttl:
+            return True
+        
+        try:
+            releases, releases_changed = self._fetch_paginated(
+                'releases', f"{self.repo_api}/releases?per_page={self.PER_PAGE}")
+            if releases_changed or last_synced is None:
+                self.release_index.replace_releases(self.repo_key, releases)
+            
+            refs, refs_changed = self._fetch_paginated(
+                'tags', f"{self.repo_api}/git/matching-refs/tags?per_page={self.PER_PAGE}")
+            if refs_changed or last_synced is None:
+                self.release_index.replace_tags(self.repo_key, refs)
+            
+            self.release_index.mark_synced(self.repo_key, 'releases')
+            return True
+        except Exception as e:
+            print(f"⚠️ Não foi possível sincronizar releases ({e}); usando índice local")
+            return False
+    
     def get_latest_release(self) -> Optional[Dict]:
         """
         Obtém informações do último release
@@ -99,30 +210,18 @@ class GitHubReleaseManager:
         Returns:
             Dicionário com dados do release ou None
         """
-        try:
-            response = requests.get(f"{self.repo_api}/releases/latest", 
-                                  headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                return response.json()
-            return None
-        except Exception:
-            return None
+        self.sync_releases()
+        return self.release_index.get_latest_release(self.repo_key)
     
     def get_all_releases(self) -> List[Dict]:
         """
-        Obtém lista de todos os releases
+        Obtém lista de todos os releases (todas as páginas)
         
         Returns:
             Lista de dicionários com dados dos releases
         """
-        try:
-            response = requests.get(f"{self.repo_api}/releases", 
-                                  headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                return response.json()
-            return []
-        except Exception:
-            return []
+        self.sync_releases()
+        return self.release_index.get_releases(self.repo_key)
     
     def check_tag_exists(self, tag_name: str) -> bool:
         """
@@ -134,12 +233,8 @@ class GitHubReleaseManager:
         Returns:
             True se a tag existe
         """
-        try:
-            response = requests.get(f"{self.repo_api}/git/refs/tags/{tag_name}", 
-                                  headers=self.headers, timeout=10)
-            return response.status_code == 200
-        except Exception:
-            return False
+        self.sync_releases()
+        return self.release_index.has_tag(self.repo_key, tag_name)
     
     def create_release(self, release_info: Dict) -> Tuple[bool, Dict]:
         """
@@ -152,7 +247,8 @@ class GitHubReleaseManager:
             Tupla (sucesso, dados_do_release)
         """
         try:
-            # Verificar se tag já existe
+            # Verificar se tag já existe (índice atualizado antes da criação)
+            self.sync_releases(force=True)
             if self.check_tag_exists(release_info['tag_name']):
                 return False, {'error': f"Tag {release_info['tag_name']} já existe"}
             
@@ -166,11 +262,13 @@ class GitHubReleaseManager:
             }
             
             # Criar release
-            response = requests.post(f"{self.repo_api}/releases", 
-                                   json=release_data, headers=self.headers, timeout=30)
+            response = self.session.post(f"{self.repo_api}/releases", 
+                                         json=release_data, headers=self.headers, timeout=30)
             
             if response.status_code == 201:
-                return True, response.json()
+                release = response.json()
+                self.release_index.upsert_release(self.repo_key, release)
+                return True, release
             else:
                 return False, {
                     'error': f'Erro HTTP {response.status_code}',
@@ -186,15 +284,15 @@ class GitHubReleaseManager:
         
         Args:
             release_id: ID do release
-            asset_info: Informações do asset
+            asset_info: Informações do asset ('path' ou, de um build em memória, 'data')
             
         Returns:
             Tupla (sucesso, dados_do_asset)
         """
         try:
-            asset_path = Path(asset_info['path'])
+            asset_path = Path(asset_info['path']) if asset_info.get('data') is None else None
             
-            if not asset_path.exists():
+            if asset_path is not None and not asset_path.exists():
                 return False, {'error': f"Arquivo não encontrado: {asset_path}"}
             
             # URL para upload de assets
@@ -207,16 +305,25 @@ class GitHubReleaseManager:
             # Parâmetros
             params = {'name': asset_info['name']}
             
-            # Upload do arquivo
-            with open(asset_path, 'rb') as file:
-                response = requests.post(upload_url, 
-                                       headers=upload_headers,
-                                       params=params,
-                                       data=file,
-                                       timeout=300)  # 5 minutos para upload
+            # Upload do arquivo (ou dos bytes já em memória)
+            if asset_path is None:
+                response = self.session.post(upload_url,
+                                             headers=upload_headers,
+                                             params=params,
+                                             data=asset_info['data'],
+                                             timeout=300)
+            else:
+                with open(asset_path, 'rb') as file:
+                    response = self.session.post(upload_url, 
+                                                 headers=upload_headers,
+                                                 params=params,
+                                                 data=file,
+                                                 timeout=300)  # 5 minutos para upload
             
             if response.status_code == 201:
-                return True, response.json()
+                asset = response.json()
+                self.release_index.upsert_asset(self.repo_key, release_id, asset)
+                return True, asset
             else:
                 return False, {
                     'error': f'Erro HTTP {response.status_code}',
@@ -226,14 +333,77 @@ class GitHubReleaseManager:
         except Exception as e:
             return False, {'error': str(e)}
     
+    def publish_release(self, release_info: Dict, verbose: bool = True) -> Dict[str, any]:
+        """
+        Cria o release no GitHub e faz upload dos assets (build já pronto)
+        
+        Args:
+            release_info: Informações do release (create_github_release_info)
+            verbose: Se True, exibe o progresso de cada etapa
+            
+        Returns:
+            Dicionário com resultado da publicação
+        """
+        log = print if verbose else (lambda *args, **kwargs: None)
+        
+        # Etapa 4: Criar release no GitHub
+        log("🌐 Etapa 4: Criando release no GitHub...")
+        release_success, release_data = self.create_release(release_info)
+        
+        if not release_success:
+            return {
+                'success': False,
+                'error': f"Falha ao criar release: {release_data.get('error', 'Erro desconhecido')}"
+            }
+        
+        release_id = release_data['id']
+        release_url = release_data['html_url']
+        
+        log(f"✅ Release criado: {release_url}")
+        log("━" * 60)
+        
+        # Etapa 5: Upload de assets
+        log("📎 Etapa 5: Fazendo upload de assets...")
+        asset_results = []
+        
+        for asset_info in release_info['assets']:
+            log(f"⬆️ Uploading {asset_info['name']}...")
+            
+            asset_success, asset_data = self.upload_release_asset(release_id, asset_info)
+            
+            if asset_success:
+                log(f"✅ Asset enviado: {asset_data['browser_download_url']}")
+                asset_results.append({
+                    'name': asset_info['name'],
+                    'success': True,
+                    'download_url': asset_data['browser_download_url'],
+                    'size': asset_data['size']
+                })
+            else:
+                log(f"❌ Falha no upload: {asset_data.get('error', 'Erro desconhecido')}")
+                asset_results.append({
+                    'name': asset_info['name'],
+                    'success': False,
+                    'error': asset_data.get('error')
+                })
+        
+        return {
+            'success': True,
+            'release_data': release_data,
+            'release_url': release_url,
+            'asset_results': asset_results
+        }
+    
     def create_full_release(self, version_type: str = 'patch', 
-                           dry_run: bool = False) -> Dict[str, any]:
+                           dry_run: bool = False, in_memory: bool = False) -> Dict[str, any]:
         """
         Cria release completo: build + GitHub release + assets
         
         Args:
             version_type: Tipo de incremento de versão
             dry_run: Se True, não cria release real (apenas simula)
+            in_memory: Publica a versão atual (sem incremento) empacotada em memória,
+                       enviando os bytes sem gravar pacotes em disco
             
         Returns:
             Dicionário com resultado da operação
@@ -261,14 +431,21 @@ class GitHubReleaseManager:
             
             print("━" * 60)
             
-            # Etapa 2: Executar build
-            print("📦 Etapa 2: Executando build da extensão...")
-            build_result = self.builder.build_extension(version_type)
+            # Etapa 2: Executar build (ou planejá-lo em memória no dry run)
+            if dry_run:
+                print("📦 Etapa 2: Planejando build em memória (nenhum arquivo alterado)...")
+                build_result = self.builder.plan_build(version_type)
+            elif in_memory:
+                print("📦 Etapa 2: Empacotando a versão atual em memória...")
+                build_result = self.builder.build_in_memory()
+            else:
+                print("📦 Etapa 2: Executando build da extensão...")
+                build_result = self.builder.build_extension(version_type)
             
             if not build_result['success']:
                 raise ValueError(f"Build falhou: {build_result['error']}")
             
-            print("✅ Build concluído com sucesso")
+            print("✅ Plano concluído" if dry_run else "✅ Build concluído com sucesso")
             print("━" * 60)
             
             # Etapa 3: Preparar informações do release
@@ -290,43 +467,15 @@ class GitHubReleaseManager:
             
             print("━" * 60)
             
-            # Etapa 4: Criar release no GitHub
-            print("🌐 Etapa 4: Criando release no GitHub...")
-            release_success, release_data = self.create_release(release_info)
-            
-            if not release_success:
-                raise ValueError(f"Falha ao criar release: {release_data.get('error', 'Erro desconhecido')}")
-            
-            release_id = release_data['id']
-            release_url = release_data['html_url']
-            
-            print(f"✅ Release criado: {release_url}")
-            print("━" * 60)
+            # Etapas 4 e 5: Criar release no GitHub e enviar assets
+            publish_result = self.publish_release(release_info)
             
-            # Etapa 5: Upload de assets
-            print("📎 Etapa 5: Fazendo upload de assets...")
-            asset_results = []
+            if not publish_result['success']:
+                raise ValueError(publish_result['error'])
             
-            for asset_info in release_info['assets']:
-                print(f"⬆️ Uploading {asset_info['name']}...")
-                
-                asset_success, asset_data = self.upload_release_asset(release_id, asset_info)
-                
-                if asset_success:
-                    print(f"✅ Asset enviado: {asset_data['browser_download_url']}")
-                    asset_results.append({
-                        'name': asset_info['name'],
-                        'success': True,
-                        'download_url': asset_data['browser_download_url'],
-                        'size': asset_data['size']
-                    })
-                else:
-                    print(f"❌ Falha no upload: {asset_data.get('error', 'Erro desconhecido')}")
-                    asset_results.append({
-                        'name': asset_info['name'],
-                        'success': False,
-                        'error': asset_data.get('error')
-                    })
+            release_data = publish_result['release_data']
+            release_url = publish_result['release_url']
+            asset_results = publish_result['asset_results']
             
             print("━" * 60)
             
@@ -378,22 +527,23 @@ class GitHubReleaseManager:
         """
         print(f"📋 Listando últimos {limit} releases...")
         
-        releases = self.get_all_releases()
+        if self.offline:
+            print("📴 Modo offline - usando apenas o índice local")
+        self.sync_releases()
+        
+        releases = self.release_index.get_releases(self.repo_key, limit)
         
         if not releases:
             print("📭 Nenhum release encontrado")
             return []
         
-        # Limitar resultados
-        releases = releases[:limit]
-        
         print(f"📦 Encontrados {len(releases)} releases:")
         print("━" * 60)
         
         for release in releases:
             tag = release['tag_name']
             name = release['name']
-            published = release.get('published_at', 'N/A')[:10]  # YYYY-MM-DD
+            published = (release.get('published_at') or 'N/A')[:10]  # YYYY-MM-DD
             draft = "🚧 DRAFT" if release.get('draft') else ""
             prerelease = "🧪 PRE" if release.get('prerelease') else ""
             assets = len(release.get('assets', []))
@@ -404,6 +554,213 @@ class GitHubReleaseManager:
         return releases
 
 
+class BatchReleaseManager:
+    """Classe responsável por releases em vários repositórios (forks por órgão)"""
+    
+    def __init__(self, targets: List[str], project_root: str = None, github_token: str = None,
+                 api_base: str = None, max_workers: int = None):
+        """
+        Inicializa o BatchReleaseManager
+        
+        Args:
+            targets: Repositórios de destino no formato OWNER/REPO
+            project_root: Caminho raiz do projeto
+            github_token: Token de acesso do GitHub (compartilhado entre destinos)
+            api_base: URL base da API
+            max_workers: Número de destinos publicados em paralelo
+        """
+        if not targets:
+            raise ValueError("Nenhum repositório de destino informado")
+        
+        self.max_workers = max_workers or min(len(targets), 8)
+        
+        # Pool de conexões compartilhado por todos os destinos
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers * 2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        self.managers: Dict[str, GitHubReleaseManager] = {}
+        for target in targets:
+            try:
+                owner, name = target.strip().split('/')
+            except ValueError:
+                raise ValueError(f"Formato de repositório inválido: {target} (use OWNER/REPO)")
+            
+            self.managers[f"{owner}/{name}"] = GitHubReleaseManager(
+                project_root=project_root,
+                github_token=github_token,
+                repo_owner=owner,
+                repo_name=name,
+                api_base=api_base,
+                session=self.session
+            )
+        
+        # O build é feito uma única vez, pelo primeiro destino
+        self.builder = next(iter(self.managers.values())).builder
+    
+    def _publish_target(self, target: str, release_info: Dict) -> Dict[str, any]:
+        """
+        Publica o release em um destino (executado em thread)
+        
+        Args:
+            target: Repositório no formato OWNER/REPO
+            release_info: Informações do release
+            
+        Returns:
+            Resultado da publicação no destino
+        """
+        manager = self.managers[target]
+        start = time.perf_counter()
+        
+        try:
+            if not manager.test_github_connection():
+                result = {'success': False, 'error': 'Não foi possível conectar ao repositório'}
+            else:
+                result = manager.publish_release(release_info, verbose=False)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        
+        result['target'] = target
+        result['seconds'] = round(time.perf_counter() - start, 3)
+        return result
+    
+    def create_batch_release(self, version_type: str = 'patch', dry_run: bool = False,
+                             in_memory: bool = False) -> Dict[str, any]:
+        """
+        Executa um build e publica o release em todos os destinos em paralelo
+        
+        Args:
+            version_type: Tipo de incremento de versão
+            dry_run: Se True, apenas planeja o build e lista os destinos
+            in_memory: Empacota a versão atual em memória e envia os mesmos bytes a todos
+            
+        Returns:
+            Dicionário com resultado geral e status por destino
+        """
+        print(f"🚀 Iniciando release em lote ({len(self.managers)} destinos)")
+        print("━" * 60)
+        
+        try:
+            # Etapa 1: Validar configurações
+            if not dry_run:
+                print("🔑 Etapa 1: Validando configurações GitHub...")
+                valid, errors = next(iter(self.managers.values())).validate_github_config()
+                if not valid:
+                    for error in errors:
+                        print(f"❌ {error}")
+                    raise ValueError("Configurações GitHub inválidas")
+                print("✅ Configurações GitHub válidas")
+            else:
+                print("🧪 Modo DRY RUN - simulando operações...")
+            
+            print("━" * 60)
+            
+            # Etapa 2: Build único
+            if dry_run:
+                print("📦 Etapa 2: Planejando build em memória (nenhum arquivo alterado)...")
+                build_result = self.builder.plan_build(version_type)
+            elif in_memory:
+                print("📦 Etapa 2: Empacotando a versão atual em memória (uma vez para todos os destinos)...")
+                build_result = self.builder.build_in_memory()
+            else:
+                print("📦 Etapa 2: Executando build da extensão (uma vez para todos os destinos)...")
+                build_result = self.builder.build_extension(version_type)
+            
+            if not build_result['success']:
+                raise ValueError(f"Build falhou: {build_result['error']}")
+            
+            release_info = self.builder.create_github_release_info(build_result)
+            print("━" * 60)
+            
+            if dry_run:
+                for target in self.managers:
+                    print(f"🧪 {target}: {release_info['tag_name']} seria criado "
+                          f"com {len(release_info['assets'])} asset(s)")
+                return {
+                    'success': True,
+                    'dry_run': True,
+                    'build_result': build_result,
+                    'release_info': release_info,
+                    'targets': {target: {'success': True, 'dry_run': True} for target in self.managers}
+                }
+            
+            # Etapa 3: Publicar em todos os destinos em paralelo
+            print(f"🌐 Etapa 3: Publicando {release_info['tag_name']} em paralelo "
+                  f"({self.max_workers} workers)...")
+            
+            target_results = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self._publish_target, target, release_info): target
+                    for target in self.managers
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    target_results[result['target']] = result
+                    
+                    if result['success']:
+                        sent = sum(1 for asset in result['asset_results'] if asset['success'])
+                        print(f"   ✅ {result['target']}: {result['release_url']} "
+                              f"[{sent}/{len(result['asset_results'])} assets] ({result['seconds']}s)")
+                    else:
+                        print(f"   ❌ {result['target']}: {result['error']} ({result['seconds']}s)")
+            
+            print("━" * 60)
+            
+            successful = [t for t, r in target_results.items()
+                          if r['success'] and all(a['success'] for a in r['asset_results'])]
+            
+            print("📊 Resumo por destino:")
+            for target in self.managers:
+                status = "✅" if target in successful else "❌"
+                print(f"   {status} {target}")
+            print(f"🎯 {len(successful)}/{len(self.managers)} destinos publicados")
+            
+            return {
+                'success': len(successful) == len(self.managers),
+                'dry_run': False,
+                'build_result': build_result,
+                'release_info': release_info,
+                'targets': target_results,
+                'error': None if len(successful) == len(self.managers) else
+                         f"{len(self.managers) - len(successful)} destino(s) falharam"
+            }
+            
+        except Exception as error:
+            print(f"❌ Erro durante release em lote: {error}")
+            return {
+                'success': False,
+                'error': str(error)
+            }
+
+
+def load_targets(targets_arg: str = None, targets_file: str = None) -> List[str]:
+    """
+    Monta lista de destinos a partir de argumento e/ou arquivo
+    
+    Args:
+        targets_arg: Destinos separados por vírgula (OWNER/REPO,OWNER/REPO)
+        targets_file: Arquivo com um destino por linha (# para comentários)
+        
+    Returns:
+        Lista de destinos sem duplicatas, na ordem informada
+    """
+    targets = []
+    
+    if targets_arg:
+        targets.extend(t.strip() for t in targets_arg.split(','))
+    
+    if targets_file:
+        with open(targets_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    targets.append(line)
+    
+    return list(dict.fromkeys(t for t in targets if t))
+
+
 def show_help():
     """Exibe ajuda do script"""
     help_text = """
@@ -415,6 +772,7 @@ Uso: python release.py [comando] [opções]
 Comandos:
   create [tipo]    Cria novo release (patch/minor/major) [padrão: patch]
   list [n]         Lista últimos N releases [padrão: 10]
+  batch [tipo]     Um build e release em vários repositórios (--targets)
   
 Tipos de release:
   patch   Incrementa versão patch (2.1.0 → 2.1.1) [padrão]
@@ -426,17 +784,25 @@ Exemplos:
   python release.py create minor   # Release minor
   python release.py list           # Lista releases
   python release.py list 5         # Lista últimos 5
+  python release.py batch --targets org/HELP-OTRS-SFB,org/HELP-OTRS-MT
 
 Opções:
   --dry-run         Simula criação de release (não cria real)
   --token TOKEN     Token GitHub (ou use GITHUB_TOKEN env)
   --repo OWNER/REPO Nome do repositório
+  --targets LISTA   Destinos do batch: OWNER/REPO,OWNER/REPO
+  --targets-file F  Arquivo com um destino OWNER/REPO por linha
+  --jobs N          Destinos publicados em paralelo no batch
+  --in-memory       Publica a versão atual empacotada em memória (sem incremento)
+  --offline         Usa apenas o índice local de releases (sem rede)
+  --refresh         Força sincronização do índice local de releases
   --help, -h        Mostra esta ajuda
 
 Variáveis de Ambiente:
   GITHUB_TOKEN        Token de acesso GitHub (obrigatório)
   GITHUB_REPO_OWNER   Proprietário do repo (padrão: CharllysFernandes)
   GITHUB_REPO_NAME    Nome do repo (padrão: HELP-OTRS-MAPA)
+  GITHUB_API_URL      URL base da API (padrão: https://api.github.com)
 
 O comando create executa:
   1. Valida configurações GitHub
@@ -444,6 +810,11 @@ O comando create executa:
   3. Prepara informações do release
   4. Cria release no GitHub
   5. Faz upload dos assets (ZIP)
+
+Índice local de releases:
+  Releases, assets e tags ficam em .cache/releases.sqlite3 e são
+  sincronizados com requisições condicionais (ETag) em todas as páginas.
+  list, verificação de tags e último release respondem pelo índice.
 """
     print(help_text)
 
@@ -459,7 +830,7 @@ def main():
         'command',
         nargs='?',
         default='create',
-        choices=['create', 'list'],
+        choices=['create', 'list', 'batch'],
         help='Comando a executar'
     )
     
@@ -485,6 +856,40 @@ def main():
         help='Repositório no formato OWNER/REPO'
     )
     
+    parser.add_argument(
+        '--targets',
+        help='Destinos do batch no formato OWNER/REPO,OWNER/REPO'
+    )
+    
+    parser.add_argument(
+        '--targets-file',
+        help='Arquivo com um destino OWNER/REPO por linha'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        help='Número de destinos publicados em paralelo'
+    )
+    
+    parser.add_argument(
+        '--in-memory',
+        action='store_true',
+        help='Publica a versão atual empacotada em memória (sem incremento nem arquivos)'
+    )
+    
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Usa apenas o índice local de releases'
+    )
+    
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Força sincronização do índice local de releases'
+    )
+    
     parser.add_argument(
         '--help', '-h',
         action='store_true',
@@ -507,21 +912,45 @@ def main():
             print("❌ Formato de repositório inválido. Use: OWNER/REPO")
             return 1
     
+    if args.command == 'batch':
+        try:
+            targets = load_targets(args.targets, args.targets_file)
+            batch = BatchReleaseManager(
+                targets,
+                github_token=args.token,
+                max_workers=args.jobs
+            )
+            version_type = args.arg if args.arg in ['patch', 'minor', 'major'] else 'patch'
+            result = batch.create_batch_release(version_type=version_type, dry_run=args.dry_run,
+                                                in_memory=args.in_memory)
+            if not result['success']:
+                print(f"❌ Falha no release em lote: {result['error']}")
+                return 1
+            return 0
+        except Exception as error:
+            print(f"❌ Erro: {error}")
+            return 1
+    
     try:
         # Inicializar release manager
         manager = GitHubReleaseManager(
             github_token=args.token,
             repo_owner=repo_owner,
-            repo_name=repo_name
+            repo_name=repo_name,
+            offline=args.offline
         )
         
+        if args.refresh:
+            manager.sync_releases(force=True)
+        
         # Executar comando
         if args.command == 'create':
             version_type = args.arg if args.arg in ['patch', 'minor', 'major'] else 'patch'
             
             result = manager.create_full_release(
                 version_type=version_type,
-                dry_run=args.dry_run
+                dry_run=args.dry_run,
+                in_memory=args.in_memory
             )
             
             if not result['success']:
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Índice local (SQLite) de releases do GitHub
+Mantém cache de releases, assets, tags e páginas condicionais (ETag)
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS releases (
+    repo TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    tag_name TEXT NOT NULL,
+    name TEXT,
+    draft INTEGER NOT NULL DEFAULT 0,
+    prerelease INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    published_at TEXT,
+    html_url TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (repo, id)
+);
+CREATE INDEX IF NOT EXISTS idx_releases_tag ON releases (repo, tag_name);
+CREATE INDEX IF NOT EXISTS idx_releases_created ON releases (repo, created_at);
+
+CREATE TABLE IF NOT EXISTS assets (
+    repo TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    release_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER,
+    content_type TEXT,
+    download_count INTEGER,
+    browser_download_url TEXT,
+    PRIMARY KEY (repo, id)
+);
+CREATE INDEX IF NOT EXISTS idx_assets_release ON assets (repo, release_id);
+
+CREATE TABLE IF NOT EXISTS tags (
+    repo TEXT NOT NULL,
+    name TEXT NOT NULL,
+    sha TEXT,
+    PRIMARY KEY (repo, name)
+);
+
+CREATE TABLE IF NOT EXISTS pages (
+    repo TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    url TEXT NOT NULL,
+    etag TEXT,
+    next_url TEXT,
+    items TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (repo, url)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    repo TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (repo, resource)
+);
+"""
+
+
+class ReleaseIndex:
+    """Classe responsável pelo índice local de releases"""
+
+    def __init__(self, db_path: Path):
+        """
+        Inicializa o ReleaseIndex
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+        """
+        self.db_path = Path(db_path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Abre conexão com o banco, criando o schema na primeira vez
+
+        Uma conexão por operação mantém o índice seguro entre threads
+
+        Returns:
+            Conexão SQLite
+        """
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+
+        if not self._initialized:
+            conn.executescript(SCHEMA)
+            self._initialized = True
+
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Abre conexão, confirma a transação ao final e fecha a conexão"""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Páginas condicionais (ETag)
+    # ------------------------------------------------------------------
+
+    def get_page(self, repo: str, url: str) -> Optional[Dict]:
+        """
+        Obtém página armazenada para uma URL
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            url: URL da página
+
+        Returns:
+            Dicionário com etag, next_url e items ou None
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT etag, next_url, items FROM pages WHERE repo = ? AND url = ?",
+                (repo, url)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'etag': row['etag'],
+            'next_url': row['next_url'],
+            'items': json.loads(row['items'])
+        }
+
+    def save_page(self, repo: str, resource: str, url: str, etag: Optional[str],
+                  next_url: Optional[str], items: List[Dict]):
+        """
+        Salva página recebida da API
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            resource: Recurso paginado ('releases' ou 'tags')
+            url: URL da página
+            etag: ETag retornado pela API
+            next_url: URL da próxima página (Link rel="next")
+            items: Itens da página
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages (repo, resource, url, etag, next_url, items, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (repo, resource, url, etag, next_url, json.dumps(items), time.time())
+            )
+
+    def prune_pages(self, repo: str, resource: str, visited_urls: List[str]):
+        """
+        Remove páginas que não fazem mais parte da paginação
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            resource: Recurso paginado
+            visited_urls: URLs visitadas na última sincronização
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT url FROM pages WHERE repo = ? AND resource = ?", (repo, resource)
+            ).fetchall()
+            stale = [(repo, row['url']) for row in rows if row['url'] not in visited_urls]
+            conn.executemany("DELETE FROM pages WHERE repo = ? AND url = ?", stale)
+
+    # ------------------------------------------------------------------
+    # Releases, assets e tags
+    # ------------------------------------------------------------------
+
+    def replace_releases(self, repo: str, releases: List[Dict]):
+        """
+        Substitui todos os releases (e assets) de um repositório
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            releases: Lista completa de releases da API
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM releases WHERE repo = ?", (repo,))
+            conn.execute("DELETE FROM assets WHERE repo = ?", (repo,))
+            for release in releases:
+                self._insert_release(conn, repo, release)
+
+    def upsert_release(self, repo: str, release: Dict):
+        """
+        Insere ou atualiza um release (ex: logo após criá-lo)
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            release: Dados do release da API
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM assets WHERE repo = ? AND release_id = ?", (repo, release['id']))
+            self._insert_release(conn, repo, release)
+            conn.execute(
+                "INSERT OR IGNORE INTO tags (repo, name, sha) VALUES (?, ?, NULL)",
+                (repo, release['tag_name'])
+            )
+
+    def upsert_asset(self, repo: str, release_id: int, asset: Dict):
+        """
+        Insere ou atualiza um asset de release
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            release_id: ID do release
+            asset: Dados do asset da API
+        """
+        with self._transaction() as conn:
+            self._insert_asset(conn, repo, release_id, asset)
+            row = conn.execute(
+                "SELECT data FROM releases WHERE repo = ? AND id = ?", (repo, release_id)
+            ).fetchone()
+            if row is not None:
+                data = json.loads(row['data'])
+                data['assets'] = [a for a in data.get('assets', []) if a.get('id') != asset.get('id')]
+                data['assets'].append(asset)
+                conn.execute(
+                    "UPDATE releases SET data = ? WHERE repo = ? AND id = ?",
+                    (json.dumps(data), repo, release_id)
+                )
+
+    def replace_tags(self, repo: str, refs: List[Dict]):
+        """
+        Substitui as tags conhecidas de um repositório
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            refs: Lista de refs de git/matching-refs/tags
+        """
+        rows = []
+        for ref in refs:
+            name = ref.get('ref', '')
+            if name.startswith('refs/tags/'):
+                rows.append((repo, name[len('refs/tags/'):], ref.get('object', {}).get('sha')))
+
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM tags WHERE repo = ?", (repo,))
+            conn.executemany("INSERT OR REPLACE INTO tags (repo, name, sha) VALUES (?, ?, ?)", rows)
+
+    def _insert_release(self, conn: sqlite3.Connection, repo: str, release: Dict):
+        """Insere release e seus assets na conexão fornecida"""
+        conn.execute(
+            "INSERT OR REPLACE INTO releases "
+            "(repo, id, tag_name, name, draft, prerelease, created_at, published_at, html_url, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                repo,
+                release['id'],
+                release['tag_name'],
+                release.get('name'),
+                int(bool(release.get('draft'))),
+                int(bool(release.get('prerelease'))),
+                release.get('created_at'),
+                release.get('published_at'),
+                release.get('html_url'),
+                json.dumps(release)
+            )
+        )
+        for asset in release.get('assets', []):
+            self._insert_asset(conn, repo, release['id'], asset)
+
+    def _insert_asset(self, conn: sqlite3.Connection, repo: str, release_id: int, asset: Dict):
+        """Insere asset na conexão fornecida"""
+        conn.execute(
+            "INSERT OR REPLACE INTO assets "
+            "(repo, id, release_id, name, size, content_type, download_count, browser_download_url) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                repo,
+                asset['id'],
+                release_id,
+                asset['name'],
+                asset.get('size'),
+                asset.get('content_type'),
+                asset.get('download_count'),
+                asset.get('browser_download_url')
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def get_releases(self, repo: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Lista releases do índice (mais recentes primeiro)
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            limit: Número máximo de releases
+
+        Returns:
+            Lista de releases no formato da API
+        """
+        query = "SELECT data FROM releases WHERE repo = ? ORDER BY created_at DESC, id DESC"
+        params = [repo]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._transaction() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        return [json.loads(row['data']) for row in rows]
+
+    def get_latest_release(self, repo: str) -> Optional[Dict]:
+        """
+        Obtém o último release publicado (sem draft e sem prerelease)
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+
+        Returns:
+            Dados do release ou None
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT data FROM releases WHERE repo = ? AND draft = 0 AND prerelease = 0 "
+                "ORDER BY created_at DESC, id DESC LIMIT 1",
+                (repo,)
+            ).fetchone()
+
+        return json.loads(row['data']) if row else None
+
+    def has_tag(self, repo: str, tag_name: str) -> bool:
+        """
+        Verifica se a tag é conhecida (tag git ou tag de release)
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            tag_name: Nome da tag
+
+        Returns:
+            True se a tag existe no índice
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM tags WHERE repo = ? AND name = ? "
+                "UNION ALL SELECT 1 FROM releases WHERE repo = ? AND tag_name = ? LIMIT 1",
+                (repo, tag_name, repo, tag_name)
+            ).fetchone()
+
+        return row is not None
+
+    # ------------------------------------------------------------------
+    # Estado de sincronização
+    # ------------------------------------------------------------------
+
+    def mark_synced(self, repo: str, resource: str):
+        """
+        Registra horário da última sincronização de um recurso
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            resource: Recurso sincronizado
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (repo, resource, synced_at) VALUES (?, ?, ?)",
+                (repo, resource, time.time())
+            )
+
+    def last_synced(self, repo: str, resource: str) -> Optional[float]:
+        """
+        Obtém horário da última sincronização
+
+        Args:
+            repo: Repositório no formato OWNER/REPO
+            resource: Recurso sincronizado
+
+        Returns:
+            Timestamp da última sincronização ou None
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT synced_at FROM sync_state WHERE repo = ? AND resource = ?",
+                (repo, resource)
+            ).fetchone()
+
+        return row['synced_at'] if row else None
@@ -0,0 +1,794 @@
+#!/usr/bin/env python3
+"""
+Perfil de custo dos seletores CSS dos content scripts
+Extrai os seletores de src/ e os avalia nas páginas de "Páginas modelos/" e nos fixtures de tests/
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from js_source import JsSource
+
+
+class SelectorError(ValueError):
+    """Seletor inválido ou fora do subconjunto suportado"""
+
+    def __init__(self, message: str, unsupported: bool = False):
+        super().__init__(message)
+        self.unsupported = unsupported
+
+
+# ----------------------------------------------------------------------
+# Árvore HTML (parser embutido, sem dependências)
+# ----------------------------------------------------------------------
+
+class Element:
+    """Elemento da árvore montada pelo parser embutido"""
+
+    __slots__ = ('tag', 'attrs', 'classes', 'parent', 'children', 'position', 'has_text', '_checked')
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional['Element']):
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = frozenset(attrs.get('class', '').split())
+        self.parent = parent
+        self.children: List['Element'] = []
+        self.position = 0
+        self.has_text = False
+        self._checked = None
+
+
+def iter_descendants(element: Element):
+    """Descendentes em ordem de documento"""
+    for child in element.children:
+        yield child
+        yield from iter_descendants(child)
+
+
+class DocumentBuilder(HTMLParser):
+    """Monta a árvore de elementos tolerando HTML real (tags implícitas e não fechadas)"""
+
+    VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                           'param', 'source', 'track', 'wbr'))
+
+    # Tag aberta → tags que a fecham implicitamente
+    IMPLIED_END = {
+        'option': ('option', 'optgroup'),
+        'optgroup': ('optgroup',),
+        'li': ('li',),
+        'dt': ('dt', 'dd'),
+        'dd': ('dt', 'dd'),
+        'tr': ('tr',),
+        'td': ('td', 'th', 'tr'),
+        'th': ('td', 'th', 'tr'),
+        'thead': ('tbody', 'tfoot'),
+        'tbody': ('tbody', 'tfoot')
+    }
+
+    # Blocos que fecham um <p> aberto
+    P_CLOSERS = frozenset(('address', 'article', 'aside', 'blockquote', 'div', 'dl', 'fieldset', 'footer',
+                           'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'main', 'nav', 'ol',
+                           'p', 'pre', 'section', 'table', 'ul'))
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element('#document', {}, None)
+        self.elements: List[Element] = []
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        self._open(tag, attrs, self_closing=False)
+
+    def handle_startendtag(self, tag, attrs):
+        self._open(tag, attrs, self_closing=True)
+
+    def _open(self, tag: str, attrs: List[Tuple[str, Optional[str]]], self_closing: bool):
+        if tag in self.P_CLOSERS and self._stack[-1].tag == 'p':
+            self._stack.pop()
+        while self._stack[-1].tag in self.IMPLIED_END and tag in self.IMPLIED_END[self._stack[-1].tag]:
+            self._stack.pop()
+
+        parent = self._stack[-1]
+        element = Element(tag, {name: value or '' for name, value in attrs}, parent)
+        element.position = len(parent.children)
+        parent.children.append(element)
+        self.elements.append(element)
+
+        if not self_closing and tag not in self.VOID_TAGS:
+            self._stack.append(element)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data):
+        if data:
+            self._stack[-1].has_text = True
+
+
+class BuiltinDocument:
+    """Documento indexado por id, classe e tag para avaliação de seletores"""
+
+    backend = 'builtin'
+
+    def __init__(self, html: str):
+        builder = DocumentBuilder()
+        builder.feed(html)
+        builder.close()
+
+        self.elements = builder.elements
+        self.by_id: Dict[str, List[Element]] = {}
+        self.by_class: Dict[str, List[Element]] = {}
+        self.by_tag: Dict[str, List[Element]] = {}
+        for element in self.elements:
+            self.by_tag.setdefault(element.tag, []).append(element)
+            for name in element.classes:
+                self.by_class.setdefault(name, []).append(element)
+            if 'id' in element.attrs:
+                self.by_id.setdefault(element.attrs['id'], []).append(element)
+
+    def count(self, selector: 'ParsedSelector') -> int:
+        """Quantidade de elementos distintos que casam (semântica de querySelectorAll)"""
+        matched = set()
+        for parts in selector.complexes:
+            for element in self._candidates(parts[-1][1]):
+                if id(element) not in matched and selector.match_complex(element, parts):
+                    matched.add(id(element))
+        return len(matched)
+
+    def _candidates(self, compound: Dict[str, Any]) -> List[Element]:
+        """Elementos que podem casar o composto mais à direita (pelo índice mais seletivo)"""
+        if compound['id'] is not None:
+            return self.by_id.get(compound['id'], [])
+        if compound['classes']:
+            return min((self.by_class.get(name, []) for name in compound['classes']), key=len)
+        if compound['tag'] not in (None, '*'):
+            return self.by_tag.get(compound['tag'], [])
+        return self.elements
+
+
+class LexborDocument:
+    """Documento avaliado com selectolax (Lexbor), se instalado"""
+
+    backend = 'selectolax'
+
+    def __init__(self, html: str):
+        from selectolax.lexbor import LexborHTMLParser
+        self.tree = LexborHTMLParser(html)
+        self.elements = self.tree.css('*')
+
+    def count(self, selector: 'ParsedSelector') -> int:
+        return len(self.tree.css(selector.text))
+
+
+class LxmlDocument:
+    """Documento avaliado com lxml + cssselect, se instalados"""
+
+    backend = 'lxml'
+
+    def __init__(self, html: str):
+        import lxml.html
+        self.tree = lxml.html.document_fromstring(html)
+        self.elements = list(self.tree.iter())
+
+    def count(self, selector: 'ParsedSelector') -> int:
+        from lxml.cssselect import CSSSelector
+        return len(CSSSelector(selector.text, translator='html')(self.tree))
+
+
+# ----------------------------------------------------------------------
+# Seletores
+# ----------------------------------------------------------------------
+
+class ParsedSelector:
+    """Lista de seletores CSS já analisada (subconjunto usado por querySelector)"""
+
+    IDENT = r'-?(?:[_a-zA-Z]|[^\x00-\x7f]|\\.)(?:[_a-zA-Z0-9-]|[^\x00-\x7f]|\\.)*'
+    STRING = r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''
+    TOKEN = re.compile(
+        rf'(?P<ws>\s+)|(?P<comb>\s*[>+~]\s*)|(?P<comma>\s*,\s*)|(?P<star>\*)|'
+        rf'(?P<type>{IDENT})|#(?P<id>{IDENT})|\.(?P<cls>{IDENT})|'
+        rf'\[\s*(?P<attr>{IDENT})\s*(?:(?P<op>[~|^$*]?=)\s*(?P<value>{IDENT}|{STRING})\s*(?P<flag>[iIsS])?\s*)?\]|'
+        rf'(?P<pseudo_element>::{IDENT})|:(?P<pseudo>{IDENT})(?P<paren>\()?'
+    )
+
+    SUPPORTED_PSEUDOS = ('checked', 'disabled', 'enabled', 'first-child', 'last-child', 'only-child',
+                         'empty', 'required', 'not')
+
+    # Pseudo-classes válidas no navegador mas não avaliadas aqui
+    KNOWN_PSEUDOS = ('hover', 'focus', 'active', 'visited', 'link', 'any-link', 'focus-within',
+                     'focus-visible', 'nth-child', 'nth-last-child', 'nth-of-type', 'nth-last-of-type',
+                     'first-of-type', 'last-of-type', 'only-of-type', 'is', 'where', 'has', 'root', 'scope',
+                     'target', 'lang', 'dir', 'optional', 'valid', 'invalid', 'read-only', 'read-write',
+                     'placeholder-shown', 'indeterminate', 'default', 'defined', 'in-range', 'out-of-range')
+
+    FORM_ELEMENTS = ('input', 'select', 'textarea', 'button', 'option', 'optgroup', 'fieldset')
+
+    def __init__(self, text: str):
+        """
+        Analisa um seletor
+
+        Args:
+            text: Seletor CSS (pode ser lista separada por vírgulas)
+
+        Raises:
+            SelectorError: Seletor inválido no navegador ou não suportado pelo avaliador
+        """
+        self.text = text
+        self.complexes, _ = self._parse_list(text.strip(), 0, nested=False)
+
+    # ------------------------------------------------------------------
+    # Análise
+    # ------------------------------------------------------------------
+
+    def _parse_list(self, text: str, position: int, nested: bool):
+        """Lista de seletores complexos; cada um é [(combinador, composto), ...]"""
+        complexes = []
+        parts = []
+        compound = self._new_compound()
+        combinator = None
+        pending_ws = False
+
+        def flush_compound():
+            nonlocal compound, combinator
+            if self._is_empty(compound):
+                raise SelectorError(f"seletor incompleto em '{text}'")
+            parts.append((combinator, compound))
+            compound = self._new_compound()
+            combinator = None
+
+        while position < len(text):
+            if nested and text[position] == ')':
+                break
+
+            match = self.TOKEN.match(text, position)
+            if not match or match.end() == position:
+                raise SelectorError(f"sintaxe inválida em '{text[position:]}'")
+            position = match.end()
+
+            if match.group('ws') is not None:
+                pending_ws = True
+                continue
+            if match.group('comb') is not None:
+                flush_compound()
+                combinator = match.group('comb').strip()
+                pending_ws = False
+                continue
+            if match.group('comma') is not None:
+                flush_compound()
+                complexes.append(parts)
+                parts = []
+                pending_ws = False
+                continue
+
+            if pending_ws:
+                flush_compound()
+                combinator = ' '
+                pending_ws = False
+
+            if match.group('star') is not None or match.group('type') is not None:
+                if compound['tag'] is not None or not self._is_empty(compound):
+                    raise SelectorError(f"tipo fora de posição em '{text}'")
+                compound['tag'] = '*' if match.group('star') else self._unescape(match.group('type')).lower()
+            elif match.group('id') is not None:
+                compound['id'] = self._unescape(match.group('id'))
+            elif match.group('cls') is not None:
+                compound['classes'].append(self._unescape(match.group('cls')))
+            elif match.group('attr') is not None:
+                value = match.group('value')
+                if value is not None and value[0] in '"\'':
+                    value = self._unescape(value[1:-1])
+                elif value is not None:
+                    value = self._unescape(value)
+                compound['attrs'].append((match.group('attr').lower(), match.group('op'), value,
+                                          (match.group('flag') or '').lower() == 'i'))
+            elif match.group('pseudo_element') is not None:
+                raise SelectorError(f"pseudo-elemento {match.group('pseudo_element')} não casa elementos",
+                                    unsupported=True)
+            else:
+                name = match.group('pseudo').lower()
+                if name not in self.SUPPORTED_PSEUDOS:
+                    if name in self.KNOWN_PSEUDOS:
+                        raise SelectorError(f":{name} não é suportado pelo avaliador", unsupported=True)
+                    raise SelectorError(f":{name} não é CSS válido (querySelector lança SyntaxError)")
+                if name == 'not':
+                    if not match.group('paren'):
+                        raise SelectorError(":not exige argumento")
+                    inner, position = self._parse_list(text, position, nested=True)
+                    if position >= len(text) or text[position] != ')':
+                        raise SelectorError(f"parêntese não fechado em '{text}'")
+                    position += 1
+                    compound['pseudos'].append(('not', inner))
+                elif match.group('paren'):
+                    raise SelectorError(f":{name} não aceita argumento")
+                else:
+                    compound['pseudos'].append((name, None))
+
+        flush_compound()
+        complexes.append(parts)
+        return complexes, position
+
+    @staticmethod
+    def _new_compound() -> Dict[str, Any]:
+        return {'tag': None, 'id': None, 'classes': [], 'attrs': [], 'pseudos': []}
+
+    @staticmethod
+    def _is_empty(compound: Dict[str, Any]) -> bool:
+        return (compound['tag'] is None and compound['id'] is None and not compound['classes']
+                and not compound['attrs'] and not compound['pseudos'])
+
+    @staticmethod
+    def _unescape(value: str) -> str:
+        return re.sub(r'\\(.)', r'\1', value)
+
+    # ------------------------------------------------------------------
+    # Avaliação (parser embutido)
+    # ------------------------------------------------------------------
+
+    def match_complex(self, element: Element, parts: List[Tuple[Optional[str], Dict[str, Any]]],
+                      index: Optional[int] = None) -> bool:
+        """Casa um seletor complexo da direita para a esquerda"""
+        if index is None:
+            index = len(parts) - 1
+        combinator, compound = parts[index]
+        if not self._match_compound(element, compound):
+            return False
+        if index == 0:
+            return True
+
+        if combinator == '>':
+            parent = element.parent
+            return parent is not None and parent.parent is not None and \
+                self.match_complex(parent, parts, index - 1)
+        if combinator == ' ':
+            ancestor = element.parent
+            while ancestor is not None and ancestor.parent is not None:
+                if self.match_complex(ancestor, parts, index - 1):
+                    return True
+                ancestor = ancestor.parent
+            return False
+
+        siblings = element.parent.children
+        if combinator == '+':
+            return element.position > 0 and self.match_complex(siblings[element.position - 1], parts, index - 1)
+        return any(self.match_complex(sibling, parts, index - 1) for sibling in siblings[:element.position])
+
+    def _match_compound(self, element: Element, compound: Dict[str, Any]) -> bool:
+        if compound['tag'] not in (None, '*') and element.tag != compound['tag']:
+            return False
+        if compound['id'] is not None and element.attrs.get('id') != compound['id']:
+            return False
+        for name in compound['classes']:
+            if name not in element.classes:
+                return False
+        for name, op, value, insensitive in compound['attrs']:
+            if not self._match_attr(element.attrs.get(name), op, value, insensitive):
+                return False
+        for name, argument in compound['pseudos']:
+            if not self._match_pseudo(element, name, argument):
+                return False
+        return True
+
+    @staticmethod
+    def _match_attr(actual: Optional[str], op: Optional[str], value: Optional[str], insensitive: bool) -> bool:
+        if actual is None:
+            return False
+        if op is None:
+            return True
+        if insensitive:
+            actual, value = actual.lower(), value.lower()
+        if op == '=':
+            return actual == value
+        if op == '~=':
+            return value in actual.split()
+        if op == '|=':
+            return actual == value or actual.startswith(value + '-')
+        if not value:
+            return False
+        if op == '^=':
+            return actual.startswith(value)
+        if op == '$=':
+            return actual.endswith(value)
+        return value in actual
+
+    def _match_pseudo(self, element: Element, name: str, argument) -> bool:
+        if name == 'not':
+            return not any(self.match_complex(element, parts) for parts in argument)
+        if name == 'checked':
+            return self._is_checked(element)
+        if name == 'disabled':
+            return element.tag in self.FORM_ELEMENTS and 'disabled' in element.attrs
+        if name == 'enabled':
+            return element.tag in self.FORM_ELEMENTS and 'disabled' not in element.attrs
+        if name == 'required':
+            return element.tag in ('input', 'select', 'textarea') and 'required' in element.attrs
+        if name == 'empty':
+            return not element.children and not element.has_text
+
+        siblings = element.parent.children if element.parent is not None else [element]
+        if name == 'first-child':
+            return element.position == 0
+        if name == 'last-child':
+            return element.position == len(siblings) - 1
+        return len(siblings) == 1  # only-child
+
+    @staticmethod
+    def _is_checked(element: Element) -> bool:
+        """:checked no HTML estático (inclui a primeira opção de um select sem selected)"""
+        if element.tag == 'input':
+            return element.attrs.get('type', '').lower() in ('checkbox', 'radio') and 'checked' in element.attrs
+        if element.tag != 'option':
+            return False
+        if element._checked is None:
+            select = element.parent
+            while select is not None and select.tag != 'select':
+                select = select.parent
+            element._checked = 'selected' in element.attrs
+            if not element._checked and select is not None and 'multiple' not in select.attrs:
+                options = [node for node in iter_descendants(select) if node.tag == 'option']
+                element._checked = bool(options) and options[0] is element and \
+                    not any('selected' in option.attrs for option in options)
+        return element._checked
+
+
+# ----------------------------------------------------------------------
+# Profiler
+# ----------------------------------------------------------------------
+
+class SelectorProfiler:
+    """Classe responsável por extrair e medir os seletores dos content scripts"""
+
+    # Páginas usadas por padrão (relativas à raiz do projeto)
+    DEFAULT_PAGES = ('Páginas modelos/*.html', 'tests/*.html')
+
+    # Chamadas cujo primeiro argumento é um seletor
+    QUERY_CALL_PATTERN = re.compile(
+        r'(?:\b(\w+)\s*(?:\?\.|\.)\s*)?\b(querySelectorAll|querySelector|getCachedElements|getCachedElement|'
+        r'closest|matches)\s*(?:\?\.\s*)?\(')
+
+    # Arrays de seletores: const nome = [ ... ]
+    ARRAY_PATTERN = re.compile(r'\b(?:const|let|var)\s+(\w+)\s*=\s*\[')
+
+    # Nomes de classe/id criados pela própria extensão
+    OWN_NAME_PATTERNS = (
+        re.compile(r'\bclass(?:Name)?\s*=\s*[\'"`]([^\'"`$]+)'),
+        re.compile(r'classList\.(?:add|toggle)\(\s*[\'"]([^\'"]+)'),
+        re.compile(r'\bid\s*=\s*[\'"`]([\w-]+)')
+    )
+
+    BACKENDS = ('auto', 'selectolax', 'lxml', 'builtin')
+
+    def __init__(self, project_root: Path, backend: str = 'auto'):
+        """
+        Inicializa o SelectorProfiler
+
+        Args:
+            project_root: Caminho raiz do projeto
+            backend: Parser HTML (auto usa selectolax ou lxml se instalados)
+        """
+        self.project_root = Path(project_root)
+        self.document_class = self._resolve_backend(backend)
+
+    @staticmethod
+    def _resolve_backend(backend: str):
+        """Escolhe a implementação de documento conforme dependências instaladas"""
+        if backend in ('auto', 'selectolax'):
+            try:
+                import selectolax.lexbor  # noqa: F401
+                return LexborDocument
+            except ImportError:
+                if backend == 'selectolax':
+                    raise
+        if backend in ('auto', 'lxml'):
+            try:
+                import lxml.html  # noqa: F401
+                import lxml.cssselect  # noqa: F401
+                return LxmlDocument
+            except ImportError:
+                if backend == 'lxml':
+                    raise
+        return BuiltinDocument
+
+    # ------------------------------------------------------------------
+    # Extração
+    # ------------------------------------------------------------------
+
+    def default_scripts(self) -> List[Path]:
+        """Content scripts do manifest (exceto src/generated/)"""
+        with open(self.project_root / 'manifest.json', 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        scripts = []
+        for content_script in manifest.get('content_scripts', []):
+            for relpath in content_script.get('js', []):
+                if not relpath.startswith('src/generated/') and relpath not in scripts:
+                    scripts.append(relpath)
+        return [self.project_root / relpath for relpath in scripts]
+
+    def default_pages(self) -> List[Path]:
+        """Páginas modelo e fixtures HTML"""
+        pages = []
+        for pattern in self.DEFAULT_PAGES:
+            pages.extend(sorted(self.project_root.glob(pattern)))
+        return pages
+
+    def extract(self, scripts: List[Path]) -> Dict[str, Any]:
+        """
+        Extrai seletores literais dos scripts
+
+        Args:
+            scripts: Arquivos JS
+
+        Returns:
+            Dicionário com 'selectors' (texto → ocorrências), 'chains' e 'dynamic'
+        """
+        selectors: Dict[str, Dict[str, Any]] = {}
+        chains = []
+        dynamic = []
+        own_names = set()
+
+        for script in scripts:
+            with open(script, 'r', encoding='utf-8') as f:
+                js = JsSource(f.read())
+            display = self._display(script)
+
+            for pattern in self.OWN_NAME_PATTERNS:
+                for match in pattern.finditer(js.source):
+                    own_names.update(match.group(1).split())
+
+            def add(text: str, offset: int, chain: Optional[str] = None):
+                entry = selectors.setdefault(text, {'locations': [], 'chains': []})
+                location = f"{display}:{js.line_of(offset)}"
+                if location not in entry['locations']:
+                    entry['locations'].append(location)
+                if chain and chain not in entry['chains']:
+                    entry['chains'].append(chain)
+
+            for match in self.QUERY_CALL_PATTERN.finditer(js.code):
+                args = js.split_args(match.end() - 1)
+                if not args:
+                    continue
+                value = js.string_value(*args[0])
+                if value is not None:
+                    add(value, match.start())
+                elif '`' in js.source[args[0][0]:args[0][1]] or '+' in js.code[args[0][0]:args[0][1]]:
+                    dynamic.append(f"{display}:{js.line_of(match.start())}")
+
+            for chain in self._extract_chains(js, display):
+                chains.append(chain)
+                for text, offset in chain.pop('items'):
+                    add(text, offset, chain['id'])
+
+        for text, entry in selectors.items():
+            entry['own'] = self._is_own_selector(text, own_names)
+
+        return {'selectors': selectors, 'chains': chains, 'dynamic': dynamic}
+
+    def _extract_chains(self, js: JsSource, display: str) -> List[Dict[str, Any]]:
+        """Arrays de seletores percorridos com querySelector* (cadeias de fallback) ou unidos com join"""
+        chains = []
+        for match in self.ARRAY_PATTERN.finditer(js.code):
+            name = match.group(1)
+            escaped = re.escape(name)
+            loop = re.search(rf'for\s*\(\s*(?:const|let|var)\s+(\w+)\s+of\s+{escaped}\s*\)', js.code[match.end():])
+            joined = re.search(rf'(?:querySelectorAll|querySelector)\s*\(\s*{escaped}\.join\(', js.code)
+            if loop:
+                body = js.code[match.end() + loop.end():match.end() + loop.end() + 2000]
+                uses_query = re.search(
+                    rf'(?:querySelectorAll|querySelector|getCachedElements|getCachedElement)\s*\(\s*{loop.group(1)}\s*\)',
+                    body)
+                if not uses_query:
+                    continue
+            elif not joined:
+                continue
+
+            items = []
+            for start, end in js.split_args(match.end() - 1):
+                value = js.string_value(start, end)
+                if value is not None:
+                    items.append((value, start + len(js.source[start:end]) - len(js.source[start:end].lstrip())))
+
+            if items:
+                chains.append({
+                    'id': f"{name} ({display}:{js.line_of(match.start())})",
+                    'mode': 'join' if joined and not loop else 'fallback',
+                    'size': len(items),
+                    'items': items
+                })
+        return chains
+
+    @staticmethod
+    def _is_own_selector(text: str, own_names: set) -> bool:
+        """Seletor aponta para elementos criados pela própria extensão"""
+        names = re.findall(r'[.#]([\w-]+)', text)
+        return bool(names) and all(name in own_names for name in names)
+
+    def _display(self, path: Path) -> str:
+        try:
+            return Path(path).resolve().relative_to(self.project_root.resolve()).as_posix()
+        except ValueError:
+            return str(path)
+
+    # ------------------------------------------------------------------
+    # Avaliação
+    # ------------------------------------------------------------------
+
+    def profile(self, scripts: Optional[List[Path]] = None, pages: Optional[List[Path]] = None,
+                repeat: int = 3) -> Dict[str, Any]:
+        """
+        Avalia todos os seletores em todas as páginas
+
+        Args:
+            scripts: Arquivos JS (padrão: content scripts do manifest)
+            pages: Páginas HTML (padrão: Páginas modelos/ e tests/)
+            repeat: Repetições por medição (usa o menor tempo)
+
+        Returns:
+            Relatório com páginas, seletores, mortos, inválidos e cadeias
+        """
+        scripts = scripts or self.default_scripts()
+        pages = pages or self.default_pages()
+        extracted = self.extract(scripts)
+
+        parsed = {}
+        invalid = {}
+        unsupported = {}
+        for text in extracted['selectors']:
+            try:
+                parsed[text] = ParsedSelector(text)
+            except SelectorError as error:
+                (unsupported if error.unsupported else invalid)[text] = str(error)
+
+        page_info = []
+        documents = []
+        for page in pages:
+            with open(page, 'r', encoding='utf-8', errors='replace') as f:
+                html = f.read()
+            start = time.perf_counter()
+            document = self.document_class(html)
+            parse_ms = (time.perf_counter() - start) * 1000
+            documents.append(document)
+            page_info.append({'page': self._display(page), 'elements': len(document.elements),
+                              'parse_ms': round(parse_ms, 2)})
+
+        results = {}
+        for text, selector in parsed.items():
+            counts = {}
+            total_seconds = 0.0
+            for info, document in zip(page_info, documents):
+                best = None
+                for _ in range(max(1, repeat)):
+                    start = time.perf_counter()
+                    count = document.count(selector)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                total_seconds += best
+                if count:
+                    counts[info['page']] = count
+            results[text] = {
+                'matches': sum(counts.values()),
+                'pages': counts,
+                'time_ms': round(total_seconds * 1000, 3)
+            }
+
+        selectors = {}
+        for text, entry in extracted['selectors'].items():
+            selectors[text] = dict(entry, **results.get(text, {}))
+            if text in invalid:
+                selectors[text]['status'] = 'invalid'
+                selectors[text]['error'] = invalid[text]
+            elif text in unsupported:
+                selectors[text]['status'] = 'unsupported'
+                selectors[text]['error'] = unsupported[text]
+            elif entry['own']:
+                selectors[text]['status'] = 'extension'
+            else:
+                selectors[text]['status'] = 'live' if results[text]['matches'] else 'dead'
+
+        chains = []
+        for chain in extracted['chains']:
+            members = [text for text, entry in selectors.items() if chain['id'] in entry['chains']]
+            dead = [text for text in members if selectors[text]['status'] in ('dead', 'invalid')]
+            chains.append(dict(chain, dead=dead, all_dead=len(dead) == len(members)))
+
+        return {
+            'backend': self.document_class.backend,
+            'scripts': [self._display(script) for script in scripts],
+            'pages': page_info,
+            'selectors': selectors,
+            'chains': chains,
+            'dynamic': extracted['dynamic'],
+            'summary': {
+                status: sum(1 for entry in selectors.values() if entry['status'] == status)
+                for status in ('live', 'dead', 'invalid', 'unsupported', 'extension')
+            }
+        }
+
+    # ------------------------------------------------------------------
+    # Relatório
+    # ------------------------------------------------------------------
+
+    def print_report(self, report: Dict[str, Any], top: int = 10):
+        """Exibe o relatório no terminal"""
+        summary = report['summary']
+        print(f"🔎 Perfil de seletores ({report['backend']}): {len(report['selectors'])} seletores de "
+              f"{len(report['scripts'])} scripts em {len(report['pages'])} páginas")
+        for page in report['pages']:
+            print(f"   📄 {page['page']}: {page['elements']} elementos ({page['parse_ms']:.1f} ms)")
+
+        print("━" * 60)
+        timed = sorted((item for item in report['selectors'].items() if 'time_ms' in item[1]),
+                       key=lambda item: item[1]['time_ms'], reverse=True)
+        print("⏱️ Seletores mais caros (tempo somado nas páginas):")
+        for text, entry in timed[:top]:
+            print(f"   {entry['time_ms']:8.3f} ms  {entry['matches']:5d} elem.  {text}")
+
+        print("━" * 60)
+        dead = [(text, entry) for text, entry in report['selectors'].items() if entry['status'] == 'dead']
+        print(f"💀 Sem correspondência em nenhuma página: {len(dead)}")
+        for text, entry in sorted(dead, key=lambda item: item[1]['locations'][0]):
+            print(f"   {entry['locations'][0]}: {text}")
+
+        invalid = [(text, entry) for text, entry in report['selectors'].items() if entry['status'] == 'invalid']
+        if invalid:
+            print(f"❌ Inválidos: {len(invalid)}")
+            for text, entry in invalid:
+                print(f"   {entry['locations'][0]}: {text} ({entry['error']})")
+
+        if report['chains']:
+            print("━" * 60)
+            print("🔗 Cadeias de seletores:")
+            for chain in report['chains']:
+                marker = '💀' if chain['all_dead'] else ('⚠️' if chain['dead'] else '✅')
+                print(f"   {marker} {chain['id']}: {len(chain['dead'])}/{chain['size']} mortos ({chain['mode']})")
+
+        print("━" * 60)
+        print(f"📊 Vivos: {summary['live']} | Mortos: {summary['dead']} | Inválidos: {summary['invalid']} | "
+              f"Não suportados: {summary['unsupported']} | Da extensão: {summary['extension']} | "
+              f"Dinâmicos (não avaliados): {len(report['dynamic'])}")
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(description='Perfil de custo dos seletores CSS dos content scripts')
+    parser.add_argument('--scripts', nargs='+', help='Arquivos JS (padrão: content scripts do manifest)')
+    parser.add_argument('--pages', nargs='+', help='Páginas HTML (padrão: Páginas modelos/ e tests/)')
+    parser.add_argument('--parser', choices=SelectorProfiler.BACKENDS, default='auto',
+                        help='Parser HTML (auto usa selectolax ou lxml se instalados)')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetições por medição (menor tempo)')
+    parser.add_argument('--top', type=int, default=10, help='Quantidade de seletores mais caros exibidos')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+    args = parser.parse_args()
+
+    try:
+        profiler = SelectorProfiler(Path(__file__).parent.parent, args.parser)
+    except ImportError as error:
+        print(f"❌ Parser indisponível: {error}")
+        return 1
+
+    report = profiler.profile(
+        [Path(p) for p in args.scripts] if args.scripts else None,
+        [Path(p) for p in args.pages] if args.pages else None,
+        repeat=args.repeat
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        profiler.print_report(report, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Source maps v3 dos arquivos transformados pelo build
+Gera mapeamentos por alinhamento entre o arquivo original e o transformado
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import bisect
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class SourceMap:
+    """Classe responsável por montar, serializar e consultar source maps (formato v3)"""
+
+    BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+    # Tokens usados no alinhamento (palavras, espaços e pontuação isolada)
+    TOKEN_PATTERN = re.compile(r'[\w$]+|\s+|.', re.DOTALL)
+
+    # Pontuação só é casada até esta distância (em tokens) da posição atual na origem;
+    # palavras podem saltar trechos removidos de qualquer tamanho
+    PUNCTUATION_WINDOW = 16
+
+    # Versão do alinhamento (entra na chave do cache de mapas)
+    ALIGNMENT_VERSION = 2
+
+    def __init__(self, file: str):
+        """
+        Inicializa o SourceMap
+
+        Args:
+            file: Nome do arquivo gerado
+        """
+        self.file = file
+        self.sources: List[str] = []
+        self.sources_content: List[Optional[str]] = []
+        # Por linha gerada: lista de (coluna_gerada, índice_fonte, linha_original, coluna_original)
+        self.lines: List[List[Tuple[int, int, int, int]]] = []
+
+    # ------------------------------------------------------------------
+    # Montagem
+    # ------------------------------------------------------------------
+
+    def add_source(self, name: str, content: Optional[str] = None) -> int:
+        """Registra um arquivo de origem e devolve seu índice"""
+        if name in self.sources:
+            return self.sources.index(name)
+        self.sources.append(name)
+        self.sources_content.append(content)
+        return len(self.sources) - 1
+
+    def add_mapping(self, line: int, column: int, source: int, original_line: int, original_column: int):
+        """
+        Adiciona um segmento (posições 0-based)
+
+        Args:
+            line: Linha no arquivo gerado
+            column: Coluna no arquivo gerado
+            source: Índice da origem
+            original_line: Linha na origem
+            original_column: Coluna na origem
+        """
+        while len(self.lines) <= line:
+            self.lines.append([])
+        self.lines[line].append((column, source, original_line, original_column))
+
+    @classmethod
+    def from_alignment(cls, file: str, generated: str, original: str, source_name: str,
+                       include_content: bool = True) -> 'SourceMap':
+        """
+        Mapeia um arquivo transformado para a origem alinhando os tokens dos dois
+
+        Serve para transformações que removem ou encolhem trechos (minificação,
+        no-ops, poda de regras): os tokens mantidos são localizados na origem
+        numa única passada, ignorando espaços. Um segmento é emitido no início
+        de cada linha gerada e sempre que o deslocamento entre as posições muda.
+
+        Args:
+            file: Nome do arquivo gerado
+            generated: Conteúdo gerado
+            original: Conteúdo original
+            source_name: Caminho da origem registrado no mapa
+            include_content: Inclui o conteúdo original (sourcesContent)
+
+        Returns:
+            SourceMap preenchido
+        """
+        source_map = cls(file)
+        source = source_map.add_source(source_name, original if include_content else None)
+        gen_lines = _LineIndex(generated)
+        orig_lines = _LineIndex(original)
+
+        last = None  # (linha_gerada, deslocamento_de_linha, deslocamento_de_coluna)
+        for gen_offset, orig_offset in cls._align(generated, original):
+            line, column = gen_lines.position(gen_offset)
+            original_line, original_column = orig_lines.position(orig_offset)
+            delta = (line, original_line - line, original_column - column)
+            if delta != last:
+                source_map.add_mapping(line, column, source, original_line, original_column)
+                last = delta
+        return source_map
+
+    @classmethod
+    def _tokens(cls, text: str) -> List[Tuple[int, str]]:
+        """Tokens sem espaços, com deslocamento"""
+        return [(m.start(), m.group(0)) for m in cls.TOKEN_PATTERN.finditer(text) if not m.group(0).isspace()]
+
+    @classmethod
+    def _align(cls, generated: str, original: str) -> List[Tuple[int, int]]:
+        """
+        Pares (deslocamento gerado, deslocamento original) dos tokens mantidos
+
+        A transformação só remove trechos, então os tokens gerados aparecem na
+        origem na mesma ordem: cada um é casado com a próxima ocorrência igual
+        a partir da última posição casada (busca binária nas ocorrências de
+        cada token), em O(n log n). Pontuação distante demais fica sem par,
+        para não arrastar a posição para dentro de um trecho removido.
+        """
+        orig_tokens = cls._tokens(original)
+        occurrences: Dict[str, List[int]] = {}
+        for index, (_, token) in enumerate(orig_tokens):
+            occurrences.setdefault(token, []).append(index)
+
+        pairs = []
+        cursor = 0
+        for gen_offset, token in cls._tokens(generated):
+            positions = occurrences.get(token)
+            if not positions:
+                continue
+            found = bisect.bisect_left(positions, cursor)
+            if found == len(positions):
+                continue
+            index = positions[found]
+            if not (token[0].isalnum() or token[0] in '_$') and index - cursor > cls.PUNCTUATION_WINDOW:
+                continue
+            pairs.append((gen_offset, orig_tokens[index][0]))
+            cursor = index + 1
+        return pairs
+
+    # ------------------------------------------------------------------
+    # Serialização
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def encode_vlq(cls, value: int) -> str:
+        """Codifica um inteiro em Base64 VLQ"""
+        vlq = (-value << 1) | 1 if value < 0 else value << 1
+        out = ''
+        while True:
+            digit = vlq & 0x1F
+            vlq >>= 5
+            if vlq:
+                digit |= 0x20
+            out += cls.BASE64[digit]
+            if not vlq:
+                return out
+
+    @classmethod
+    def decode_vlq(cls, text: str) -> List[int]:
+        """Decodifica uma sequência Base64 VLQ"""
+        values = []
+        value = shift = 0
+        for char in text:
+            digit = cls.BASE64.index(char)
+            value += (digit & 0x1F) << shift
+            if digit & 0x20:
+                shift += 5
+                continue
+            values.append(-(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+        return values
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Source map v3 como dicionário JSON"""
+        encoded_lines = []
+        previous = [0, 0, 0, 0]  # coluna gerada é relativa só dentro da linha
+        for segments in self.lines:
+            previous[0] = 0
+            encoded = []
+            for segment in sorted(segments):
+                encoded.append(''.join(self.encode_vlq(value - previous[i]) for i, value in enumerate(segment)))
+                previous = list(segment)
+            encoded_lines.append(','.join(encoded))
+
+        data = {
+            'version': 3,
+            'file': self.file,
+            'sources': self.sources,
+            'names': [],
+            'mappings': ';'.join(encoded_lines)
+        }
+        if any(content is not None for content in self.sources_content):
+            data['sourcesContent'] = self.sources_content
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SourceMap':
+        """
+        Lê um source map v3
+
+        Raises:
+            ValueError: Versão diferente de 3 ou mapeamentos inválidos
+        """
+        if data.get('version') != 3:
+            raise ValueError(f"Source map não suportado (versão {data.get('version')})")
+
+        source_map = cls(data.get('file', ''))
+        root = data.get('sourceRoot') or ''
+        contents = data.get('sourcesContent') or []
+        for index, name in enumerate(data.get('sources', [])):
+            source_map.sources.append(root + name)
+            source_map.sources_content.append(contents[index] if index < len(contents) else None)
+
+        state = [0, 0, 0, 0]
+        for line, encoded_line in enumerate(data.get('mappings', '').split(';')):
+            state[0] = 0
+            source_map.lines.append([])
+            for encoded in filter(None, encoded_line.split(',')):
+                values = cls.decode_vlq(encoded)
+                if len(values) < 4:
+                    continue  # Segmento sem origem
+                state = [state[i] + values[i] for i in range(4)]
+                source_map.lines[line].append(tuple(state))
+        return source_map
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def original_position(self, line: int, column: int) -> Optional[Dict[str, Any]]:
+        """
+        Posição original de uma posição gerada (0-based)
+
+        Usa o segmento mais próximo à esquerda na mesma linha; a distância até ele
+        é somada à coluna original (exata em trechos copiados sem alteração).
+
+        Returns:
+            {'source', 'line', 'column'} (0-based) ou None sem mapeamento
+        """
+        if line >= len(self.lines) or not self.lines[line]:
+            return None
+        segments = sorted(self.lines[line])
+        index = bisect.bisect_right([segment[0] for segment in segments], column) - 1
+        if index < 0:
+            index = 0
+        gen_column, source, original_line, original_column = segments[index]
+        return {
+            'source': self.sources[source],
+            'line': original_line,
+            'column': original_column + max(0, column - gen_column)
+        }
+
+    def source_line(self, source: str, line: int) -> Optional[str]:
+        """Linha (0-based) do conteúdo original embutido no mapa"""
+        if source not in self.sources:
+            return None
+        content = self.sources_content[self.sources.index(source)]
+        if content is None:
+            return None
+        lines = content.splitlines()
+        return lines[line] if 0 <= line < len(lines) else None
+
+
+class _LineIndex:
+    """Conversão de deslocamento em (linha, coluna) 0-based"""
+
+    def __init__(self, text: str):
+        self.starts = [0] + [i + 1 for i, char in enumerate(text) if char == '\n']
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        line = bisect.bisect_right(self.starts, offset) - 1
+        return line, offset - self.starts[line]
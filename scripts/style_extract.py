@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Extração dos estilos injetados em tempo de execução para folhas estáticas
+Move o CSS dos template strings dos content scripts para content_scripts.css do dist/
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from js_source import JsSource
+from minify import PageMinifier
+
+
+class StyleExtractor:
+    """Classe responsável por extrair CSS dos scripts e registrá-lo no manifest do dist/"""
+
+    # Método que devolve/injeta o CSS → arquivo gerado; os métodos em 'stubs' viram no-op
+    EXTRACTIONS = [
+        {
+            'script': 'src/core/AlertSystem.js',
+            'css_method': 'getAlertStyles',
+            'output': 'src/styles/alertSystem.min.css',
+            'stubs': {'getAlertStyles': "return '';", 'injectStyles': ''}
+        },
+        {
+            'script': 'src/core/FormDataReuser.js',
+            'css_method': 'addReusePopupStyles',
+            'output': 'src/styles/formDataReuser.min.css',
+            'stubs': {'addReusePopupStyles': ''}
+        }
+    ]
+
+    STUB_COMMENT = '// Estilos empacotados em content_scripts.css (scripts/style_extract.py)'
+
+    def __init__(self, extractions: Optional[List[Dict[str, Any]]] = None):
+        """
+        Inicializa o StyleExtractor
+
+        Args:
+            extractions: Regras de extração (padrão: EXTRACTIONS)
+        """
+        self.extractions = extractions if extractions is not None else self.EXTRACTIONS
+
+    def apply(self, dist_dir: Path) -> Dict[str, Any]:
+        """
+        Extrai os estilos dos scripts do dist/ e atualiza o manifest.json
+
+        Regras cujo método não é encontrado (ex: código refatorado) são ignoradas
+        com aviso, mantendo a injeção em tempo de execução daquele script.
+
+        Args:
+            dist_dir: Diretório de distribuição
+
+        Returns:
+            Dicionário com 'changed' (caminho → conteúdo gravado), 'styles',
+            'skipped' e bytes de JS removidos
+        """
+        dist_dir = Path(dist_dir)
+        changed: Dict[str, bytes] = {}
+        styles = []
+        skipped = []
+        js_saved = 0
+
+        for rule in self.extractions:
+            script_path = dist_dir / rule['script']
+            if not script_path.exists():
+                skipped.append({'script': rule['script'], 'reason': 'script ausente'})
+                continue
+
+            source = script_path.read_text(encoding='utf-8')
+            try:
+                css, new_source = self.extract(source, rule['css_method'], rule['stubs'])
+            except ValueError as error:
+                skipped.append({'script': rule['script'], 'reason': str(error)})
+                continue
+
+            css_bytes = PageMinifier.minify_css(css).encode('utf-8')
+            js_bytes = new_source.encode('utf-8')
+            js_saved += len(source.encode('utf-8')) - len(js_bytes)
+            changed[rule['script']] = js_bytes
+            changed[rule['output']] = css_bytes
+            styles.append({
+                'script': rule['script'],
+                'output': rule['output'],
+                'css_bytes': len(css_bytes),
+                'original_css_bytes': len(css.encode('utf-8'))
+            })
+
+        if styles:
+            manifest_path = dist_dir / 'manifest.json'
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            manifest = self.register_styles(manifest, styles)
+            changed['manifest.json'] = json.dumps(manifest, indent=4, ensure_ascii=False).encode('utf-8')
+
+        for name, data in changed.items():
+            path = dist_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Troca atômica: etapas paralelas do build podem estar lendo o manifest.json
+            temp_path = path.with_name(f"{path.name}.tmp")
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+
+        return {'changed': changed, 'styles': styles, 'skipped': skipped, 'js_bytes_saved': js_saved}
+
+    def extract(self, source: str, css_method: str, stubs: Dict[str, str]) -> Tuple[str, str]:
+        """
+        Obtém o CSS de um método e troca os corpos dos métodos indicados por no-ops
+
+        Args:
+            source: Código do script
+            css_method: Método cujo maior template string é o CSS
+            stubs: Método → corpo substituto
+
+        Returns:
+            Tupla (css, código_transformado)
+
+        Raises:
+            ValueError: Se um método ou o CSS não forem encontrados
+        """
+        js = JsSource(source)
+        open_brace, close_brace = self._method_body(js, css_method)
+
+        css = None
+        position = js.code.find('`', open_brace, close_brace)
+        while position >= 0:
+            end = js.code.find('`', position + 1, close_brace)
+            if end < 0:
+                break
+            value = js.string_value(position, end + 1)
+            if value is not None and (css is None or len(value) > len(css)):
+                css = value
+            position = js.code.find('`', end + 1, close_brace)
+        if not css or not css.strip():
+            raise ValueError(f"CSS não encontrado em {css_method}()")
+
+        bodies = sorted((self._method_body(js, name) + (body,) for name, body in stubs.items()), reverse=True)
+        for open_brace, close_brace, body in bodies:
+            indent = self._indent_of(source, open_brace)
+            lines = [self.STUB_COMMENT] + ([body] if body else [])
+            replacement = ''.join(f"\n{indent}    {line}" for line in lines) + f"\n{indent}"
+            source = source[:open_brace + 1] + replacement + source[close_brace:]
+        return css, source
+
+    @staticmethod
+    def _method_body(js: JsSource, name: str) -> Tuple[int, int]:
+        """Posições das chaves do corpo de um método de classe"""
+        for match in re.finditer(rf'^[ \t]*(?:async\s+)?{re.escape(name)}\s*\(', js.code, re.MULTILINE):
+            close_paren = js.pairs.get(match.end() - 1)
+            if close_paren is None:
+                continue
+            open_brace = js.skip_whitespace(close_paren + 1)
+            if js.code[open_brace:open_brace + 1] == '{' and open_brace in js.pairs:
+                return open_brace, js.pairs[open_brace]
+        raise ValueError(f"Método {name}() não encontrado")
+
+    @staticmethod
+    def _indent_of(source: str, position: int) -> str:
+        """Indentação da linha que contém a posição"""
+        line_start = source.rfind('\n', 0, position) + 1
+        line = source[line_start:position]
+        return line[:len(line) - len(line.lstrip())]
+
+    @staticmethod
+    def register_styles(manifest: Dict[str, Any], styles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Adiciona as folhas geradas aos content_scripts que carregam cada script
+
+        Args:
+            manifest: Manifest do dist/
+            styles: Estilos extraídos (script, output)
+
+        Returns:
+            Manifest atualizado
+        """
+        manifest = dict(manifest)
+        content_scripts = []
+        for content_script in manifest.get('content_scripts', []):
+            content_script = dict(content_script)
+            css = list(content_script.get('css', []))
+            for style in styles:
+                if style['script'] in content_script.get('js', []) and style['output'] not in css:
+                    css.append(style['output'])
+            if css:
+                content_script['css'] = css
+            content_scripts.append(content_script)
+        manifest['content_scripts'] = content_scripts
+        return manifest
+
+
+def main():
+    """Função principal do script"""
+    if len(sys.argv) != 2:
+        print("Uso: python scripts/style_extract.py <diretório dist>")
+        return 1
+
+    result = StyleExtractor().apply(Path(sys.argv[1]))
+    for style in result['styles']:
+        print(f"🎨 {style['script']} → {style['output']} "
+              f"({style['original_css_bytes']} → {style['css_bytes']} bytes)")
+    for skipped in result['skipped']:
+        print(f"⚠️ {skipped['script']}: {skipped['reason']}")
+    print(f"📉 JS reduzido em {result['js_bytes_saved']} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Simbolização de stack traces da extensão
+Traduz posições dos arquivos transformados pelo build para o código-fonte original
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import argparse
+import json
+import posixpath
+import re
+import sys
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from artifact_store import ArtifactStore
+from sourcemap import SourceMap
+
+
+class StackSymbolicator:
+    """Classe responsável por reescrever os frames de um stack trace usando os source maps de uma versão"""
+
+    # chrome-extension://<id>/src/core/AlertSystem.js:120:15 (e equivalentes do Firefox/Safari)
+    FRAME_PATTERN = re.compile(r'(?:chrome|moz|safari-web)-extension://[^/\s]+/([^:\s)]+):(\d+):(\d+)')
+
+    def __init__(self, maps: Dict[str, SourceMap]):
+        """
+        Inicializa o StackSymbolicator
+
+        Args:
+            maps: Caminho no pacote → SourceMap
+        """
+        self.maps = maps
+
+    @classmethod
+    def from_zip(cls, zip_path: Path) -> 'StackSymbolicator':
+        """Carrega os mapas de um sourcemaps-v<versão>.zip"""
+        maps = {}
+        with zipfile.ZipFile(zip_path) as archive:
+            for name in archive.namelist():
+                if name.endswith('.map'):
+                    maps[name[:-len('.map')]] = SourceMap.from_dict(json.loads(archive.read(name)))
+        return cls(maps)
+
+    @staticmethod
+    def find_maps(project_root: Path, version: str) -> Optional[Path]:
+        """
+        Localiza o ZIP de source maps de uma versão (store de artefatos ou raiz do projeto)
+
+        Returns:
+            Caminho do ZIP ou None
+        """
+        artifact = ArtifactStore(project_root / "build").find_by_version(version)
+        candidates = [project_root / f"sourcemaps-v{version}.zip"]
+        if artifact:
+            candidates.insert(0, Path(artifact['path']) / f"sourcemaps-v{version}.zip")
+        return next((path for path in candidates if path.exists()), None)
+
+    def resolve(self, path: str, line: int, column: int) -> Optional[Dict[str, Any]]:
+        """
+        Posição original de um frame (linha e coluna 1-based, como nos stack traces)
+
+        Returns:
+            {'source', 'line', 'column', 'code'} (1-based) ou None se o arquivo não foi transformado
+        """
+        source_map = self.maps.get(path)
+        if source_map is None or line < 1 or column < 1:
+            return None
+        position = source_map.original_position(line - 1, column - 1)
+        if position is None:
+            return None
+        code = source_map.source_line(position['source'], position['line'])
+        return {
+            'source': posixpath.normpath(posixpath.join(posixpath.dirname(path), position['source'])),
+            'line': position['line'] + 1,
+            'column': position['column'] + 1,
+            'code': code.strip() if code else None
+        }
+
+    def symbolicate(self, trace: str, show_code: bool = False) -> str:
+        """
+        Reescreve as posições dos frames mapeados; os demais ficam inalterados
+
+        Args:
+            trace: Stack trace colado (console, relatório de erro, ...)
+            show_code: Acrescenta a linha original abaixo de cada frame traduzido
+
+        Returns:
+            Stack trace simbolizado
+        """
+        output = []
+        for trace_line in trace.splitlines():
+            codes = []
+
+            def replace(match: re.Match) -> str:
+                resolved = self.resolve(match.group(1), int(match.group(2)), int(match.group(3)))
+                if resolved is None:
+                    return match.group(0)
+                if resolved['code']:
+                    codes.append(resolved['code'])
+                prefix = match.group(0)[:match.start(1) - match.start(0)]
+                return f"{prefix}{resolved['source']}:{resolved['line']}:{resolved['column']}"
+
+            output.append(self.FRAME_PATTERN.sub(replace, trace_line))
+            if show_code:
+                indent = trace_line[:len(trace_line) - len(trace_line.lstrip())]
+                output.extend(f"{indent}    > {code}" for code in codes)
+        return '\n'.join(output)
+
+
+def main():
+    """Função principal do script"""
+    parser = argparse.ArgumentParser(description='Simboliza um stack trace com os source maps de uma versão')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--version', help='Versão da extensão (busca sourcemaps-v<versão>.zip no build/)')
+    source.add_argument('--maps', help='Caminho de um sourcemaps-v<versão>.zip (ex: baixado do release)')
+    parser.add_argument('trace', nargs='?', help='Arquivo com o stack trace (padrão: entrada padrão)')
+    parser.add_argument('--code', action='store_true', help='Exibe a linha original de cada frame traduzido')
+    args = parser.parse_args()
+
+    if args.maps:
+        maps_path = Path(args.maps)
+    else:
+        maps_path = StackSymbolicator.find_maps(Path(__file__).parent.parent, args.version)
+        if maps_path is None:
+            print(f"❌ Source maps da versão {args.version} não encontrados", file=sys.stderr)
+            return 1
+
+    try:
+        symbolicator = StackSymbolicator.from_zip(maps_path)
+        trace = Path(args.trace).read_text(encoding='utf-8') if args.trace else sys.stdin.read()
+    except (OSError, zipfile.BadZipFile, ValueError) as error:
+        print(f"❌ Erro: {error}", file=sys.stderr)
+        return 1
+
+    print(symbolicator.symbolicate(trace, args.code))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Grafo de tarefas do build
+Executa tarefas com dependências declaradas em um pool de threads, pula as
+atualizadas e calcula o caminho crítico
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import hashlib
+import io
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from integrity import IntegrityChecker
+
+
+class Task:
+    """Tarefa do grafo: ação, dependências e (opcionalmente) entradas/saídas declaradas"""
+
+    def __init__(self, name: str, action: Callable[[Dict[str, Any]], Any], deps: List[str],
+                 inputs: Optional[Callable[[], List[Path]]] = None,
+                 outputs: Optional[Callable[[], List[Path]]] = None, key: str = ''):
+        self.name = name
+        self.action = action
+        self.deps = list(deps)
+        self.inputs = inputs
+        self.outputs = outputs
+        self.key = key
+        self.status = 'pending'  # pending → done | skipped | failed
+        self.result = None
+        self.start = None
+        self.seconds = 0.0
+
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout que separa o que cada tarefa imprime (exibido inteiro ao fim dela)"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, 'buffer', None)
+        (buffer if buffer is not None else self.stream).write(text)
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class TaskGraph:
+    """Classe responsável por agendar as tarefas do build respeitando as dependências"""
+
+    STATE_PREFIX = 'task:'
+
+    def __init__(self, jobs: Optional[int] = None, build_cache=None, root: Optional[Path] = None,
+                 events=None):
+        """
+        Inicializa o TaskGraph
+
+        Args:
+            jobs: Tarefas simultâneas (padrão: número de CPUs)
+            build_cache: BuildCache onde ficam os carimbos das tarefas com entradas declaradas
+            root: Raiz usada para nomear as entradas no carimbo
+            events: BuildEventLog que recebe 'stage.start'/'stage.end' de cada tarefa
+        """
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.build_cache = build_cache
+        self.root = Path(root) if root else None
+        self.events = events
+        self.integrity = IntegrityChecker()
+        self.tasks: Dict[str, Task] = {}
+        self._started = None
+        self._finished = None
+
+    def add(self, name: str, action: Callable[[Dict[str, Any]], Any], deps: Optional[List[str]] = None,
+            inputs: Optional[Callable[[], List[Path]]] = None,
+            outputs: Optional[Callable[[], List[Path]]] = None, key: str = '') -> Task:
+        """
+        Adiciona uma tarefa
+
+        Tarefas com 'inputs' são puladas quando o carimbo (digests das entradas +
+        'key') é igual ao da última execução bem-sucedida e todas as 'outputs'
+        existem; o resultado gravado é reaproveitado e, por isso, deve ser
+        serializável em JSON.
+
+        Args:
+            name: Nome único
+            action: Função que recebe {dependência: resultado} e devolve o resultado
+            deps: Tarefas que precisam terminar antes
+            inputs: Arquivos lidos (avaliado na hora de executar)
+            outputs: Arquivos gerados (avaliado na hora de executar)
+            key: Parâmetros que também invalidam o carimbo (ex: modo)
+
+        Returns:
+            Tarefa criada
+
+        Raises:
+            ValueError: Nome repetido ou dependência desconhecida
+        """
+        if name in self.tasks:
+            raise ValueError(f"Tarefa duplicada: {name}")
+        for dep in deps or []:
+            if dep not in self.tasks:
+                raise ValueError(f"Dependência desconhecida de {name}: {dep}")
+        task = Task(name, action, deps or [], inputs, outputs, key)
+        self.tasks[name] = task
+        return task
+
+    def result(self, name: str) -> Any:
+        """Resultado de uma tarefa já executada"""
+        return self.tasks[name].result
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+
+    def run(self, goals: List[str]) -> Dict[str, Any]:
+        """
+        Executa as tarefas necessárias para os objetivos (e só elas)
+
+        Pode ser chamado várias vezes no mesmo grafo: tarefas concluídas não rodam
+        de novo. A saída de cada tarefa é exibida de uma vez quando ela termina.
+
+        Args:
+            goals: Tarefas desejadas
+
+        Returns:
+            Mapa objetivo → resultado
+
+        Raises:
+            Exception: Primeiro erro de uma tarefa (as já iniciadas terminam antes)
+        """
+        needed = []
+        self._collect(goals, needed, set())
+        waiting = {name: {dep for dep in self.tasks[name].deps if self.tasks[dep].status == 'pending'}
+                   for name in needed}
+        ready = [name for name in needed if not waiting[name]]
+        error = None
+
+        if self._started is None:
+            self._started = time.perf_counter()
+
+        output = _ThreadOutput(sys.stdout)
+        previous_stdout, sys.stdout = sys.stdout, output
+        try:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                running = {}
+                while ready or running:
+                    while ready and error is None and len(running) < self.jobs:
+                        name = ready.pop(0)
+                        running[executor.submit(self._execute, self.tasks[name], output)] = name
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        task_error, text = future.result()
+                        output.stream.write(text)
+                        if task_error is not None:
+                            error = error or task_error
+                            continue
+                        for other in needed:
+                            if name in waiting[other]:
+                                waiting[other].discard(name)
+                                if not waiting[other] and self.tasks[other].status == 'pending':
+                                    ready.append(other)
+        finally:
+            sys.stdout = previous_stdout
+            self._finished = time.perf_counter()
+            if self.build_cache is not None:
+                self.build_cache.save()
+
+        if error is not None:
+            raise error
+        return {name: self.tasks[name].result for name in goals}
+
+    def _collect(self, names: List[str], needed: List[str], seen: set):
+        """Fecho das dependências pendentes, em ordem topológica"""
+        for name in names:
+            if name in seen:
+                continue
+            seen.add(name)
+            task = self.tasks[name]
+            if task.status != 'pending':
+                continue
+            self._collect(task.deps, needed, seen)
+            needed.append(name)
+
+    def _execute(self, task: Task, output: _ThreadOutput):
+        """Executa uma tarefa (na thread do pool); devolve (erro, texto impresso)"""
+        output.local.buffer = io.StringIO()
+        task.start = time.perf_counter()
+        error = None
+        if self.events is not None:
+            self.events.emit('stage.start', name=task.name)
+        try:
+            stamp = self._stamp(task)
+            stored = self.build_cache.get_state(self.STATE_PREFIX + task.name) if stamp else None
+            if stored and stored.get('stamp') == stamp and self._outputs_exist(task):
+                task.result = stored.get('result')
+                task.status = 'skipped'
+                print(f"⏭️ {task.name}: atualizada (entradas inalteradas)")
+            else:
+                task.result = task.action({dep: self.tasks[dep].result for dep in task.deps})
+                task.status = 'done'
+                if stamp:
+                    self.build_cache.set_state(self.STATE_PREFIX + task.name,
+                                               {'stamp': stamp, 'result': task.result})
+        except Exception as task_error:
+            task.status = 'failed'
+            error = task_error
+        finally:
+            task.seconds = time.perf_counter() - task.start
+            if self.events is not None:
+                self.events.emit('stage.end', name=task.name, status=task.status, seconds=round(task.seconds, 4))
+            text = output.local.buffer.getvalue()
+            output.local.buffer = None
+        return error, text
+
+    def _stamp(self, task: Task) -> Optional[str]:
+        """Carimbo das entradas declaradas (None se a tarefa não declara entradas)"""
+        if task.inputs is None or self.build_cache is None:
+            return None
+        files = {}
+        for path in task.inputs():
+            path = Path(path)
+            try:
+                name = path.relative_to(self.root).as_posix() if self.root else path.as_posix()
+            except ValueError:
+                name = path.as_posix()
+            files[name] = path
+        digests = self.integrity.compute_digests(files, self.build_cache)
+        digest = hashlib.sha256(f"{task.key}\n".encode('utf-8'))
+        for name in sorted(digests):
+            digest.update(f"{name}\0{digests[name]}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _outputs_exist(task: Task) -> bool:
+        """Se todas as saídas declaradas existem"""
+        return task.outputs is None or all(Path(path).exists() for path in task.outputs())
+
+    # ------------------------------------------------------------------
+    # Relatório
+    # ------------------------------------------------------------------
+
+    def critical_path(self) -> Dict[str, Any]:
+        """
+        Cadeia de dependências mais longa entre as tarefas executadas
+
+        Returns:
+            {'tasks': [nomes], 'seconds': soma da cadeia, 'wall_seconds': tempo total}
+        """
+        finish = {}
+        previous = {}
+        for name, task in self.tasks.items():  # ordem de inserção já é topológica
+            if task.status == 'pending':
+                continue
+            deps = [dep for dep in task.deps if dep in finish]
+            best = max(deps, key=lambda dep: finish[dep], default=None)
+            finish[name] = task.seconds + (finish[best] if best else 0.0)
+            previous[name] = best
+
+        chain = []
+        name = max(finish, key=finish.get, default=None)
+        total = finish.get(name, 0.0)
+        while name:
+            chain.append(name)
+            name = previous[name]
+
+        wall = (self._finished - self._started) if self._started is not None else 0.0
+        return {'tasks': chain[::-1], 'seconds': round(total, 4), 'wall_seconds': round(wall, 4)}
+
+    def report(self) -> Dict[str, Any]:
+        """Status e duração de cada tarefa executada, com o caminho crítico"""
+        return {
+            'jobs': self.jobs,
+            'tasks': {name: {'status': task.status, 'seconds': round(task.seconds, 4)}
+                      for name, task in self.tasks.items() if task.status != 'pending'},
+            'critical_path': self.critical_path()
+        }
+
+    def print_report(self):
+        """Exibe as tarefas mais lentas e o caminho crítico"""
+        report = self.report()
+        path = report['critical_path']
+        slowest = sorted(report['tasks'].items(), key=lambda item: item[1]['seconds'], reverse=True)[:5]
+        print(f"⏱️ Tarefas mais lentas (jobs={report['jobs']}): " +
+              ', '.join(f"{name} {info['seconds']:.3f}s" for name, info in slowest))
+        print(f"🧭 Caminho crítico: {' → '.join(path['tasks'])} "
+              f"({path['seconds']:.3f}s de {path['wall_seconds']:.3f}s)")
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Pacotes por órgão (MAPA, MT, ...)
+Carrega tenants.json e gera a configuração padrão pré-compilada e o manifest restrito
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import copy
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+
+class TenantConfig:
+    """Classe responsável pelas configurações de build por órgão"""
+
+    CONFIG_VERSION = 1
+
+    # Arquivo gerado incluído em todos os pacotes (nulo no pacote genérico)
+    DEFAULT_CONFIG_PATH = 'src/generated/defaultConfig.js'
+
+    # ID do pacote Firefox de cada órgão (sobrescrito por 'geckoId' em tenants.json)
+    GECKO_ID_TEMPLATE = 'help-otrs-{code}@helpotrs'
+    GECKO_ID_PATTERN = re.compile(r'[A-Za-z0-9._+-]+@[A-Za-z0-9._-]+')
+
+    # Configuração base (mesma de background.js / ConfigManager.getDefaultConfig)
+    BASE_CONFIG = {
+        'otrs_systems': [],
+        'features': {
+            'alertsEnabled': True,
+            'typeOfServiceAlerts': True,
+            'serviceClassificationAlerts': True,
+            'queueValidation': True,
+            'formDataReuser': True
+        },
+        'advanced': {
+            'delayTime': 500
+        }
+    }
+
+    def __init__(self, config_path: Path):
+        """
+        Inicializa o TenantConfig
+
+        Args:
+            config_path: Caminho do tenants.json
+        """
+        self.config_path = Path(config_path)
+        self._tenants: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def tenants(self) -> Dict[str, Dict[str, Any]]:
+        """Órgãos definidos no arquivo (carregados sob demanda)"""
+        if self._tenants is None:
+            self._tenants = self._load()
+        return self._tenants
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Carrega e valida tenants.json
+
+        Returns:
+            Mapa código → configuração do órgão
+
+        Raises:
+            ValueError: Se o arquivo for inválido
+        """
+        if not self.config_path.exists():
+            raise FileNotFoundError(f"Arquivo de órgãos não encontrado: {self.config_path}")
+
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('version') != self.CONFIG_VERSION:
+            raise ValueError(f"Versão de {self.config_path.name} incompatível: {data.get('version')}")
+
+        tenants = data.get('tenants', {})
+        for code, tenant in tenants.items():
+            systems = tenant.get('systems', [])
+            if not systems:
+                raise ValueError(f"Órgão {code} sem sistemas OTRS configurados")
+            for system in systems:
+                parsed = urlparse(system.get('baseUrl', ''))
+                if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+                    raise ValueError(f"Órgão {code}: URL base inválida: {system.get('baseUrl')}")
+                if not system.get('id') or not system.get('name'):
+                    raise ValueError(f"Órgão {code}: sistema sem 'id' ou 'name'")
+            if 'geckoId' in tenant and not self.GECKO_ID_PATTERN.fullmatch(str(tenant['geckoId'])):
+                raise ValueError(f"Órgão {code}: geckoId inválido: {tenant['geckoId']}")
+
+        gecko_ids = [tenant.get('geckoId') or self.GECKO_ID_TEMPLATE.format(code=code.lower())
+                     for code, tenant in tenants.items()]
+        if len(set(gecko_ids)) != len(gecko_ids):
+            raise ValueError(f"{self.config_path.name}: órgãos com o mesmo geckoId")
+
+        return tenants
+
+    def resolve(self, selection: str) -> List[str]:
+        """
+        Resolve a seleção de órgãos da linha de comando
+
+        Args:
+            selection: Códigos separados por vírgula ou "all"
+
+        Returns:
+            Lista de códigos
+
+        Raises:
+            ValueError: Se algum código não existir
+        """
+        if selection == 'all':
+            return list(self.tenants)
+
+        codes = [code.strip().upper() for code in selection.split(',') if code.strip()]
+        unknown = [code for code in codes if code not in self.tenants]
+        if unknown:
+            raise ValueError(f"Órgãos desconhecidos: {', '.join(unknown)} "
+                             f"(disponíveis: {', '.join(self.tenants)})")
+        return codes
+
+    def build_default_config(self, code: str, version: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Monta a configuração padrão de um órgão
+
+        Args:
+            code: Código do órgão (ex: MAPA)
+            version: Versão do pacote (manifest.json), gravada em 'version'
+
+        Returns:
+            Configuração no formato de helpOtrsConfig
+        """
+        tenant = self.tenants[code]
+        config = copy.deepcopy(self.BASE_CONFIG)
+
+        config['otrs_systems'] = [
+            {
+                'id': system['id'],
+                'name': system['name'],
+                'baseUrl': system['baseUrl'] if system['baseUrl'].endswith('/') else system['baseUrl'] + '/',
+                **({'userProfile': system['userProfile']} if system.get('userProfile') else {}),
+                'enabled': system.get('enabled', True)
+            }
+            for system in tenant['systems']
+        ]
+        config['features'].update(tenant.get('features', {}))
+        config['advanced'].update(tenant.get('advanced', {}))
+        config['tenant'] = code
+        if version:
+            config['version'] = version
+
+        return config
+
+    def gecko_id(self, code: str) -> str:
+        """
+        ID do pacote Firefox do órgão (browser_specific_settings.gecko.id)
+
+        Cada órgão tem o seu, de modo que os pacotes podem ser instalados lado
+        a lado e publicados separadamente.
+
+        Args:
+            code: Código do órgão
+
+        Returns:
+            'geckoId' de tenants.json ou help-otrs-<código>@helpotrs
+        """
+        return self.tenants[code].get('geckoId') or self.GECKO_ID_TEMPLATE.format(code=code.lower())
+
+    def get_match_patterns(self, code: str) -> List[str]:
+        """
+        Padrões de URL (match patterns) restritos aos sistemas do órgão
+
+        Args:
+            code: Código do órgão
+
+        Returns:
+            Lista de padrões (ex: https://host/otrs/*)
+        """
+        patterns = []
+        for system in self.tenants[code]['systems']:
+            parsed = urlparse(system['baseUrl'])
+            path = parsed.path if parsed.path.endswith('/') else parsed.path + '/'
+            pattern = f"{parsed.scheme}://{parsed.hostname}{path}*"
+            if pattern not in patterns:
+                patterns.append(pattern)
+        return patterns
+
+    def transform_manifest(self, manifest: Dict[str, Any], code: str) -> Dict[str, Any]:
+        """
+        Restringe host_permissions e matches aos sistemas do órgão
+
+        Args:
+            manifest: Manifest original
+            code: Código do órgão
+
+        Returns:
+            Manifest do órgão
+        """
+        tenant = self.tenants[code]
+        patterns = self.get_match_patterns(code)
+
+        tenant_manifest = copy.deepcopy(manifest)
+        tenant_manifest['host_permissions'] = patterns
+        for content_script in tenant_manifest.get('content_scripts', []):
+            content_script['matches'] = patterns
+
+        if tenant.get('name'):
+            tenant_manifest['name'] = tenant['name']
+            if 'action' in tenant_manifest:
+                tenant_manifest['action']['default_title'] = \
+                    f"{tenant['name']} | Clique para abrir as configurações"
+
+        return tenant_manifest
+
+    def render_default_config(self, code: Optional[str] = None, version: Optional[str] = None) -> bytes:
+        """
+        Gera src/generated/defaultConfig.js
+
+        Args:
+            code: Código do órgão (None gera o arquivo genérico, sem sistemas)
+            version: Versão do pacote (manifest.json) gravada na configuração do órgão
+
+        Returns:
+            Conteúdo do módulo JS
+        """
+        if code is None:
+            value = 'null'
+            description = (" * O pacote genérico não traz sistemas OTRS (configuração manual);\n"
+                           " * pacotes por órgão (--tenants) substituem este arquivo com os\n"
+                           " * sistemas definidos em tenants.json.\n")
+        else:
+            config = self.build_default_config(code, version)
+            value = json.dumps(config, indent=4, ensure_ascii=False).replace('\n', '\n    ')
+            description = f" * Pacote do órgão {code}: {len(config['otrs_systems'])} sistema(s) OTRS.\n"
+
+        return (
+            "/**\n"
+            " * Configuração padrão pré-compilada\n"
+            " * \n"
+            " * Arquivo gerado por scripts/build.py - não editar manualmente.\n"
+            f"{description}"
+            " */\n"
+            "\n"
+            "(function(global) {\n"
+            "    'use strict';\n"
+            "\n"
+            "    global.HelpOTRS = global.HelpOTRS || {};\n"
+            f"    global.HelpOTRS.defaultConfig = {value};\n"
+            "\n"
+            "})(globalThis);\n"
+        ).encode('utf-8')
@@ -151,6 +151,77 @@ class VersionBumper:
         }
         return descriptions.get(bump_type, 'Atualização')
     
+    def preview_version(self, bump_type: str = 'patch', manifest: dict = None) -> dict:
+        """
+        Calcula a próxima versão sem alterar nenhum arquivo
+        
+        Args:
+            bump_type: Tipo de incremento ('major', 'minor', 'patch')
+            manifest: Conteúdo do manifest.json (carregado se não informado)
+            
+        Returns:
+            Dicionário com informações da versão (mesmo formato de bump_version)
+        """
+        if manifest is None:
+            manifest = self.load_json_file(self.manifest_path)
+        
+        # Extrair e validar versão atual
+        current_version_str = manifest.get('version')
+        if not current_version_str:
+            raise ValueError("Campo 'version' não encontrado em manifest.json")
+            
+        current_version = self.parse_version(current_version_str)
+        
+        # Calcular nova versão
+        new_version = self.calculate_new_version(current_version, bump_type)
+        new_version_str = '.'.join(map(str, new_version))
+        version_description = self.get_version_description(bump_type)
+        
+        # Preparar entrada do changelog
+        changelog_entry = f"""
+## [{new_version_str}] - {self.get_current_date()}
+
+### 🔧 Alterado
+- Versão incrementada automaticamente ({bump_type})
+- {version_description}
+
+### 📋 Notas de Desenvolvimento
+- Build automático executado
+- Versão atualizada via script Python
+"""
+        
+        return {
+            'version': new_version_str,
+            'previous_version': current_version_str,
+            'type': bump_type,
+            'description': version_description,
+            'date': self.get_current_date(),
+            'datetime': self.get_current_datetime(),
+            'changelog_entry': changelog_entry
+        }
+    
+    def current_version_info(self) -> dict:
+        """
+        Informações da versão atual, para builds sem incremento
+        
+        Returns:
+            Dicionário com informações da versão (mesmo formato de bump_version)
+        """
+        manifest = self.load_json_file(self.manifest_path)
+        version = manifest.get('version')
+        if not version:
+            raise ValueError("Campo 'version' não encontrado em manifest.json")
+        
+        return {
+            'version': version,
+            'previous_version': version,
+            'type': 'current',
+            'description': 'Rebuild da versão atual',
+            'date': self.get_current_date(),
+            'datetime': self.get_current_datetime(),
+            'changelog_entry': 'Ver CHANGELOG.md para detalhes'
+        }
+    
     def bump_version(self, bump_type: str = 'patch') -> dict:
         """
         Incrementa versão nos arquivos manifest.json e package.json
@@ -175,19 +246,12 @@ class VersionBumper:
         manifest = self.load_json_file(self.manifest_path)
         package = self.load_json_file(self.package_path)
         
-        # Extrair e validar versão atual
-        current_version_str = manifest.get('version')
-        if not current_version_str:
-            raise ValueError("Campo 'version' não encontrado em manifest.json")
-            
-        current_version = self.parse_version(current_version_str)
-        print(f"📋 Versão atual: {current_version_str}")
-        
         # Calcular nova versão
-        new_version = self.calculate_new_version(current_version, bump_type)
-        new_version_str = '.'.join(map(str, new_version))
-        version_description = self.get_version_description(bump_type)
+        version_info = self.preview_version(bump_type, manifest)
+        new_version_str = version_info['version']
+        version_description = version_info['description']
         
+        print(f"📋 Versão atual: {version_info['previous_version']}")
         print(f"📈 Nova versão: {new_version_str}")
         print(f"📝 Descrição: {version_description}")
         
@@ -207,32 +271,11 @@ class VersionBumper:
         print(f"   📄 manifest.json → {new_version_str}")
         print(f"   📄 package.json → {new_version_str}")
         
-        # Preparar entrada do changelog
-        changelog_entry = f"""
-## [{new_version_str}] - {self.get_current_date()}
-
-### 🔧 Alterado
-- Versão incrementada automaticamente ({bump_type})
-- {version_description}
-
-### 📋 Notas de Desenvolvimento
-- Build automático executado
-- Versão atualizada via script Python
-"""
-
         print("━" * 50)
         print("💡 Lembre-se de atualizar o CHANGELOG.md com:")
-        print(changelog_entry)
+        print(version_info['changelog_entry'])
         
-        return {
-            'version': new_version_str,
-            'previous_version': current_version_str,
-            'type': bump_type,
-            'description': version_description,
-            'date': self.get_current_date(),
-            'datetime': self.get_current_datetime(),
-            'changelog_entry': changelog_entry
-        }
+        return version_info
     
     def update_changelog(self, version_info: dict) -> bool:
         """
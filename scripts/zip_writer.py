@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Escrita de ZIP com membros pré-comprimidos
+Permite reaproveitar dados deflate em cache sem recomprimir os arquivos
+
+Autor: Charllys Fernandes
+Data: 2026-10-18
+"""
+
+import struct
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, List, Tuple, Union
+
+
+class PrecompressedZipWriter:
+    """Classe responsável por montar ZIPs a partir de dados já comprimidos"""
+
+    LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+    CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+    END_RECORD = struct.Struct('<IHHHHIIH')
+
+    LOCAL_SIGNATURE = 0x04034b50
+    CENTRAL_SIGNATURE = 0x02014b50
+    END_SIGNATURE = 0x06054b50
+
+    # Versão 2.0 (deflate); criado em sistema Unix
+    VERSION_NEEDED = 20
+    VERSION_MADE_BY = (3 << 8) | 20
+
+    # Bit 11: nomes em UTF-8
+    FLAG_UTF8 = 0x800
+
+    # Limites do formato sem ZIP64
+    MAX_SIZE = 0xFFFFFFFF
+    MAX_ENTRIES = 0xFFFF
+
+    def __init__(self, zip_path: Union[Path, BinaryIO]):
+        """
+        Inicializa o PrecompressedZipWriter
+
+        Args:
+            zip_path: Caminho do ZIP a criar ou arquivo binário já aberto
+                      (ex: SpooledTemporaryFile), que não é fechado ao final
+        """
+        self._stream = zip_path if hasattr(zip_path, 'write') else None
+        self.zip_path = None if self._stream is not None else Path(zip_path)
+        self._fp = None
+        self._central: List[bytes] = []
+
+    def __enter__(self):
+        self._fp = self._stream if self._stream is not None else open(self.zip_path, 'wb')
+        self._base = self._fp.tell() if self._stream is not None else 0
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._write_end_record()
+        finally:
+            if self._stream is None:
+                self._fp.close()
+
+    @staticmethod
+    def _dos_datetime(date_time: Tuple[int, int, int, int, int, int]) -> Tuple[int, int]:
+        """Converte (ano, mês, dia, hora, min, seg) para data/hora DOS"""
+        year, month, day, hour, minute, second = date_time
+        dos_date = (max(year, 1980) - 1980) << 9 | month << 5 | day
+        dos_time = hour << 11 | minute << 5 | second // 2
+        return dos_date, dos_time
+
+    def add_compressed(self, arcname: str, data: bytes, crc: int, file_size: int,
+                       date_time: Tuple[int, int, int, int, int, int], mode: int = 0o100644,
+                       compress_type: int = zipfile.ZIP_DEFLATED):
+        """
+        Adiciona membro cujos dados já estão comprimidos
+
+        Args:
+            arcname: Caminho dentro do ZIP (formato POSIX)
+            data: Dados comprimidos (deflate puro, sem header zlib)
+            crc: CRC-32 do conteúdo original
+            file_size: Tamanho do conteúdo original
+            date_time: Data de modificação (como em zipfile.ZipInfo)
+            mode: Permissões Unix do arquivo
+            compress_type: Método de compressão dos dados
+        """
+        if file_size > self.MAX_SIZE or len(data) > self.MAX_SIZE:
+            raise ValueError(f"Arquivo grande demais para ZIP sem ZIP64: {arcname}")
+        if len(self._central) >= self.MAX_ENTRIES:
+            raise ValueError("Número de arquivos excede o limite do ZIP sem ZIP64")
+
+        name = arcname.encode('utf-8')
+        flags = self.FLAG_UTF8 if not arcname.isascii() else 0
+        dos_date, dos_time = self._dos_datetime(date_time)
+        offset = self._fp.tell() - self._base
+
+        self._fp.write(self.LOCAL_HEADER.pack(
+            self.LOCAL_SIGNATURE, self.VERSION_NEEDED, flags, compress_type,
+            dos_time, dos_date, crc, len(data), file_size, len(name), 0
+        ))
+        self._fp.write(name)
+        self._fp.write(data)
+
+        self._central.append(self.CENTRAL_HEADER.pack(
+            self.CENTRAL_SIGNATURE, self.VERSION_MADE_BY, self.VERSION_NEEDED, flags,
+            compress_type, dos_time, dos_date, crc, len(data), file_size, len(name),
+            0, 0, 0, 0, (mode & 0xFFFF) << 16, offset
+        ) + name)
+
+    def _write_end_record(self):
+        """Escreve o diretório central e o registro final"""
+        start = self._fp.tell() - self._base
+        for entry in self._central:
+            self._fp.write(entry)
+        size = self._fp.tell() - self._base - start
+
+        if start > self.MAX_SIZE:
+            raise ValueError("ZIP grande demais sem ZIP64")
+
+        self._fp.write(self.END_RECORD.pack(
+            self.END_SIGNATURE, 0, 0, len(self._central), len(self._central), size, start, 0
+        ))
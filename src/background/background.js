@@ -18,6 +18,16 @@
  * @since 2024
  */
 
+// Configuração padrão pré-compilada (pacotes por órgão - ver tenants.json)
+// No Firefox o arquivo é carregado via manifest (background.scripts)
+if (typeof importScripts === 'function') {
+    try {
+        importScripts('../generated/defaultConfig.js');
+    } catch (error) {
+        console.warn('Background: Configuração pré-compilada indisponível:', error);
+    }
+}
+
 // Background script para gerenciar configurações
 /**
  * Event listener para quando a extensão é instalada ou atualizada
@@ -30,7 +40,14 @@ chrome.runtime.onInstalled.addListener(function() {
         let needsUpdate = false;
         let config = result.helpOtrsConfig;
         
-        if (!config) {
+        const prebuiltConfig = self.HelpOTRS?.defaultConfig;
+        
+        if (!config && prebuiltConfig) {
+            // Primeira instalação de pacote do órgão - usar sistemas pré-configurados
+            config = JSON.parse(JSON.stringify(prebuiltConfig));
+            needsUpdate = true;
+            console.log(`Background: Configuração do órgão ${prebuiltConfig.tenant} aplicada - sistemas:`, config.otrs_systems.length);
+        } else if (!config) {
             // Primeira instalação - criar configuração vazia para forçar configuração manual
             config = {
                 otrs_systems: [], // Array vazio - usuário deve configurar manualmente
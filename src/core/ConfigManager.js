@@ -18,68 +18,8 @@
             this.selectorCache = new Map(); // Cache para seletores DOM
             this.configLoadPromise = null; // Promise para evitar race conditions
             
-            // Cache do mapeamento de níveis para otimizar performance
-            this.levelMappings = this.initializeLevelMappings();
-        }
-
-        /**
-         * Inicializar mapeamento de níveis de usuário (executado uma vez)
-         * @returns {Object} Mapeamento completo de sinônimos
-         */
-        initializeLevelMappings() {
-            return {
-                // Nível 1 - Variações
-                'nível 1 - serviços aos usuários de tic': 'Nível 1',
-                'nível1 - serviços aos usuários de tic': 'Nível 1',
-                'nivel 1 - serviços aos usuários de tic': 'Nível 1',
-                'nivel1 - serviços aos usuários de tic': 'Nível 1',
-                'nivel 1 - serviços aos usuarios de tic': 'Nível 1',
-                'nivel1 - serviços aos usuarios de tic': 'Nível 1',
-                'técnico remoto': 'Nível 1',
-                'técnico remotox': 'Nível 1',
-                'tecnico remoto': 'Nível 1',
-                'tecnico remotox': 'Nível 1',
-                'remoto': 'Nível 1',
-                'nível 1': 'Nível 1',
-                'nivel 1': 'Nível 1',
-                'n1': 'Nível 1',
-                'l1': 'Nível 1',
-                'level 1': 'Nível 1',
-
-                // Nível 2 - Variações
-                'nível 2 - serviços aos usuários de tic': 'Nível 2',
-                'nível2 - serviços aos usuários de tic': 'Nível 2',
-                'nivel 2 - serviços aos usuários de tic': 'Nível 2',
-                'nivel2 - serviços aos usuários de tic': 'Nível 2',
-                'nivel 2 - serviços aos usuarios de tic': 'Nível 2',
-                'nivel2 - serviços aos usuarios de tic': 'Nível 2',
-                'técnico presencial': 'Nível 2',
-                'técnico presencialx': 'Nível 2',
-                'técnico local': 'Nível 2',
-                'tecnico presencial': 'Nível 2',
-                'tecnico presencialx': 'Nível 2',
-                'tecnico local': 'Nível 2',
-                'local': 'Nível 2',            
-                'presencial': 'Nível 2',
-                'nível 2': 'Nível 2',
-                'nivel 2': 'Nível 2',
-                'n2': 'Nível 2',
-                'l2': 'Nível 2',
-                'level 2': 'Nível 2',
-                
-                // Nível 3 - Variações (incluindo possível variação futura)
-                'nível 3 - serviços aos usuários de tic': 'Nível 3',
-                'nível3 - serviços aos usuários de tic': 'Nível 3',
-                'nivel 3 - serviços aos usuários de tic': 'Nível 3',
-                'nivel3 - serviços aos usuários de tic': 'Nível 3',
-                'nivel 3 - serviços aos usuarios de tic': 'Nível 3',
-                'nivel3 - serviços aos usuarios de tic': 'Nível 3',
-                'nível 3': 'Nível 3',
-                'nivel 3': 'Nível 3',
-                'n3': 'Nível 3',
-                'l3': 'Nível 3',
-                'level 3': 'Nível 3'
-            };
+            // Tabela pré-compilada de níveis (src/generated/levelTable.js)
+            this.levelTable = global.HelpOTRS && global.HelpOTRS.LevelTable;
         }
 
         /**
@@ -104,7 +44,8 @@
         }
 
     /**
-     * Normalizar níveis de usuário (tratar sinônimos) - Versão otimizada
+     * Normalizar níveis de usuário (tratar sinônimos)
+     * Uma dobra (acentos, caixa, espaços) e uma busca na tabela gerada de level-synonyms.json
      * @param {string} level - Nível do usuário
      * @returns {string|null} Nível normalizado
      */
@@ -115,35 +56,11 @@
             
             this.validateParam(level, 'string', 'level');
             
-            const normalizedLevel = level.toLowerCase().trim();
-            
-            // Cache da normalização para evitar reprocessamento
-            const cacheKey = `normalize_${normalizedLevel}`;
-            if (this.selectorCache.has(cacheKey)) {
-                const cached = this.selectorCache.get(cacheKey);
-                if (Date.now() - cached.timestamp < 30000) { // 30 segundos
-                    return cached.value;
-                }
-                this.selectorCache.delete(cacheKey);
-            }
-            
-            // Usar mapeamento pré-inicializado (otimização principal)
-            let mappedLevel = this.levelMappings[normalizedLevel];
-            
-            if (mappedLevel) {
-                console.log(`Help OTRS: Nível "${level}" normalizado para "${mappedLevel}"`);
-            } else {
-                // Se não há mapeamento, retornar o nível original com primeira letra maiúscula
-                mappedLevel = level.charAt(0).toUpperCase() + level.slice(1);
-            }
-            
-            // Cache do resultado
-            this.selectorCache.set(cacheKey, {
-                value: mappedLevel,
-                timestamp: Date.now()
-            });
+            // Sem levelTable.js carregado, todo nível é tratado como desconhecido
+            const mappedLevel = this.levelTable ? this.levelTable.lookup(level) : null;
             
-            return mappedLevel;
+            // Se não há mapeamento, retornar o nível original com primeira letra maiúscula
+            return mappedLevel || level.charAt(0).toUpperCase() + level.slice(1);
             
         } catch (error) {
             console.error('Help OTRS: Erro ao normalizar nível:', error);
@@ -218,6 +135,29 @@
      * @returns {Promise<Object>} Configuração carregada
      */
     async performConfigLoad() {
+        // Pacotes por órgão: configuração pré-compilada disponível antes do storage
+        const prebuiltConfig = this.getPrebuiltConfig();
+        if (prebuiltConfig && !this.config) {
+            this.config = prebuiltConfig;
+            this.validateConfigStructure(this.config);
+            this.detectCurrentOtrsSystem();
+            
+            // Configuração do usuário (storage) substitui a pré-compilada ao chegar
+            this.loadStoredConfig().catch(error => {
+                console.warn('Help OTRS: Mantendo configuração pré-compilada:', error.message);
+            });
+            return this.config;
+        }
+        
+        return this.loadStoredConfig();
+    }
+
+    /**
+     * Carregar configuração do chrome.storage
+     * @private
+     * @returns {Promise<Object>} Configuração carregada
+     */
+    async loadStoredConfig() {
         try {
             console.log('Help OTRS: Iniciando carregamento de configuração...');
             
@@ -240,6 +180,7 @@
             } else {
                 console.log('Help OTRS: Nenhuma configuração encontrada, usando padrões');
                 this.config = this.getDefaultConfig();
+                this.detectCurrentOtrsSystem();
             }
             
             return this.config;
@@ -261,6 +202,11 @@
      * @returns {Object} Configuração padrão
      */
     getDefaultConfig() {
+        const prebuiltConfig = this.getPrebuiltConfig();
+        if (prebuiltConfig) {
+            return prebuiltConfig;
+        }
+        
         return {
             otrs_systems: [],
             features: {
@@ -278,6 +224,23 @@
         };
     }
 
+    /**
+     * Obter configuração pré-compilada do pacote do órgão (src/generated/defaultConfig.js)
+     * @private
+     * @returns {Object|null} Cópia da configuração ou null no pacote genérico
+     */
+    getPrebuiltConfig() {
+        const prebuiltConfig = global.HelpOTRS && global.HelpOTRS.defaultConfig;
+        if (!prebuiltConfig) {
+            return null;
+        }
+        
+        // 'version' vem do build (versão do pacote); não é sobrescrita aqui
+        return Object.assign(JSON.parse(JSON.stringify(prebuiltConfig)), {
+            lastUpdated: Date.now()
+        });
+    }
+
     /**
      * Validar estrutura da configuração carregada
      * @private
@@ -320,6 +283,8 @@
 
     /**
      * Detectar sistema OTRS atual baseado na URL
+     * Usa o matcher pré-compilado (src/generated/otrsMatcher.js): sistemas
+     * indexados por hostname e indicadores OTRS em uma única regex
      * @returns {Object|null} Sistema OTRS detectado
      */
     detectCurrentOtrsSystem() {
@@ -328,95 +293,20 @@
             return null;
         }
 
-        const currentUrl = window.location.href;
-        console.log('Help OTRS: URL atual:', currentUrl);
-        console.log('Help OTRS: Sistemas configurados:', this.config.otrs_systems);
-        
-        this.currentOtrsSystem = this.config.otrs_systems.find(system => {
-            console.log('Help OTRS: Verificando sistema:', system);
-            console.log('Help OTRS: Sistema habilitado:', system.enabled);
-            
-            if (!system.enabled) {
-                console.log('Help OTRS: Sistema desabilitado:', system.name);
-                return false;
-            }
-            
-            try {
-                // Normalizar URLs para comparação
-                const systemUrl = new URL(system.baseUrl);
-                const currentUrlObj = new URL(currentUrl);
-                
-                console.log('Help OTRS: Comparando URLs:', {
-                    sistemaHost: systemUrl.hostname,
-                    sistemaPath: systemUrl.pathname,
-                    sistemaUrl: system.baseUrl,
-                    atualHost: currentUrlObj.hostname,
-                    atualPath: currentUrlObj.pathname,
-                    atualUrl: currentUrl
-                });
-                
-                // Comparar hostname exato
-                const hostnameMatch = systemUrl.hostname === currentUrlObj.hostname;
-                
-                // Verificar se a URL atual contém o caminho do OTRS de forma mais robusta
-                const hasOtrsPath = currentUrl.includes('/otrs/') || 
-                                   currentUrl.includes('index.pl') ||
-                                   currentUrl.includes('Action=Agent') ||
-                                   currentUrlObj.pathname.startsWith('/otrs');
-                
-                // Verificar se o caminho base do sistema está contido na URL atual
-                const pathBasedMatch = systemUrl.pathname !== '/' && 
-                                      currentUrlObj.pathname.startsWith(systemUrl.pathname);
-                
-                console.log('Help OTRS: Verificações detalhadas:', {
-                    hostnameMatch,
-                    hasOtrsPath,
-                    pathBasedMatch,
-                    systemName: system.name,
-                    finalMatch: hostnameMatch && (hasOtrsPath || pathBasedMatch)
-                });
-                
-                return hostnameMatch && (hasOtrsPath || pathBasedMatch);
-                
-            } catch (error) {
-                console.error('Help OTRS: Erro ao processar URL do sistema:', system.baseUrl, error);
-                
-                // Fallback mais robusto: verificar se a URL atual contém partes da URL do sistema
-                const systemHost = system.baseUrl.replace(/https?:\/\//, '').replace(/\/.*$/, '');
-                const urlContainsSystem = currentUrl.includes(systemHost);
-                const hasOtrsIndicators = currentUrl.includes('/otrs/') || 
-                                        currentUrl.includes('index.pl') ||
-                                        currentUrl.includes('Action=Agent');
-                
-                console.log('Help OTRS: Fallback match:', {
-                    systemHost,
-                    urlContainsSystem,
-                    hasOtrsIndicators,
-                    systemName: system.name,
-                    finalMatch: urlContainsSystem && hasOtrsIndicators
-                });
-                
-                return urlContainsSystem && hasOtrsIndicators;
-            }
-        });
+        const matcher = global.HelpOTRS && global.HelpOTRS.OtrsMatcher;
+        if (!matcher) {
+            console.error('Help OTRS: otrsMatcher.js não carregado - verifique o manifest');
+            return null;
+        }
+
+        const { href, hostname, pathname } = window.location;
+        this.currentOtrsSystem = matcher.match(this.config.otrs_systems, href, hostname, pathname);
 
         if (this.currentOtrsSystem) {
             console.log('Help OTRS: Sistema detectado:', this.currentOtrsSystem.name);
         } else {
-            console.log('Help OTRS: Nenhum sistema correspondente encontrado');
-            console.log('Help OTRS: URL atual analisada:', currentUrl);
-            console.log('Help OTRS: Hostname atual:', new URL(currentUrl).hostname);
-            console.log('Help OTRS: Path atual:', new URL(currentUrl).pathname);
-            console.log('Help OTRS: Sistemas disponíveis:', this.config.otrs_systems.map(s => ({
-                name: s.name,
-                enabled: s.enabled,
-                baseUrl: s.baseUrl,
-                hostname: s.baseUrl ? new URL(s.baseUrl).hostname : 'URL inválida'
-            })));
-            
-            // Sugestão para configuração
-            const currentHostname = new URL(currentUrl).hostname;
-            console.log('Help OTRS: Dica - Para habilitar neste site, configure um sistema OTRS com hostname:', currentHostname);
+            console.log('Help OTRS: Nenhum sistema correspondente encontrado para', hostname);
+            console.log('Help OTRS: Dica - Para habilitar neste site, configure um sistema OTRS com hostname:', hostname);
         }
 
         return this.currentOtrsSystem;
@@ -652,7 +542,7 @@
             cacheEntries: Array.from(this.selectorCache.keys()),
             lastConfigLoad: this.configLoadPromise ? 'Loading...' : 'Completed',
             performanceMetrics: {
-                levelMappingsCount: Object.keys(this.levelMappings).length,
+                levelMappingsCount: this.levelTable ? Object.keys(this.levelTable.LEVELS).length : 0,
                 cacheHitRatio: this.calculateCacheHitRatio(),
                 memoryUsage: this.getMemoryUsage()
             }
@@ -676,7 +566,7 @@
      * @returns {Object} Informações de memória
      */
     getMemoryUsage() {
-        const levelMappingSize = JSON.stringify(this.levelMappings).length;
+        const levelMappingSize = this.levelTable ? JSON.stringify(this.levelTable.LEVELS).length : 0;
         const configSize = this.config ? JSON.stringify(this.config).length : 0;
         const cacheSize = JSON.stringify(Array.from(this.selectorCache)).length;
         
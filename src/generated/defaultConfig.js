@@ -0,0 +1,16 @@
+/**
+ * Configuração padrão pré-compilada
+ * 
+ * Arquivo gerado por scripts/build.py - não editar manualmente.
+ * O pacote genérico não traz sistemas OTRS (configuração manual);
+ * pacotes por órgão (--tenants) substituem este arquivo com os
+ * sistemas definidos em tenants.json.
+ */
+
+(function(global) {
+    'use strict';
+
+    global.HelpOTRS = global.HelpOTRS || {};
+    global.HelpOTRS.defaultConfig = null;
+
+})(globalThis);
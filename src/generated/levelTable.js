@@ -0,0 +1,71 @@
+/**
+ * Tabela pré-compilada de normalização de níveis de usuário
+ * 
+ * Arquivo gerado por scripts/codegen.py - não editar manualmente.
+ * 
+ * Gerada a partir de level-synonyms.json (32 variantes).
+ * Normalizar um nível é uma dobra (acentos, caixa, espaços e
+ * pontuação) seguida de uma busca na tabela.
+ */
+
+(function(global) {
+    'use strict';
+
+    // Chave dobrada → nível canônico
+    const LEVELS = Object.freeze({
+        "l1": "Nível 1",
+        "l1servicosaosusuariosdetic": "Nível 1",
+        "l2": "Nível 2",
+        "l2servicosaosusuariosdetic": "Nível 2",
+        "l3": "Nível 3",
+        "l3servicosaosusuariosdetic": "Nível 3",
+        "level1": "Nível 1",
+        "level1servicosaosusuariosdetic": "Nível 1",
+        "level2": "Nível 2",
+        "level2servicosaosusuariosdetic": "Nível 2",
+        "level3": "Nível 3",
+        "level3servicosaosusuariosdetic": "Nível 3",
+        "local": "Nível 2",
+        "n1": "Nível 1",
+        "n1servicosaosusuariosdetic": "Nível 1",
+        "n2": "Nível 2",
+        "n2servicosaosusuariosdetic": "Nível 2",
+        "n3": "Nível 3",
+        "n3servicosaosusuariosdetic": "Nível 3",
+        "nivel1": "Nível 1",
+        "nivel1servicosaosusuariosdetic": "Nível 1",
+        "nivel2": "Nível 2",
+        "nivel2servicosaosusuariosdetic": "Nível 2",
+        "nivel3": "Nível 3",
+        "nivel3servicosaosusuariosdetic": "Nível 3",
+        "presencial": "Nível 2",
+        "remoto": "Nível 1",
+        "tecnicolocal": "Nível 2",
+        "tecnicopresencial": "Nível 2",
+        "tecnicopresencialx": "Nível 2",
+        "tecnicoremoto": "Nível 1",
+        "tecnicoremotox": "Nível 1"
+    });
+
+    /**
+     * Dobrar texto para a chave da tabela (idêntico a CodeGenerator.fold_level)
+     * @param {string} text - Texto original
+     * @returns {string} Chave dobrada
+     */
+    function fold(text) {
+        return text.normalize('NFD').replace(/[\u0300-\u036f]/g, '').toLowerCase().replace(/[^a-z0-9]+/g, '');
+    }
+
+    /**
+     * Obter nível canônico de um texto
+     * @param {string} text - Nível em qualquer grafia
+     * @returns {string|null} Nível canônico ou null se desconhecido
+     */
+    function lookup(text) {
+        return LEVELS[fold(text)] || null;
+    }
+
+    global.HelpOTRS = global.HelpOTRS || {};
+    global.HelpOTRS.LevelTable = { fold, lookup, LEVELS };
+
+})(globalThis);
@@ -0,0 +1,126 @@
+/**
+ * Detecção pré-compilada de sistema OTRS por URL
+ * 
+ * Arquivo gerado por scripts/codegen.py - não editar manualmente.
+ * 
+ * match() indexa os sistemas configurados por hostname uma única vez
+ * (URLs base conhecidas já vêm pré-processadas de tenants.json) e
+ * testa os indicadores de caminho OTRS com uma única regex.
+ */
+
+(function(global) {
+    'use strict';
+
+    // Indicadores de caminho OTRS combinados (/otrs/, index.pl, Action=Agent)
+    const OTRS_PATH_PATTERN = /^[^:]+:\/\/[^\/?#]*\/otrs|\/otrs\/|index\.pl|Action=Agent/;
+    const OTRS_INDICATOR_PATTERN = /\/otrs\/|index\.pl|Action=Agent/;
+
+    // URL base → [hostname, pathname] dos sistemas conhecidos
+    const KNOWN_SYSTEMS = {
+        "http://itsm-mtpa.hepta.com.br/otrs/": [
+            "itsm-mtpa.hepta.com.br",
+            "/otrs/"
+        ],
+        "https://atendetiadmin.agro.gov.br/otrs/": [
+            "atendetiadmin.agro.gov.br",
+            "/otrs/"
+        ]
+    };
+
+    const indexCache = new WeakMap();
+
+    /**
+     * Extrair hostname e caminho de uma URL base (tabela pré-compilada primeiro)
+     * @param {string} baseUrl - URL base do sistema
+     * @returns {Array|null} [hostname, pathname] ou null se inválida
+     */
+    function parseBaseUrl(baseUrl) {
+        const known = KNOWN_SYSTEMS[baseUrl];
+        if (known) {
+            return known;
+        }
+        try {
+            const url = new URL(baseUrl);
+            return [url.hostname, url.pathname];
+        } catch (error) {
+            return null;
+        }
+    }
+
+    /**
+     * Indexar sistemas habilitados por hostname (uma vez por array de sistemas)
+     * @param {Array} systems - Sistemas configurados
+     * @returns {Object} Índice { byHost: Map, invalid: Array }
+     */
+    function buildIndex(systems) {
+        let index = indexCache.get(systems);
+        if (index) {
+            return index;
+        }
+
+        index = { byHost: new Map(), invalid: [] };
+        systems.forEach((system, order) => {
+            if (!system || !system.enabled || !system.baseUrl) {
+                return;
+            }
+            const parsed = parseBaseUrl(system.baseUrl);
+            if (!parsed) {
+                // Mesmo fallback de antes: host contido na URL atual
+                const host = system.baseUrl.replace(/https?:\/\//, '').replace(/\/.*$/, '');
+                index.invalid.push({ system, order, host });
+                return;
+            }
+            const [hostname, pathname] = parsed;
+            if (!index.byHost.has(hostname)) {
+                index.byHost.set(hostname, []);
+            }
+            index.byHost.get(hostname).push({ system, order, pathname });
+        });
+
+        indexCache.set(systems, index);
+        return index;
+    }
+
+    /**
+     * Encontrar o sistema OTRS correspondente a uma URL
+     * @param {Array} systems - Sistemas configurados (ordem define prioridade)
+     * @param {string} href - URL completa
+     * @param {string} hostname - Hostname da URL
+     * @param {string} pathname - Caminho da URL
+     * @returns {Object|null} Sistema correspondente
+     */
+    function match(systems, href, hostname, pathname) {
+        if (!Array.isArray(systems) || systems.length === 0) {
+            return null;
+        }
+
+        const index = buildIndex(systems);
+        const hasOtrsPath = OTRS_PATH_PATTERN.test(href);
+        let best = null;
+
+        for (const entry of index.byHost.get(hostname) || []) {
+            if (hasOtrsPath || (entry.pathname !== '/' && pathname.startsWith(entry.pathname))) {
+                best = entry;
+                break;
+            }
+        }
+
+        if (index.invalid.length > 0 && OTRS_INDICATOR_PATTERN.test(href)) {
+            for (const entry of index.invalid) {
+                if (best && entry.order > best.order) {
+                    break;
+                }
+                if (href.includes(entry.host)) {
+                    best = entry;
+                    break;
+                }
+            }
+        }
+
+        return best ? best.system : null;
+    }
+
+    global.HelpOTRS = global.HelpOTRS || {};
+    global.HelpOTRS.OtrsMatcher = { match, OTRS_PATH_PATTERN, KNOWN_SYSTEMS };
+
+})(globalThis);